@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Exhaustive vs block-max MaxScore scoring for long multi-term queries.
+
+Scores the same queries with ``BM25SearchEngine(enable_pruning=False)`` and
+with pruning enabled, checks that both return identical rankings, and reports
+latency plus the share of posting blocks each mode decoded. The posting cache
+is disabled so every query pays for the blocks it touches.
+
+Point ``--segments`` at real tenant segments (queries are sampled from each
+segment's own body vocabulary):
+
+    uv run python benchmarks/bm25_pruning.py --segments mcp-data/*/__search_segments/*.db
+
+Without ``--segments`` a synthetic Zipf-distributed corpus is generated:
+
+    uv run python benchmarks/bm25_pruning.py --docs 20000 --queries 100
+"""
+
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import statistics
+import tempfile
+import time
+
+from docs_mcp_server.search.bm25_engine import BM25SearchEngine
+from docs_mcp_server.search.posting_cache import configure_posting_cache
+from docs_mcp_server.search.posting_codec import PostingBlocks
+from docs_mcp_server.search.schema import create_default_schema
+from docs_mcp_server.search.sqlite_storage import SqliteSegment, SqliteSegmentStore, SqliteSegmentWriter
+
+
+def _zipf_weights(count: int) -> list[float]:
+    return [1 / (rank + 1) for rank in range(count)]
+
+
+def _synthetic_segment(directory: Path, doc_count: int, *, vocabulary_size: int = 5000, seed: int = 5) -> SqliteSegment:
+    rng = random.Random(seed)
+    vocabulary = [f"term{index}x" for index in range(vocabulary_size)]
+    weights = _zipf_weights(vocabulary_size)
+    writer = SqliteSegmentWriter(create_default_schema(), segment_id="pruning")
+    for doc_index in range(doc_count):
+        body = " ".join(rng.choices(vocabulary, weights, k=rng.randint(50, 400)))
+        writer.add_document(
+            {
+                "url": f"https://docs.example.com/page-{doc_index}/",
+                "url_path": f"/page-{doc_index}/",
+                "title": " ".join(rng.choices(vocabulary, weights, k=4)),
+                "body": body,
+                "path": f"page-{doc_index}.md",
+                "excerpt": body[:200],
+                "language": "en",
+                "timestamp": 0,
+            }
+        )
+    store = SqliteSegmentStore(directory)
+    store.save(writer.build())
+    return store.latest()
+
+
+def _queries(segment: SqliteSegment, count: int, *, seed: int = 9) -> list[str]:
+    """Sample 8-15 term queries, weighting terms by document frequency like real agent queries."""
+    terms = segment.get_terms("body")
+    doc_freqs = [len(segment.get_posting_columns("body", term) or ()) for term in terms]
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(terms, doc_freqs, k=rng.randint(8, 15))) for _ in range(count)]
+
+
+def _run(engine: BM25SearchEngine, segment: SqliteSegment, queries: list[str], limit: int):
+    decoded = {"blocks": 0, "available": 0}
+    select = PostingBlocks.select
+
+    def _counting_select(self, block_indices):
+        decoded["blocks"] += len(block_indices)
+        decoded["available"] += self.block_count
+        return select(self, block_indices)
+
+    stats = segment.get_field_length_stats([field.name for field in segment.schema.text_fields])
+    samples: list[float] = []
+    results = []
+    PostingBlocks.select = _counting_select
+    try:
+        for query in queries:
+            tokens = engine.tokenize_query(query)
+            start = time.perf_counter()
+            results.append(engine.score(segment, tokens, limit=limit, field_length_stats=stats))
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        PostingBlocks.select = select
+    return samples, results, decoded["blocks"] / max(decoded["available"], 1)
+
+
+def _summarize(samples_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(samples_ms) or [0.0]
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+    }
+
+
+def compare(name: str, segment: SqliteSegment, query_count: int, limit: int) -> dict[str, object]:
+    queries = _queries(segment, query_count)
+    boosts = {field.name: segment.schema.get_boost(field.name) for field in segment.schema.fields}
+    report: dict[str, object] = {"source": name, "docs": segment.doc_count, "queries": len(queries), "limit": limit}
+    rankings = {}
+    for label, pruning in (("exhaustive", False), ("pruned", True)):
+        engine = BM25SearchEngine(segment.schema, field_boosts=boosts, enable_pruning=pruning)
+        _run(engine, segment, queries[:5], limit)  # warm SQLite's page cache
+        samples, results, decoded_share = _run(engine, segment, queries, limit)
+        rankings[label] = results
+        report[label] = {**_summarize(samples), "blocks_decoded": round(decoded_share, 3)}
+    report["identical_results"] = rankings["exhaustive"] == rankings["pruned"]
+    report["p50_speedup"] = round(report["exhaustive"]["p50_ms"] / max(report["pruned"]["p50_ms"], 1e-9), 2)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", nargs="*", type=Path, default=[], help="Existing segment .db files to query")
+    parser.add_argument("--docs", type=int, default=20000, help="Synthetic documents when no --segments are given")
+    parser.add_argument("--queries", type=int, default=100, help="Queries per mode (default: 100)")
+    parser.add_argument("--limit", type=int, default=10, help="Results requested per query (default: 10)")
+    args = parser.parse_args()
+
+    configure_posting_cache(0)
+    reports = []
+    if args.segments:
+        for db_path in args.segments:
+            segment = SqliteSegmentStore(db_path.parent).load(db_path.stem)
+            if segment is None:
+                print(f"skipping unreadable segment {db_path}")
+                continue
+            try:
+                reports.append(compare(str(db_path), segment, args.queries, args.limit))
+            finally:
+                segment.close()
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            segment = _synthetic_segment(Path(tmp_dir), args.docs)
+            try:
+                reports.append(compare("synthetic", segment, args.queries, args.limit))
+            finally:
+                segment.close()
+    print(json.dumps(reports, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
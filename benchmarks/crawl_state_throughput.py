@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark crawl-state store traffic during a simulated sync.
+
+Each tenant gets its own ``CrawlStateStore``. Its queue is filled with
+``--urls`` URLs and drained the way ``SyncScheduler`` does: dequeue a batch of
+``--concurrency`` URLs, then process them concurrently. Each URL loads its
+metadata, records ``process_start``, waits ``--fetch-ms`` (the network),
+records ``fetch_success`` and upserts its metadata. All tenants share one
+event loop, like the server.
+
+Reports URLs/sec per tenant and event-loop stalls, measured as the overshoot
+of a 5 ms ticker. A stall is time the loop could not serve anything else,
+such as search requests.
+
+Usage:
+    uv run python benchmarks/crawl_state_throughput.py --tenants 4 --urls 2000 --concurrency 20
+"""
+
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+import statistics
+import tempfile
+import time
+
+from docs_mcp_server.utils.crawl_state_store import CrawlStateStore
+
+
+_TICK_SECONDS = 0.005
+
+
+async def _process_url(store: CrawlStateStore, url: str, fetch_seconds: float) -> None:
+    await store.load_url_metadata(url)
+    await store.record_event(url=url, event_type="process_start", status="ok")
+    await asyncio.sleep(fetch_seconds)
+    await store.record_event(url=url, event_type="fetch_success", status="ok", duration_ms=int(fetch_seconds * 1000))
+    now = datetime.now(timezone.utc)
+    await store.upsert_url_metadata(
+        {
+            "url": url,
+            "last_status": "success",
+            "last_fetched_at": now.isoformat(),
+            "next_due_at": (now + timedelta(days=1)).isoformat(),
+        }
+    )
+
+
+async def _run_tenant(root: Path, index: int, args: argparse.Namespace) -> dict[str, float]:
+    store = CrawlStateStore(root / f"tenant-{index}")
+    urls = {f"https://tenant{index}.example.com/docs/page-{page}/" for page in range(args.urls)}
+    started = time.perf_counter()
+    await store.enqueue_urls(urls, reason="benchmark", force=True)
+    enqueue_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    processed = 0
+    while batch := await store.dequeue_batch(args.concurrency):
+        await asyncio.gather(*(_process_url(store, url, args.fetch_ms / 1000) for url in batch))
+        processed += len(batch)
+        await store.queue_depth()
+    elapsed = time.perf_counter() - started
+    close = getattr(store, "close", None)
+    if close is not None:
+        close()
+    return {
+        "urls": processed,
+        "enqueue_seconds": round(enqueue_seconds, 3),
+        "seconds": round(elapsed, 3),
+        "urls_per_second": round(processed / elapsed, 1),
+    }
+
+
+async def _ticker(stalls: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(_TICK_SECONDS)
+        stalls.append(max(0.0, time.perf_counter() - started - _TICK_SECONDS) * 1000)
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stalls: list[float] = []
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_ticker(stalls, stop))
+        tenants = await asyncio.gather(*(_run_tenant(Path(tmp_dir), index, args) for index in range(args.tenants)))
+        stop.set()
+        await ticker
+    ordered = sorted(stalls)
+    return {
+        "tenants": args.tenants,
+        "urls_per_tenant": args.urls,
+        "concurrency": args.concurrency,
+        "fetch_ms": args.fetch_ms,
+        "per_tenant": tenants,
+        "urls_per_second_per_tenant": round(statistics.fmean(t["urls_per_second"] for t in tenants), 1),
+        "loop_stall_p99_ms": round(ordered[int(len(ordered) * 0.99)], 2) if ordered else 0.0,
+        "loop_stall_max_ms": round(ordered[-1], 2) if ordered else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark CrawlStateStore throughput during a simulated sync")
+    parser.add_argument("--tenants", type=int, default=4, help="Tenants syncing at once (default: 4)")
+    parser.add_argument("--urls", type=int, default=2000, help="URLs per tenant (default: 2000)")
+    parser.add_argument("--concurrency", type=int, default=20, help="URLs in flight per tenant (default: 20)")
+    parser.add_argument("--fetch-ms", type=float, default=5.0, help="Simulated fetch time per URL (default: 5)")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(_run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Serial vs process-pool document parsing in ``TenantIndexer``.
+
+Builds the same tenant once per worker count with ``persist=False`` and
+reports wall time, docs/sec, and peak RSS, and checks that every build
+produced the same fingerprint (segment id).
+
+Point ``--docs-root`` at a real tenant's docs directory (indexed as a
+filesystem tenant, so metadata files are ignored):
+
+    uv run python benchmarks/indexing_throughput.py --docs-root mcp-data/django --workers 1 2 4
+
+Without ``--docs-root`` a synthetic markdown tree is generated:
+
+    uv run python benchmarks/indexing_throughput.py --docs 5000 --workers 1 2 4 8
+"""
+
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import tempfile
+
+from docs_mcp_server.search.indexer import TenantIndexer, TenantIndexingContext
+
+
+def _zipf_weights(count: int) -> list[float]:
+    return [1 / (rank + 1) for rank in range(count)]
+
+
+def _synthetic_docs(root: Path, doc_count: int, *, vocabulary_size: int = 8000, seed: int = 3) -> None:
+    rng = random.Random(seed)
+    vocabulary = [f"term{index}x" for index in range(vocabulary_size)]
+    weights = _zipf_weights(vocabulary_size)
+    for doc_index in range(doc_count):
+        sections = []
+        for section_index in range(rng.randint(2, 6)):
+            heading = " ".join(rng.choices(vocabulary, weights, k=3))
+            paragraphs = [" ".join(rng.choices(vocabulary, weights, k=rng.randint(40, 160))) for _ in range(3)]
+            sections.append(f"{'#' * (2 + section_index % 2)} {heading}\n\n" + "\n\n".join(paragraphs))
+        title = " ".join(rng.choices(vocabulary, weights, k=4))
+        path = root / f"section-{doc_index % 50}" / f"page-{doc_index}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            f"---\ntitle: {title}\nurl: https://docs.example.com/page-{doc_index}/\n---\n# {title}\n\n"
+            + "\n\n".join(sections),
+            encoding="utf-8",
+        )
+
+
+def compare(name: str, docs_root: Path, worker_counts: list[int]) -> dict[str, object]:
+    report: dict[str, object] = {"source": name}
+    segment_ids = set()
+    with tempfile.TemporaryDirectory() as segments_dir:
+        context = TenantIndexingContext(
+            codename="benchmark",
+            docs_root=docs_root,
+            segments_dir=Path(segments_dir),
+            source_type="filesystem",
+        )
+        for workers in worker_counts:
+            TenantIndexer.set_parse_workers(workers)
+            result = TenantIndexer(context).build_segment(persist=False)
+            segment_ids.update(result.segment_ids)
+            report["docs"] = result.documents_indexed
+            report[f"workers_{workers}"] = {
+                "seconds": round(result.elapsed_seconds, 3),
+                "docs_per_second": round(result.documents_per_second, 1),
+                "peak_rss_mib": round(result.peak_rss_bytes / (1024 * 1024), 1) if result.peak_rss_bytes else None,
+            }
+    TenantIndexer.set_parse_workers(None)
+    report["identical_fingerprints"] = len(segment_ids) == 1
+    baseline = report[f"workers_{worker_counts[0]}"]["seconds"]
+    report["speedup"] = {
+        str(workers): round(baseline / max(report[f"workers_{workers}"]["seconds"], 1e-9), 2)
+        for workers in worker_counts[1:]
+    }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs-root", type=Path, help="Existing tenant docs directory to index")
+    parser.add_argument("--docs", type=int, default=3000, help="Synthetic documents when no --docs-root is given")
+    parser.add_argument(
+        "--workers", nargs="+", type=int, default=[1, 2, 4], help="Parse worker counts; the first is the baseline"
+    )
+    args = parser.parse_args()
+
+    if args.docs_root:
+        report = compare(str(args.docs_root), args.docs_root, args.workers)
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            _synthetic_docs(Path(tmp_dir), args.docs)
+            report = compare("synthetic", Path(tmp_dir), args.workers)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
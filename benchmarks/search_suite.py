@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""Reproducible search and indexing benchmark suite with regression gates.
+
+For each scale, a markdown corpus is synthesized from the documents under
+``tests/fixtures``: every synthetic page reuses a fixture page's headings and
+code blocks, and its prose is drawn from a Zipf-weighted vocabulary grown from
+the fixture words (Heaps' law sizing, so larger corpora have more distinct
+terms). Generation is seeded, so a given scale and seed always produce the
+same corpus and queries.
+
+Each scale reports:
+
+- ``build``: index build time, peak RSS of the build (run in a fresh process
+  so scales don't inherit each other's peak), segment size and the part of it
+  taken by the typo (fuzzy) index;
+- ``queries``: p50/p99/mean latency per query class (single term,
+  multi-term, typo, phrase) with the result cache disabled, measured after
+  one unmeasured warm-up pass;
+- ``concurrent``: queries per second with ``--threads`` threads sharing one
+  index.
+
+Write a report and keep it as the baseline:
+
+    uv run python benchmarks/search_suite.py --scales 1000 10000 --output baseline.json
+
+Compare a later run against it; the script exits 1 when any metric regressed
+by more than its tolerance:
+
+    uv run python benchmarks/search_suite.py --scales 1000 10000 --baseline baseline.json
+
+The full suite runs ``--scales 1000 10000 100000``. Timings only compare
+meaningfully on the same machine; the report records the environment and a
+mismatch with the baseline is printed as a warning.
+"""
+
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+import itertools
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import platform
+import random
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+from docs_mcp_server.search.indexer import TenantIndexer, TenantIndexingContext
+from docs_mcp_server.search.result_cache import configure_result_cache
+from docs_mcp_server.search.segment_search_index import SegmentSearchIndex
+
+
+DEFAULT_SCALES = (1000, 10000, 100000)
+QUERY_CLASSES = ("single_term", "multi_term", "typo", "phrase")
+
+_FIXTURES_ROOT = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+_WORD = re.compile(r"[a-z]{3,}")
+_HEAPS_K = 30
+_PROSE_WORDS = (40, 120)
+# Query terms come from the head of the vocabulary so they actually match documents.
+_QUERY_VOCABULARY = 2000
+
+
+def _fixture_pages(root: Path) -> list[list[tuple[str, str]]]:
+    """Split every fixture page into ``(kind, text)`` blocks: headings, code and prose."""
+    pages = []
+    for path in sorted(root.rglob("*.md")):
+        if any(part.startswith("__") for part in path.relative_to(root).parts):
+            continue
+        blocks: list[tuple[str, str]] = []
+        in_code = False
+        code: list[str] = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if line.startswith("```"):
+                if in_code:
+                    blocks.append(("code", "\n".join([*code, line])))
+                    code = []
+                else:
+                    code = [line]
+                in_code = not in_code
+            elif in_code:
+                code.append(line)
+            elif line.startswith("#"):
+                blocks.append(("heading", line))
+            elif line.strip():
+                blocks.append(("prose", line))
+        if blocks:
+            pages.append(blocks)
+    return pages
+
+
+def _vocabulary(pages: list[list[tuple[str, str]]], size: int, rng: random.Random) -> list[str]:
+    """Fixture words first, then compounds of them, until ``size`` distinct words."""
+    seeds = sorted(
+        {word for page in pages for kind, text in page if kind != "code" for word in _WORD.findall(text.lower())}
+    )
+    vocabulary = list(seeds)
+    seen = set(seeds)
+    while len(vocabulary) < size:
+        word = "".join(rng.sample(seeds, rng.choice((2, 2, 3))))
+        if word not in seen:
+            seen.add(word)
+            vocabulary.append(word)
+    return vocabulary
+
+
+class CorpusGenerator:
+    """Deterministic synthetic corpus of ``doc_count`` markdown pages shaped like the fixtures."""
+
+    def __init__(self, doc_count: int, *, seed: int = 7, fixtures_root: Path = _FIXTURES_ROOT) -> None:
+        self.doc_count = doc_count
+        self._rng = random.Random(seed)
+        self._pages = _fixture_pages(fixtures_root)
+        if not self._pages:
+            raise SystemExit(f"No fixture markdown found under {fixtures_root}")
+        average_words = sum(_PROSE_WORDS) / 2 * 3
+        self.vocabulary = _vocabulary(self._pages, int(_HEAPS_K * (doc_count * average_words) ** 0.5), self._rng)
+        # Zipf ranks are shuffled once so the fixture words aren't always the most frequent.
+        ranked = list(self.vocabulary)
+        self._rng.shuffle(ranked)
+        self.ranked_vocabulary = ranked
+        self._cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(ranked))))
+        self.phrases: list[str] = []
+
+    def _words(self, count: int) -> list[str]:
+        return self._rng.choices(self.ranked_vocabulary, cum_weights=self._cum_weights, k=count)
+
+    def _prose(self) -> str:
+        words = self._words(self._rng.randint(*_PROSE_WORDS))
+        if len(self.phrases) < 500:
+            start = self._rng.randrange(len(words) - 1)
+            self.phrases.append(f'"{words[start]} {words[start + 1]}"')
+        sentences = []
+        for start in range(0, len(words), 12):
+            sentence = words[start : start + 12]
+            sentences.append(" ".join(sentence).capitalize() + ".")
+        return " ".join(sentences)
+
+    def write(self, root: Path) -> None:
+        for doc_index in range(self.doc_count):
+            template = self._pages[doc_index % len(self._pages)]
+            title = " ".join(self._words(3)).title()
+            parts = [f"# {title}"]
+            for kind, text in template:
+                if kind == "heading" and not text.startswith("# "):
+                    parts.append(text.split(" ", 1)[0] + " " + " ".join(self._words(2)).title())
+                elif kind == "code":
+                    parts.append(text)
+                elif kind == "prose":
+                    parts.append(self._prose())
+            path = root / f"section-{doc_index % 100}" / f"page-{doc_index}.md"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                f"---\ntitle: {title}\nurl: https://bench.example.com/page-{doc_index}/\n---\n" + "\n\n".join(parts),
+                encoding="utf-8",
+            )
+
+    def queries(self, per_class: int) -> dict[str, list[str]]:
+        rng = random.Random(self._rng.random())
+        head = self.ranked_vocabulary[:_QUERY_VOCABULARY]
+        long_words = [word for word in head if len(word) >= 6] or head
+        typos = []
+        for word in rng.sample(long_words, min(per_class, len(long_words))):
+            index = len(word) // 2
+            replacement = rng.choice([letter for letter in "etaoinsrhl" if letter != word[index]])
+            typos.append(word[:index] + replacement + word[index + 1 :])
+        return {
+            "single_term": rng.sample(head, min(per_class, len(head))),
+            "multi_term": [" ".join(rng.sample(head, rng.randint(2, 4))) for _ in range(per_class)],
+            "typo": typos,
+            "phrase": rng.sample(self.phrases, min(per_class, len(self.phrases))),
+        }
+
+
+def _fuzzy_index_bytes(segment_path: Path) -> int | None:
+    """Bytes held by the segment's fuzzy index tables, or None when SQLite lacks ``dbstat``."""
+    with closing(sqlite3.connect(segment_path)) as conn:
+        try:
+            row = conn.execute(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name IN ('fuzzy_deletes', 'fuzzy_terms')"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+    return int(row[0] or 0)
+
+
+def _build_index(docs_root: str, segments_dir: str, parse_workers: int) -> dict[str, float | int | None]:
+    """Build the corpus into a segment; runs in a fresh process so peak RSS is the build's own."""
+    TenantIndexer.set_parse_workers(parse_workers)
+    context = TenantIndexingContext(
+        codename="benchmark",
+        docs_root=Path(docs_root),
+        segments_dir=Path(segments_dir),
+        source_type="filesystem",
+    )
+    result = TenantIndexer(context).build_segment(persist=True)
+    segment_path = result.segment_paths[0]
+    return {
+        "docs": result.documents_indexed,
+        "seconds": round(result.elapsed_seconds, 3),
+        "docs_per_second": round(result.documents_per_second, 1),
+        "peak_rss_bytes": result.peak_rss_bytes,
+        "segment_bytes": segment_path.stat().st_size,
+        "fuzzy_index_bytes": _fuzzy_index_bytes(segment_path),
+        "segment_path": str(segment_path),
+    }
+
+
+def _latency_summary(samples_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(samples_ms)
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+    }
+
+
+def _measure_queries(index: SegmentSearchIndex, queries: dict[str, list[str]], repeat: int, limit: int) -> dict:
+    for query in itertools.chain.from_iterable(queries.values()):
+        index.search(query, limit)
+    report = {}
+    for query_class in QUERY_CLASSES:
+        samples = []
+        hits = 0
+        for _ in range(repeat):
+            for query in queries[query_class]:
+                started = time.perf_counter()
+                response = index.search(query, limit)
+                samples.append((time.perf_counter() - started) * 1000)
+                hits += bool(response.results)
+        report[query_class] = {
+            **_latency_summary(samples),
+            "queries": len(queries[query_class]),
+            "hit_rate": round(hits / max(len(samples), 1), 3),
+        }
+    return report
+
+
+def _measure_concurrency(index: SegmentSearchIndex, queries: list[str], threads: int, total: int, limit: int) -> dict:
+    workload = [queries[position % len(queries)] for position in range(total)]
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        started = time.perf_counter()
+        for _ in pool.map(lambda query: index.search(query, limit), workload):
+            pass
+        elapsed = time.perf_counter() - started
+    return {"threads": threads, "queries": total, "qps": round(total / elapsed, 1)}
+
+
+def run_scale(doc_count: int, args: argparse.Namespace) -> dict:
+    generator = CorpusGenerator(doc_count, seed=args.seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        docs_root = Path(tmp_dir) / "docs"
+        segments_dir = Path(tmp_dir) / "segments"
+        generator.write(docs_root)
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+            build = pool.submit(_build_index, str(docs_root), str(segments_dir), args.index_workers).result()
+        segment_path = Path(build.pop("segment_path"))
+
+        queries = generator.queries(args.queries_per_class)
+        with SegmentSearchIndex(segment_path, tenant="benchmark") as index:
+            query_report = _measure_queries(index, queries, args.repeat, args.limit)
+            mixed = [query for query_class in QUERY_CLASSES for query in queries[query_class]]
+            concurrent = _measure_concurrency(index, mixed, args.threads, args.concurrent_queries, args.limit)
+    return {
+        "docs": doc_count,
+        "vocabulary": len(generator.vocabulary),
+        "build": build,
+        "queries": query_report,
+        "concurrent": concurrent,
+    }
+
+
+def environment() -> dict[str, str | int | None]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _flatten(report: dict, prefix: str = "") -> dict[str, float]:
+    flat: dict[str, float] = {}
+    for key, value in report.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = float(value)
+    return flat
+
+
+def compare(current: dict, baseline: dict, *, tolerance: float, size_tolerance: float) -> list[str]:
+    """Return one message per metric that got worse than its baseline by more than its tolerance.
+
+    Times (``*_ms``, ``seconds``) and sizes (``*_bytes``) regress upwards,
+    throughput (``qps``, ``docs_per_second``) downwards; other numbers are
+    descriptive and not gated. A p99 rests on a handful of samples, so it gets
+    twice the time tolerance.
+    """
+    regressions = []
+    current_metrics = _flatten(current["scales"])
+    for path, base in _flatten(baseline["scales"]).items():
+        value = current_metrics.get(path)
+        metric = path.rsplit(".", 1)[-1]
+        if value is None or base <= 0:
+            continue
+        if metric.endswith("_bytes"):
+            limit, change = size_tolerance, value / base - 1
+        elif metric == "p99_ms":
+            limit, change = 2 * tolerance, value / base - 1
+        elif metric.endswith("_ms") or metric == "seconds":
+            limit, change = tolerance, value / base - 1
+        elif metric in {"qps", "docs_per_second"}:
+            limit, change = tolerance, 1 - value / base
+        else:
+            continue
+        if change > limit:
+            regressions.append(f"{path}: {base:,.6g} -> {value:,.6g} ({change:+.0%} worse, limit {limit:.0%})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", nargs="+", type=int, default=list(DEFAULT_SCALES), help="Corpus sizes in docs")
+    parser.add_argument("--seed", type=int, default=7, help="Corpus and query seed (default: 7)")
+    parser.add_argument("--queries-per-class", type=int, default=40, help="Distinct queries per class (default: 40)")
+    parser.add_argument("--repeat", type=int, default=5, help="Measured passes over each query class (default: 5)")
+    parser.add_argument("--limit", type=int, default=10, help="Results requested per query (default: 10)")
+    parser.add_argument("--threads", type=int, default=4, help="Threads for the QPS measurement (default: 4)")
+    parser.add_argument("--concurrent-queries", type=int, default=2000, help="Queries in the QPS run (default: 2000)")
+    parser.add_argument(
+        "--index-workers", type=int, default=1, help="Parse workers for index builds; 1 = serial (default: 1)"
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Baseline report to gate against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed slowdown for times and throughput (default: 0.25)"
+    )
+    parser.add_argument("--size-tolerance", type=float, default=0.05, help="Allowed growth for sizes (default: 0.05)")
+    args = parser.parse_args()
+
+    # Measure scoring, not cache lookups.
+    configure_result_cache(0, 0, 0)
+    report = {
+        "suite": "search",
+        "environment": environment(),
+        "settings": {
+            key: getattr(args, key)
+            for key in (
+                "seed",
+                "queries_per_class",
+                "repeat",
+                "limit",
+                "threads",
+                "concurrent_queries",
+                "index_workers",
+            )
+        },
+        "scales": {},
+    }
+    for doc_count in sorted(args.scales):
+        print(f"Running scale {doc_count}...", file=sys.stderr)
+        report["scales"][str(doc_count)] = run_scale(doc_count, args)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("environment") != report["environment"]:
+        print("warning: baseline was recorded in a different environment", file=sys.stderr)
+    if baseline.get("settings") != report["settings"]:
+        print("warning: baseline was recorded with different settings", file=sys.stderr)
+    regressions = compare(report, baseline, tolerance=args.tolerance, size_tolerance=args.size_tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"No regressions against {args.baseline}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Size and latency comparison: row-per-posting segments vs ordinal posting blobs.
+
+Each source segment is written twice: once in the historical row-per-posting
+layout (``postings`` keyed by ``(field, term, doc_id)`` plus the redundant
+``idx_postings_field_term`` index) and once by ``SqliteSegmentStore`` in the
+current ordinal/blob layout. Both copies are then scored with the same
+``BM25SearchEngine`` queries with the posting cache disabled, so the numbers
+reflect on-disk reads and decoding rather than cache hits.
+
+Point ``--segments`` at real tenant segments to compare production corpora
+(any format is accepted; the data is re-exported via ``to_segment_data``):
+
+    uv run python benchmarks/segment_format.py --segments mcp-data/*/__search_segments/*.db
+
+Without ``--segments`` a synthetic corpus is generated:
+
+    uv run python benchmarks/segment_format.py --docs 5000 --iterations 200
+"""
+
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import argparse
+from array import array
+import json
+from pathlib import Path
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from docs_mcp_server.search.bm25_engine import BM25SearchEngine
+from docs_mcp_server.search.posting_cache import configure_posting_cache
+from docs_mcp_server.search.schema import create_default_schema
+from docs_mcp_server.search.sqlite_storage import SqliteSegment, SqliteSegmentStore, SqliteSegmentWriter
+
+
+_VOCABULARY = (
+    "model",
+    "request",
+    "config",
+    "router",
+    "middleware",
+    "serializer",
+    "queryset",
+    "template",
+    "settings",
+    "cache",
+    "session",
+    "token",
+    "auth",
+    "permission",
+    "viewset",
+    "migration",
+    "signal",
+    "handler",
+    "logging",
+    "database",
+)
+
+_ROW_SCHEMA = """
+    CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT);
+    CREATE TABLE postings (
+        field TEXT NOT NULL,
+        term TEXT NOT NULL,
+        doc_id TEXT NOT NULL,
+        tf INTEGER NOT NULL,
+        doc_length INTEGER NOT NULL,
+        positions_blob BLOB,
+        PRIMARY KEY (field, term, doc_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_postings_field_term ON postings(field, term);
+"""
+
+
+def _synthetic_segment_data(doc_count: int, *, seed: int = 11) -> dict[str, Any]:
+    rng = random.Random(seed)
+    writer = SqliteSegmentWriter(create_default_schema(), segment_id="synthetic")
+    for doc_idx in range(doc_count):
+        words = rng.choices(_VOCABULARY, k=180)
+        title = " ".join(rng.choices(_VOCABULARY, k=3))
+        writer.add_document(
+            {
+                "url": f"https://docs.example.com/reference/api/section-{doc_idx % 40}/page-{doc_idx}/",
+                "url_path": f"/reference/api/section-{doc_idx % 40}/page-{doc_idx}/",
+                "title": title,
+                "headings_h1": title,
+                "headings_h2": " ".join(rng.choices(_VOCABULARY, k=4)),
+                "body": " ".join(words),
+                "path": f"reference/page-{doc_idx}.md",
+                "excerpt": " ".join(words[:20]),
+                "language": "en",
+                "timestamp": 0,
+            }
+        )
+    return writer.build()
+
+
+def _write_row_segment(segment_data: dict[str, Any], directory: Path) -> Path:
+    """Write segment_data in the row-per-posting layout, reusing the store for the rest."""
+    directory.mkdir(parents=True, exist_ok=True)
+    db_path = directory / f"{segment_data['segment_id']}.db"
+    store = SqliteSegmentStore(directory)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(_ROW_SCHEMA)
+        store._create_schema(conn)  # documents, bloom_blocks (+ unused ordinal tables, dropped below)
+        conn.executescript("DROP TABLE doc_ordinals; DROP TABLE posting_lists;")
+        store._store_metadata(conn, segment_data["segment_id"], segment_data)
+        conn.execute("DELETE FROM metadata WHERE key = 'postings_format'")
+        rows = []
+        for field_name, terms in segment_data["postings"].items():
+            lengths = segment_data["field_lengths"].get(field_name, {})
+            for term, posting_list in terms.items():
+                for posting in posting_list:
+                    positions = array("I", posting["positions"])
+                    doc_id = posting["doc_id"]
+                    rows.append(
+                        (field_name, term, doc_id, len(positions), int(lengths.get(doc_id, 0)), positions.tobytes())
+                    )
+        conn.executemany("INSERT INTO postings VALUES (?, ?, ?, ?, ?, ?)", rows)
+        store._store_bloom_filter(conn, segment_data)
+        store._store_documents(conn, segment_data)
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return db_path
+
+
+def _write_ordinal_segment(segment_data: dict[str, Any], directory: Path) -> Path:
+    db_path = SqliteSegmentStore(directory).save(segment_data)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("VACUUM")
+    return db_path
+
+
+def _table_bytes(db_path: Path, tables: tuple[str, ...]) -> int | None:
+    try:
+        with sqlite3.connect(db_path) as conn:
+            placeholders = ", ".join("?" for _ in tables)
+            row = conn.execute(f"SELECT SUM(pgsize) FROM dbstat WHERE name IN ({placeholders})", tables).fetchone()
+    except sqlite3.Error:
+        return None  # dbstat virtual table not compiled in
+    return int(row[0] or 0)
+
+
+def _queries(segment_data: dict[str, Any], count: int) -> list[str]:
+    body = segment_data["postings"].get("body", {})
+    frequent = sorted(body, key=lambda term: len(body[term]), reverse=True)[:24]
+    if not frequent:
+        return []
+    rng = random.Random(3)
+    return [" ".join(rng.sample(frequent, k=min(len(frequent), 1 + idx % 4))) for idx in range(count)]
+
+
+def _time_queries(segment: SqliteSegment, queries: list[str], limit: int) -> list[float]:
+    engine = BM25SearchEngine(
+        segment.schema,
+        field_boosts={field.name: segment.schema.get_boost(field.name) for field in segment.schema.fields},
+        enable_phrase_bonus=True,
+    )
+    stats = segment.get_field_length_stats([field.name for field in segment.schema.text_fields])
+    samples: list[float] = []
+    for query in queries:
+        tokens = engine.tokenize_query(query)
+        start = time.perf_counter()
+        engine.score(segment, tokens, limit=limit, field_length_stats=stats)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _summarize(samples_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(samples_ms) or [0.0]
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+    }
+
+
+def compare(name: str, segment_data: dict[str, Any], iterations: int, limit: int) -> dict[str, object]:
+    queries = _queries(segment_data, iterations)
+    report: dict[str, object] = {"source": name, "docs": segment_data.get("doc_count", 0)}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        rows_path = _write_row_segment(segment_data, Path(tmp_dir) / "rows")
+        ordinal_path = _write_ordinal_segment(segment_data, Path(tmp_dir) / "ordinal")
+        for label, db_path, tables in (
+            ("rows", rows_path, ("postings", "idx_postings_field_term")),
+            ("ordinal_blobs", ordinal_path, ("posting_lists", "doc_ordinals")),
+        ):
+            segment = SqliteSegmentStore(db_path.parent).load(db_path.stem)
+            try:
+                report[label] = {
+                    "file_bytes": db_path.stat().st_size,
+                    "postings_bytes": _table_bytes(db_path, tables),
+                    **_summarize(_time_queries(segment, queries, limit)),
+                }
+            finally:
+                segment.close()
+    rows, ordinal = report["rows"], report["ordinal_blobs"]
+    report["file_size_ratio"] = round(ordinal["file_bytes"] / max(rows["file_bytes"], 1), 3)
+    report["p50_speedup"] = round(rows["p50_ms"] / max(ordinal["p50_ms"], 1e-9), 2)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", nargs="*", type=Path, default=[], help="Existing segment .db files to compare")
+    parser.add_argument("--docs", type=int, default=3000, help="Synthetic documents when no --segments are given")
+    parser.add_argument("--iterations", type=int, default=200, help="Queries per format (default: 200)")
+    parser.add_argument("--limit", type=int, default=10, help="Results requested per query (default: 10)")
+    args = parser.parse_args()
+
+    configure_posting_cache(0)
+    reports = []
+    if args.segments:
+        for db_path in args.segments:
+            segment = SqliteSegmentStore(db_path.parent).load(db_path.stem)
+            if segment is None:
+                print(f"skipping unreadable segment {db_path}")
+                continue
+            try:
+                segment_data = segment.to_segment_data()
+            finally:
+                segment.close()
+            reports.append(compare(str(db_path), segment_data, args.iterations, args.limit))
+    else:
+        reports.append(compare("synthetic", _synthetic_segment_data(args.docs), args.iterations, args.limit))
+    print(json.dumps(reports, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Latency benchmark: cold per-query segment loading vs the resident segment handle.
+
+The cold path reproduces the historical behavior of ``SegmentSearchIndex.search``:
+open a ``SqliteSegmentStore``, load the segment (metadata + schema JSON + fresh
+connection pool with read PRAGMAs), build a ``BM25SearchEngine``, score and then
+close the segment on every query. The resident path calls ``SegmentSearchIndex.search``,
+which reuses one loaded segment, its field-length stats and engine.
+
+Usage:
+    uv run python benchmarks/segment_residency.py --docs 2000 --iterations 300
+"""
+
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import random
+import statistics
+import tempfile
+import time
+
+from docs_mcp_server.search.bm25_engine import BM25SearchEngine
+from docs_mcp_server.search.schema import create_default_schema
+from docs_mcp_server.search.segment_search_index import SegmentSearchIndex
+from docs_mcp_server.search.snippet import build_smart_snippet
+from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter
+
+
+_VOCABULARY = (
+    "model",
+    "request",
+    "config",
+    "router",
+    "middleware",
+    "serializer",
+    "queryset",
+    "template",
+    "settings",
+    "cache",
+    "session",
+    "token",
+    "auth",
+    "permission",
+    "viewset",
+    "migration",
+    "signal",
+    "handler",
+    "logging",
+    "database",
+    "index",
+    "query",
+    "field",
+    "schema",
+    "response",
+    "header",
+    "cookie",
+    "form",
+    "widget",
+    "validator",
+)
+
+_QUERIES = (
+    "model",
+    "request config",
+    "serializer validation",
+    "queryset cache middleware",
+    "authentication token permission",
+)
+
+
+def _build_corpus(directory: Path, doc_count: int, *, seed: int = 7) -> Path:
+    rng = random.Random(seed)
+    writer = SqliteSegmentWriter(create_default_schema())
+    for doc_idx in range(doc_count):
+        words = rng.choices(_VOCABULARY, k=180)
+        title = " ".join(rng.choices(_VOCABULARY, k=3))
+        writer.add_document(
+            {
+                "url": f"https://docs.example.com/guide/page-{doc_idx}/",
+                "url_path": f"/guide/page-{doc_idx}/",
+                "title": title,
+                "headings_h1": title,
+                "headings_h2": " ".join(rng.choices(_VOCABULARY, k=4)),
+                "headings": "",
+                "body": " ".join(words),
+                "path": f"guide/page-{doc_idx}.md",
+                "tags": [],
+                "excerpt": " ".join(words[:20]),
+                "language": "en",
+                "timestamp": 0,
+            }
+        )
+    return SqliteSegmentStore(directory).save(writer.build())
+
+
+def _cold_query(db_path: Path, query: str, limit: int) -> int:
+    segment = SqliteSegmentStore(db_path.parent).load(db_path.stem)
+    if segment is None:
+        return 0
+    try:
+        engine = BM25SearchEngine(
+            segment.schema,
+            field_boosts={field.name: segment.schema.get_boost(field.name) for field in segment.schema.fields},
+            enable_phrase_bonus=True,
+            enable_fuzzy=True,
+        )
+        tokens = engine.tokenize_query(query)
+        ranked = engine.score(segment, tokens, limit=limit)
+        for ranked_doc in ranked:
+            fields = segment.get_document(ranked_doc.doc_id) or {}
+            build_smart_snippet(fields.get("body", ""), list(tokens.ordered_terms), max_chars=200)
+        return len(ranked)
+    finally:
+        segment.close()
+
+
+def _summarize(samples_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(samples_ms)
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+    }
+
+
+def run(doc_count: int, iterations: int, limit: int) -> dict[str, object]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = _build_corpus(Path(tmp_dir), doc_count)
+
+        cold_samples: list[float] = []
+        for idx in range(iterations):
+            start = time.perf_counter()
+            _cold_query(db_path, _QUERIES[idx % len(_QUERIES)], limit)
+            cold_samples.append((time.perf_counter() - start) * 1000)
+
+        resident_samples: list[float] = []
+        with SegmentSearchIndex(db_path, tenant="benchmark") as index:
+            for idx in range(iterations):
+                start = time.perf_counter()
+                index.search(_QUERIES[idx % len(_QUERIES)], limit)
+                resident_samples.append((time.perf_counter() - start) * 1000)
+
+    cold = _summarize(cold_samples)
+    resident = _summarize(resident_samples)
+    return {
+        "docs": doc_count,
+        "iterations": iterations,
+        "limit": limit,
+        "cold": cold,
+        "resident": resident,
+        "p50_speedup": round(cold["p50_ms"] / max(resident["p50_ms"], 1e-9), 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=2000, help="Synthetic documents to index (default: 2000)")
+    parser.add_argument("--iterations", type=int, default=300, help="Queries per path (default: 300)")
+    parser.add_argument("--limit", type=int, default=10, help="Results requested per query (default: 10)")
+    args = parser.parse_args()
+    print(json.dumps(run(args.docs, args.iterations, args.limit), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
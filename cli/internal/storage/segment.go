@@ -5,6 +5,7 @@ package storage
 
 import (
 	"database/sql"
+	"encoding/binary"
 	"encoding/json"
 	"errors"
 	"fmt"
@@ -22,6 +23,11 @@ type Segment struct {
 	db       *sql.DB
 	dbPath   string
 	DocCount int
+
+	// Ordinal-blob segments store postings per (field, term) keyed by doc
+	// ordinal; docIDs maps ordinals back to doc ids and is loaded lazily.
+	ordinalBlobs bool
+	docIDs       []string
 }
 
 // CorpusStats holds aggregate index statistics.
@@ -59,6 +65,10 @@ func OpenSegment(dbPath string) (*Segment, error) {
 		db.Close()
 		return nil, explainBusy(err)
 	}
+	if err := seg.loadPostingsFormat(); err != nil {
+		db.Close()
+		return nil, explainBusy(err)
+	}
 	return seg, nil
 }
 
@@ -99,6 +109,19 @@ func (s *Segment) loadDocCount() error {
 	return nil
 }
 
+func (s *Segment) loadPostingsFormat() error {
+	var val sql.NullString
+	err := s.db.QueryRow("SELECT value FROM metadata WHERE key = 'postings_format'").Scan(&val)
+	if err == sql.ErrNoRows {
+		return nil // row-per-posting segment written before ordinal blobs
+	}
+	if err != nil {
+		return fmt.Errorf("read postings_format: %w", err)
+	}
+	s.ordinalBlobs = val.Valid && val.String == "ordinal-blobs-v2"
+	return nil
+}
+
 // GetCorpusStats returns total docs and average body length.
 func (s *Segment) GetCorpusStats() (CorpusStats, error) {
 	rows, err := s.db.Query("SELECT key, value FROM metadata WHERE key IN ('doc_count', 'body_total_terms')")
@@ -166,6 +189,9 @@ type Postings struct {
 
 // GetPostings retrieves postings for a field/term pair.
 func (s *Segment) GetPostings(field, term string) ([]Postings, error) {
+	if s.ordinalBlobs {
+		return s.getBlobPostings(field, term)
+	}
 	rows, err := s.db.Query(
 		"SELECT doc_id, tf, doc_length FROM postings WHERE field = ? AND term = ?",
 		field, term,
@@ -186,6 +212,110 @@ func (s *Segment) GetPostings(field, term string) ([]Postings, error) {
 	return result, rows.Err()
 }
 
+func (s *Segment) getBlobPostings(field, term string) ([]Postings, error) {
+	var blob []byte
+	err := s.db.QueryRow(
+		"SELECT postings_blob FROM posting_lists WHERE field = ? AND term = ?",
+		field, term,
+	).Scan(&blob)
+	if err == sql.ErrNoRows {
+		return nil, nil
+	}
+	if err != nil {
+		return nil, err
+	}
+	if s.docIDs == nil {
+		if err := s.loadDocOrdinals(); err != nil {
+			return nil, err
+		}
+	}
+	return decodePostingColumns(blob, s.docIDs)
+}
+
+func (s *Segment) loadDocOrdinals() error {
+	rows, err := s.db.Query("SELECT doc_id FROM doc_ordinals ORDER BY ordinal")
+	if err != nil {
+		return fmt.Errorf("read doc_ordinals: %w", err)
+	}
+	defer rows.Close()
+
+	docIDs := make([]string, 0, s.DocCount)
+	for rows.Next() {
+		var docID string
+		if err := rows.Scan(&docID); err != nil {
+			return err
+		}
+		docIDs = append(docIDs, docID)
+	}
+	if err := rows.Err(); err != nil {
+		return err
+	}
+	s.docIDs = docIDs
+	return nil
+}
+
+// decodePostingColumns decodes the columns section of a posting blob. The
+// uvarint header (n, block_size, skip_nbytes, columns_nbytes) is followed by
+// the block skip table, which the CLI does not need, and then per block of
+// block_size postings: ordinal deltas, term frequencies and doc lengths.
+// Ordinal deltas continue across blocks. The trailing positions section is
+// skipped.
+func decodePostingColumns(blob []byte, docIDs []string) ([]Postings, error) {
+	readUvarint := func() (uint64, error) {
+		v, n := binary.Uvarint(blob)
+		if n <= 0 {
+			return 0, errors.New("corrupt posting list")
+		}
+		blob = blob[n:]
+		return v, nil
+	}
+	var header [4]uint64
+	for i := range header {
+		v, err := readUvarint()
+		if err != nil {
+			return nil, err
+		}
+		header[i] = v
+	}
+	count, blockSize, skipBytes := header[0], header[1], header[2]
+	if count > uint64(len(blob)) || skipBytes > uint64(len(blob)) || (count > 0 && blockSize == 0) {
+		return nil, errors.New("corrupt posting list")
+	}
+	blob = blob[skipBytes:]
+
+	result := make([]Postings, count)
+	var ordinal uint64
+	for start := uint64(0); start < count; start += blockSize {
+		block := result[start:min(start+blockSize, count)]
+		for i := range block {
+			delta, err := readUvarint()
+			if err != nil {
+				return nil, err
+			}
+			ordinal += delta
+			if ordinal >= uint64(len(docIDs)) {
+				return nil, fmt.Errorf("posting ordinal %d out of range", ordinal)
+			}
+			block[i].DocID = docIDs[ordinal]
+		}
+		for i := range block {
+			tf, err := readUvarint()
+			if err != nil {
+				return nil, err
+			}
+			block[i].TF = int(tf)
+		}
+		for i := range block {
+			docLength, err := readUvarint()
+			if err != nil {
+				return nil, err
+			}
+			block[i].DocLength = int(docLength)
+		}
+	}
+	return result, nil
+}
+
 // GetDocument retrieves a document by ID.
 func (s *Segment) GetDocument(docID string) (*DocumentFields, error) {
 	var doc DocumentFields
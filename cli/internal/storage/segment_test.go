@@ -146,3 +146,34 @@ func assertReadOnlySegment(t *testing.T, seg *Segment) {
 		t.Fatal("CREATE TABLE on read-only segment succeeded, want error")
 	}
 }
+
+func TestDecodePostingColumnsMatchesPythonCodec(t *testing.T) {
+	// encode_posting_list([0, 2, 300], [1, 3, 1], [5, 200, 7], positions,
+	// block_size=2) from docs_mcp_server.search.posting_codec.
+	blob := []byte{
+		3, 2, 9, 11, // header
+		2, 7, 3, 5, 170, 2, 4, 1, 7, // skip table
+		0, 2, 1, 3, 5, 200, 1, 170, 2, 1, 7, // columns
+		1, 3, 1, 1, 0, 4, 5, 2, // positions
+	}
+	docIDs := make([]string, 301)
+	docIDs[0], docIDs[2], docIDs[300] = "a", "b", "c"
+
+	got, err := decodePostingColumns(blob, docIDs)
+	if err != nil {
+		t.Fatalf("decodePostingColumns: %v", err)
+	}
+	want := []Postings{{"a", 1, 5}, {"b", 3, 200}, {"c", 1, 7}}
+	if len(got) != len(want) {
+		t.Fatalf("got %d postings, want %d", len(got), len(want))
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Errorf("posting %d = %+v, want %+v", i, got[i], want[i])
+		}
+	}
+
+	if _, err := decodePostingColumns(blob, docIDs[:10]); err == nil {
+		t.Error("out-of-range ordinal decoded without error")
+	}
+}
@@ -32,8 +32,14 @@ from docs_mcp_server.observability import (
 )
 from docs_mcp_server.observability.tracing import TraceContextMiddleware
 from docs_mcp_server.runtime.health import build_health_endpoint
-from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore
+from docs_mcp_server.search.indexer import TenantIndexer
+from docs_mcp_server.search.posting_cache import configure_posting_cache
+from docs_mcp_server.search.query_profile import configure_slow_query_log, get_slow_query_log
+from docs_mcp_server.search.result_cache import configure_result_cache
+from docs_mcp_server.search.search_executor import configure_search_executor
+from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter
 from docs_mcp_server.utils.crawl_state_store import DatabaseCriticalError
+from docs_mcp_server.utils.host_politeness import configure_host_politeness
 from docs_mcp_server.utils.sync_scheduler import SyncScheduler
 
 from .config import Settings
@@ -121,6 +127,26 @@ class AppBuilder:
         configure_log_exporter(collector_config)
 
         SqliteSegmentStore.set_max_segments(infra.search_max_segments)
+        SqliteSegmentWriter.set_memory_budget(infra.search_index_memory_mb * 1024 * 1024)
+        TenantIndexer.set_parse_workers(infra.search_index_workers)
+        TenantIndexer.set_max_delta_segments(infra.search_max_delta_segments)
+        configure_search_executor(
+            max_workers=infra.search_executor_workers,
+            max_concurrency_per_tenant=infra.search_max_concurrency_per_tenant,
+            timeout_seconds=infra.search_timeout,
+        )
+        configure_posting_cache(infra.search_posting_cache_mb * 1024 * 1024)
+        configure_result_cache(
+            infra.search_result_cache_entries,
+            infra.search_result_cache_mb * 1024 * 1024,
+            infra.search_result_cache_ttl_seconds,
+        )
+        configure_slow_query_log(infra.search_slow_query_ms, infra.search_slow_query_sample_rate)
+        configure_host_politeness(
+            infra.crawl_host_max_requests_per_second,
+            infra.crawl_host_max_concurrency,
+            infra.crawl_host_latency_target_seconds,
+        )
 
         self._initialize_tenants()
         routes = self._build_routes(infra)
@@ -605,7 +631,15 @@ class AppBuilder:
                 return error
 
             snapshot = await tenant_app.scheduler_service.get_status_snapshot()
-            return JSONResponse({"tenant": tenant_codename, **snapshot, "index": tenant_app.get_index_status()})
+            slow_queries = [entry.as_dict() for entry in get_slow_query_log().entries(tenant_codename)]
+            return JSONResponse(
+                {
+                    "tenant": tenant_codename,
+                    **snapshot,
+                    "index": tenant_app.get_index_status(),
+                    "slow_queries": slow_queries,
+                }
+            )
 
         return sync_status_endpoint
 
@@ -674,6 +708,8 @@ class AppBuilder:
             await ctx.__aenter__()
 
             SyncScheduler.configure_sync_gate(self.deployment_config.infrastructure.sync_concurrency_limit)
+            # Startup indexes are warmed together, before the server takes requests.
+            await asyncio.gather(*(tenant.warm_up() for tenant in self.tenant_apps), return_exceptions=True)
 
             async def _staggered_tenant_init() -> None:
                 for tenant in self.tenant_apps:
@@ -108,7 +108,9 @@ class Settings(BaseSettings):
     # HTTP/Request settings
     http_timeout: int = Field(default=30, ge=1, description="HTTP request timeout in seconds")
     max_concurrent_requests: int = Field(default=10, ge=1, description="Maximum concurrent HTTP requests")
-    request_delay_ms: int = Field(default=100, ge=0, description="Delay between requests in milliseconds")
+    request_delay_ms: int = Field(
+        default=100, ge=0, description="Minimum delay between requests to one host in milliseconds"
+    )
     fetch_user_agent: str | None = Field(default=None, description="Optional User-Agent override for fetches")
 
     # Content settings
@@ -247,10 +247,28 @@ class SearchConfig(BaseModel):
         Field(
             ge=0.0,
             le=3600.0,
-            description="Experimental warm-cache pin duration to keep BM25 segments in memory after warmup",
+            description="Seconds this tenant's cached search results stay pinned, outliving the result cache TTL and LRU",
         ),
     ] = 0.0
 
+    warmup_seconds: Annotated[
+        float,
+        Field(
+            ge=0.0,
+            le=60.0,
+            description="Time budget for warming a newly loaded index with test_queries and hot postings (0 disables)",
+        ),
+    ] = 0.0
+
+    warmup_io_mb: Annotated[
+        int,
+        Field(
+            ge=0,
+            le=4096,
+            description="MiB of the most frequent terms' posting lists to prefetch during warm-up",
+        ),
+    ] = 64
+
 
 class ArticleExtractorFallbackConfig(BaseModel):
     """Configuration for the optional external article extractor fallback."""
@@ -915,10 +933,109 @@ class SharedInfraConfig(BaseModel):
         Field(
             ge=1,
             le=300,
-            description="Search operation timeout in seconds for ripgrep",
+            description="Max seconds a tenant search may wait and run on the search executor",
         ),
     ] = 30
 
+    search_executor_workers: Annotated[
+        int,
+        Field(
+            ge=1,
+            le=64,
+            description="Worker threads shared by all tenants for running searches off the event loop",
+        ),
+    ] = 8
+
+    search_max_concurrency_per_tenant: Annotated[
+        int,
+        Field(
+            ge=1,
+            le=64,
+            description="Max in-flight searches per tenant on the search executor (excess requests queue)",
+        ),
+    ] = 4
+
+    search_posting_cache_mb: Annotated[
+        int,
+        Field(
+            ge=0,
+            le=16384,
+            description="Memory budget in MiB for the decoded posting-list LRU cache shared by all tenants (0 disables)",
+        ),
+    ] = 64
+
+    search_result_cache_entries: Annotated[
+        int,
+        Field(
+            ge=0,
+            le=1_000_000,
+            description="Max search responses kept in the query result cache shared by all tenants (0 disables)",
+        ),
+    ] = 2048
+
+    search_result_cache_mb: Annotated[
+        int,
+        Field(
+            ge=0,
+            le=4096,
+            description="Memory budget in MiB for the query result cache shared by all tenants (0 disables)",
+        ),
+    ] = 16
+
+    search_result_cache_ttl_seconds: Annotated[
+        float,
+        Field(
+            ge=0.0,
+            le=86400.0,
+            description="Seconds a cached search response stays valid unless its tenant pins it longer (0 disables)",
+        ),
+    ] = 300.0
+
+    search_slow_query_ms: Annotated[
+        float,
+        Field(
+            ge=0.0,
+            le=60000.0,
+            description="Scored searches slower than this many milliseconds go to the slow-query log (0 disables)",
+        ),
+    ] = 250.0
+
+    search_slow_query_sample_rate: Annotated[
+        float,
+        Field(
+            ge=0.0,
+            le=1.0,
+            description="Fraction of slow searches recorded in the slow-query log; all are counted in metrics",
+        ),
+    ] = 1.0
+
+    search_index_memory_mb: Annotated[
+        int,
+        Field(
+            ge=8,
+            le=16384,
+            description="Memory budget in MiB for buffered postings while building a segment before runs spill to disk",
+        ),
+    ] = 256
+
+    search_index_workers: Annotated[
+        int,
+        Field(
+            ge=0,
+            le=64,
+            description="Processes that parse and analyze documents during large index builds (0 = auto, 1 = serial)",
+        ),
+    ] = 0
+
+    search_max_delta_segments: Annotated[
+        int,
+        Field(
+            ge=1,
+            le=64,
+            description="Delta segments a tenant may stack over its base segment before a background compaction",
+        ),
+    ] = 8
+
     # Default context configuration (can be overridden per tenant)
     default_snippet_surrounding_chars: Annotated[
         int,
@@ -944,6 +1061,69 @@ class SharedInfraConfig(BaseModel):
         ),
     ] = 45
 
+    crawl_host_max_requests_per_second: Annotated[
+        float,
+        Field(
+            ge=0.1,
+            le=1000.0,
+            description="Highest request rate the crawler adapts up to against one host, shared by all tenants",
+        ),
+    ] = 10.0
+
+    crawl_host_max_concurrency: Annotated[
+        int,
+        Field(
+            ge=1,
+            le=64,
+            description="Highest number of concurrent requests the crawler adapts up to against one host",
+        ),
+    ] = 8
+
+    crawl_host_latency_target_seconds: Annotated[
+        float,
+        Field(
+            ge=0.0,
+            le=120.0,
+            description="Average response time above which the crawler slows down against a host (0 disables)",
+        ),
+    ] = 5.0
+
+    crawl_event_flush_size: Annotated[
+        int,
+        Field(
+            ge=1,
+            le=10000,
+            description="Buffered crawl events that trigger a group commit to the crawl state database",
+        ),
+    ] = 256
+
+    crawl_event_flush_interval_seconds: Annotated[
+        float,
+        Field(
+            ge=0.0,
+            le=60.0,
+            description="Longest a buffered crawl event waits before it is committed (0 writes each event at once)",
+        ),
+    ] = 1.0
+
+    crawl_event_sample_rates: Annotated[
+        dict[str, float],
+        Field(
+            description="Fraction of crawl event rows kept per event type; per-URL counters still count every event",
+            examples=[{"process_start": 0.1, "skip_recent": 0.0}],
+        ),
+    ] = Field(default_factory=dict)
+
+    @field_validator("crawl_event_sample_rates")
+    @classmethod
+    def validate_crawl_event_sample_rates(cls, value: dict[str, float]) -> dict[str, float]:
+        """Validate that every sample rate is between 0.0 and 1.0."""
+        invalid = {event_type: rate for event_type, rate in value.items() if not 0.0 <= rate <= 1.0}
+        if invalid:
+            details = ", ".join(f"{event_type}={rate}" for event_type, rate in invalid.items())
+            raise ValueError(f"crawl_event_sample_rates values must be between 0.0 and 1.0; got: {details}")
+        return value
+
     fallback_extractor_url: Annotated[
         str | None,
         Field(
@@ -10,7 +10,10 @@ from docs_mcp_server.observability.logging import (
 from docs_mcp_server.observability.metrics import (
     REQUEST_COUNT,
     REQUEST_LATENCY,
+    SEARCH_ACTIVE,
     SEARCH_LATENCY,
+    SEARCH_QUEUE_DEPTH,
+    SEARCH_TIMEOUTS,
     configure_metrics_exporter,
     get_metrics,
     get_metrics_content_type,
@@ -29,7 +32,10 @@ from docs_mcp_server.observability.tracing import (
 __all__ = [
     "REQUEST_COUNT",
     "REQUEST_LATENCY",
+    "SEARCH_ACTIVE",
     "SEARCH_LATENCY",
+    "SEARCH_QUEUE_DEPTH",
+    "SEARCH_TIMEOUTS",
     "JsonFormatter",
     "build_trace_resource_attributes",
     "configure_log_exporter",
@@ -206,6 +206,115 @@ _SEARCH_LATENCY_PROM = Histogram(
     buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5),
 )
 
+_SEARCH_QUEUE_DEPTH_PROM = Gauge(
+    "search_queue_depth",
+    "Searches waiting for a per-tenant search executor slot",
+    ["tenant"],
+)
+
+_SEARCH_ACTIVE_PROM = Gauge(
+    "search_active",
+    "Searches currently running on a search executor worker",
+    ["tenant"],
+)
+
+_SEARCH_TIMEOUTS_PROM = Counter(
+    "search_timeouts_total",
+    "Searches abandoned after exceeding search_timeout",
+    ["tenant"],
+)
+
+_POSTING_CACHE_HITS_PROM = Counter(
+    "search_posting_cache_hits_total",
+    "Posting list lookups served from the in-memory posting cache",
+    ["field"],
+)
+
+_POSTING_CACHE_MISSES_PROM = Counter(
+    "search_posting_cache_misses_total",
+    "Posting list lookups that had to be read from the segment database",
+    ["field"],
+)
+
+_POSTING_CACHE_BYTES_PROM = Gauge(
+    "search_posting_cache_bytes",
+    "Approximate bytes held by the in-memory posting cache",
+    ["field"],
+)
+
+_SEARCH_RESULT_CACHE_HITS_PROM = Counter(
+    "search_result_cache_hits_total",
+    "Searches answered from the query result cache",
+    ["tenant"],
+)
+
+_SEARCH_RESULT_CACHE_MISSES_PROM = Counter(
+    "search_result_cache_misses_total",
+    "Searches that missed the query result cache and were scored",
+    ["tenant"],
+)
+
+_SEARCH_RESULT_CACHE_HIT_RATIO_PROM = Gauge(
+    "search_result_cache_hit_ratio",
+    "Fraction of searches answered from the query result cache since startup",
+    ["tenant"],
+)
+
+_SEARCH_WARMUP_SECONDS_PROM = Gauge(
+    "search_warmup_seconds",
+    "Seconds spent warming the tenant's most recently loaded search index",
+    ["tenant"],
+)
+
+_SEARCH_STAGE_SECONDS_PROM = Histogram(
+    "search_stage_seconds",
+    "Time each search stage spent on a scored query",
+    ["stage"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+_SEARCH_POSTINGS_SCANNED_PROM = Counter(
+    "search_postings_scanned_total",
+    "Postings scored by search queries",
+    ["tenant"],
+)
+
+_SEARCH_SQL_STATEMENTS_PROM = Counter(
+    "search_sql_statements_total",
+    "SQL statements issued against segment databases by search queries",
+    ["tenant"],
+)
+
+_SEARCH_SLOW_QUERIES_PROM = Counter(
+    "search_slow_queries_total",
+    "Search queries slower than search_slow_query_ms",
+    ["tenant"],
+)
+
+_CRAWL_HOST_RATE_PROM = Gauge(
+    "crawl_host_rate_per_second",
+    "Requests per second the crawler currently allows against a host",
+    ["host"],
+)
+
+_CRAWL_HOST_CONCURRENCY_PROM = Gauge(
+    "crawl_host_concurrency_limit",
+    "Concurrent requests the crawler currently allows against a host",
+    ["host"],
+)
+
+_CRAWL_HOST_BACKOFF_PROM = Gauge(
+    "crawl_host_backoff_seconds",
+    "Seconds the crawler was told to wait before its next request to a host",
+    ["host"],
+)
+
+_CRAWL_HOST_THROTTLED_PROM = Counter(
+    "crawl_host_throttled_total",
+    "Responses that made the crawler slow down against a host",
+    ["host", "reason"],
+)
+
 _OTLP_EXPORT_ERRORS_PROM = Counter(
     "otlp_export_errors_total",
     "Total OTLP export configuration errors",
@@ -239,6 +348,132 @@ SEARCH_LATENCY = MetricBridge(
     otel_kind="histogram",
 )
 
+SEARCH_QUEUE_DEPTH = MetricBridge(
+    _SEARCH_QUEUE_DEPTH_PROM,
+    otel_name="search_queue_depth",
+    otel_description="Searches waiting for a per-tenant search executor slot",
+    otel_kind="gauge",
+)
+
+SEARCH_ACTIVE = MetricBridge(
+    _SEARCH_ACTIVE_PROM,
+    otel_name="search_active",
+    otel_description="Searches currently running on a search executor worker",
+    otel_kind="gauge",
+)
+
+SEARCH_TIMEOUTS = MetricBridge(
+    _SEARCH_TIMEOUTS_PROM,
+    otel_name="search_timeouts_total",
+    otel_description="Searches abandoned after exceeding search_timeout",
+    otel_kind="counter",
+)
+
+POSTING_CACHE_HITS = MetricBridge(
+    _POSTING_CACHE_HITS_PROM,
+    otel_name="search_posting_cache_hits_total",
+    otel_description="Posting list lookups served from the in-memory posting cache",
+    otel_kind="counter",
+)
+
+POSTING_CACHE_MISSES = MetricBridge(
+    _POSTING_CACHE_MISSES_PROM,
+    otel_name="search_posting_cache_misses_total",
+    otel_description="Posting list lookups that had to be read from the segment database",
+    otel_kind="counter",
+)
+
+POSTING_CACHE_BYTES = MetricBridge(
+    _POSTING_CACHE_BYTES_PROM,
+    otel_name="search_posting_cache_bytes",
+    otel_description="Approximate bytes held by the in-memory posting cache",
+    otel_kind="gauge",
+)
+
+SEARCH_RESULT_CACHE_HITS = MetricBridge(
+    _SEARCH_RESULT_CACHE_HITS_PROM,
+    otel_name="search_result_cache_hits_total",
+    otel_description="Searches answered from the query result cache",
+    otel_kind="counter",
+)
+
+SEARCH_RESULT_CACHE_MISSES = MetricBridge(
+    _SEARCH_RESULT_CACHE_MISSES_PROM,
+    otel_name="search_result_cache_misses_total",
+    otel_description="Searches that missed the query result cache and were scored",
+    otel_kind="counter",
+)
+
+SEARCH_RESULT_CACHE_HIT_RATIO = MetricBridge(
+    _SEARCH_RESULT_CACHE_HIT_RATIO_PROM,
+    otel_name="search_result_cache_hit_ratio",
+    otel_description="Fraction of searches answered from the query result cache since startup",
+    otel_kind="gauge",
+)
+
+SEARCH_WARMUP_SECONDS = MetricBridge(
+    _SEARCH_WARMUP_SECONDS_PROM,
+    otel_name="search_warmup_seconds",
+    otel_description="Seconds spent warming the tenant's most recently loaded search index",
+    otel_kind="gauge",
+)
+
+SEARCH_STAGE_SECONDS = MetricBridge(
+    _SEARCH_STAGE_SECONDS_PROM,
+    otel_name="search_stage_seconds",
+    otel_description="Time each search stage spent on a scored query",
+    otel_kind="histogram",
+)
+
+SEARCH_POSTINGS_SCANNED = MetricBridge(
+    _SEARCH_POSTINGS_SCANNED_PROM,
+    otel_name="search_postings_scanned_total",
+    otel_description="Postings scored by search queries",
+    otel_kind="counter",
+)
+
+SEARCH_SQL_STATEMENTS = MetricBridge(
+    _SEARCH_SQL_STATEMENTS_PROM,
+    otel_name="search_sql_statements_total",
+    otel_description="SQL statements issued against segment databases by search queries",
+    otel_kind="counter",
+)
+
+SEARCH_SLOW_QUERIES = MetricBridge(
+    _SEARCH_SLOW_QUERIES_PROM,
+    otel_name="search_slow_queries_total",
+    otel_description="Search queries slower than search_slow_query_ms",
+    otel_kind="counter",
+)
+
+CRAWL_HOST_RATE = MetricBridge(
+    _CRAWL_HOST_RATE_PROM,
+    otel_name="crawl_host_rate_per_second",
+    otel_description="Requests per second the crawler currently allows against a host",
+    otel_kind="gauge",
+)
+
+CRAWL_HOST_CONCURRENCY = MetricBridge(
+    _CRAWL_HOST_CONCURRENCY_PROM,
+    otel_name="crawl_host_concurrency_limit",
+    otel_description="Concurrent requests the crawler currently allows against a host",
+    otel_kind="gauge",
+)
+
+CRAWL_HOST_BACKOFF = MetricBridge(
+    _CRAWL_HOST_BACKOFF_PROM,
+    otel_name="crawl_host_backoff_seconds",
+    otel_description="Seconds the crawler was told to wait before its next request to a host",
+    otel_kind="gauge",
+)
+
+CRAWL_HOST_THROTTLED = MetricBridge(
+    _CRAWL_HOST_THROTTLED_PROM,
+    otel_name="crawl_host_throttled_total",
+    otel_description="Responses that made the crawler slow down against a host",
+    otel_kind="counter",
+)
+
 OTLP_EXPORT_ERRORS = MetricBridge(
     _OTLP_EXPORT_ERRORS_PROM,
     otel_name="otlp_export_errors_total",
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
+from docs_mcp_server.tenant_routing import TenantRoutingIndex
+
 
 if TYPE_CHECKING:
     from docs_mcp_server.deployment_config import TenantConfig
@@ -179,6 +181,7 @@ class TenantRegistry:
         self._tenants: dict[str, TenantApp] = {}
         self._configs: dict[str, TenantConfig] = {}
         self._metadata_cache: dict[str, TenantMetadata] = {}
+        self._routing_index: TenantRoutingIndex | None = None
 
     def register(self, config: "TenantConfig", tenant_app: "TenantApp") -> None:
         """Register a tenant application.
@@ -190,8 +193,9 @@ class TenantRegistry:
         codename = config.codename
         self._tenants[codename] = tenant_app
         self._configs[codename] = config
-        # Clear cached metadata (will be regenerated on next access)
+        # Clear cached metadata and routing index (regenerated on next access)
         self._metadata_cache.pop(codename, None)
+        self._routing_index = None
 
     def get_tenant(self, codename: str) -> "TenantApp | None":
         """Get tenant application by codename.
@@ -236,6 +240,19 @@ class TenantRegistry:
                 result.append(metadata)
         return result
 
+    def routing_index(self) -> TenantRoutingIndex:
+        """Get the immutable find_tenant routing index over all registered tenants.
+
+        Built on first access after registration and reused until the next
+        ``register`` call.
+
+        Returns:
+            TenantRoutingIndex covering every registered tenant
+        """
+        if self._routing_index is None:
+            self._routing_index = TenantRoutingIndex(self.list_tenants())
+        return self._routing_index
+
     def list_codenames(self) -> list[str]:
         """List all registered tenant codenames.
 
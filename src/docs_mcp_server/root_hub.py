@@ -1,5 +1,6 @@
 """RootHub - Single entry point for all documentation tenants."""
 
+import asyncio
 import logging
 from typing import Annotated, Any
 
@@ -8,83 +9,132 @@ from opentelemetry.trace import SpanKind
 
 from docs_mcp_server.observability import REQUEST_COUNT, REQUEST_LATENCY, track_latency
 from docs_mcp_server.observability.tracing import create_span
-from docs_mcp_server.registry import TenantMetadata, TenantRegistry
-from docs_mcp_server.search.fuzzy import levenshtein_distance
-from docs_mcp_server.utils.models import FetchDocResponse, SearchDocsResponse
+from docs_mcp_server.registry import TenantRegistry
+from docs_mcp_server.utils.models import (
+    FederatedSearchResponse,
+    FederatedSearchResult,
+    FetchDocResponse,
+    SearchDocsResponse,
+)
 
 
 logger = logging.getLogger(__name__)
 
+_TENANT_MATCH_THRESHOLD = 0.1
+
+# root_search_all fan-out limits.
+_FEDERATED_MAX_TENANTS = 20
+_FEDERATED_MAX_CONCURRENCY = 8
+_FEDERATED_DEADLINE_S = 10.0
+
+# Cross-tenant score blend, kept in step with cli/internal/engine/search_all.go:
+# tenant match bonus + BM25 normalized by the tenant's best hit + dampened raw BM25.
+_TENANT_BOOST_WEIGHT = 1.0
+_NORMALIZED_SCORE_WEIGHT = 0.3
+_RAW_SCORE_WEIGHT = 0.2
+_RAW_SCORE_DAMPING = 100.0
+
 
 def _format_missing_tenant_error(registry: TenantRegistry, codename: str) -> str:
     available = ", ".join(registry.list_codenames())
     return f"Tenant '{codename}' not found. Available: {available}"
 
 
-def _score_tenant_match(metadata: TenantMetadata, query: str) -> float:
-    """Score how well a tenant matches a search query.
+def _select_federated_targets(
+    registry: TenantRegistry, query: str, tenant_codenames: list[str] | None, max_tenants: int
+) -> list[tuple[str, float]]:
+    """Pick the tenants root_search_all fans out to, each with its query match boost.
 
-    Uses a combination of exact matching and fuzzy (Levenshtein) distance
-    to score tenant metadata fields against the query.
-
-    Returns:
-        Score from 0.0 to 1.0, higher is better match.
+    Explicit codenames are searched as given. Otherwise the best ``max_tenants``
+    matches of the query against tenant metadata are used, falling back to the
+    first ``max_tenants`` registered tenants when nothing matches.
     """
-    query_lower = query.lower()
-    query_terms = query_lower.split()
-
-    # Collect all searchable text from tenant metadata
-    searchable_fields: list[tuple[str, float]] = [
-        (metadata.codename.lower(), 3.0),  # Codename gets highest weight
-        (metadata.display_name.lower(), 2.5),
-        (metadata.description.lower(), 1.5),
-        (metadata.source_type.lower(), 0.5),
-    ]
-
-    # Add URL prefixes and test queries
-    searchable_fields.extend((url.lower(), 1.0) for url in metadata.url_prefixes)
-    searchable_fields.extend((tq.lower(), 1.0) for tq in metadata.test_queries)
-
-    best_score = 0.0
-
-    for field_text, weight in searchable_fields:
-        # Exact substring match (strongest signal)
-        if query_lower in field_text:
-            # Full query matches exactly
-            score = 1.0 * weight
-            best_score = max(best_score, score)
-            continue
-
-        # Check if field text contains query as whole word
-        if any(query_lower == word for word in field_text.split()):
-            score = 0.95 * weight
-            best_score = max(best_score, score)
+    scores = registry.routing_index().score(query)
+    if tenant_codenames:
+        return [(codename, scores.get(codename, 0.0)) for codename in dict.fromkeys(tenant_codenames)]
+
+    matches = [target for target in scores.items() if target[1] > _TENANT_MATCH_THRESHOLD]
+    if not matches:
+        return [(codename, 0.0) for codename in scores][:max_tenants]
+    matches.sort(key=lambda target: target[1], reverse=True)
+    return matches[:max_tenants]
+
+
+def _merge_federated_results(
+    responses: dict[str, SearchDocsResponse], boosts: dict[str, float], size: int
+) -> list[FederatedSearchResult]:
+    """Merge per-tenant results into one ranking of comparable scores."""
+    merged: list[FederatedSearchResult] = []
+    for codename, response in responses.items():
+        raw_scores = [result.score or 0.0 for result in response.results]
+        best = max(raw_scores, default=0.0)
+        if best <= 0:
             continue
+        for result, raw in zip(response.results, raw_scores, strict=True):
+            score = (
+                boosts.get(codename, 0.0) * _TENANT_BOOST_WEIGHT
+                + (raw / best) * _NORMALIZED_SCORE_WEIGHT
+                + (raw / (raw + _RAW_SCORE_DAMPING)) * _RAW_SCORE_WEIGHT
+            )
+            merged.append(
+                FederatedSearchResult(
+                    url=result.url, title=result.title, snippet=result.snippet, score=round(score, 4), tenant=codename
+                )
+            )
+    merged.sort(key=lambda result: result.score, reverse=True)
+    return merged[:size]
+
+
+async def _fan_out_search(
+    tenant_apps: dict[str, Any],
+    query: str,
+    size: int,
+    word_match: bool,
+    *,
+    deadline_seconds: float,
+    max_concurrency: int,
+    ctx: Context | None = None,
+) -> tuple[dict[str, SearchDocsResponse], list[str]]:
+    """Search tenants in parallel, returning whatever finished by the deadline plus the tenants still pending."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _search_one(tenant_app: Any) -> SearchDocsResponse:
+        async with semaphore:
+            return await tenant_app.search(query=query, size=size, word_match=word_match)
+
+    tasks = {
+        asyncio.create_task(_search_one(tenant_app), name=f"search-all-{codename}"): codename
+        for codename, tenant_app in tenant_apps.items()
+    }
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + deadline_seconds
+    responses: dict[str, SearchDocsResponse] = {}
+    pending = set(tasks)
+    while pending:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            codename = tasks[task]
+            try:
+                responses[codename] = task.result()
+            except Exception as exc:
+                logger.warning("root_search_all: search failed for tenant %s: %s", codename, exc)
+                responses[codename] = SearchDocsResponse(results=[], error=f"Search failed: {exc!s}", query=query)
+            if ctx is not None:
+                await ctx.report_progress(
+                    progress=len(responses),
+                    total=len(tasks),
+                    message=f"{codename}: {len(responses[codename].results)} results",
+                )
 
-        # Term-by-term matching for multi-word queries
-        term_scores = []
-        for term in query_terms:
-            if term in field_text:
-                term_scores.append(0.8)
-            else:
-                # Fuzzy match against words in field
-                field_words = field_text.replace("-", " ").replace("_", " ").split()
-                best_fuzzy = 0.0
-                for word in field_words:
-                    if len(term) >= 3 and len(word) >= 3:
-                        distance = levenshtein_distance(term, word, max_distance=2)
-                        if distance <= 2:
-                            # Convert distance to score: 0 dist = 0.7, 1 dist = 0.5, 2 dist = 0.3
-                            fuzzy_score = max(0.0, 0.7 - (distance * 0.2))
-                            best_fuzzy = max(best_fuzzy, fuzzy_score)
-                term_scores.append(best_fuzzy)
-
-        if term_scores:
-            avg_term_score = sum(term_scores) / len(term_scores)
-            score = avg_term_score * weight
-            best_score = max(best_score, score)
-
-    return min(best_score, 1.0)  # Cap at 1.0
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    timed_out = [codename for task, codename in tasks.items() if task in pending]
+    return responses, timed_out
 
 
 def create_root_hub(registry: TenantRegistry) -> FastMCP:
@@ -92,7 +142,8 @@ def create_root_hub(registry: TenantRegistry) -> FastMCP:
 
     instructions = (
         f"Docs Hub exposing {len(registry)} documentation sources. "
-        "List tenants, pick a codename, then call root_search/root_fetch."
+        "List tenants, pick a codename, then call root_search/root_fetch, "
+        "or root_search_all to search several tenants at once."
     )
 
     mcp = FastMCP(
@@ -101,6 +152,8 @@ def create_root_hub(registry: TenantRegistry) -> FastMCP:
         mask_error_details=True,
     )
 
+    # Build the find_tenant routing index now rather than on the first call.
+    registry.routing_index()
     _register_discovery_tools(mcp, registry)
     _register_proxy_tools(mcp, registry)
     return mcp
@@ -189,20 +242,8 @@ def _register_discovery_tools(mcp: FastMCP, registry: TenantRegistry) -> None:
                 attributes={"search.query": query[:100], "mcp.tool.name": tool_name},
             ) as span,
         ):
-            all_tenants = registry.list_tenants()
-
-            # Score and rank tenants
-            scored_tenants: list[tuple[TenantMetadata, float]] = []
-            for tenant in all_tenants:
-                score = _score_tenant_match(tenant, query)
-                if score > 0.1:  # Minimum threshold
-                    scored_tenants.append((tenant, score))
-
-            # Sort by score descending
-            scored_tenants.sort(key=lambda x: x[1], reverse=True)
-
-            # Take top 10 results
-            top_results = scored_tenants[:10]
+            # Routing index scores match codename, names, description, URLs and test queries (typo tolerant)
+            top_results = registry.routing_index().match(query, threshold=_TENANT_MATCH_THRESHOLD, limit=10)
 
             span.set_attribute("search.result_count", len(top_results))
             logger.info(
@@ -333,6 +374,98 @@ def _register_proxy_tools(mcp: FastMCP, registry: TenantRegistry) -> None:
             REQUEST_COUNT.labels(tenant=tenant_codename, tool=tool_name, status="ok").inc()
             return result
 
+    @mcp.tool(name="root_search_all", annotations={"title": "Search Across Docs", "readOnlyHint": True})
+    async def root_search_all(
+        query: Annotated[str, "Search query - use specific terms, not vague descriptions"],
+        tenant_codenames: Annotated[
+            list[str] | None, "Tenants to search (default: the best find_tenant matches for the query)"
+        ] = None,
+        size: Annotated[int, "Number of merged results to return (default: 10, max: 100)"] = 10,
+        max_tenants: Annotated[int, "Tenants to search if none are given (default: 5, max: 20)"] = 5,
+        word_match: Annotated[bool, "Enable whole-word matching for exact phrases"] = False,
+        ctx: Context | None = None,
+    ) -> FederatedSearchResponse:
+        """Search several documentation tenants at once and merge the results.
+
+        Replaces a find_tenant + repeated root_search sequence. Tenants are
+        searched in parallel under a global deadline; results from tenants
+        that finish in time are merged, tenants whose search errored are
+        listed in tenants_failed, and the rest in tenants_timed_out. Each
+        result names its tenant for root_fetch.
+
+        Examples:
+            root_search_all("dependency injection")
+            root_search_all("serializer validation", tenant_codenames=["drf", "django"])
+
+        Returns:
+            {
+                "results": [
+                    {"url": "https://...", "title": "Serializers", "snippet": "...", "score": 1.42, "tenant": "drf"},
+                    ...
+                ],
+                "tenants_searched": ["drf", "django"],
+                "tenants_failed": {},
+                "tenants_timed_out": []
+            }
+        """
+        tool_name = "root_search_all"
+        with (
+            track_latency(REQUEST_LATENCY, tenant="root", tool=tool_name),
+            create_span(
+                "mcp.tool.root_search_all",
+                kind=SpanKind.INTERNAL,
+                attributes={"search.query": query[:100], "mcp.tool.name": tool_name},
+            ) as span,
+        ):
+            size = max(1, min(size, 100))
+            max_tenants = max(1, min(max_tenants, _FEDERATED_MAX_TENANTS))
+            targets = _select_federated_targets(registry, query, tenant_codenames, max_tenants)
+            unknown = [codename for codename, _ in targets if registry.get_tenant(codename) is None]
+            if unknown:
+                span.set_attribute("error", True)
+                logger.warning("root_search_all called with unknown tenants: %s", ", ".join(unknown))
+                REQUEST_COUNT.labels(tenant="root", tool=tool_name, status="error").inc()
+                return FederatedSearchResponse(
+                    error="; ".join(_format_missing_tenant_error(registry, codename) for codename in unknown),
+                    query=query,
+                )
+
+            boosts = dict(targets)
+            tenant_apps = {codename: registry.get_tenant(codename) for codename in boosts}
+            logger.info(
+                "root_search_all called - query='%s', tenants=%s, size=%d", query[:50], ",".join(tenant_apps), size
+            )
+            responses, timed_out = await _fan_out_search(
+                tenant_apps,
+                query,
+                size,
+                word_match,
+                deadline_seconds=_FEDERATED_DEADLINE_S,
+                max_concurrency=_FEDERATED_MAX_CONCURRENCY,
+                ctx=ctx,
+            )
+            failed = {codename: response.error for codename, response in responses.items() if response.error}
+            succeeded = {codename: response for codename, response in responses.items() if codename not in failed}
+            results = _merge_federated_results(succeeded, boosts, size)
+            span.set_attribute("search.result_count", len(results))
+            span.set_attribute("search.tenant_count", len(tenant_apps))
+            span.set_attribute("search.tenants_failed", len(failed))
+            span.set_attribute("search.tenants_timed_out", len(timed_out))
+            logger.info(
+                "root_search_all completed - searched=%d, failed=%d, timed_out=%d, results=%d",
+                len(succeeded),
+                len(failed),
+                len(timed_out),
+                len(results),
+            )
+            REQUEST_COUNT.labels(tenant="root", tool=tool_name, status="ok").inc()
+            return FederatedSearchResponse(
+                results=results,
+                tenants_searched=[codename for codename in tenant_apps if codename in succeeded],
+                tenants_failed={codename: failed[codename] for codename in tenant_apps if codename in failed},
+                tenants_timed_out=timed_out,
+            )
+
     @mcp.tool(name="root_fetch", annotations={"title": "Fetch Doc Page", "readOnlyHint": True})
     async def root_fetch(
         tenant_codename: Annotated[str, "Tenant codename (same as used in search)"],
@@ -4,12 +4,19 @@ This module intentionally mirrors Whoosh's composable tokenizer/filter design
 without pulling in heavy dependencies. The analyzers defined here are used by
 schema field definitions to transform raw text into tokens suitable for
 ranking.
+
+Indexing and query analysis only need each token's text and position, and
+positions are always renumbered 0..n-1 after filtering. The ``terms`` fast
+path therefore returns just the token texts in position order, produced by a
+single regex, lowercase and stopword pass with a memoized stemmer, without
+allocating a ``Token`` per word.
 """
 
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, MutableMapping, Sequence
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 import re
 from typing import Any, Protocol
 
@@ -44,6 +51,10 @@ class Analyzer(Protocol):
     def __call__(self, text: str) -> list[Token]:  # pragma: no cover - interface definition
         ...
 
+    def terms(self, text: str) -> list[str]:  # pragma: no cover - interface definition
+        """Token texts in position order (a term's position is its index)."""
+        ...
+
 
 class Tokenizer(Protocol):
     """Protocol implemented by tokenizers."""
@@ -153,6 +164,9 @@ _SUFFIX_RULES: tuple[tuple[str, str], ...] = (
 
 _SIMPLE_SUFFIXES: tuple[str, ...] = ("ingly", "edly", "ing", "ed", "ly", "es", "s")
 
+# Distinct words seen while indexing a corpus; each entry costs ~200 bytes.
+_STEM_CACHE_SIZE = 65536
+
 
 class StopFilter:
     """Removes stopwords from the stream."""
@@ -180,18 +194,20 @@ class PorterStemFilter:
 
 def _build_porter_stemmer() -> Callable[[str], str]:
     """Return a very small Porter-like stemmer suited for docs search."""
+    return _stem_word
 
-    def stem(word: str) -> str:
-        lower = word.lower()
-        candidate = _strip_complex_suffix(lower)
-        if candidate:
-            return candidate
-        fallback = _strip_simple_suffix(lower)
-        if fallback:
-            return fallback
-        return lower
 
-    return stem
+@lru_cache(maxsize=_STEM_CACHE_SIZE)
+def _stem_word(word: str) -> str:
+    """Stem one word; memoized because docs repeat the same words constantly."""
+    lower = word.lower()
+    candidate = _strip_complex_suffix(lower)
+    if candidate:
+        return candidate
+    fallback = _strip_simple_suffix(lower)
+    if fallback:
+        return fallback
+    return lower
 
 
 def _strip_complex_suffix(lower: str) -> str | None:
@@ -228,6 +244,20 @@ class AnalyzerPipeline:
             token.position = idx
         return tokens
 
+    def terms(self, text: str) -> list[str]:
+        return [token.text for token in self(text)]
+
+
+def _lowercase_words(pattern: re.Pattern[str], text: str) -> list[str]:
+    """Regex matches of ``pattern`` in ``text``, lowercased.
+
+    ASCII text is lowercased in one pass before matching; other text is
+    lowercased per match, since lowercasing can change what the pattern splits.
+    """
+    if text.isascii():
+        return pattern.findall(text.lower())
+    return [word.lower() for word in pattern.findall(text)]
+
 
 class KeywordAnalyzer:
     """Analyzer that treats the entire input as a single token."""
@@ -237,6 +267,9 @@ class KeywordAnalyzer:
             return []
         return [Token(text=text, position=0, start_char=0, end_char=len(text))]
 
+    def terms(self, text: str) -> list[str]:
+        return [text] if text else []
+
 
 class PathAnalyzer:
     """Analyzer for URL paths - splits on slashes and lowercases.
@@ -286,6 +319,13 @@ class PathAnalyzer:
 
         return tokens
 
+    def terms(self, text: str) -> list[str]:
+        if not text:
+            return []
+        if "/" not in text:
+            return self._fallback_analyzer.terms(text)
+        return [segment.lower() for segment in text.split("/") if segment]
+
 
 class StandardAnalyzer:
     """Default analyzer wired into the schema."""
@@ -296,14 +336,27 @@ class StandardAnalyzer:
         stopwords: Sequence[str] | None = None,
         apply_stemming: bool = True,
     ) -> None:
-        filters: list[TokenFilter] = [LowercaseFilter(), StopFilter(stopwords)]
+        stop_filter = StopFilter(stopwords)
+        filters: list[TokenFilter] = [LowercaseFilter(), stop_filter]
         if apply_stemming:
             filters.append(PorterStemFilter())
-        self.pipeline = AnalyzerPipeline(RegexTokenizer(), filters)
+        tokenizer = RegexTokenizer()
+        self.pipeline = AnalyzerPipeline(tokenizer, filters)
+        self._pattern = tokenizer.pattern
+        self._stopwords = frozenset(stop_filter.stopwords)
+        self._stem = _stem_word if apply_stemming else None
 
     def __call__(self, text: str) -> list[Token]:
         return self.pipeline(text)
 
+    def terms(self, text: str) -> list[str]:
+        stopwords = self._stopwords
+        words = _lowercase_words(self._pattern, text)
+        stem = self._stem
+        if stem is None:
+            return [word for word in words if word not in stopwords]
+        return [stem(word) for word in words if word not in stopwords]
+
 
 class CodeTokenizer:
     """Tokenizer for code documentation that preserves technical patterns.
@@ -342,13 +395,19 @@ class CodeFriendlyAnalyzer:
     """
 
     def __init__(self, *, stopwords: Sequence[str] | None = None) -> None:
-        filters: list[TokenFilter] = [LowercaseFilter(), StopFilter(stopwords)]
+        stop_filter = StopFilter(stopwords)
+        filters: list[TokenFilter] = [LowercaseFilter(), stop_filter]
         # No stemming - code tokens should match exactly
         self.pipeline = AnalyzerPipeline(CodeTokenizer(), filters)
+        self._stopwords = frozenset(stop_filter.stopwords)
 
     def __call__(self, text: str) -> list[Token]:
         return self.pipeline(text)
 
+    def terms(self, text: str) -> list[str]:
+        stopwords = self._stopwords
+        return [word for word in _lowercase_words(CodeTokenizer._CODE_PATTERN, text) if word not in stopwords]
+
 
 _ANALYZER_FACTORIES: dict[str, Callable[[], Analyzer]] = {
     "default": lambda: StandardAnalyzer(),
@@ -362,12 +421,20 @@ _ANALYZER_FACTORIES: dict[str, Callable[[], Analyzer]] = {
 
 
 def get_analyzer(name: str | None) -> Analyzer:
-    """Return analyzer by name, defaulting to the standard analyzer."""
+    """Return analyzer by name, defaulting to the standard analyzer.
+
+    Analyzers are stateless, so one shared instance per name is returned.
+    """
 
     if name is None:
-        return _ANALYZER_FACTORIES["default"]()
+        return _shared_analyzer(_ANALYZER_FACTORIES["default"])
     normalized = name.lower()
     if normalized not in _ANALYZER_FACTORIES:
         msg = f"Unknown analyzer '{name}'. Available: {sorted(_ANALYZER_FACTORIES)}"
         raise ValueError(msg)
-    return _ANALYZER_FACTORIES[normalized]()
+    return _shared_analyzer(_ANALYZER_FACTORIES[normalized])
+
+
+@cache
+def _shared_analyzer(factory: Callable[[], Analyzer]) -> Analyzer:
+    return factory()
@@ -2,25 +2,40 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
-import heapq
 from types import MappingProxyType
 
+import numpy as np
+
 from docs_mcp_server.search.analyzers import get_analyzer
 from docs_mcp_server.search.fuzzy import find_fuzzy_matches
-from docs_mcp_server.search.models import Posting
-from docs_mcp_server.search.phrase import get_min_span
+from docs_mcp_server.search.models import Posting, PostingColumns
+from docs_mcp_server.search.phrase import get_min_span, has_phrase, parse_phrases, strip_phrases
+from docs_mcp_server.search.posting_codec import PostingBlocks
+from docs_mcp_server.search.query_profile import (
+    FUZZY,
+    PHRASE,
+    SCORING,
+    SYNONYMS,
+    TOKENIZE,
+    count_postings,
+    stage,
+    timed_stage,
+)
 from docs_mcp_server.search.schema import Schema
 from docs_mcp_server.search.sqlite_storage import SqliteSegment
-from docs_mcp_server.search.stats import FieldLengthStats, bm25, calculate_idf
+from docs_mcp_server.search.stats import FieldLengthStats, bm25_weights, calculate_idf
 from docs_mcp_server.search.synonyms import expand_query_terms
 
 
 # Fuzzy match scores are discounted to prefer exact matches
 _FUZZY_DISCOUNT = 0.8
 
+# Pruning compares float sums accumulated in a different order than the final
+# scores; this relative slack keeps rounding from ever dropping a true top-k doc.
+_PRUNING_SLACK = 1e-9
+
 
 @dataclass(frozen=True)
 class RankedDocument:
@@ -30,14 +45,35 @@ class RankedDocument:
     score: float
 
 
+@dataclass(frozen=True)
+class CollectionStats:
+    """Corpus statistics shared by every segment of a multi-segment index.
+
+    Scoring each segment against the same document count, field lengths and
+    document frequencies keeps scores comparable when per-segment results are
+    merged. Like Lucene, counts include documents deleted by newer segments
+    until the segments are compacted.
+    """
+
+    total_docs: int
+    field_length_stats: Mapping[str, FieldLengthStats]
+    doc_frequency: Callable[[str, str], int]
+
+
 @dataclass(frozen=True)
 class QueryTokens:
-    """Immutable snapshot of query terms aligned with index fields."""
+    """Immutable snapshot of query terms aligned with index fields.
+
+    ``phrases`` holds one entry per exact phrase the query requires, mapping
+    each text field to the phrase's analyzed terms in that field. A document
+    matches a phrase when any of those fields holds the terms consecutively.
+    """
 
     per_field: Mapping[str, tuple[str, ...]]
     ordered_terms: tuple[str, ...]
     base_term_count: int
     seed_text: str
+    phrases: tuple[Mapping[str, tuple[str, ...]], ...] = ()
 
     @classmethod
     def empty(cls) -> QueryTokens:
@@ -60,6 +96,7 @@ class BM25SearchEngine:
         enable_synonyms: bool = True,
         enable_phrase_bonus: bool = False,
         enable_fuzzy: bool = False,
+        enable_pruning: bool = True,
     ) -> None:
         self.schema = schema
         self.field_boosts = dict(field_boosts or {})
@@ -68,15 +105,26 @@ class BM25SearchEngine:
         self.enable_synonyms = enable_synonyms
         self.enable_phrase_bonus = enable_phrase_bonus
         self.enable_fuzzy = enable_fuzzy
+        self.enable_pruning = enable_pruning
+
+    @timed_stage(TOKENIZE)
+    def tokenize_query(self, seed_text: str, *, word_match: bool = False) -> QueryTokens:
+        """Return aligned query tokens plus metadata for scoring helpers.
 
-    def tokenize_query(self, seed_text: str) -> QueryTokens:
-        """Return aligned query tokens plus metadata for scoring helpers."""
+        Double-quoted spans of ``seed_text`` become exact phrases, and
+        ``word_match`` makes the whole query one. Phrase terms are matched as
+        written: they are not synonym-expanded, and with ``word_match`` no
+        term is fuzzy-matched either.
+        """
 
         normalized_seed = seed_text.strip()
         if not normalized_seed:
             return QueryTokens.empty()
 
+        phrase_texts = parse_phrases(normalized_seed, word_match=word_match)
+        unquoted_text = "" if word_match else strip_phrases(normalized_seed)
         per_field: dict[str, tuple[str, ...]] = {}
+        phrases: list[dict[str, tuple[str, ...]]] = [{} for _ in phrase_texts]
         ordered_terms: list[str] = []
         ordered_seen: set[str] = set()
         base_term_count = 0
@@ -85,18 +133,28 @@ class BM25SearchEngine:
             analyzer = get_analyzer(field.analyzer_name)
             seen_in_field: set[str] = set()
             base_terms: list[str] = []
-            for token in analyzer(normalized_seed):
-                if not token.text or token.text in seen_in_field:
+            for term in analyzer.terms(normalized_seed):
+                if not term or term in seen_in_field:
                     continue
-                seen_in_field.add(token.text)
-                base_terms.append(token.text)
+                seen_in_field.add(term)
+                base_terms.append(term)
 
-            if field.name == "body" and not base_term_count:
+            for phrase, phrase_text in zip(phrases, phrase_texts, strict=True):
+                phrase_terms = tuple(term for term in analyzer.terms(phrase_text) if term)
+                if phrase_terms:
+                    phrase[field.name] = phrase_terms
+
+            if field.name == "body" and not base_term_count and not word_match:
                 base_term_count = len(base_terms)
 
             terms = list(base_terms)
-            if self.enable_synonyms and base_terms:
-                expanded = expand_query_terms(base_terms)
+            expandable = base_terms
+            if phrase_texts:
+                unquoted_terms = set(analyzer.terms(unquoted_text))
+                expandable = [term for term in base_terms if term in unquoted_terms]
+            if self.enable_synonyms and expandable:
+                with stage(SYNONYMS):
+                    expanded = expand_query_terms(expandable)
                 for syn in sorted(expanded):
                     if syn in seen_in_field:
                         continue
@@ -121,34 +179,97 @@ class BM25SearchEngine:
             tuple(ordered_terms),
             base_term_count,
             normalized_seed,
+            tuple(MappingProxyType(phrase) for phrase in phrases if phrase),
         )
 
+    @timed_stage(PHRASE)
+    def match_phrases(self, segment: SqliteSegment, query_tokens: QueryTokens) -> np.ndarray:
+        """Return a mask over the segment's doc ordinals of docs containing every query phrase."""
+        required: np.ndarray | None = None
+        for phrase in query_tokens.phrases:
+            matched = np.zeros(len(segment.doc_ids), dtype=bool)
+            for field_name, terms in phrase.items():
+                matched[self._phrase_ordinals(segment, field_name, terms, within=required)] = True
+            required = matched if required is None else required & matched
+            if not required.any():
+                break
+        return required if required is not None else np.ones(len(segment.doc_ids), dtype=bool)
+
+    def _phrase_ordinals(
+        self, segment: SqliteSegment, field_name: str, terms: tuple[str, ...], *, within: np.ndarray | None
+    ) -> np.ndarray:
+        """Ordinals of docs whose ``field_name`` holds ``terms`` consecutively.
+
+        Posting lists are intersected rarest first, decoding only the blocks
+        that can hold a surviving candidate; positions are then read for the
+        survivors alone.
+        """
+        empty = np.zeros(0, dtype=np.int64)
+        postings: dict[str, PostingBlocks] = {}
+        for term in dict.fromkeys(terms):
+            blocks = segment.get_posting_blocks(field_name, term)
+            if not blocks:
+                return empty
+            postings[term] = blocks
+
+        by_frequency = sorted(postings, key=lambda term: len(postings[term]))
+        candidates = np.frombuffer(postings[by_frequency[0]].columns().ordinals, dtype=np.uint32).astype(np.int64)
+        if within is not None:
+            candidates = candidates[within[candidates]]
+        for term in by_frequency[1:]:
+            blocks = postings[term]
+            block_indices = blocks.block_of(candidates)
+            in_list = block_indices < blocks.block_count
+            if not in_list.any():
+                return empty
+            ordinals = np.frombuffer(blocks.select(np.unique(block_indices[in_list])).ordinals, dtype=np.uint32)
+            candidates = np.intersect1d(candidates, ordinals, assume_unique=True)
+            if not candidates.size:
+                return empty
+        if len(terms) == 1:
+            return candidates
+
+        survivors = candidates.tolist()
+        positions = {term: segment.get_positions(field_name, term, survivors) for term in postings}
+        matched = [ordinal for ordinal in survivors if has_phrase([positions[term].get(ordinal, ()) for term in terms])]
+        return np.array(matched, dtype=np.int64)
+
     def _resolve_postings(
         self,
         *,
         term: str,
         field_name: str,
-        postings: list[Posting] | None,
+        postings: PostingBlocks | None,
         is_base_term: bool,
         segment: SqliteSegment,
         vocabulary: list[str] | None,
-    ) -> tuple[list[Posting] | None, float]:
+    ) -> tuple[PostingBlocks | None, float]:
         if postings or not (self.enable_fuzzy and is_base_term):
             return postings, 1.0
-
-        if vocabulary is None:
-            vocabulary = segment.get_terms(field_name)
-        if not vocabulary:
-            return None, 1.0
-
-        fuzzy_matches = find_fuzzy_matches(term, vocabulary)
+        with stage(FUZZY):
+            return self._fuzzy_postings(term=term, field_name=field_name, segment=segment, vocabulary=vocabulary)
+
+    def _fuzzy_postings(
+        self, *, term: str, field_name: str, segment: SqliteSegment, vocabulary: list[str] | None
+    ) -> tuple[PostingBlocks | None, float]:
+        """Postings of the closest vocabulary term to ``term``, with the fuzzy discount."""
+        if vocabulary is None and segment.has_fuzzy_index:
+            fuzzy_matches = segment.find_fuzzy_terms(field_name, term)
+        else:
+            # Segments written before the deletion index fall back to a vocabulary scan.
+            if vocabulary is None:
+                vocabulary = segment.get_terms(field_name)
+            if not vocabulary:
+                return None, 1.0
+            fuzzy_matches = find_fuzzy_matches(term, vocabulary)
         if not fuzzy_matches:
             return None, 1.0
 
         fuzzy_term, _distance = fuzzy_matches[0]
-        matched = segment.get_postings(field_name, fuzzy_term, include_positions=False)
+        matched = segment.get_posting_blocks(field_name, fuzzy_term)
         return (matched, _FUZZY_DISCOUNT) if matched else (None, 1.0)
 
+    @timed_stage(PHRASE)
     def _apply_phrase_bonus(
         self,
         doc_scores: dict[str, float],
@@ -168,7 +289,7 @@ class BM25SearchEngine:
             return
 
         analyzer = get_analyzer(body_field.analyzer_name)
-        query_tokens = [t.text for t in analyzer(query_text) if t.text]
+        query_tokens = [term for term in analyzer.terms(query_text) if term]
         if len(query_tokens) < 2:
             return
 
@@ -220,24 +341,114 @@ class BM25SearchEngine:
             bonus = max_bonus - (scatter_ratio - 1.0) * (max_bonus - 1.0) / 2.0
             doc_scores[doc_id] *= max(1.0, bonus)
 
-    def score(
+    def _term_weights(self, postings: PostingColumns, avg_length: float) -> tuple[np.ndarray, np.ndarray]:
+        """Return ordinals and BM25 weights for the postings with a positive weight.
+
+        Postings without a stored doc length fall back to their tf as the length.
+        """
+        ordinals = np.frombuffer(postings.ordinals, dtype=np.uint32)
+        tf = np.frombuffer(postings.frequencies, dtype=np.uint32).astype(np.float64)
+        doc_lengths = np.frombuffer(postings.doc_lengths, dtype=np.uint32).astype(np.float64)
+        doc_lengths = np.where(doc_lengths > 0, doc_lengths, tf)
+        weights = bm25_weights(tf, doc_lengths, avg_length, k1=self.k1, b=self.b)
+        positive = weights > 0
+        if positive.all():
+            return ordinals, weights
+        return ordinals[positive], weights[positive]
+
+    def _term_contribution(self, term: _ScoredTerm, postings: PostingColumns) -> tuple[np.ndarray, np.ndarray]:
+        count_postings(len(postings.ordinals))
+        ordinals, weights = self._term_weights(postings, term.avg_length)
+        if term.deleted is not None:
+            live = ~term.deleted[ordinals]
+            ordinals, weights = ordinals[live], weights[live]
+        return ordinals, term.idf * weights * term.field_boost * term.discount
+
+    @timed_stage(SCORING)
+    def _accumulate(self, terms: list[_ScoredTerm], doc_total: int, top_k: int) -> tuple[np.ndarray, np.ndarray | None]:
+        """Sum term contributions per doc ordinal.
+
+        Returns the scores plus, when pruning ran, a mask of the docs that can
+        still reach the top ``top_k``; docs outside the mask may have partial
+        scores and must not be ranked. Scores of docs inside the mask are
+        exact and accumulated in query-term order, so they are bit-identical
+        to the exhaustive path.
+        """
+        doc_scores = np.zeros(doc_total, dtype=np.float64)
+        if not self.enable_pruning or top_k <= 0 or len(terms) < 2:
+            for term in terms:
+                ordinals, contribution = self._term_contribution(term, term.postings.columns())
+                # Ordinals are unique within a posting list, so fancy-index += is safe.
+                doc_scores[ordinals] += contribution
+            return doc_scores, None
+
+        # Block-max MaxScore: visit terms by decreasing upper bound. Once the
+        # bounds of the unvisited terms sum to less than the current k-th best
+        # score, unseen docs can no longer make the top k; from then on only
+        # the surviving candidates are tracked, and each remaining term only
+        # decodes the blocks holding candidates that could still get there.
+        block_bounds = [
+            term.idf
+            * term.postings.max_weights(term.avg_length, k1=self.k1, b=self.b)
+            * term.field_boost
+            * term.discount
+            for term in terms
+        ]
+        term_bounds = np.array([bounds.max(initial=0.0) for bounds in block_bounds])
+        order = np.argsort(-term_bounds, kind="stable")
+        remaining = np.append(np.cumsum(term_bounds[order][::-1])[::-1], 0.0)
+
+        partial = np.zeros(doc_total, dtype=np.float64)
+        contributions: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        candidates: np.ndarray | None = None
+        threshold = 0.0
+        for position, term_index in enumerate(order.tolist()):
+            term = terms[term_index]
+            remaining_after = remaining[position + 1]
+            if candidates is None:
+                postings = term.postings.columns()
+            else:
+                blocks = term.postings.block_of(candidates)
+                in_list = blocks < term.postings.block_count
+                reach = np.full(candidates.size, remaining_after)
+                reach[in_list] += block_bounds[term_index][blocks[in_list]]
+                viable = partial[candidates] + reach >= threshold
+                candidates = candidates[viable]
+                postings = term.postings.select(np.unique(blocks[viable & in_list]))
+            ordinals, contribution = self._term_contribution(term, postings)
+            contributions[term_index] = (ordinals, contribution)
+            partial[ordinals] += contribution
+
+            if candidates is not None:
+                threshold = max(threshold, _kth_score(partial[candidates], top_k) * (1.0 - _PRUNING_SLACK))
+            elif remaining_after < remaining[0] - remaining_after:
+                # The k-th best score can't exceed the bounds visited so far, so
+                # only look for it once those outweigh the unvisited ones.
+                threshold = _kth_score(partial, top_k) * (1.0 - _PRUNING_SLACK)
+                if remaining_after < threshold:
+                    candidates = np.flatnonzero(partial + remaining_after >= threshold)
+
+        for term_index in range(len(terms)):
+            ordinals, contribution = contributions[term_index]
+            doc_scores[ordinals] += contribution
+        if candidates is None:
+            return doc_scores, None
+        alive = np.zeros(doc_total, dtype=bool)
+        alive[candidates] = True
+        return doc_scores, alive
+
+    def _scored_terms(
         self,
         segment: SqliteSegment,
         query_tokens: QueryTokens,
-        *,
-        limit: int,
-        field_length_stats: Mapping[str, FieldLengthStats] | None = None,
-    ) -> list[RankedDocument]:
-        """Return ranked results for a tokenized query."""
-
-        if query_tokens.is_empty():
-            return []
-
-        if field_length_stats is None:
-            field_length_stats = segment.get_field_length_stats(list(query_tokens.per_field.keys()))
-        doc_scores: dict[str, float] = defaultdict(float)
-        total_docs = max(segment.doc_count, 1)
+        field_length_stats: Mapping[str, FieldLengthStats],
+        collection: CollectionStats | None,
+        deleted: np.ndarray | None,
+    ) -> list[_ScoredTerm]:
+        """Resolve every (field, term) of the query to its postings and scoring constants."""
+        total_docs = max(collection.total_docs if collection is not None else segment.doc_count, 1)
         vocabulary_cache: dict[str, list[str]] = {}
+        terms: list[_ScoredTerm] = []
 
         for field_name, tokens in query_tokens.per_field.items():
             if not tokens:
@@ -250,12 +461,21 @@ class BM25SearchEngine:
             field_boost = self.field_boosts.get(field_name, 1.0)
 
             for term_idx, term in enumerate(tokens):
-                postings = segment.get_postings(field_name, term, include_positions=False)
+                postings = segment.get_posting_blocks(field_name, term)
+                if collection is not None and not postings and collection.doc_frequency(field_name, term):
+                    # Another segment has the exact term, so don't fuzzy-match it here.
+                    continue
                 vocabulary = None
-                if self.enable_fuzzy and term_idx < query_tokens.base_term_count and not postings:
+                if (
+                    self.enable_fuzzy
+                    and term_idx < query_tokens.base_term_count
+                    and not postings
+                    and not segment.has_fuzzy_index
+                ):
                     vocabulary = vocabulary_cache.get(field_name)
                     if vocabulary is None:
-                        vocabulary = segment.get_terms(field_name)
+                        with stage(FUZZY):
+                            vocabulary = segment.get_terms(field_name)
                         vocabulary_cache[field_name] = vocabulary
                 postings, discount = self._resolve_postings(
                     term=term,
@@ -268,32 +488,105 @@ class BM25SearchEngine:
                 if not postings:
                     continue
 
-                idf = calculate_idf(len(postings), total_docs)
-                for posting in postings:
-                    doc_length = posting.doc_length or posting.frequency
-                    weight = bm25(posting.frequency, doc_length, avg_length, k1=self.k1, b=self.b)
-                    if weight <= 0:
-                        continue
-                    doc_scores[posting.doc_id] += idf * weight * field_boost * discount
+                doc_freq = len(postings)
+                if collection is not None and discount == 1.0:
+                    doc_freq = collection.doc_frequency(field_name, term)
+                idf = calculate_idf(doc_freq, total_docs)
+                terms.append(_ScoredTerm(postings, idf, field_boost, discount, avg_length, deleted))
+        return terms
 
-        if self.enable_phrase_bonus and query_tokens.seed_text and doc_scores:
-            phrase_limit = min(max(limit * 5, 50), 500) if limit > 0 else min(len(doc_scores), 50)
-            if phrase_limit > 0:
-                top_doc_ids = [
-                    doc_id
-                    for doc_id, _score in heapq.nlargest(phrase_limit, doc_scores.items(), key=lambda item: item[1])
-                ]
-                self._apply_phrase_bonus(doc_scores, segment, query_tokens.seed_text, doc_id_filter=top_doc_ids)
+    def score(
+        self,
+        segment: SqliteSegment,
+        query_tokens: QueryTokens,
+        *,
+        limit: int,
+        field_length_stats: Mapping[str, FieldLengthStats] | None = None,
+        collection: CollectionStats | None = None,
+        deleted: np.ndarray | None = None,
+    ) -> list[RankedDocument]:
+        """Return ranked results for a tokenized query.
+
+        ``collection`` scores the segment as one part of a larger index, and
+        ``deleted`` is a boolean mask over the segment's doc ordinals whose
+        documents never score.
+        """
+
+        if query_tokens.is_empty():
+            return []
+
+        if query_tokens.phrases:
+            # Docs without every phrase never score, exactly like deleted ones.
+            required = self.match_phrases(segment, query_tokens)
+            if not required.any():
+                return []
+            deleted = ~required if deleted is None else deleted | ~required
+
+        if collection is not None:
+            field_length_stats = collection.field_length_stats
+        elif field_length_stats is None:
+            field_length_stats = segment.get_field_length_stats(list(query_tokens.per_field.keys()))
+        doc_ids = segment.doc_ids
+        terms = self._scored_terms(segment, query_tokens, field_length_stats, collection, deleted)
+
+        apply_phrase_bonus = self.enable_phrase_bonus and bool(query_tokens.seed_text)
+        # Phrase candidates are the top BM25 docs, so prune to however many of them we need.
+        phrase_limit = min(max(limit * 5, 50), 500) if limit > 0 else 0
+        doc_scores, alive = self._accumulate(terms, len(doc_ids), phrase_limit if apply_phrase_bonus else limit)
+        hits = np.flatnonzero(doc_scores > 0) if alive is None else np.flatnonzero((doc_scores > 0) & alive)
 
         if limit <= 0:
             return []
-        if limit < len(doc_scores):
-            top_items = heapq.nlargest(limit, doc_scores.items(), key=lambda item: item[1])
-            return [RankedDocument(doc_id=doc_id, score=score) for doc_id, score in top_items]
-
-        ranked = sorted(
-            (RankedDocument(doc_id=doc_id, score=score) for doc_id, score in doc_scores.items()),
-            key=lambda entry: entry.score,
-            reverse=True,
-        )
-        return ranked
+
+        if apply_phrase_bonus and hits.size:
+            top_ordinals = _top_ordinals(doc_scores, hits, phrase_limit).tolist()
+            candidate_scores = {doc_ids[ordinal]: float(doc_scores[ordinal]) for ordinal in top_ordinals}
+            self._apply_phrase_bonus(
+                candidate_scores, segment, query_tokens.seed_text, doc_id_filter=list(candidate_scores)
+            )
+            for ordinal in top_ordinals:
+                doc_scores[ordinal] = candidate_scores[doc_ids[ordinal]]
+
+        return [
+            RankedDocument(doc_id=doc_ids[ordinal], score=float(doc_scores[ordinal]))
+            for ordinal in _top_ordinals(doc_scores, hits, limit).tolist()
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class _ScoredTerm:
+    """One resolved (field, term) of a query with its scoring constants."""
+
+    postings: PostingBlocks
+    idf: float
+    field_boost: float
+    discount: float
+    avg_length: float
+    deleted: np.ndarray | None = None
+
+
+def _kth_score(scores: np.ndarray, k: int) -> float:
+    """Return the k-th largest positive score, or 0.0 if fewer than ``k`` docs scored."""
+    positive = scores[scores > 0]
+    if positive.size < k:
+        return 0.0
+    return float(np.partition(positive, positive.size - k)[positive.size - k])
+
+
+def _top_ordinals(scores: np.ndarray, hits: np.ndarray, k: int) -> np.ndarray:
+    """Return up to ``k`` hit ordinals by descending score, ties in ordinal order.
+
+    ``np.argpartition`` finds the k-th best score in O(n) so only the top k
+    are sorted. Ties at the cut-off keep the lowest ordinals, matching a
+    stable full sort.
+    """
+    hit_scores = scores[hits]
+    if k < hits.size:
+        threshold = hit_scores[np.argpartition(-hit_scores, k - 1)[k - 1]]
+        above = np.flatnonzero(hit_scores > threshold)
+        at_threshold = np.flatnonzero(hit_scores == threshold)[: k - above.size]
+        keep = np.sort(np.concatenate((above, at_threshold)))
+        hits = hits[keep]
+        hit_scores = hit_scores[keep]
+    # Hits are ascending ordinals and the sort is stable, so equal scores stay in ordinal order.
+    return hits[np.argsort(-hit_scores, kind="stable")]
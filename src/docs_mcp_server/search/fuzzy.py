@@ -8,6 +8,10 @@ Smart Defaults (no per-tenant config needed):
 - Max edit distance of 2 for longer terms (6+ chars)
 - No fuzzy matching for very short terms (1-2 chars)
 - Preserves exact matches with higher priority
+
+Segments also store a SymSpell-style deletion index (see
+``deletion_variants``) so a typo only needs to verify the handful of terms
+that share a deletion variant with it, instead of scanning the vocabulary.
 """
 
 from __future__ import annotations
@@ -15,6 +19,12 @@ from __future__ import annotations
 from collections.abc import Sequence
 
 
+# Deletion variants are generated from this many leading characters only, which
+# bounds the variants per term (at most 29 for two deletions) regardless of its
+# length. Candidates are always verified against the full term.
+FUZZY_PREFIX_LENGTH = 7
+
+
 def levenshtein_distance(s1: str, s2: str, max_distance: int | None = None) -> int:
     """Calculate the Levenshtein (edit) distance between two strings.
 
@@ -101,6 +111,67 @@ def get_max_edit_distance(term_length: int) -> int:
     return 2  # 2 typos for longer terms
 
 
+def get_index_edit_distance(term_length: int) -> int:
+    """Get the largest edit distance at which any query could match a term of this length.
+
+    A query of length ``q`` tolerates ``get_max_edit_distance(q)`` edits, so
+    the deletion index must cover the worst case over every query length
+    that could still reach the term.
+
+    Args:
+        term_length: Length of the indexed term.
+
+    Returns:
+        Number of deletions to index for the term (0 means never fuzzy-matched).
+    """
+    return max(
+        (
+            get_max_edit_distance(query_length)
+            for query_length in range(max(term_length - 2, 1), term_length + 3)
+            if abs(query_length - term_length) <= get_max_edit_distance(query_length)
+        ),
+        default=0,
+    )
+
+
+def deletion_variants(
+    term: str,
+    max_deletions: int,
+    prefix_length: int = FUZZY_PREFIX_LENGTH,
+) -> list[set[str]]:
+    """Generate the deletion neighborhood of a term's prefix.
+
+    Two strings within edit distance ``d`` share at least one variant when
+    both sides generate up to ``d`` deletions of their first
+    ``prefix_length`` characters, so an index of these variants yields every
+    fuzzy candidate (plus some false positives to verify).
+
+    Args:
+        term: The term (lowercased by the caller).
+        max_deletions: Maximum number of characters to delete.
+        prefix_length: Number of leading characters to generate variants from.
+
+    Returns:
+        Variant sets indexed by deletion count; index 0 holds the prefix itself.
+
+    Examples:
+        >>> [sorted(level) for level in deletion_variants("cat", 1)]
+        [['cat'], ['at', 'ca', 'ct']]
+    """
+    levels = [{term[:prefix_length]}]
+    seen = set(levels[0])
+    for _ in range(max_deletions):
+        level: set[str] = set()
+        for variant in levels[-1]:
+            for index in range(len(variant)):
+                shorter = variant[:index] + variant[index + 1 :]
+                if shorter not in seen:
+                    seen.add(shorter)
+                    level.add(shorter)
+        levels.append(level)
+    return levels
+
+
 def find_fuzzy_matches(
     query_term: str,
     vocabulary: Sequence[str],
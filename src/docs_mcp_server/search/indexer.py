@@ -9,30 +9,56 @@ interfaces.
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Iterable, Iterator, Mapping, Sequence
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 import hashlib
+from itertools import islice
 import json
 import logging
+import multiprocessing
+import os
 from pathlib import Path
 import re
 import sqlite3
 import subprocess
+import sys
+import time
 from typing import Any
 from urllib.parse import urlparse
 
 from docs_mcp_server.search.schema import Schema, create_default_schema
-from docs_mcp_server.search.sqlite_storage import SqliteSegmentWriter
+from docs_mcp_server.search.sqlite_storage import (
+    AnalyzedDocument,
+    SqliteSegment,
+    SqliteSegmentWriter,
+    analyze_document,
+)
 from docs_mcp_server.search.storage_factory import create_segment_store
 from docs_mcp_server.utils.front_matter import parse_front_matter
 
 
+if sys.platform == "win32":  # pragma: no cover - no resource module on Windows
+    resource = None
+else:
+    import resource
+
+
 logger = logging.getLogger(__name__)
 
 _HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
 _METADATA_DIRNAME = "__docs_metadata"
-_SEGMENT_FORMAT_VERSION = "v5-sqlite-bloom"
+_SEGMENT_FORMAT_VERSION = "v9-sqlite-shared-fuzzy-index"
+# Parsing fans out to processes only when every worker gets at least this many documents.
+_MIN_DOCUMENTS_PER_WORKER = 64
+_PARSE_CHUNK_SIZE = 16
+_CHUNKS_IN_FLIGHT_PER_WORKER = 4
+_MAX_AUTO_PARSE_WORKERS = 8
+# Deltas are compacted into a fresh base once they hold this share of the base's documents.
+_DELTA_COMPACTION_RATIO = 0.1
 
 
 @dataclass(frozen=True)
@@ -61,6 +87,25 @@ class IndexBuildResult:
     errors: tuple[str, ...]
     segment_ids: tuple[str, ...]
     segment_paths: tuple[Path, ...]
+    elapsed_seconds: float = 0.0
+    peak_rss_bytes: int | None = None
+    spilled_runs: int = 0
+    documents_deleted: int = 0
+
+    @property
+    def documents_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.documents_indexed / self.elapsed_seconds
+
+
+def _peak_rss_bytes() -> int | None:
+    """Return the process's peak resident set size, or None where ``resource`` is unavailable."""
+    if resource is None:  # pragma: no cover - Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
 
 
 @dataclass(frozen=True)
@@ -108,10 +153,37 @@ INDEXABLE_EXTENSIONS: tuple[str, ...] = (
 class TenantIndexer:
     """Coordinate extraction + segment persistence for one tenant."""
 
+    DEFAULT_PARSE_WORKERS = 0  # 0 sizes the pool from the CPU count
+    PARSE_WORKERS = DEFAULT_PARSE_WORKERS
+    DEFAULT_MAX_DELTA_SEGMENTS = 8
+    MAX_DELTA_SEGMENTS = DEFAULT_MAX_DELTA_SEGMENTS
+
     def __init__(self, context: TenantIndexingContext) -> None:
         self.context = context
         self._store = create_segment_store(context.segments_dir)
 
+    @classmethod
+    def set_parse_workers(cls, workers: int | None) -> None:
+        """Configure how many processes parse and analyze documents (0 = auto, 1 = serial)."""
+        if workers is None:
+            cls.PARSE_WORKERS = cls.DEFAULT_PARSE_WORKERS
+        else:
+            cls.PARSE_WORKERS = max(0, workers)
+
+    @classmethod
+    def set_max_delta_segments(cls, max_deltas: int | None) -> None:
+        """Configure how many delta segments may stack up before compaction is due."""
+        if max_deltas is None:
+            cls.MAX_DELTA_SEGMENTS = cls.DEFAULT_MAX_DELTA_SEGMENTS
+        else:
+            cls.MAX_DELTA_SEGMENTS = max(1, max_deltas)
+
+    def parse_workers(self) -> int:
+        """Effective parse worker count for this process."""
+        if self.PARSE_WORKERS > 0:
+            return self.PARSE_WORKERS
+        return max(1, min(_MAX_AUTO_PARSE_WORKERS, (os.cpu_count() or 1) - 1))
+
     def build_segment(
         self,
         *,
@@ -132,142 +204,366 @@ class TenantIndexer:
                 JSON segment/manifest to disk. This powers CLI dry-run flows.
         """
 
-        normalized_filters = self._normalize_paths(changed_paths)
+        started = time.perf_counter()
+        # Spill next to the segments so staged runs stay on the same volume as the output.
+        writer = SqliteSegmentWriter(self.context.schema, spill_dir=self.context.segments_dir)
+        try:
+            result = self._build_with_writer(
+                writer,
+                changed_paths=changed_paths,
+                limit=limit,
+                changed_only=changed_only,
+                persist=persist,
+            )
+        finally:
+            writer.close()
+
+        elapsed = time.perf_counter() - started
+        result = replace(
+            result,
+            elapsed_seconds=elapsed,
+            peak_rss_bytes=_peak_rss_bytes(),
+            spilled_runs=writer.spill_count,
+        )
+        if result.documents_indexed:
+            logger.info(
+                "Indexed %d documents for %s in %.2fs (%.1f docs/s, %d spilled runs, peak RSS %s)",
+                result.documents_indexed,
+                self.context.codename,
+                elapsed,
+                result.documents_per_second,
+                result.spilled_runs,
+                f"{result.peak_rss_bytes / (1024 * 1024):.1f} MiB" if result.peak_rss_bytes else "n/a",
+            )
+        return result
+
+    def _build_with_writer(
+        self,
+        writer: SqliteSegmentWriter,
+        *,
+        changed_paths: Sequence[str] | None,
+        limit: int | None,
+        changed_only: bool,
+        persist: bool,
+    ) -> IndexBuildResult:
         latest_segment = self._store.latest()
-        last_built_at = latest_segment.created_at if latest_segment else None
+        options = _ParseOptions(
+            normalized_filters=frozenset(self._normalize_paths(changed_paths)),
+            last_built_at=latest_segment.created_at if latest_segment else None,
+            changed_only=changed_only,
+        )
+        tally = self._add_documents(writer, options, limit=limit)
 
-        writer = SqliteSegmentWriter(self.context.schema)
-        fingerprinter = _DocsFingerprintBuilder(self.context.schema)
-        documents_indexed = 0
-        documents_skipped = 0
-        errors: list[str] = []
-        explicit_freshness_count = 0
-        source_updated_at: datetime | None = None
-        source_evidence: set[str] = set()
+        if tally.documents_indexed == 0:
+            return IndexBuildResult(
+                documents_indexed=0,
+                documents_skipped=tally.documents_skipped,
+                errors=tuple(tally.errors),
+                segment_ids=(),
+                segment_paths=(),
+            )
 
-        seen_markdown_paths: set[Path] = set()
+        fingerprint = tally.fingerprinter.digest()
+        if fingerprint:
+            writer.segment_id = fingerprint
+
+        segment_paths: tuple[Path, ...] = ()
+        segment_id: str | None = writer.segment_id if tally.documents_indexed > 0 else None
+        if persist:
+            provenance = self._build_provenance(
+                documents_indexed=tally.documents_indexed,
+                explicit_freshness_count=tally.explicit_freshness_count,
+                source_updated_at=tally.source_updated_at,
+                source_evidence=tally.source_evidence,
+            )
+            segment_path = self._store.save_writer(writer, provenance=provenance)
+            self._store.prune_to_segment_ids((writer.segment_id,))
+            segment_paths = (segment_path,)
+            segment_id = writer.segment_id
 
-        def process_payload(payload: _DocumentPayload) -> None:
-            nonlocal documents_indexed, documents_skipped, explicit_freshness_count, source_updated_at
+        segment_ids: tuple[str, ...] = (segment_id,) if segment_id else ()
+        return IndexBuildResult(
+            documents_indexed=tally.documents_indexed,
+            documents_skipped=tally.documents_skipped,
+            errors=tuple(tally.errors),
+            segment_ids=segment_ids,
+            segment_paths=segment_paths,
+        )
 
-            markdown_rel = self._relative_to_root(payload.markdown_path)
-            metadata_rel = self._relative_to_root(payload.metadata_path) if payload.metadata_path is not None else None
+    def build_delta(self, *, changed_paths: Sequence[str] | None = None) -> IndexBuildResult:
+        """Index what changed since the newest segment into a delta segment.
 
-            if (
-                normalized_filters
-                and markdown_rel not in normalized_filters
-                and (metadata_rel is None or metadata_rel not in normalized_filters)
-            ):
-                documents_skipped += 1
-                return
+        Documents modified after the newest segment was built, or listed in
+        ``changed_paths``, are re-analyzed into a small segment that also
+        tombstones their previous copies and every indexed document whose
+        source file is gone. Nothing is written when nothing changed. Without
+        a base segment this falls back to a full ``build_segment``.
+        """
+        base_segment = self._store.latest()
+        if base_segment is None:
+            return self.build_segment(persist=True)
 
-            if self.context.source_type == "online" and not self._url_allowed(payload.url):
-                if payload.metadata_path is not None:
-                    self._prune_metadata_file(payload.metadata_path, reason="url_filtered")
-                documents_skipped += 1
+        started = time.perf_counter()
+        segments = [base_segment]
+        try:
+            for delta_id in self._store.delta_segment_ids():
+                delta = self._store.load(delta_id)
+                if delta is None:
+                    raise RuntimeError(f"Delta segment {delta_id} is not loadable")
+                segments.append(delta)
+            live_paths = _live_document_paths(segments)
+            built_at = max(segment.created_at for segment in segments)
+        finally:
+            for segment in segments:
+                segment.close()
+
+        options = _ParseOptions(
+            normalized_filters=frozenset(),
+            last_built_at=built_at,
+            changed_only=True,
+            forced_paths=frozenset(self._normalize_paths(changed_paths)),
+        )
+        writer = SqliteSegmentWriter(self.context.schema, spill_dir=self.context.segments_dir)
+        try:
+            tally = self._add_documents(writer, options, limit=None)
+            added_doc_ids = set(writer.sorted_doc_ids())
+            deleted_doc_ids = {
+                doc_id
+                for doc_id, path in live_paths.items()
+                if doc_id in added_doc_ids
+                or (path is not None and (path in tally.indexed_paths or path not in tally.present_paths))
+            }
+            segment_ids: tuple[str, ...] = ()
+            segment_paths: tuple[Path, ...] = ()
+            if tally.documents_indexed or deleted_doc_ids:
+                segment_paths = (self._store.save_delta(writer, deleted_doc_ids=sorted(deleted_doc_ids)),)
+                segment_ids = (writer.segment_id,)
+        finally:
+            writer.close()
+
+        elapsed = time.perf_counter() - started
+        if segment_ids:
+            logger.info(
+                "Delta segment %s for %s: %d documents indexed, %d tombstoned in %.2fs",
+                segment_ids[0],
+                self.context.codename,
+                tally.documents_indexed,
+                len(deleted_doc_ids),
+                elapsed,
+            )
+        return IndexBuildResult(
+            documents_indexed=tally.documents_indexed,
+            documents_skipped=tally.documents_skipped,
+            errors=tuple(tally.errors),
+            segment_ids=segment_ids,
+            segment_paths=segment_paths,
+            elapsed_seconds=elapsed,
+            peak_rss_bytes=_peak_rss_bytes(),
+            spilled_runs=writer.spill_count,
+            documents_deleted=len(deleted_doc_ids),
+        )
+
+    def delta_compaction_due(self) -> bool:
+        """Whether the deltas over the base segment should be merged by a full rebuild.
+
+        Due once ``MAX_DELTA_SEGMENTS`` deltas are stacked or they hold more than
+        ``_DELTA_COMPACTION_RATIO`` of the base's documents, since every delta
+        adds a segment to score per query and deleted documents still count in
+        the collection statistics.
+        """
+        delta_ids = self._store.delta_segment_ids()
+        if not delta_ids:
+            return False
+        if len(delta_ids) >= self.MAX_DELTA_SEGMENTS:
+            return True
+        delta_docs = 0
+        for delta_id in delta_ids:
+            delta = self._store.load(delta_id)
+            if delta is None:
+                return True
+            delta_docs += delta.doc_count + len(delta.deleted_doc_ids())
+            delta.close()
+        return delta_docs > (self._store.latest_doc_count() or 0) * _DELTA_COMPACTION_RATIO
+
+    def _add_documents(self, writer: SqliteSegmentWriter, options: _ParseOptions, *, limit: int | None) -> _BuildTally:
+        """Discover, parse, and add the tenant's documents to ``writer``."""
+        tally = _BuildTally(fingerprinter=_DocsFingerprintBuilder(self.context.schema))
+        seen_markdown_paths: set[Path] = set()
+
+        def process_parsed(parsed: _ParsedDocument) -> None:
+            payload = parsed.payload
+            if payload is None:
+                logger.debug("Skipping %s: %s", parsed.task.path, parsed.error)
+                tally.errors.append(str(parsed.error))
+                tally.documents_skipped += 1
                 return
 
-            if changed_only and last_built_at and not self._has_changed(payload, last_built_at):
-                documents_skipped += 1
+            if parsed.task.kind == _TASK_METADATA:
+                seen_markdown_paths.add(payload.markdown_path.resolve())
+
+            if parsed.skip_reason is not None:
+                if parsed.skip_reason == "url_filtered":
+                    if payload.metadata_path is not None:
+                        self._prune_metadata_file(payload.metadata_path, reason="url_filtered")
+                else:
+                    tally.present_paths.add(payload.record["path"])
+                tally.documents_skipped += 1
                 return
 
             try:
-                doc_key = writer.add_document(payload.record)
-                fingerprinter.add_document(doc_key, payload.record)
+                doc_key = writer.add_analyzed_document(parsed.require_analyzed())
+                tally.fingerprinter.add_digest(doc_key, parsed.record_digest)
             except ValueError as exc:
                 logger.warning("Failed to index %s: %s", payload.source_hint, exc)
-                errors.append(f"{payload.url}: {exc}")
-                documents_skipped += 1
+                tally.errors.append(f"{payload.url}: {exc}")
+                tally.documents_skipped += 1
                 return
 
-            documents_indexed += 1
+            tally.documents_indexed += 1
+            tally.present_paths.add(payload.record["path"])
+            tally.indexed_paths.add(payload.record["path"])
             if payload.freshness_at is not None:
-                explicit_freshness_count += 1
-                if source_updated_at is None or payload.freshness_at > source_updated_at:
-                    source_updated_at = payload.freshness_at
+                tally.explicit_freshness_count += 1
+                if tally.source_updated_at is None or payload.freshness_at > tally.source_updated_at:
+                    tally.source_updated_at = payload.freshness_at
                 if payload.freshness_evidence:
-                    source_evidence.add(payload.freshness_evidence)
+                    tally.source_evidence.add(payload.freshness_evidence)
             return
 
         if self.context.source_type == "online":
-            for metadata_path in self._discover_metadata_files():
-                if limit is not None and documents_indexed >= limit:
+            metadata_tasks = [_ParseTask(_TASK_METADATA, path) for path in self._discover_metadata_files()]
+            for parsed in self._parse_in_order(metadata_tasks, options):
+                if limit is not None and tally.documents_indexed >= limit:
                     break
+                process_parsed(parsed)
 
-                try:
-                    document_payload = self._load_document_from_metadata(metadata_path)
-                except DocumentLoadError as exc:  # pragma: no cover - defensive log
-                    logger.debug("Skipping %s: %s", metadata_path, exc)
-                    errors.append(str(exc))
-                    documents_skipped += 1
-                    continue
-
-                seen_markdown_paths.add(document_payload.markdown_path.resolve())
-
-                process_payload(document_payload)
-
+        markdown_tasks: list[_ParseTask] = []
         for markdown_path in self._discover_markdown_files():
-            if limit is not None and documents_indexed >= limit:
-                break
-
             if markdown_path.is_dir():
                 logger.warning("indexer skip: %s is a directory (yielded by rglob)", markdown_path)
-                documents_skipped += 1
+                tally.documents_skipped += 1
                 continue
-
-            resolved_markdown = markdown_path.resolve()
-            if resolved_markdown in seen_markdown_paths:
+            if markdown_path.resolve() in seen_markdown_paths:
                 continue
-
-            try:
-                document_payload = self._load_document_from_markdown(markdown_path)
-            except DocumentLoadError as exc:
-                logger.debug("Skipping %s: %s", markdown_path, exc)
-                errors.append(str(exc))
-                documents_skipped += 1
+            if options.forced_paths is not None and self._unchanged_on_disk(markdown_path, options):
+                # Delta builds skip unchanged files without reading them.
+                tally.present_paths.add(str(self._relative_to_root(markdown_path)))
+                tally.documents_skipped += 1
                 continue
+            markdown_tasks.append(_ParseTask(_TASK_MARKDOWN, markdown_path))
 
-            seen_markdown_paths.add(resolved_markdown)
+        for parsed in self._parse_in_order(markdown_tasks, options):
+            if limit is not None and tally.documents_indexed >= limit:
+                break
+            process_parsed(parsed)
+        return tally
 
-            process_payload(document_payload)
+    def _parse_in_order(self, tasks: Sequence[_ParseTask], options: _ParseOptions) -> Iterator[_ParsedDocument]:
+        """Parse ``tasks`` and yield results in task order.
 
-        if documents_indexed == 0:
-            return IndexBuildResult(
-                documents_indexed=0,
-                documents_skipped=documents_skipped,
-                errors=tuple(errors),
-                segment_ids=(),
-                segment_paths=(),
+        Large batches fan out to a process pool; results are consumed in
+        submission order, so the writer sees documents in discovery order
+        regardless of which worker finishes first.
+        """
+        workers = min(self.parse_workers(), len(tasks) // _MIN_DOCUMENTS_PER_WORKER)
+        if workers < 2:
+            for task in tasks:
+                yield self._parse_document(task, options)
+            return
+
+        chunks = iter([tasks[start : start + _PARSE_CHUNK_SIZE] for start in range(0, len(tasks), _PARSE_CHUNK_SIZE)])
+        parsed_count = 0
+        try:
+            # Spawned workers avoid forking a process that runs event-loop and search threads.
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parse_worker,
+                initargs=(self.context, options),
+            ) as pool:
+                in_flight = workers * _CHUNKS_IN_FLIGHT_PER_WORKER
+                pending: deque[Future[list[_ParsedDocument]]] = deque(
+                    pool.submit(_parse_chunk_in_worker, chunk) for chunk in islice(chunks, in_flight)
+                )
+                try:
+                    while pending:
+                        results = pending.popleft().result()
+                        next_chunk = next(chunks, None)
+                        if next_chunk is not None:
+                            pending.append(pool.submit(_parse_chunk_in_worker, next_chunk))
+                        for parsed in results:
+                            parsed_count += 1
+                            yield parsed
+                finally:
+                    for future in pending:
+                        future.cancel()
+        except BrokenProcessPool as exc:
+            logger.warning(
+                "Parse workers for %s failed (%s); parsing the remaining %d documents serially",
+                self.context.codename,
+                exc,
+                len(tasks) - parsed_count,
             )
+            for task in tasks[parsed_count:]:
+                yield self._parse_document(task, options)
 
-        fingerprint = fingerprinter.digest()
-        if fingerprint:
-            writer.segment_id = fingerprint
+    def _parse_document(self, task: _ParseTask, options: _ParseOptions) -> _ParsedDocument:
+        """Load, filter, analyze, and hash one document (runs in parse workers)."""
+        try:
+            if task.kind == _TASK_METADATA:
+                payload = self._load_document_from_metadata(task.path)
+            else:
+                payload = self._load_document_from_markdown(task.path)
+        except DocumentLoadError as exc:
+            return _ParsedDocument(task=task, error=str(exc))
 
-        segment_paths: tuple[Path, ...] = ()
-        segment_id: str | None = writer.segment_id if documents_indexed > 0 else None
-        if persist:
-            segment_data = writer.build()
-            segment_data["provenance"] = self._build_provenance(
-                documents_indexed=documents_indexed,
-                explicit_freshness_count=explicit_freshness_count,
-                source_updated_at=source_updated_at,
-                source_evidence=source_evidence,
-            )
-            segment_path = self._store.save(segment_data)
-            self._store.prune_to_segment_ids((segment_data["segment_id"],))
-            segment_paths = (segment_path,)
-            segment_id = segment_data["segment_id"]
+        skip_reason = self._skip_reason(payload, options)
+        if skip_reason is not None:
+            return _ParsedDocument(task=task, payload=payload, skip_reason=skip_reason)
 
-        segment_ids: tuple[str, ...] = (segment_id,) if segment_id else ()
-        return IndexBuildResult(
-            documents_indexed=documents_indexed,
-            documents_skipped=documents_skipped,
-            errors=tuple(errors),
-            segment_ids=segment_ids,
-            segment_paths=segment_paths,
+        try:
+            analyzed = analyze_document(self.context.schema, payload.record)
+        except ValueError as exc:
+            return _ParsedDocument(task=task, payload=payload, error=str(exc))
+        return _ParsedDocument(
+            task=task,
+            payload=payload,
+            analyzed=analyzed,
+            record_digest=_record_digest(payload.record),
         )
 
+    def _skip_reason(self, payload: _DocumentPayload, options: _ParseOptions) -> str | None:
+        if options.normalized_filters:
+            markdown_rel = self._relative_to_root(payload.markdown_path)
+            metadata_rel = self._relative_to_root(payload.metadata_path) if payload.metadata_path is not None else None
+            if markdown_rel not in options.normalized_filters and (
+                metadata_rel is None or metadata_rel not in options.normalized_filters
+            ):
+                return "path_filtered"
+
+        if self.context.source_type == "online" and not self._url_allowed(payload.url):
+            return "url_filtered"
+
+        if options.changed_only and options.last_built_at and not self._has_changed(payload, options.last_built_at):
+            if not options.forced_paths or (
+                self._relative_to_root(payload.markdown_path) not in options.forced_paths
+                and (
+                    payload.metadata_path is None
+                    or self._relative_to_root(payload.metadata_path) not in options.forced_paths
+                )
+            ):
+                return "unchanged"
+        return None
+
+    def _unchanged_on_disk(self, markdown_path: Path, options: _ParseOptions) -> bool:
+        """Whether a standalone markdown file predates the last build and was not forced."""
+        if options.last_built_at is None or self._relative_to_root(markdown_path) in (options.forced_paths or ()):
+            return False
+        try:
+            return markdown_path.stat().st_mtime <= options.last_built_at.timestamp()
+        except OSError:
+            return False
+
     def compute_fingerprint(self) -> str | None:
         """Return the deterministic fingerprint without persisting a segment."""
 
@@ -578,6 +874,76 @@ class _DocumentPayload:
     freshness_evidence: str | None
 
 
+_TASK_METADATA = "metadata"
+_TASK_MARKDOWN = "markdown"
+
+
+@dataclass(frozen=True)
+class _ParseTask:
+    kind: str
+    path: Path
+
+
+@dataclass(frozen=True)
+class _ParseOptions:
+    normalized_filters: frozenset[Path]
+    last_built_at: datetime | None
+    changed_only: bool
+    # Delta builds only: paths re-indexed even when their mtime predates ``last_built_at``.
+    forced_paths: frozenset[Path] | None = None
+
+
+@dataclass
+class _BuildTally:
+    """Counters and document paths gathered while adding documents to a writer."""
+
+    fingerprinter: _DocsFingerprintBuilder
+    documents_indexed: int = 0
+    documents_skipped: int = 0
+    errors: list[str] = field(default_factory=list)
+    explicit_freshness_count: int = 0
+    source_updated_at: datetime | None = None
+    source_evidence: set[str] = field(default_factory=set)
+    # Relative markdown paths that still exist on disk and pass the URL filters.
+    present_paths: set[str] = field(default_factory=set)
+    indexed_paths: set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True)
+class _ParsedDocument:
+    """Worker output for one task: a load error, a skip, or an analyzed document."""
+
+    task: _ParseTask
+    payload: _DocumentPayload | None = None
+    skip_reason: str | None = None
+    error: str | None = None
+    analyzed: AnalyzedDocument | None = None
+    record_digest: str = ""
+
+    def require_analyzed(self) -> AnalyzedDocument:
+        """Return the analyzed document, raising ValueError with the parse error when there is none."""
+        if self.analyzed is None:
+            raise ValueError(self.error)
+        return self.analyzed
+
+
+# Per-process parse worker state, filled in by the pool initializer.
+_worker_holder: dict[str, Any] = {}
+
+
+def _init_parse_worker(context: TenantIndexingContext, options: _ParseOptions) -> None:
+    _worker_holder["indexer"] = TenantIndexer(context)
+    _worker_holder["options"] = options
+
+
+def _parse_chunk_in_worker(tasks: list[_ParseTask]) -> list[_ParsedDocument]:
+    indexer: TenantIndexer | None = _worker_holder.get("indexer")
+    options: _ParseOptions | None = _worker_holder.get("options")
+    assert indexer is not None
+    assert options is not None
+    return [indexer._parse_document(task, options) for task in tasks]
+
+
 @dataclass(frozen=True)
 class TieredHeadings:
     """Headings separated by level for weighted search."""
@@ -721,6 +1087,21 @@ def _should_skip_markdown_dir(dirname: str) -> bool:
     return dirname in _SKIP_MARKDOWN_DIRS or dirname.startswith(_STAGING_DIR_PREFIX)
 
 
+def _live_document_paths(segments: Sequence[SqliteSegment]) -> dict[str, str | None]:
+    """Map doc id to stored path for the documents live across base + delta segments (oldest first)."""
+    live: dict[str, str | None] = {}
+    for segment in segments:
+        for doc_id in segment.deleted_doc_ids():
+            live.pop(doc_id, None)
+        live.update(segment.document_paths())
+    return live
+
+
+def _record_digest(record: Mapping[str, Any]) -> str:
+    serialized_record = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(serialized_record.encode("utf-8")).hexdigest()
+
+
 class _DocsFingerprintBuilder:
     """Deterministically hash indexed documents + schema for idempotent segments."""
 
@@ -733,8 +1114,10 @@ class _DocsFingerprintBuilder:
         self._doc_digests: list[tuple[str, str]] = []
 
     def add_document(self, doc_id: str, record: Mapping[str, Any]) -> None:
-        serialized_record = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
-        digest = hashlib.sha256(serialized_record.encode("utf-8")).hexdigest()
+        self.add_digest(doc_id, _record_digest(record))
+
+    def add_digest(self, doc_id: str, digest: str) -> None:
+        """Add a document whose record was hashed elsewhere (e.g. in a parse worker)."""
         self._doc_digests.append((doc_id, digest))
 
     def digest(self) -> str:
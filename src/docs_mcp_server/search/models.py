@@ -31,3 +31,29 @@ class Posting:
         """Create from dictionary."""
         positions = array("I", data.get("positions", []))
         return cls(doc_id=data["doc_id"], frequency=data.get("frequency", 0), positions=positions)
+
+
+# Rough per-list cost of the array headers and the owning object.
+_POSTING_COLUMNS_OVERHEAD_BYTES = 256
+
+
+@dataclass(frozen=True, slots=True)
+class PostingColumns:
+    """Columnar posting list for one (field, term): parallel arrays indexed by posting.
+
+    ``ordinals`` are dense per-segment doc ordinals in ascending order; a
+    ``doc_lengths`` value of 0 means the length is unknown.
+    """
+
+    ordinals: array
+    frequencies: array
+    doc_lengths: array
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this posting list."""
+        payload = sum(column.itemsize * len(column) for column in (self.ordinals, self.frequencies, self.doc_lengths))
+        return payload + _POSTING_COLUMNS_OVERHEAD_BYTES
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
@@ -5,12 +5,49 @@ when query terms appear adjacent or near each other in documents.
 
 The phrase bonus is a smart default that rewards exact or near-exact
 phrase matches without requiring per-tenant configuration.
+
+It also holds the helpers behind exact-phrase queries: quoted phrases in the
+query string (or the whole query with ``word_match``) must appear verbatim,
+i.e. as adjacent analyzed terms, in at least one text field of every result.
 """
 
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
 import heapq
+import re
+
+
+_QUOTED_PHRASE = re.compile(r'"([^"]*)"')
+
+
+def parse_phrases(query: str, *, word_match: bool = False) -> list[str]:
+    """Return the exact phrases a query requires.
+
+    With ``word_match`` the whole query (quotes ignored) is a single phrase;
+    otherwise every double-quoted span is one. An unmatched quote is ignored.
+    """
+    if word_match:
+        phrase = query.replace('"', " ").strip()
+        return [phrase] if phrase else []
+    return [phrase.strip() for phrase in _QUOTED_PHRASE.findall(query) if phrase.strip()]
+
+
+def strip_phrases(query: str) -> str:
+    """Return the query with its quoted phrases removed."""
+    return _QUOTED_PHRASE.sub(" ", query)
+
+
+def has_phrase(term_positions: Sequence[Sequence[int]]) -> bool:
+    """Whether the terms occur consecutively, i.e. ``p + i`` is in ``term_positions[i]`` for some ``p``."""
+    if not term_positions:
+        return False
+    starts = set(term_positions[0])
+    for offset, positions in enumerate(term_positions[1:], start=1):
+        starts.intersection_update(position - offset for position in positions)
+        if not starts:
+            return False
+    return bool(starts)
 
 
 def get_min_span(term_positions: Mapping[str, Sequence[int]]) -> float:
@@ -0,0 +1,134 @@
+"""Byte-budgeted LRU cache of decoded posting lists.
+
+Hot terms ("model", "request", "config") are looked up by almost every query.
+Instead of re-running the postings SQL and rebuilding ``Posting`` objects each
+time, segments keep decoded lists here as compact parallel arrays keyed by
+``(segment_id, field, term)``. Doc ids are stored as ordinals into the owning
+segment's doc ordinal table, so an entry costs ~12 bytes per posting.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+
+from docs_mcp_server.observability.metrics import (
+    POSTING_CACHE_BYTES,
+    POSTING_CACHE_HITS,
+    POSTING_CACHE_MISSES,
+)
+from docs_mcp_server.search.models import PostingColumns
+
+
+DEFAULT_POSTING_CACHE_BYTES = 64 * 1024 * 1024
+
+CacheKey = tuple[str, str, str]
+
+
+class PostingCache:
+    """Thread-safe LRU of ``PostingColumns`` bounded by a byte budget."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_POSTING_CACHE_BYTES) -> None:
+        self.budget_bytes = max(0, budget_bytes)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, PostingColumns] = OrderedDict()
+        self._bytes_by_field: dict[str, int] = {}
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget_bytes > 0
+
+    def get(self, segment_id: str, field_name: str, term: str) -> PostingColumns | None:
+        """Return cached postings and mark them most recently used."""
+        key = (segment_id, field_name, term)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            POSTING_CACHE_MISSES.labels(field=field_name).inc()
+        else:
+            POSTING_CACHE_HITS.labels(field=field_name).inc()
+        return entry
+
+    def put(self, segment_id: str, field_name: str, term: str, postings: PostingColumns) -> None:
+        """Insert postings, evicting least recently used entries to fit the budget."""
+        size = postings.nbytes
+        if size > self.budget_bytes:
+            return
+        key = (segment_id, field_name, term)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._account(key, -previous.nbytes)
+            self._entries[key] = postings
+            self._account(key, size)
+            while self.bytes_used > self.budget_bytes and self._entries:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._account(evicted_key, -evicted.nbytes)
+            field_bytes = dict(self._bytes_by_field)
+        self._publish(field_bytes)
+
+    def invalidate_segment(self, segment_id: str) -> int:
+        """Drop every entry belonging to ``segment_id`` (e.g. after an index swap)."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == segment_id]
+            for key in stale:
+                self._account(key, -self._entries.pop(key).nbytes)
+            field_bytes = dict(self._bytes_by_field)
+        if stale:
+            self._publish(field_bytes)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            field_bytes = dict.fromkeys(self._bytes_by_field, 0)
+            self._bytes_by_field.clear()
+            self.bytes_used = 0
+        self._publish(field_bytes)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _account(self, key: CacheKey, delta: int) -> None:
+        field_name = key[1]
+        self.bytes_used += delta
+        self._bytes_by_field[field_name] = self._bytes_by_field.get(field_name, 0) + delta
+
+    def _publish(self, field_bytes: dict[str, int]) -> None:
+        for field_name, used in field_bytes.items():
+            POSTING_CACHE_BYTES.labels(field=field_name).set(used)
+
+
+_cache_lock = threading.Lock()
+_cache_holder: dict[str, PostingCache] = {}
+
+
+def configure_posting_cache(budget_bytes: int) -> PostingCache:
+    """Replace the process-wide posting cache (called once at startup)."""
+    cache = PostingCache(budget_bytes)
+    with _cache_lock:
+        previous = _cache_holder.get("cache")
+        _cache_holder["cache"] = cache
+    if previous is not None:
+        previous.clear()
+    return cache
+
+
+def get_posting_cache() -> PostingCache:
+    """Return the process-wide posting cache, creating a default one if needed."""
+    with _cache_lock:
+        cache = _cache_holder.get("cache")
+        if cache is None:
+            cache = PostingCache()
+            _cache_holder["cache"] = cache
+        return cache
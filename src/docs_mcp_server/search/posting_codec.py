@@ -0,0 +1,371 @@
+"""Block-structured delta + varint codec for columnar posting lists.
+
+Segments store one blob per ``(field, term)`` instead of one row per posting.
+All integers are unsigned LEB128 varints (the same encoding as Go's
+``binary.Uvarint``), laid out as::
+
+    header:    n, block_size, skip_nbytes, columns_nbytes
+    skip:      per block: last_ordinal_delta, block_nbytes, max_tf, min_doc_length
+    columns:   per block: ordinal_deltas[b], tf[b], doc_length[b]
+    positions: position_count[n], position_deltas[sum(position_count)]
+
+Postings are grouped into blocks of ``block_size`` (the last block may be
+shorter). Doc ordinals are sorted and delta-encoded across the whole list, so
+a block's first delta is relative to the previous block's last ordinal, which
+the skip table records. The skip table also keeps each block's largest tf and
+smallest doc length: enough for a BM25 upper bound per block, so top-k
+pruning can decide which blocks to decode at all. Positions within each doc
+are delta-encoded too, and scoring never touches them. Encoding and decoding
+are vectorized with NumPy so large lists don't pay per-integer Python overhead.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from docs_mcp_server.search.models import PostingColumns
+from docs_mcp_server.search.stats import bm25_weights
+
+
+POSTING_BLOCK_SIZE = 128
+
+_MAX_VARINT_BYTES = 10
+_HEADER_VALUES = 4
+_SKIP_VALUES = 4
+
+
+def _varint_nbytes(data: np.ndarray) -> np.ndarray:
+    nbytes = np.ones(data.shape, dtype=np.int64)
+    for shift in range(7, 64, 7):
+        nbytes += data >= (np.uint64(1) << np.uint64(shift))
+    return nbytes
+
+
+def encode_varints(values: np.ndarray) -> bytes:
+    """Encode non-negative integers as concatenated LEB128 varints."""
+    data = np.asarray(values, dtype=np.uint64)
+    if data.size == 0:
+        return b""
+    nbytes = _varint_nbytes(data)
+    ends = np.cumsum(nbytes)
+    starts = ends - nbytes
+    out = np.empty(int(ends[-1]), dtype=np.uint8)
+    for index in range(int(nbytes.max())):
+        mask = nbytes > index
+        chunk = (data[mask] >> np.uint64(7 * index)) & np.uint64(0x7F)
+        more = (nbytes[mask] > index + 1).astype(np.uint64) << np.uint64(7)
+        out[starts[mask] + index] = (chunk | more).astype(np.uint8)
+    return out.tobytes()
+
+
+def decode_varints(blob: bytes | memoryview) -> np.ndarray:
+    """Decode concatenated LEB128 varints into a ``uint64`` array."""
+    raw = np.frombuffer(blob, dtype=np.uint8)
+    if raw.size == 0:
+        return np.zeros(0, dtype=np.uint64)
+    ends = np.flatnonzero(raw < 0x80)
+    if ends.size == 0 or ends[-1] != raw.size - 1:
+        raise ValueError("Truncated varint stream")
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts + 1
+    if int(lengths.max()) == 1:
+        return raw.astype(np.uint64)
+    offsets = np.arange(raw.size, dtype=np.int64) - np.repeat(starts, lengths)
+    payload = (raw & 0x7F).astype(np.uint64) << (np.uint64(7) * offsets.astype(np.uint64))
+    return np.add.reduceat(payload, starts)
+
+
+def _read_header(blob: bytes) -> tuple[list[int], int]:
+    values: list[int] = []
+    value = 0
+    shift = 0
+    for offset, byte in enumerate(blob[: _MAX_VARINT_BYTES * _HEADER_VALUES]):
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append(value)
+        if len(values) == _HEADER_VALUES:
+            return values, offset + 1
+        value = 0
+        shift = 0
+    raise ValueError("Truncated posting list header")
+
+
+def _block_sizes(count: int, block_size: int) -> np.ndarray:
+    full, rest = divmod(count, block_size)
+    sizes = np.full(full + (1 if rest else 0), block_size, dtype=np.int64)
+    if rest:
+        sizes[-1] = rest
+    return sizes
+
+
+def _to_block_major(columns: np.ndarray, block_size: int) -> np.ndarray:
+    """Reorder a ``(3, n)`` column matrix into per-block ``[c0..., c1..., c2...]`` runs."""
+    full = columns.shape[1] // block_size * block_size
+    head = columns[:, :full].reshape(3, -1, block_size).transpose(1, 0, 2).ravel()
+    return np.concatenate((head, columns[:, full:].ravel()))
+
+
+def encode_posting_list(
+    ordinals: Sequence[int],
+    frequencies: Sequence[int],
+    doc_lengths: Sequence[int],
+    positions: Sequence[array],
+    *,
+    block_size: int = POSTING_BLOCK_SIZE,
+) -> bytes:
+    """Pack one posting list into a blob; ``ordinals`` must be strictly increasing."""
+    ordinal_values = np.asarray(ordinals, dtype=np.int64)
+    tf_values = np.asarray(frequencies, dtype=np.int64)
+    length_values = np.asarray(doc_lengths, dtype=np.int64)
+    count = int(ordinal_values.size)
+
+    skip = columns = b""
+    if count:
+        sizes = _block_sizes(count, block_size)
+        starts = np.cumsum(sizes) - sizes
+        column_values = _to_block_major(
+            np.stack((np.diff(ordinal_values, prepend=0), tf_values, length_values)), block_size
+        )
+        block_nbytes = np.add.reduceat(_varint_nbytes(column_values.astype(np.uint64)), starts * 3)
+        effective_lengths = np.where(length_values > 0, length_values, tf_values)
+        skip_table = np.stack(
+            (
+                np.diff(ordinal_values[starts + sizes - 1], prepend=0),
+                block_nbytes,
+                np.maximum.reduceat(tf_values, starts),
+                np.minimum.reduceat(effective_lengths, starts),
+            ),
+            axis=1,
+        )
+        skip = encode_varints(skip_table.ravel())
+        columns = encode_varints(column_values)
+
+    position_counts = np.fromiter((len(doc_positions) for doc_positions in positions), np.int64, count)
+    flat_positions = np.frombuffer(b"".join(doc_positions.tobytes() for doc_positions in positions), np.uint32)
+    position_deltas = np.diff(flat_positions.astype(np.int64), prepend=0)
+    doc_starts = (np.cumsum(position_counts) - position_counts)[position_counts > 0]
+    position_deltas[doc_starts] = flat_positions[doc_starts]
+    positions_section = encode_varints(np.concatenate((position_counts, position_deltas)))
+
+    header = encode_varints(np.array([count, block_size, len(skip), len(columns)]))
+    return header + skip + columns + positions_section
+
+
+def _columns_from_block_major(values: np.ndarray, sizes: np.ndarray, bases: np.ndarray) -> PostingColumns:
+    """Inverse of ``_to_block_major`` for the given blocks, restoring absolute ordinals.
+
+    Only a list's final block can be short, so every selected block but the
+    last has the same size and can be reshaped instead of gathered.
+    """
+    total = int(sizes.sum())
+    if values.size != total * 3:
+        raise ValueError("Corrupt posting list columns")
+    if not total:
+        return PostingColumns(array("I"), array("I"), array("I"))
+    full_size = int(sizes[0])
+    head_blocks = sizes.size - 1 if int(sizes[-1]) != full_size else sizes.size
+    head = values[: head_blocks * 3 * full_size].reshape(head_blocks, 3, full_size)
+    head_ordinals = bases[:head_blocks, None] + np.cumsum(head[:, 0, :], axis=1)
+    ordinals = [head_ordinals.ravel()]
+    frequencies = [head[:, 1, :].ravel()]
+    doc_lengths = [head[:, 2, :].ravel()]
+    if head_blocks < sizes.size:
+        tail = values[head_blocks * 3 * full_size :].reshape(3, -1)
+        ordinals.append(bases[-1] + np.cumsum(tail[0]))
+        frequencies.append(tail[1])
+        doc_lengths.append(tail[2])
+    return PostingColumns(
+        array("I", np.concatenate(ordinals).astype(np.uint32).tobytes()),
+        array("I", np.concatenate(frequencies).astype(np.uint32).tobytes()),
+        array("I", np.concatenate(doc_lengths).astype(np.uint32).tobytes()),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _SkipTable:
+    """Per-block skip entries: last ordinal, largest tf, smallest doc length and posting count."""
+
+    last_ordinals: np.ndarray
+    max_frequencies: np.ndarray
+    min_doc_lengths: np.ndarray
+    sizes: np.ndarray
+
+
+class PostingBlocks:
+    """A posting list's skip table with lazy, per-block decoding of its columns.
+
+    Built either from an encoded blob (blocks are decoded on demand) or from
+    already decoded ``PostingColumns`` (e.g. cache hits and row-format
+    segments), so callers can treat both the same way.
+    """
+
+    __slots__ = (
+        "_blob",
+        "_block_ends",
+        "_block_starts",
+        "_columns",
+        "_on_decode",
+        "last_ordinals",
+        "max_frequencies",
+        "min_doc_lengths",
+        "sizes",
+    )
+
+    def __init__(
+        self,
+        skip: _SkipTable,
+        *,
+        blob: bytes | None = None,
+        block_starts: np.ndarray | None = None,
+        block_ends: np.ndarray | None = None,
+        columns: PostingColumns | None = None,
+        on_decode: Callable[[PostingColumns], None] | None = None,
+    ) -> None:
+        self.last_ordinals = skip.last_ordinals
+        self.max_frequencies = skip.max_frequencies
+        self.min_doc_lengths = skip.min_doc_lengths
+        self.sizes = skip.sizes
+        self._blob = blob
+        self._block_starts = block_starts
+        self._block_ends = block_ends
+        self._columns = columns
+        self._on_decode = on_decode
+
+    @classmethod
+    def from_blob(cls, blob: bytes, *, on_decode: Callable[[PostingColumns], None] | None = None) -> PostingBlocks:
+        """Parse the header and skip table; ``on_decode`` sees the first full decode."""
+        (count, block_size, skip_nbytes, columns_nbytes), header_nbytes = _read_header(blob)
+        skip = decode_varints(memoryview(blob)[header_nbytes : header_nbytes + skip_nbytes]).astype(np.int64)
+        sizes = _block_sizes(count, block_size) if block_size else np.zeros(0, dtype=np.int64)
+        if skip.size != sizes.size * _SKIP_VALUES:
+            raise ValueError("Corrupt posting list skip table")
+        skip = skip.reshape(-1, _SKIP_VALUES)
+        block_nbytes = skip[:, 1]
+        if int(block_nbytes.sum()) != columns_nbytes:
+            raise ValueError("Corrupt posting list skip table")
+        block_ends = header_nbytes + skip_nbytes + np.cumsum(block_nbytes)
+        return cls(
+            _SkipTable(
+                last_ordinals=np.cumsum(skip[:, 0]),
+                max_frequencies=skip[:, 2],
+                min_doc_lengths=skip[:, 3],
+                sizes=sizes,
+            ),
+            blob=blob,
+            block_starts=block_ends - block_nbytes,
+            block_ends=block_ends,
+            on_decode=on_decode,
+        )
+
+    @classmethod
+    def from_columns(cls, columns: PostingColumns, *, block_size: int = POSTING_BLOCK_SIZE) -> PostingBlocks:
+        """Wrap decoded columns, deriving the skip table they would be stored with."""
+        ordinals = np.frombuffer(columns.ordinals, dtype=np.uint32).astype(np.int64)
+        frequencies = np.frombuffer(columns.frequencies, dtype=np.uint32).astype(np.int64)
+        doc_lengths = np.frombuffer(columns.doc_lengths, dtype=np.uint32).astype(np.int64)
+        sizes = _block_sizes(ordinals.size, block_size)
+        starts = np.cumsum(sizes) - sizes
+        if not sizes.size:
+            empty = np.zeros(0, dtype=np.int64)
+            return cls(_SkipTable(empty, empty, empty, sizes), columns=columns)
+        return cls(
+            _SkipTable(
+                last_ordinals=ordinals[starts + sizes - 1],
+                max_frequencies=np.maximum.reduceat(frequencies, starts),
+                min_doc_lengths=np.minimum.reduceat(np.where(doc_lengths > 0, doc_lengths, frequencies), starts),
+                sizes=sizes,
+            ),
+            columns=columns,
+        )
+
+    def __len__(self) -> int:
+        return int(self.sizes.sum())
+
+    @property
+    def block_count(self) -> int:
+        return int(self.sizes.size)
+
+    def max_weights(self, avg_length: float, *, k1: float, b: float) -> np.ndarray:
+        """Per-block upper bound of the BM25 term weight (without IDF)."""
+        return bm25_weights(
+            self.max_frequencies.astype(np.float64), self.min_doc_lengths.astype(np.float64), avg_length, k1=k1, b=b
+        )
+
+    def block_of(self, ordinals: np.ndarray) -> np.ndarray:
+        """Index of the block whose ordinal range covers each ordinal (``block_count`` if past the end)."""
+        return np.searchsorted(self.last_ordinals, ordinals, side="left")
+
+    def columns(self) -> PostingColumns:
+        """Decode (once) and return the whole posting list."""
+        if self._columns is None:
+            self._columns = self.select(np.arange(self.block_count))
+            if self._on_decode is not None:
+                self._on_decode(self._columns)
+        return self._columns
+
+    def select(self, block_indices: np.ndarray) -> PostingColumns:
+        """Decode only the given blocks (ascending, unique)."""
+        block_indices = np.asarray(block_indices, dtype=np.int64)
+        if self._columns is not None:
+            return self._slice_columns(block_indices)
+        sizes = self.sizes[block_indices]
+        bases = np.where(block_indices > 0, self.last_ordinals[block_indices - 1], 0)
+        view = memoryview(self._blob)
+        payload = b"".join(
+            view[start:end]
+            for start, end in zip(
+                self._block_starts[block_indices].tolist(), self._block_ends[block_indices].tolist(), strict=True
+            )
+        )
+        return _columns_from_block_major(decode_varints(payload).astype(np.int64), sizes, bases)
+
+    def _slice_columns(self, block_indices: np.ndarray) -> PostingColumns:
+        columns = self._columns
+        if block_indices.size == self.block_count:
+            return columns
+        starts = np.cumsum(self.sizes) - self.sizes
+        keep = np.concatenate(
+            [np.arange(starts[index], starts[index] + self.sizes[index]) for index in block_indices.tolist()]
+            or [np.zeros(0, dtype=np.int64)]
+        )
+        return PostingColumns(
+            array("I", np.frombuffer(columns.ordinals, dtype=np.uint32)[keep].tobytes()),
+            array("I", np.frombuffer(columns.frequencies, dtype=np.uint32)[keep].tobytes()),
+            array("I", np.frombuffer(columns.doc_lengths, dtype=np.uint32)[keep].tobytes()),
+        )
+
+
+def decode_posting_columns(blob: bytes) -> PostingColumns:
+    """Decode ordinals, tf and doc_length columns, skipping positions."""
+    return PostingBlocks.from_blob(blob).columns()
+
+
+def decode_posting_positions(blob: bytes, indices: Sequence[int] | None = None) -> list[array]:
+    """Decode per-posting position arrays (same order as the columns).
+
+    ``indices`` selects postings by index into the list; only their arrays are built.
+    """
+    (count, _block_size, skip_nbytes, columns_nbytes), header_nbytes = _read_header(blob)
+    values = decode_varints(memoryview(blob)[header_nbytes + skip_nbytes + columns_nbytes :])
+    position_counts = values[:count].astype(np.int64)
+    position_deltas = values[count:].astype(np.int64)
+    if position_deltas.size != int(position_counts.sum()):
+        raise ValueError("Corrupt posting list positions")
+    ends = np.cumsum(position_counts)
+    starts = ends - position_counts
+    non_empty = position_counts > 0
+    running = np.cumsum(position_deltas)
+    # Positions restart per doc: subtract the running total accumulated before each doc's first position.
+    doc_base = running[starts[non_empty]] - position_deltas[starts[non_empty]]
+    flat = (running - np.repeat(doc_base, position_counts[non_empty])).astype(np.uint32)
+    if indices is not None:
+        starts, ends = starts[indices], ends[indices]
+    return [array("I", flat[start:end].tobytes()) for start, end in zip(starts.tolist(), ends.tolist(), strict=True)]
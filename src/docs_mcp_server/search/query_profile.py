@@ -0,0 +1,276 @@
+"""Per-query stage timings, work counters and the slow-query log.
+
+``SegmentSearchIndex.search`` opens a ``QueryProfile`` for every query it
+scores. The engine, segment reads and snippet building charge their time to
+named stages and count the postings they score and the SQL statements they
+issue; outside a profile that costs one context variable lookup.
+
+When the query finishes its profile is published as the
+``search_stage_seconds`` histogram, the ``search_postings_scanned_total`` and
+``search_sql_statements_total`` counters and ``search.stage`` span events.
+Queries slower than the configured threshold are counted in
+``search_slow_queries_total`` and sampled into a bounded in-memory log that
+the tenant dashboard shows.
+
+Stage times are exclusive: time spent in a nested stage (synonym expansion
+inside tokenization, posting reads inside phrase matching) is charged to the
+nested stage only.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import wraps
+import logging
+import random
+import threading
+import time
+from typing import Any, ParamSpec, TypeVar
+
+from docs_mcp_server.observability.metrics import (
+    SEARCH_POSTINGS_SCANNED,
+    SEARCH_SLOW_QUERIES,
+    SEARCH_SQL_STATEMENTS,
+    SEARCH_STAGE_SECONDS,
+)
+
+
+logger = logging.getLogger(__name__)
+
+TOKENIZE = "tokenize"
+SYNONYMS = "synonyms"
+POSTINGS = "postings"
+FUZZY = "fuzzy"
+PHRASE = "phrase"
+SCORING = "scoring"
+DOCUMENTS = "documents"
+SNIPPETS = "snippets"
+
+DEFAULT_SLOW_QUERY_MS = 250.0
+DEFAULT_SLOW_QUERY_SAMPLE_RATE = 1.0
+DEFAULT_SLOW_QUERY_LOG_SIZE = 200
+
+_QUERY_TEXT_LIMIT = 200
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+class QueryProfile:
+    """Stage timings and work counters of one query."""
+
+    __slots__ = ("_nested", "postings_scanned", "sql_statements", "stage_seconds")
+
+    def __init__(self) -> None:
+        self.stage_seconds: dict[str, float] = {}
+        self.postings_scanned = 0
+        self.sql_statements = 0
+        # Time spent in nested stages, per open stage.
+        self._nested: list[float] = []
+
+    def stage(self, name: str) -> _Stage:
+        """Charge the enclosed time, minus nested stages, to ``name``."""
+        return _Stage(self, name)
+
+    def _enter(self) -> float:
+        self._nested.append(0.0)
+        return time.perf_counter()
+
+    def _exit(self, name: str, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        nested = self._nested.pop()
+        self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + elapsed - nested
+        if self._nested:
+            self._nested[-1] += elapsed
+
+
+class _Stage:
+    """Context manager timing one stage; a plain class keeps it cheap on hot paths."""
+
+    __slots__ = ("_name", "_profile", "_started")
+
+    def __init__(self, profile: QueryProfile, name: str) -> None:
+        self._profile = profile
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = self._profile._enter()
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self._profile._exit(self._name, self._started)
+
+
+_current_profile: ContextVar[QueryProfile | None] = ContextVar("search_query_profile", default=None)
+
+
+@contextmanager
+def profile_query() -> Iterator[QueryProfile]:
+    """Make a fresh profile current for the enclosed query."""
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+    """Time the enclosed block as stage ``name`` of the current query, if one is profiled."""
+    profile = _current_profile.get()
+    return nullcontext() if profile is None else profile.stage(name)
+
+
+def timed_stage(name: str) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Decorator form of ``stage``."""
+
+    def decorator(func: Callable[_P, _R]) -> Callable[_P, _R]:
+        @wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            profile = _current_profile.get()
+            if profile is None:
+                return func(*args, **kwargs)
+            started = profile._enter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile._exit(name, started)
+
+        return wrapper
+
+    return decorator
+
+
+def count_postings(count: int) -> None:
+    """Record ``count`` postings scored by the current query."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.postings_scanned += count
+
+
+def count_sql_statement() -> None:
+    """Record one SQL statement issued by the current query."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.sql_statements += 1
+
+
+@dataclass(frozen=True, slots=True)
+class SlowQuery:
+    """One sampled slow-query log entry."""
+
+    timestamp: float
+    tenant: str
+    query: str
+    duration_ms: float
+    result_count: int
+    postings_scanned: int
+    sql_statements: int
+    stages_ms: dict[str, float]
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class SlowQueryLog:
+    """Bounded, thread-safe log of sampled queries slower than a threshold."""
+
+    def __init__(
+        self,
+        threshold_ms: float = DEFAULT_SLOW_QUERY_MS,
+        sample_rate: float = DEFAULT_SLOW_QUERY_SAMPLE_RATE,
+        max_entries: int = DEFAULT_SLOW_QUERY_LOG_SIZE,
+        *,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.threshold_ms = max(0.0, threshold_ms)
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self._rng = rng
+        self._lock = threading.Lock()
+        self._entries: deque[SlowQuery] = deque(maxlen=max(1, max_entries))
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def observe(self, profile: QueryProfile, *, tenant: str, query: str, duration_s: float, result_count: int) -> bool:
+        """Count a finished query as slow if it crossed the threshold; returns whether it was logged."""
+        duration_ms = duration_s * 1000
+        if not self.enabled or duration_ms < self.threshold_ms:
+            return False
+        SEARCH_SLOW_QUERIES.labels(tenant=tenant).inc()
+        if self.sample_rate < 1.0 and self._rng() >= self.sample_rate:
+            return False
+        entry = SlowQuery(
+            timestamp=time.time(),
+            tenant=tenant,
+            query=query[:_QUERY_TEXT_LIMIT],
+            duration_ms=round(duration_ms, 3),
+            result_count=result_count,
+            postings_scanned=profile.postings_scanned,
+            sql_statements=profile.sql_statements,
+            stages_ms={name: round(seconds * 1000, 3) for name, seconds in profile.stage_seconds.items()},
+        )
+        with self._lock:
+            self._entries.append(entry)
+        logger.warning(
+            "Slow search for %s took %.1fms (%d postings, %d SQL statements): %s",
+            tenant,
+            duration_ms,
+            profile.postings_scanned,
+            profile.sql_statements,
+            entry.stages_ms,
+        )
+        return True
+
+    def entries(self, tenant: str | None = None) -> list[SlowQuery]:
+        """Logged slow queries, newest first, optionally for one tenant."""
+        with self._lock:
+            entries = list(self._entries)
+        return [entry for entry in reversed(entries) if tenant is None or entry.tenant == tenant]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def publish_profile(
+    profile: QueryProfile, *, tenant: str, query: str, duration_s: float, result_count: int, span: Any
+) -> None:
+    """Export a finished query's profile as metrics and span events and feed the slow-query log."""
+    for name, seconds in profile.stage_seconds.items():
+        SEARCH_STAGE_SECONDS.labels(stage=name).observe(seconds)
+        span.add_event("search.stage", {"search.stage": name, "search.stage.duration_ms": round(seconds * 1000, 3)})
+    span.set_attribute("search.postings_scanned", profile.postings_scanned)
+    span.set_attribute("search.sql_statements", profile.sql_statements)
+    if profile.postings_scanned:
+        SEARCH_POSTINGS_SCANNED.labels(tenant=tenant).inc(profile.postings_scanned)
+    if profile.sql_statements:
+        SEARCH_SQL_STATEMENTS.labels(tenant=tenant).inc(profile.sql_statements)
+    get_slow_query_log().observe(profile, tenant=tenant, query=query, duration_s=duration_s, result_count=result_count)
+
+
+_log_lock = threading.Lock()
+_log_holder: dict[str, SlowQueryLog] = {}
+
+
+def configure_slow_query_log(threshold_ms: float, sample_rate: float) -> SlowQueryLog:
+    """Replace the process-wide slow-query log (called once at startup)."""
+    slow_log = SlowQueryLog(threshold_ms, sample_rate)
+    with _log_lock:
+        _log_holder["log"] = slow_log
+    return slow_log
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """Return the process-wide slow-query log, creating a default one if needed."""
+    with _log_lock:
+        slow_log = _log_holder.get("log")
+        if slow_log is None:
+            slow_log = SlowQueryLog()
+            _log_holder["log"] = slow_log
+        return slow_log
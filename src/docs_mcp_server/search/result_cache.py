@@ -0,0 +1,178 @@
+"""Bounded, TTL-aware cache of ranked search responses.
+
+Agents repeat the same ``root_search(tenant, query, size)`` calls within and
+across sessions. Responses are cached per ``(tenant, segment_ids, normalized
+query terms, size)``: the segment ids make every entry specific to one index
+generation, so publishing a new segment or delta can never serve stale hits,
+and tenants drop their entries when they swap indexes.
+
+Entries expire after a TTL and are evicted least recently used once either
+the entry or the byte budget is exceeded. A tenant's ``cache_pin_seconds``
+pins its entries for that long: they outlive the TTL and are never evicted
+for room, so a cache full of pinned entries rejects new responses instead.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+import threading
+import time
+
+from docs_mcp_server.domain.search import SearchResponse
+from docs_mcp_server.observability.metrics import (
+    SEARCH_RESULT_CACHE_HIT_RATIO,
+    SEARCH_RESULT_CACHE_HITS,
+    SEARCH_RESULT_CACHE_MISSES,
+)
+
+
+DEFAULT_RESULT_CACHE_ENTRIES = 2048
+DEFAULT_RESULT_CACHE_BYTES = 16 * 1024 * 1024
+DEFAULT_RESULT_CACHE_TTL_SECONDS = 300.0
+
+# Rough per-result overhead of the pydantic models on top of their strings.
+_RESULT_OVERHEAD_BYTES = 512
+
+ResultCacheKey = tuple[str, tuple[str, ...], tuple[tuple[str, ...], ...], int]
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    response: SearchResponse
+    nbytes: int
+    expires_at: float
+    pinned_until: float
+
+
+class QueryResultCache:
+    """Thread-safe LRU of ``SearchResponse`` objects bounded by entries and bytes."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_RESULT_CACHE_ENTRIES,
+        budget_bytes: int = DEFAULT_RESULT_CACHE_BYTES,
+        ttl_seconds: float = DEFAULT_RESULT_CACHE_TTL_SECONDS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(0, max_entries)
+        self.budget_bytes = max(0, budget_bytes)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ResultCacheKey, _CachedResponse] = OrderedDict()
+        self._hits_by_tenant: dict[str, int] = {}
+        self._lookups_by_tenant: dict[str, int] = {}
+        self.bytes_used = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.budget_bytes > 0 and self.ttl_seconds > 0
+
+    def get(self, key: ResultCacheKey) -> SearchResponse | None:
+        """Return a live cached response and mark it most recently used."""
+        tenant = key[0]
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._drop(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits_by_tenant[tenant] = self._hits_by_tenant.get(tenant, 0) + 1
+            lookups = self._lookups_by_tenant[tenant] = self._lookups_by_tenant.get(tenant, 0) + 1
+            hit_ratio = self._hits_by_tenant.get(tenant, 0) / lookups
+        if entry is None:
+            SEARCH_RESULT_CACHE_MISSES.labels(tenant=tenant).inc()
+        else:
+            SEARCH_RESULT_CACHE_HITS.labels(tenant=tenant).inc()
+        SEARCH_RESULT_CACHE_HIT_RATIO.labels(tenant=tenant).set(hit_ratio)
+        return entry.response if entry is not None else None
+
+    def put(self, key: ResultCacheKey, response: SearchResponse, *, pin_seconds: float = 0.0) -> None:
+        """Insert a response, evicting unpinned least recently used entries to fit."""
+        size = response_nbytes(response)
+        if not self.enabled or size > self.budget_bytes:
+            return
+        now = self._clock()
+        pinned_until = now + max(0.0, pin_seconds)
+        entry = _CachedResponse(response, size, max(now + self.ttl_seconds, pinned_until), pinned_until)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self.bytes_used += size
+            while len(self._entries) > self.max_entries or self.bytes_used > self.budget_bytes:
+                victim = next((k for k, cached in self._entries.items() if cached.pinned_until <= now), None)
+                if victim is None:
+                    # Everything left is pinned (the new entry included): keep the pins.
+                    self._drop(key)
+                    break
+                self._drop(victim)
+
+    def invalidate_tenant(self, tenant: str, *, keep_segment_ids: tuple[str, ...] | None = None) -> int:
+        """Drop the tenant's entries, except those for ``keep_segment_ids`` (e.g. after an index swap)."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == tenant and key[1] != keep_segment_ids]
+            for key in stale:
+                self._drop(key)
+        return len(stale)
+
+    def hit_ratio(self, tenant: str) -> float:
+        """Fraction of the tenant's lookups served from the cache since startup."""
+        with self._lock:
+            lookups = self._lookups_by_tenant.get(tenant, 0)
+            return self._hits_by_tenant.get(tenant, 0) / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes_used = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _drop(self, key: ResultCacheKey) -> None:
+        self.bytes_used -= self._entries.pop(key).nbytes
+
+
+def response_nbytes(response: SearchResponse) -> int:
+    """Approximate memory held by a cached response."""
+    return sum(
+        _RESULT_OVERHEAD_BYTES
+        + len(result.document_url)
+        + len(result.document_title)
+        + len(result.snippet)
+        + len(result.match_trace.query_variant)
+        for result in response.results
+    )
+
+
+_cache_lock = threading.Lock()
+_cache_holder: dict[str, QueryResultCache] = {}
+
+
+def configure_result_cache(max_entries: int, budget_bytes: int, ttl_seconds: float) -> QueryResultCache:
+    """Replace the process-wide result cache (called once at startup)."""
+    cache = QueryResultCache(max_entries, budget_bytes, ttl_seconds)
+    with _cache_lock:
+        previous = _cache_holder.get("cache")
+        _cache_holder["cache"] = cache
+    if previous is not None:
+        previous.clear()
+    return cache
+
+
+def get_result_cache() -> QueryResultCache:
+    """Return the process-wide result cache, creating a default one if needed."""
+    with _cache_lock:
+        cache = _cache_holder.get("cache")
+        if cache is None:
+            cache = QueryResultCache()
+            _cache_holder["cache"] = cache
+        return cache
@@ -0,0 +1,171 @@
+"""Bounded executor that runs blocking tenant searches off the event loop.
+
+Segment searches do SQLite I/O, BM25 scoring, fuzzy expansion and snippet
+building synchronously. Running them inline would stall the uvicorn event loop
+for every tenant, so searches are submitted to a shared thread pool instead.
+
+Each tenant gets its own admission gate so one tenant with slow queries cannot
+occupy every worker. A gate slot is only released once the worker thread has
+actually finished, which keeps the bound honest even after a caller has given
+up on a timed-out search.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+import logging
+import threading
+from typing import TypeVar
+
+from docs_mcp_server.observability.metrics import SEARCH_ACTIVE, SEARCH_QUEUE_DEPTH, SEARCH_TIMEOUTS
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_SEARCH_WORKERS = 8
+DEFAULT_MAX_CONCURRENCY_PER_TENANT = 4
+DEFAULT_SEARCH_TIMEOUT_S = 30.0
+
+
+class SearchTimeoutError(TimeoutError):
+    """Raised when a search does not complete within the configured timeout."""
+
+    def __init__(self, tenant: str, timeout_seconds: float) -> None:
+        super().__init__(f"Search for {tenant} timed out after {timeout_seconds:g}s")
+        self.tenant = tenant
+        self.timeout_seconds = timeout_seconds
+
+
+class SearchExecutor:
+    """Thread pool with per-tenant admission limits and queue-depth metrics."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_SEARCH_WORKERS,
+        max_concurrency_per_tenant: int = DEFAULT_MAX_CONCURRENCY_PER_TENANT,
+        timeout_seconds: float = DEFAULT_SEARCH_TIMEOUT_S,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Number of search worker threads shared by all tenants
+            max_concurrency_per_tenant: Max in-flight searches per tenant
+            timeout_seconds: Max seconds a caller waits, including queue time
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_concurrency_per_tenant = max(1, max_concurrency_per_tenant)
+        self.timeout_seconds = timeout_seconds
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="search")
+        self._lock = threading.Lock()
+        self._gates: dict[str, asyncio.Semaphore] = {}
+        self._gates_loop: asyncio.AbstractEventLoop | None = None
+        self._queued: dict[str, int] = {}
+        self._active: dict[str, int] = {}
+
+    async def run(self, tenant: str, fn: Callable[..., T], *args: object) -> T:
+        """Run ``fn(*args)`` on a search worker, bounded per tenant.
+
+        Raises:
+            SearchTimeoutError: If the search (queue wait included) exceeds the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        gate = self._gate_for(tenant, loop)
+        self._adjust(self._queued, SEARCH_QUEUE_DEPTH, tenant, 1)
+        acquired = False
+        try:
+            async with asyncio.timeout(self.timeout_seconds):
+                await gate.acquire()
+                acquired = True
+                self._adjust(self._queued, SEARCH_QUEUE_DEPTH, tenant, -1)
+                self._adjust(self._active, SEARCH_ACTIVE, tenant, 1)
+                future = self._pool.submit(fn, *args)
+                future.add_done_callback(lambda _: self._release_threadsafe(loop, tenant, gate))
+                return await asyncio.wrap_future(future)
+        except TimeoutError as exc:
+            SEARCH_TIMEOUTS.labels(tenant=tenant).inc()
+            logger.warning("Search for %s timed out after %.1fs", tenant, self.timeout_seconds)
+            raise SearchTimeoutError(tenant, self.timeout_seconds) from exc
+        finally:
+            if not acquired:
+                self._adjust(self._queued, SEARCH_QUEUE_DEPTH, tenant, -1)
+
+    def queue_depth(self, tenant: str) -> int:
+        """Return searches waiting for a gate slot for ``tenant``."""
+        with self._lock:
+            return self._queued.get(tenant, 0)
+
+    def active(self, tenant: str) -> int:
+        """Return searches currently running on a worker for ``tenant``."""
+        with self._lock:
+            return self._active.get(tenant, 0)
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        """Stop accepting work and release the worker threads."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _gate_for(self, tenant: str, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        # Semaphores bind to the loop that first waits on them; start fresh if the
+        # executor outlives a loop (tests, or an app rebuilt in the same process).
+        if self._gates_loop is not loop:
+            self._gates = {}
+            self._gates_loop = loop
+        gate = self._gates.get(tenant)
+        if gate is None:
+            gate = asyncio.Semaphore(self.max_concurrency_per_tenant)
+            self._gates[tenant] = gate
+        return gate
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop, tenant: str, gate: asyncio.Semaphore) -> None:
+        # The loop may already be closed when a timed-out search finally returns.
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(self._release, tenant, gate)
+
+    def _release(self, tenant: str, gate: asyncio.Semaphore) -> None:
+        self._adjust(self._active, SEARCH_ACTIVE, tenant, -1)
+        gate.release()
+
+    def _adjust(self, counts: dict[str, int], gauge, tenant: str, delta: int) -> None:
+        with self._lock:
+            value = max(0, counts.get(tenant, 0) + delta)
+            counts[tenant] = value
+        gauge.labels(tenant=tenant).set(value)
+
+
+_executor_lock = threading.Lock()
+_executor_holder: dict[str, SearchExecutor] = {}
+
+
+def configure_search_executor(
+    *,
+    max_workers: int = DEFAULT_SEARCH_WORKERS,
+    max_concurrency_per_tenant: int = DEFAULT_MAX_CONCURRENCY_PER_TENANT,
+    timeout_seconds: float = DEFAULT_SEARCH_TIMEOUT_S,
+) -> SearchExecutor:
+    """Replace the process-wide search executor (called once at startup)."""
+    executor = SearchExecutor(
+        max_workers=max_workers,
+        max_concurrency_per_tenant=max_concurrency_per_tenant,
+        timeout_seconds=timeout_seconds,
+    )
+    with _executor_lock:
+        previous = _executor_holder.get("executor")
+        _executor_holder["executor"] = executor
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return executor
+
+
+def get_search_executor() -> SearchExecutor:
+    """Return the process-wide search executor, creating a default one if needed."""
+    with _executor_lock:
+        executor = _executor_holder.get("executor")
+        if executor is None:
+            executor = SearchExecutor()
+            _executor_holder["executor"] = executor
+        return executor
@@ -2,13 +2,28 @@
 
 Works with the existing segment database format that has documents and postings tables.
 Provides BM25 scoring and snippet generation with optional SIMD optimization.
+
+The segment, its parsed schema, field-length stats and the BM25 engine are
+loaded once and stay resident for the lifetime of the index, so queries do
+not pay segment setup costs.
+
+An index may also layer delta segments over its base segment. Each segment
+is scored against the combined collection statistics with the documents
+tombstoned by newer segments masked out, and the per-segment top hits are
+merged.
 """
 
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cache
 import logging
 import math
 from pathlib import Path
 import sqlite3
+import time
+from typing import Any
 
+import numpy as np
 from opentelemetry.trace import SpanKind
 
 from docs_mcp_server.domain.search import MatchTrace, SearchResponse, SearchResult as DomainSearchResult
@@ -16,11 +31,16 @@ from docs_mcp_server.observability import SEARCH_LATENCY, track_latency
 from docs_mcp_server.observability.tracing import create_span
 from docs_mcp_server.search.analyzers import get_analyzer
 from docs_mcp_server.search.bloom_filter import bloom_positions
-from docs_mcp_server.search.bm25_engine import BM25SearchEngine
+from docs_mcp_server.search.bm25_engine import BM25SearchEngine, CollectionStats, QueryTokens, RankedDocument
+from docs_mcp_server.search.phrase import parse_phrases
+from docs_mcp_server.search.posting_cache import get_posting_cache
+from docs_mcp_server.search.query_profile import profile_query, publish_profile
+from docs_mcp_server.search.result_cache import get_result_cache
 from docs_mcp_server.search.schema import Schema
 from docs_mcp_server.search.snippet import build_smart_snippet
 from docs_mcp_server.search.sqlite_pragmas import apply_read_pragmas
 from docs_mcp_server.search.sqlite_storage import SqliteSegment, SqliteSegmentStore
+from docs_mcp_server.search.stats import FieldLengthStats
 
 
 # Optional optimizations
@@ -41,6 +61,22 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 _SQLITE_MAX_VARIABLES = 999
+# Highest doc-frequency terms per field considered for posting prefetch during warm-up.
+_WARMUP_TERMS_PER_FIELD = 256
+# Results per replayed warm-up query, matching the default search size so their documents get read too.
+_WARMUP_MAX_RESULTS = 20
+# Stored columns a result needs: its URL and title, and the snippet sources.
+_RESULT_COLUMNS = ("url", "title", "body", "excerpt")
+
+
+@dataclass(frozen=True, slots=True)
+class WarmupReport:
+    """What ``SegmentSearchIndex.warm_up`` did before its budgets ran out."""
+
+    seconds: float
+    queries_replayed: int
+    postings_loaded: int
+    posting_bytes: int
 
 
 class SegmentSearchIndex:
@@ -56,12 +92,23 @@ class SegmentSearchIndex:
         enable_simd: bool | None = None,
         enable_lockfree: bool | None = None,
         enable_bloom_filter: bool | None = None,
+        delta_paths: Sequence[Path] = (),
+        cache_pin_seconds: float = 0.0,
     ):
-        """Initialize search index with segment database."""
+        """Initialize search index with segment database and optional delta segments (oldest first)."""
         self.db_path = db_path
+        self.delta_paths = tuple(delta_paths)
         self.tenant = tenant
+        self.cache_pin_seconds = cache_pin_seconds
         self._conn = None
         self._avg_doc_length_fallback = 1000.0
+        self._segment: SqliteSegment | None = None
+        self._delta_segments: list[SqliteSegment] = []
+        self._deleted_masks: list[np.ndarray | None] = []
+        self._delta_tombstones: list[frozenset[str]] = []
+        self._engine: BM25SearchEngine | None = None
+        self._field_length_stats: dict[str, FieldLengthStats] = {}
+        self.warmup_report: WarmupReport | None = None
 
         # SIMD optimization (enabled by default for performance)
         if enable_simd is None:
@@ -98,6 +145,7 @@ class SegmentSearchIndex:
 
         # Initialize connection and prepared statements
         self._initialize_connection()
+        self._load_resident_segment()
 
     def __enter__(self):
         """Context manager entry."""
@@ -135,8 +183,12 @@ class SegmentSearchIndex:
         cursor = self._conn.execute(query, params)
         return cursor.fetchone()
 
-    def search(self, query: str, max_results: int = 20) -> SearchResponse:
-        """Search documents with BM25 scoring."""
+    def search(self, query: str, max_results: int = 20, *, word_match: bool = False) -> SearchResponse:
+        """Search documents with BM25 scoring.
+
+        Double-quoted phrases in ``query`` must match exactly; ``word_match``
+        requires the whole query as one exact phrase.
+        """
         with (
             create_span(
                 "search.query",
@@ -149,17 +201,40 @@ class SegmentSearchIndex:
                 span.set_attribute("search.result_count", 0)
                 return SearchResponse(results=[])
 
-            segment = self._load_segment_for_scoring()
+            segment = self._segment
             if segment is not None:
-                try:
-                    response = self._search_with_engine(segment, query, max_results)
-                finally:
-                    segment.close()
+                result_cache = get_result_cache()
+                cache_key = None
+                if result_cache.enabled:
+                    cache_key = (
+                        self.tenant or "default",
+                        self.segment_ids,
+                        _normalized_query_terms(segment.schema, query, word_match=word_match),
+                        max_results,
+                    )
+                    cached = result_cache.get(cache_key)
+                    span.set_attribute("search.cache_hit", cached is not None)
+                    if cached is not None:
+                        span.set_attribute("search.result_count", len(cached.results))
+                        return cached
+                started = time.perf_counter()
+                with profile_query() as profile:
+                    response = self._search_with_engine(segment, query, max_results, word_match=word_match)
+                publish_profile(
+                    profile,
+                    tenant=self.tenant or "default",
+                    query=query,
+                    duration_s=time.perf_counter() - started,
+                    result_count=len(response.results),
+                    span=span,
+                )
+                if cache_key is not None:
+                    result_cache.put(cache_key, response, pin_seconds=self.cache_pin_seconds)
                 span.set_attribute("search.result_count", len(response.results))
                 return response
 
             analyzer = get_analyzer("default")
-            tokens = [token.text for token in analyzer(query.lower()) if token.text]
+            tokens = [term for term in analyzer.terms(query.lower()) if term]
 
             if not tokens:
                 span.set_attribute("search.result_count", 0)
@@ -199,27 +274,36 @@ class SegmentSearchIndex:
             span.set_attribute("search.result_count", len(results))
             return SearchResponse(results=results)
 
-    def _search_with_engine(self, segment: SqliteSegment, query: str, max_results: int) -> SearchResponse:
+    def _search_with_engine(
+        self, segment: SqliteSegment, query: str, max_results: int, *, word_match: bool = False
+    ) -> SearchResponse:
         """Search using the BM25 engine with full feature flags enabled."""
         if max_results <= 0:
             return SearchResponse(results=[])
 
-        engine = BM25SearchEngine(
-            segment.schema,
-            field_boosts=self._resolve_field_boosts(segment.schema),
-            enable_phrase_bonus=True,
-            enable_fuzzy=True,
-        )
-        token_context = engine.tokenize_query(query)
+        engine = self._engine if self._engine is not None else self._build_engine(segment)
+        token_context = engine.tokenize_query(query, word_match=word_match)
         if token_context.is_empty():
             return SearchResponse(results=[])
 
-        ranked = engine.score(segment, token_context, limit=max_results)
+        if self._delta_segments:
+            ranked = self._score_segments(engine, token_context, max_results)
+        else:
+            ranked = [
+                (ranked_doc, segment)
+                for ranked_doc in engine.score(
+                    segment,
+                    token_context,
+                    limit=max_results,
+                    field_length_stats=self._field_length_stats or None,
+                )
+            ]
         highlight_terms = list(token_context.ordered_terms)
 
+        stored_by_segment = self._fetch_result_fields(ranked)
         results: list[DomainSearchResult] = []
-        for ranked_doc in ranked:
-            doc_fields = segment.get_document(ranked_doc.doc_id)
+        for ranked_doc, source_segment in ranked:
+            doc_fields = stored_by_segment[id(source_segment)].get(ranked_doc.doc_id)
             if not doc_fields:
                 continue
             snippet_source = doc_fields.get("body") or doc_fields.get("excerpt") or doc_fields.get("title") or ""
@@ -242,10 +326,178 @@ class SegmentSearchIndex:
 
         return SearchResponse(results=results)
 
+    @staticmethod
+    def _fetch_result_fields(
+        ranked: list[tuple[RankedDocument, SqliteSegment]],
+    ) -> dict[int, dict[str, dict[str, Any]]]:
+        """Stored fields of a result page, one batched read per source segment, keyed by ``id(segment)``."""
+        doc_ids_by_segment: dict[int, list[str]] = {}
+        segments: dict[int, SqliteSegment] = {}
+        for ranked_doc, source_segment in ranked:
+            segments[id(source_segment)] = source_segment
+            doc_ids_by_segment.setdefault(id(source_segment), []).append(ranked_doc.doc_id)
+        return {
+            key: segments[key].get_documents(doc_ids, _RESULT_COLUMNS) for key, doc_ids in doc_ids_by_segment.items()
+        }
+
+    def _score_segments(
+        self, engine: BM25SearchEngine, token_context: QueryTokens, max_results: int
+    ) -> list[tuple[RankedDocument, SqliteSegment]]:
+        """Score the base and delta segments against shared stats and merge their top hits."""
+        segments = [self._segment, *self._delta_segments]
+
+        @cache
+        def doc_frequency(field_name: str, term: str) -> int:
+            return sum(segment.doc_frequency(field_name, term) for segment in segments)
+
+        collection = CollectionStats(
+            total_docs=sum(segment.doc_count for segment in segments),
+            field_length_stats=self._field_length_stats,
+            doc_frequency=doc_frequency,
+        )
+        ranked = [
+            (ranked_doc, segment)
+            for segment, deleted in zip(segments, self._deleted_masks, strict=True)
+            for ranked_doc in engine.score(
+                segment, token_context, limit=max_results, collection=collection, deleted=deleted
+            )
+        ]
+        # Stable sort: equal scores keep base-before-delta order.
+        ranked.sort(key=lambda item: item[0].score, reverse=True)
+        return ranked[:max_results]
+
     def _load_segment_for_scoring(self) -> SqliteSegment | None:
         store = SqliteSegmentStore(self.db_path.parent)
         return store.load(self.db_path.stem)
 
+    def _load_resident_segment(self) -> None:
+        """Load the segment once and keep it, its stats and the engine resident."""
+        segment = self._load_segment_for_scoring()
+        if segment is None:
+            return
+        if self.delta_paths and not self._load_delta_segments(segment):
+            segment.close()
+            return
+        try:
+            self._field_length_stats = _combined_length_stats(
+                [segment, *self._delta_segments], [field.name for field in segment.schema.text_fields]
+            )
+        except sqlite3.Error as exc:
+            # Leave stats empty so the engine resolves them per query, as before.
+            logger.debug("Deferring field length stats for %s: %s", self.db_path, exc)
+        for loaded in (segment, *self._delta_segments):
+            # Load vocabularies up front so the first query doesn't pay for them.
+            _ = loaded.term_dictionary
+        self._engine = self._build_engine(segment)
+        self._segment = segment
+
+    def _load_delta_segments(self, base: SqliteSegment) -> bool:
+        """Load every delta and mask the docs each segment loses to newer ones.
+
+        Returns False, leaving the index without a resident segment, when a
+        delta is missing; serving the base alone would return stale documents.
+        """
+        deltas: list[SqliteSegment] = []
+        for delta_path in self.delta_paths:
+            delta = SqliteSegmentStore(delta_path.parent).load(delta_path.stem)
+            if delta is None:
+                logger.warning("Delta segment %s not loadable; index %s not ready", delta_path, self.db_path)
+                for loaded in deltas:
+                    loaded.close()
+                return False
+            deltas.append(delta)
+
+        tombstones = [delta.deleted_doc_ids() for delta in deltas]
+        masks: list[np.ndarray | None] = []
+        newer_deleted: set[str] = set()
+        newest_first = [*reversed(deltas), base]
+        newest_first_tombstones = [*reversed(tombstones), frozenset()]
+        for segment, segment_tombstones in zip(newest_first, newest_first_tombstones, strict=True):
+            masks.append(_deleted_mask(segment, newer_deleted))
+            newer_deleted |= segment_tombstones
+        self._delta_segments = deltas
+        self._delta_tombstones = tombstones
+        self._deleted_masks = masks[::-1]
+        return True
+
+    def _build_engine(self, segment: SqliteSegment) -> BM25SearchEngine:
+        return BM25SearchEngine(
+            segment.schema,
+            field_boosts=self._resolve_field_boosts(segment.schema),
+            enable_phrase_bonus=True,
+            enable_fuzzy=True,
+        )
+
+    @property
+    def segment(self) -> SqliteSegment | None:
+        """Return the resident segment, or None when the database is not a full segment."""
+        return self._segment
+
+    @property
+    def segment_ids(self) -> tuple[str, ...]:
+        """Ids of the base segment followed by its delta segments, oldest first."""
+        return (self.db_path.stem, *(path.stem for path in self.delta_paths))
+
+    def warm_up(self, queries: Sequence[str], *, time_budget_s: float, io_budget_bytes: int) -> WarmupReport:
+        """Prime the caches a cold index would otherwise fill on its first queries.
+
+        Loads the term dictionaries, replays ``queries`` (a tenant's
+        ``test_queries``) straight through the engine, then decodes the
+        highest doc-frequency posting lists into the posting cache until
+        ``io_budget_bytes`` of postings have been read. Every step stops once
+        ``time_budget_s`` has elapsed; a step already running finishes first.
+        Replayed queries bypass the result cache and search latency metrics.
+        """
+        segment = self._segment
+        if segment is None or time_budget_s <= 0:
+            return WarmupReport(0.0, 0, 0, 0)
+        started = time.perf_counter()
+        deadline = started + time_budget_s
+
+        segments = (segment, *self._delta_segments)
+        for loaded in segments:
+            _ = loaded.term_dictionary
+
+        replayed = 0
+        for query in queries:
+            if time.perf_counter() >= deadline:
+                break
+            if query.strip():
+                self._search_with_engine(segment, query, _WARMUP_MAX_RESULTS)
+                replayed += 1
+
+        postings_loaded, posting_bytes = self._prefetch_hot_postings(segments, io_budget_bytes, deadline)
+        self.warmup_report = WarmupReport(time.perf_counter() - started, replayed, postings_loaded, posting_bytes)
+        return self.warmup_report
+
+    def _prefetch_hot_postings(
+        self, segments: Sequence[SqliteSegment], io_budget_bytes: int, deadline: float
+    ) -> tuple[int, int]:
+        """Read the most frequent terms' posting lists, largest first, within the byte budget."""
+        posting_cache = get_posting_cache()
+        if posting_cache.enabled:
+            # Prefetching more than the cache holds would only evict what was just read.
+            io_budget_bytes = min(io_budget_bytes, posting_cache.budget_bytes)
+        candidates = [
+            (doc_freq, segment, field.name, term)
+            for segment in segments
+            if segment.term_dictionary is not None
+            for field in segment.schema.text_fields
+            for term, doc_freq in segment.term_dictionary.most_frequent(field.name, _WARMUP_TERMS_PER_FIELD)
+        ]
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+        loaded = 0
+        bytes_read = 0
+        for _doc_freq, segment, field_name, term in candidates:
+            if bytes_read >= io_budget_bytes or time.perf_counter() >= deadline:
+                break
+            columns = segment.get_posting_columns(field_name, term)
+            if columns is not None:
+                loaded += 1
+                bytes_read += columns.nbytes
+        return loaded, bytes_read
+
     def _prepare_statements(self):
         """Prepare frequently used SQL statements for better performance."""
         # Pre-compile frequently used queries (SQLite will cache these automatically)
@@ -489,6 +741,8 @@ class SegmentSearchIndex:
         """Get document data from documents table by canonical URL."""
         if not url:
             return None
+        if self._delta_segments:
+            return self._get_live_document_by_url(url)
         row = self._execute_single_query(self._doc_data_by_url_query, (url,))
         if not row:
             return None
@@ -508,6 +762,20 @@ class SegmentSearchIndex:
         )
         return {key: value for key, value in zip(keys, row, strict=False) if value not in (None, "")}
 
+    def _get_live_document_by_url(self, url: str) -> dict | None:
+        """Return the newest live copy of a document across the delta and base segments."""
+        newer_deleted: set[str] = set()
+        for segment, tombstones in zip(
+            [*reversed(self._delta_segments), self._segment],
+            [*reversed(self._delta_tombstones), frozenset()],
+            strict=True,
+        ):
+            found = segment.get_document_by_url(url)
+            if found is not None and found[0] not in newer_deleted:
+                return found[1]
+            newer_deleted |= tombstones
+        return None
+
     def _resolve_field_boosts(self, schema: Schema) -> dict[str, float]:
         return {field.name: schema.get_boost(field.name) for field in schema.fields}
 
@@ -521,8 +789,20 @@ class SegmentSearchIndex:
         _, avg_length = self._get_corpus_stats()
         return avg_length
 
-    def close(self):
-        """Close database connection and concurrent search."""
+    def close(self, *, keep_segment_ids: Sequence[str] = ()):
+        """Close database connection, resident segment and concurrent search.
+
+        Cached postings of ``keep_segment_ids`` survive; a replacement index
+        sharing this one's base segment keeps serving from them.
+        """
+        if self._segment is not None:
+            for segment in (self._segment, *self._delta_segments):
+                segment.close()
+                if segment.segment_id not in keep_segment_ids:
+                    get_posting_cache().invalidate_segment(segment.segment_id)
+            self._segment = None
+            self._delta_segments = []
+            self._engine = None
         if self._conn:
             self._conn.close()
             self._conn = None
@@ -538,6 +818,7 @@ class SegmentSearchIndex:
             "simd_enabled": self._simd_enabled,
             "lockfree_enabled": self._lockfree_enabled,
             "bloom_enabled": self._bloom_enabled,
+            "resident_segment_id": self._segment.segment_id if self._segment is not None else None,
             "optimization_level": "fully_optimized"
             if (self._simd_enabled and self._lockfree_enabled)
             else "simd_vectorized"
@@ -547,6 +828,13 @@ class SegmentSearchIndex:
             else "scalar_baseline",
         }
 
+        if self._segment is not None:
+            dictionaries = [segment.term_dictionary for segment in (self._segment, *self._delta_segments)]
+            info["term_dictionary_bytes"] = sum(dictionary.nbytes for dictionary in dictionaries if dictionary)
+        if self.warmup_report is not None:
+            info["warmup_seconds"] = round(self.warmup_report.seconds, 3)
+            info["warmup_queries_replayed"] = self.warmup_report.queries_replayed
+
         if self._simd_calculator:
             info.update(self._simd_calculator.get_performance_info())
 
@@ -554,3 +842,51 @@ class SegmentSearchIndex:
             info.update(self._concurrent_search.get_performance_info())
 
         return info
+
+
+def _combined_length_stats(segments: Sequence[SqliteSegment], fields: list[str]) -> dict[str, FieldLengthStats]:
+    """Sum each field's length stats over the segments of one index."""
+    combined: dict[str, FieldLengthStats] = {}
+    for segment in segments:
+        for field_name, stats in segment.get_field_length_stats(fields).items():
+            previous = combined.get(field_name)
+            if previous is None:
+                combined[field_name] = stats
+                continue
+            combined[field_name] = FieldLengthStats(
+                field=field_name,
+                total_terms=previous.total_terms + stats.total_terms,
+                document_count=previous.document_count + stats.document_count,
+            )
+    return combined
+
+
+def _deleted_mask(segment: SqliteSegment, deleted_doc_ids: set[str]) -> np.ndarray | None:
+    """Boolean mask over a segment's doc ordinals, or None when nothing in it is deleted."""
+    if not deleted_doc_ids:
+        return None
+    doc_ids = segment.doc_ids
+    deleted = [ordinal for ordinal, doc_id in enumerate(doc_ids) if doc_id in deleted_doc_ids]
+    if not deleted:
+        return None
+    mask = np.zeros(len(doc_ids), dtype=bool)
+    mask[deleted] = True
+    return mask
+
+
+def _normalized_query_terms(schema: Schema, query: str, *, word_match: bool = False) -> tuple[tuple[str, ...], ...]:
+    """Analyzed query tokens per distinct field analyzer, in query order.
+
+    Everything the engine derives from the query (per-field terms, synonyms,
+    phrase positions) is a function of these, so queries differing only in
+    case, punctuation or whitespace share a result cache entry. Each required
+    phrase adds one group per analyzer, led by ``"`` (which no analyzer emits).
+    """
+    analyzers = [get_analyzer(name) for name in dict.fromkeys(field.analyzer_name for field in schema.text_fields)]
+    normalized = tuple(tuple(term for term in analyzer.terms(query.strip()) if term) for analyzer in analyzers)
+    phrases = tuple(
+        ('"', *analyzer.terms(phrase))
+        for phrase in parse_phrases(query.strip(), word_match=word_match)
+        for analyzer in analyzers
+    )
+    return normalized + phrases
@@ -12,8 +12,11 @@ Smart Defaults (no per-tenant config needed):
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import lru_cache
 import re
 
+from docs_mcp_server.search.query_profile import SNIPPETS, timed_stage
+
 
 # Sentence-ending punctuation pattern
 SENTENCE_END_PATTERN = re.compile(r"[.!?]\s+")
@@ -229,6 +232,20 @@ def highlight_terms_in_snippet(
     return result
 
 
+@lru_cache(maxsize=256)
+def term_pattern(terms: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Case-insensitive alternation of ``terms`` in order, or None when all are empty.
+
+    Cached, so the pattern is compiled once per query rather than once per
+    result, and each snippet needs only a single scan of its source text.
+    """
+    alternatives = [re.escape(term) for term in terms if term]
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+@timed_stage(SNIPPETS)
 def build_smart_snippet(
     text: str,
     terms: Sequence[str],
@@ -257,29 +274,18 @@ def build_smart_snippet(
         # No terms, just return beginning of text
         return text[:max_chars].strip()
 
-    # Find the first matching term
-    text_lower = text.lower()
-    best_match_pos = -1
-    best_match_term = ""
-
-    for term in terms:
-        if not term:
-            continue
-        term_lower = term.lower()
-        pos = text_lower.find(term_lower)
-        if pos != -1 and (best_match_pos == -1 or pos < best_match_pos):
-            best_match_pos = pos
-            best_match_term = term
-
-    if best_match_pos == -1:
+    # Find the first matching term in one scan; at equal offsets the earlier term wins
+    pattern = term_pattern(tuple(terms))
+    match = pattern.search(text) if pattern is not None else None
+    if match is None:
         # No match found, return beginning of text
         return text[:max_chars].strip()
 
     # Extract snippet with sentence awareness
     snippet, _, _ = extract_sentence_snippet(
         text,
-        best_match_pos,
-        len(best_match_term),
+        match.start(),
+        match.end() - match.start(),
         max_chars=max_chars,
         surrounding_context=surrounding_context,
     )
@@ -11,24 +11,47 @@ Optimized SQLite backend following best practices from SQLite documentation:
 from __future__ import annotations
 
 from array import array
+from bisect import bisect_left
 from collections import defaultdict
-from contextlib import contextmanager
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
+import heapq
+from itertools import groupby
 import json
 import logging
+from operator import itemgetter
 from pathlib import Path
 import sqlite3
+import tempfile
 import threading
-from typing import Any
+from typing import Any, Protocol
 from uuid import uuid4
 
 from docs_mcp_server.search.analyzers import KeywordAnalyzer, get_analyzer
 from docs_mcp_server.search.bloom_filter import BloomFilter
-from docs_mcp_server.search.models import Posting
+from docs_mcp_server.search.fuzzy import (
+    FUZZY_PREFIX_LENGTH,
+    deletion_variants,
+    find_fuzzy_matches,
+    get_index_edit_distance,
+    get_max_edit_distance,
+)
+from docs_mcp_server.search.models import Posting, PostingColumns
+from docs_mcp_server.search.posting_cache import get_posting_cache
+from docs_mcp_server.search.posting_codec import (
+    PostingBlocks,
+    decode_posting_columns,
+    decode_posting_positions,
+    encode_posting_list,
+)
+from docs_mcp_server.search.query_profile import DOCUMENTS, POSTINGS, count_sql_statement, timed_stage
 from docs_mcp_server.search.schema import KeywordField, NumericField, Schema, TextField
 from docs_mcp_server.search.sqlite_pragmas import apply_read_pragmas, apply_write_pragmas
 from docs_mcp_server.search.stats import FieldLengthStats
+from docs_mcp_server.search.term_dictionary import TermDictionary
 
 
 logger = logging.getLogger(__name__)
@@ -66,6 +89,23 @@ _BLOOM_FALSE_POSITIVE_RATE = 0.01
 _BLOOM_BLOCK_BITS = 64
 _BLOOM_FIELD = "body"
 _SQLITE_MAX_VARIABLES = 999
+# Upper bound on vocabulary terms verified per fuzzy lookup (closest variants first).
+_MAX_FUZZY_CANDIDATES = 512
+# Cap on term ids resolved per fuzzy lookup, before narrowing them to one field.
+_MAX_FUZZY_TERM_IDS = 8 * _MAX_FUZZY_CANDIDATES
+# Query terms whose fuzzy candidates a segment remembers (cleared when full).
+_FUZZY_CANDIDATE_CACHE_SIZE = 1024
+# One deletion index for all text fields, variants mapping to ids in ``fuzzy_terms``.
+# Segments with the earlier per-field index fall back to the vocabulary scan until rebuilt.
+_FUZZY_INDEX_FORMAT = "shared-term-ids"
+
+# Row-per-posting layout (``postings`` table keyed by doc_id text) written before
+# ordinal segments; still readable so existing segments keep serving until rebuilt.
+POSTINGS_FORMAT_ROWS = "rows"
+# One block-structured delta/varint blob per (field, term) in ``posting_lists``,
+# docs addressed by dense ordinals from ``doc_ordinals`` (see ``posting_codec``).
+POSTINGS_FORMAT_ORDINAL_BLOBS = "ordinal-blobs-v2"
+_READABLE_POSTINGS_FORMATS = frozenset({POSTINGS_FORMAT_ROWS, POSTINGS_FORMAT_ORDINAL_BLOBS})
 
 
 def _document_select_clause(*, with_doc_id: bool) -> str:
@@ -80,6 +120,35 @@ def _document_row_to_dict(row: sqlite3.Row | tuple, *, with_doc_id: bool) -> dic
     return {key: value for key, value in document.items() if value not in (None, "")}
 
 
+def _encode_term_ids(term_ids: Iterable[int]) -> bytes:
+    """Encode ascending term ids as LEB128 varints of their gaps."""
+    out = bytearray()
+    previous = 0
+    for term_id in term_ids:
+        gap = term_id - previous
+        previous = term_id
+        while gap >= 0x80:
+            out.append(gap & 0x7F | 0x80)
+            gap >>= 7
+        out.append(gap)
+    return bytes(out)
+
+
+def _decode_term_ids(blob: bytes) -> list[int]:
+    """Inverse of ``_encode_term_ids``."""
+    term_ids: list[int] = []
+    value = shift = previous = 0
+    for byte in blob:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        previous += value
+        term_ids.append(previous)
+        value = shift = 0
+    return term_ids
+
+
 def _bloom_blocks_from_bits(bit_array: bytes, *, block_bits: int) -> list[tuple[int, int]]:
     block_bytes = block_bits // 8
     if block_bytes <= 0 or block_bits % 8 != 0:
@@ -104,20 +173,33 @@ def _validate_bloom_block_bits() -> None:
 
 
 class SQLiteConnectionPool:
-    """Thread-safe connection pool with thread-local connections."""
+    """Thread-safe connection pool with thread-local connections.
+
+    Every connection handed out is also tracked centrally so a long-lived
+    (resident) segment can release the connections opened by all of its
+    reader threads when it is closed, not just the caller's.
+    """
 
     def __init__(self, db_path: Path, max_connections: int = 5):
         self.db_path = db_path
         self.max_connections = max_connections
         self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._generation = 0
 
     @contextmanager
     def get_connection(self):
         """Get a thread-local connection."""
-        if not hasattr(self._local, "connection") or self._local.connection is None:
-            self._local.connection = self._create_connection()
+        connection = getattr(self._local, "connection", None)
+        if connection is None or getattr(self._local, "generation", None) != self._generation:
+            connection = self._create_connection()
+            with self._lock:
+                self._connections.append(connection)
+            self._local.connection = connection
+            self._local.generation = self._generation
 
-        yield self._local.connection
+        yield connection
 
     def _create_connection(self) -> sqlite3.Connection:
         """Create connection with optimal performance settings."""
@@ -126,13 +208,20 @@ class SQLiteConnectionPool:
         return conn
 
     def close_all(self) -> None:
-        """Close thread-local connection."""
-        if hasattr(self._local, "connection") and self._local.connection is not None:
+        """Close every connection opened through this pool."""
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+            self._generation += 1
+        local_connection = getattr(self._local, "connection", None)
+        if local_connection is not None and local_connection not in connections:
+            connections.append(local_connection)
+        for connection in connections:
             try:
-                self._local.connection.close()
+                connection.close()
             except sqlite3.Error:
                 pass  # Ignore errors during cleanup
-            self._local.connection = None
+        self._local.connection = None
 
 
 @dataclass(slots=True)
@@ -144,13 +233,94 @@ class SqliteSegment:
     segment_id: str
     created_at: datetime
     doc_count: int
+    postings_format: str = POSTINGS_FORMAT_ROWS
+    fuzzy_prefix_length: int = 0
     _pool: SQLiteConnectionPool | None = None
+    _doc_ids: list[str] | None = None
+    _doc_ordinals: dict[str, int] | None = None
+    _term_dictionary: TermDictionary | None = None
+    _term_dictionary_loaded: bool = False
+    # Fuzzy candidates per query term, shared by the fields a query fuzzes.
+    _fuzzy_candidate_cache: dict[str, tuple[str, ...]] = field(default_factory=dict)
 
     def __post_init__(self):
         """Initialize connection pool lazily."""
         if self._pool is None:
             object.__setattr__(self, "_pool", SQLiteConnectionPool(self.db_path))
 
+    @property
+    def doc_ids(self) -> list[str]:
+        """Doc ids indexed by doc ordinal (the ordinal space of ``PostingColumns``)."""
+        if self._doc_ids is None:
+            self._load_doc_ordinals()
+        return self._doc_ids
+
+    @property
+    def term_dictionary(self) -> TermDictionary | None:
+        """The segment's in-memory vocabulary, loaded on first use (None if it can't be read)."""
+        if not self._term_dictionary_loaded:
+            self._term_dictionary = self._load_term_dictionary()
+            self._term_dictionary_loaded = True
+        return self._term_dictionary
+
+    def doc_frequency(self, field_name: str, term: str) -> int:
+        """Number of docs containing the term in the field, answered from the term dictionary."""
+        dictionary = self.term_dictionary
+        if dictionary is not None:
+            return dictionary.doc_frequency(field_name, term)
+        postings = self.get_posting_blocks(field_name, term)
+        return len(postings) if postings else 0
+
+    def _has_term(self, field_name: str, term: str) -> bool:
+        dictionary = self.term_dictionary
+        return dictionary is None or dictionary.doc_frequency(field_name, term) > 0
+
+    @timed_stage(POSTINGS)
+    def get_posting_columns(self, field_name: str, term: str) -> PostingColumns | None:
+        """Return the columnar posting list for a term, or None if the term is absent.
+
+        Lists are served from the process-wide posting cache when possible.
+        """
+        if not self._has_term(field_name, term):
+            return None
+        cache = get_posting_cache()
+        if cache.enabled:
+            cached = cache.get(self.segment_id, field_name, term)
+            if cached is not None:
+                return cached
+        columns = self._read_posting_columns(field_name, term)
+        if columns is not None and cache.enabled:
+            cache.put(self.segment_id, field_name, term, columns)
+        return columns
+
+    @timed_stage(POSTINGS)
+    def get_posting_blocks(self, field_name: str, term: str) -> PostingBlocks | None:
+        """Return a term's posting list with its block skip table, decoding blocks lazily.
+
+        Cached lists are wrapped as-is; otherwise the first full decode is
+        written back to the posting cache.
+        """
+        if not self._has_term(field_name, term):
+            return None
+        cache = get_posting_cache()
+        if cache.enabled:
+            cached = cache.get(self.segment_id, field_name, term)
+            if cached is not None:
+                return PostingBlocks.from_columns(cached)
+        if self.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS:
+            blob = self._read_posting_blob(field_name, term)
+            if not blob:
+                return None
+            on_decode = partial(cache.put, self.segment_id, field_name, term) if cache.enabled else None
+            return PostingBlocks.from_blob(blob, on_decode=on_decode)
+        columns = self._read_posting_columns(field_name, term)
+        if columns is None:
+            return None
+        if cache.enabled:
+            cache.put(self.segment_id, field_name, term, columns)
+        return PostingBlocks.from_columns(columns)
+
+    @timed_stage(POSTINGS)
     def get_postings(
         self,
         field_name: str,
@@ -160,6 +330,247 @@ class SqliteSegment:
         doc_id_filter: list[str] | None = None,
     ) -> list[Posting]:
         """Get postings for a specific field and term."""
+        if not self._has_term(field_name, term):
+            return []
+        if self.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS:
+            return self._get_blob_postings(
+                field_name, term, include_positions=include_positions, doc_id_filter=doc_id_filter
+            )
+        if not include_positions and doc_id_filter is None:
+            columns = self.get_posting_columns(field_name, term)
+            return self._postings_from_columns(columns) if columns is not None else []
+        return self._get_row_postings(
+            field_name, term, include_positions=include_positions, doc_id_filter=doc_id_filter
+        )
+
+    @timed_stage(POSTINGS)
+    def get_positions(self, field_name: str, term: str, ordinals: Sequence[int]) -> dict[int, array]:
+        """Return the term's positions in the docs at ``ordinals`` (ascending), keyed by ordinal.
+
+        Only the requested docs' positions are materialized; docs without the
+        term are omitted.
+        """
+        if not ordinals:
+            return {}
+        if self.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS:
+            blob = self._read_posting_blob(field_name, term)
+            if not blob:
+                return {}
+            columns = self.get_posting_columns(field_name, term) or decode_posting_columns(blob)
+            posting_ordinals = columns.ordinals
+            indices: list[int] = []
+            found: list[int] = []
+            for ordinal in ordinals:
+                index = bisect_left(posting_ordinals, ordinal)
+                if index < len(posting_ordinals) and posting_ordinals[index] == ordinal:
+                    indices.append(index)
+                    found.append(ordinal)
+            if not indices:
+                return {}
+            return dict(zip(found, decode_posting_positions(blob, indices), strict=True))
+
+        doc_ids = self.doc_ids
+        doc_ordinals = self._load_doc_ordinals()
+        chunk_size = _SQLITE_MAX_VARIABLES - 2
+        positions: dict[int, array] = {}
+        for start in range(0, len(ordinals), chunk_size):
+            chunk = [doc_ids[ordinal] for ordinal in ordinals[start : start + chunk_size]]
+            for posting in self._get_row_postings(field_name, term, include_positions=True, doc_id_filter=chunk):
+                positions[doc_ordinals[posting.doc_id]] = posting.positions
+        return positions
+
+    def get_terms(self, field_name: str) -> list[str]:
+        """Return distinct terms for a field."""
+        dictionary = self.term_dictionary
+        if dictionary is not None:
+            return dictionary.terms(field_name)
+        if self.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS:
+            query = "SELECT term FROM posting_lists WHERE field = ?"
+        else:
+            query = "SELECT DISTINCT term FROM postings WHERE field = ?"
+        count_sql_statement()
+        with self._pool.get_connection() as conn:
+            cursor = conn.execute(query, (field_name,))
+            return [row[0] for row in cursor if row[0]]
+
+    @property
+    def has_fuzzy_index(self) -> bool:
+        """Whether the segment stores a deletion index for ``find_fuzzy_terms``."""
+        return self.fuzzy_prefix_length > 0
+
+    def find_fuzzy_terms(self, field_name: str, term: str) -> list[tuple[str, int]]:
+        """Return fuzzy matches for a term using the segment's deletion index.
+
+        Same result shape as ``find_fuzzy_matches`` over the field vocabulary,
+        but only terms sharing a deletion variant with ``term`` are verified,
+        at most ``_MAX_FUZZY_CANDIDATES`` of them. The index is shared by all
+        text fields, so candidates outside ``field_name`` are dropped through
+        the term dictionary.
+        """
+        query = term.lower()
+        max_distance = get_max_edit_distance(len(query))
+        if not self.has_fuzzy_index or max_distance == 0:
+            return []
+        candidates = self._fuzzy_candidate_cache.get(query)
+        if candidates is None:
+            candidates = self._load_fuzzy_candidates(query, max_distance)
+            if len(self._fuzzy_candidate_cache) >= _FUZZY_CANDIDATE_CACHE_SIZE:
+                self._fuzzy_candidate_cache.clear()
+            self._fuzzy_candidate_cache[query] = candidates
+        in_field = [candidate for candidate in candidates if self._has_term(field_name, candidate)]
+        return find_fuzzy_matches(query, in_field[:_MAX_FUZZY_CANDIDATES], max_distance)
+
+    def _load_fuzzy_candidates(self, query: str, max_distance: int) -> tuple[str, ...]:
+        """Terms of any text field sharing a deletion variant with ``query``, closest variants first."""
+        levels = deletion_variants(query, max_distance, self.fuzzy_prefix_length)
+        rank = {variant: level for level, variants in enumerate(levels) for variant in variants}
+        placeholders = ", ".join("?" for _ in rank)
+        count_sql_statement()
+        with self._pool.get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT variant, term_ids FROM fuzzy_deletes WHERE variant IN ({placeholders})", tuple(rank)
+            ).fetchall()
+            term_ids: dict[int, None] = {}
+            for _variant, blob in sorted(rows, key=lambda row: (rank[row[0]], row[0])):
+                term_ids.update(dict.fromkeys(_decode_term_ids(blob)))
+            ordered_ids = list(term_ids)[:_MAX_FUZZY_TERM_IDS]
+            terms: dict[int, str] = {}
+            for start in range(0, len(ordered_ids), _SQLITE_MAX_VARIABLES):
+                batch = ordered_ids[start : start + _SQLITE_MAX_VARIABLES]
+                id_placeholders = ", ".join("?" for _ in batch)
+                count_sql_statement()
+                terms.update(
+                    conn.execute(f"SELECT term_id, term FROM fuzzy_terms WHERE term_id IN ({id_placeholders})", batch)
+                )
+        return tuple(
+            terms[term_id]
+            for term_id in ordered_ids
+            if term_id in terms and abs(len(terms[term_id]) - len(query)) <= max_distance
+        )
+
+    def to_segment_data(self) -> dict[str, Any]:
+        """Export the segment in ``SqliteSegmentWriter.build()`` shape.
+
+        Works for every postings format, so ``SqliteSegmentStore.save`` on the
+        result migrates an older segment to the current layout.
+        """
+        postings: dict[str, dict[str, list[dict[str, Any]]]] = defaultdict(dict)
+        field_lengths: dict[str, dict[str, int]] = defaultdict(dict)
+        with self._pool.get_connection() as conn:
+            if self.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS:
+                doc_ids = self.doc_ids
+                rows = conn.execute("SELECT field, term, postings_blob FROM posting_lists ORDER BY field, term")
+                for field_name, term, blob in rows:
+                    columns = decode_posting_columns(blob)
+                    positions = decode_posting_positions(blob)
+                    entries = []
+                    for ordinal, doc_length, doc_positions in zip(
+                        columns.ordinals, columns.doc_lengths, positions, strict=True
+                    ):
+                        entries.append({"doc_id": doc_ids[ordinal], "positions": list(doc_positions)})
+                        field_lengths[field_name][doc_ids[ordinal]] = doc_length
+                    postings[field_name][term] = entries
+            else:
+                rows = conn.execute(
+                    "SELECT field, term, doc_id, doc_length, positions_blob FROM postings ORDER BY field, term, doc_id"
+                )
+                for field_name, term, doc_id, doc_length, positions_blob in rows:
+                    positions = array("I")
+                    if positions_blob:
+                        positions.frombytes(positions_blob)
+                    postings[field_name].setdefault(term, []).append({"doc_id": doc_id, "positions": list(positions)})
+                    field_lengths[field_name][doc_id] = int(doc_length or 0)
+            try:
+                stored_rows = conn.execute(_document_select_clause(with_doc_id=True)).fetchall()
+            except sqlite3.OperationalError:
+                stored_rows = []
+        stored_fields = {row[0]: _document_row_to_dict(row, with_doc_id=True) for row in stored_rows}
+        return {
+            "segment_id": self.segment_id,
+            "created_at": self.created_at.isoformat(),
+            "schema": self.schema.to_dict(),
+            "postings": dict(postings),
+            "stored_fields": stored_fields,
+            "field_lengths": {field_name: dict(lengths) for field_name, lengths in field_lengths.items()},
+            "doc_count": self.doc_count,
+        }
+
+    def _read_posting_blob(self, field_name: str, term: str) -> bytes | None:
+        count_sql_statement()
+        with self._pool.get_connection() as conn:
+            row = conn.execute(
+                "SELECT postings_blob FROM posting_lists WHERE field = ? AND term = ?", (field_name, term)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _read_posting_columns(self, field_name: str, term: str) -> PostingColumns | None:
+        if self.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS:
+            blob = self._read_posting_blob(field_name, term)
+            return decode_posting_columns(blob) if blob else None
+
+        # Compat reader for row-per-posting segments: map doc ids onto the ordinal table.
+        postings = self._get_row_postings(field_name, term, include_positions=False, doc_id_filter=None)
+        if not postings:
+            return None
+        doc_ordinals = self._load_doc_ordinals()
+        rows = sorted(
+            (doc_ordinals[posting.doc_id], posting.frequency, posting.doc_length or 0)
+            for posting in postings
+            if posting.doc_id in doc_ordinals
+        )
+        return PostingColumns(
+            array("I", (row[0] for row in rows)),
+            array("I", (row[1] for row in rows)),
+            array("I", (row[2] for row in rows)),
+        )
+
+    def _postings_from_columns(self, columns: PostingColumns, positions: list[array] | None = None) -> list[Posting]:
+        doc_ids = self.doc_ids
+        if positions is None:
+            return [
+                Posting(doc_id=doc_ids[ordinal], frequency=tf, doc_length=doc_length or None)
+                for ordinal, tf, doc_length in zip(
+                    columns.ordinals, columns.frequencies, columns.doc_lengths, strict=True
+                )
+            ]
+        return [
+            Posting(doc_id=doc_ids[ordinal], frequency=tf, positions=doc_positions, doc_length=doc_length or None)
+            for ordinal, tf, doc_length, doc_positions in zip(
+                columns.ordinals, columns.frequencies, columns.doc_lengths, positions, strict=True
+            )
+        ]
+
+    def _get_blob_postings(
+        self,
+        field_name: str,
+        term: str,
+        *,
+        include_positions: bool,
+        doc_id_filter: list[str] | None,
+    ) -> list[Posting]:
+        if include_positions:
+            blob = self._read_posting_blob(field_name, term)
+            if not blob:
+                return []
+            postings = self._postings_from_columns(decode_posting_columns(blob), decode_posting_positions(blob))
+        else:
+            columns = self.get_posting_columns(field_name, term)
+            if columns is None:
+                return []
+            postings = self._postings_from_columns(columns)
+        if doc_id_filter is not None:
+            wanted = {doc_id for doc_id in doc_id_filter if doc_id}
+            postings = [posting for posting in postings if posting.doc_id in wanted]
+        return postings
+
+    def _get_row_postings(
+        self,
+        field_name: str,
+        term: str,
+        *,
+        include_positions: bool,
+        doc_id_filter: list[str] | None,
+    ) -> list[Posting]:
         if include_positions:
             query = "SELECT doc_id, tf, doc_length, positions_blob FROM postings WHERE field = ? AND term = ?"
         else:
@@ -177,6 +588,7 @@ class SqliteSegment:
             query = f"{query} AND doc_id IN ({placeholders})"
             params.extend(doc_ids)
 
+        count_sql_statement()
         with self._pool.get_connection() as conn:
             cursor = conn.execute(query, tuple(params))
             postings: list[Posting] = []
@@ -196,11 +608,41 @@ class SqliteSegment:
                 )
             return postings
 
-    def get_terms(self, field_name: str) -> list[str]:
-        """Return distinct terms for a field."""
+    def _load_term_dictionary(self) -> TermDictionary | None:
+        if self.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS:
+            query = "SELECT field, term, doc_freq FROM posting_lists ORDER BY field, term"
+        else:
+            query = "SELECT field, term, COUNT(*) FROM postings GROUP BY field, term ORDER BY field, term"
+        try:
+            with self._pool.get_connection() as conn:
+                return TermDictionary.from_rows(conn.execute(query))
+        except sqlite3.Error as exc:
+            logger.warning("Term dictionary unavailable for segment %s: %s", self.segment_id, exc)
+            return None
+
+    def _load_doc_ordinals(self) -> dict[str, int]:
+        if self._doc_ordinals is not None:
+            return self._doc_ordinals
+        if self.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS:
+            queries = ("SELECT doc_id FROM doc_ordinals ORDER BY ordinal",)
+        else:
+            # Row-per-posting segments never stored ordinals; sorted doc ids are stable for
+            # a segment's content. Very old segments may lack the documents table.
+            queries = (
+                "SELECT doc_id FROM documents ORDER BY doc_id",
+                "SELECT DISTINCT doc_id FROM postings ORDER BY doc_id",
+            )
+        doc_ids: list[str] = []
         with self._pool.get_connection() as conn:
-            cursor = conn.execute("SELECT DISTINCT term FROM postings WHERE field = ?", (field_name,))
-            return [row[0] for row in cursor if row[0]]
+            for query in queries:
+                try:
+                    doc_ids = [row[0] for row in conn.execute(query)]
+                    break
+                except sqlite3.Error as exc:
+                    logger.debug("Doc ordinal query failed for segment %s: %s", self.segment_id, exc)
+        self._doc_ids = doc_ids
+        self._doc_ordinals = {doc_id: ordinal for ordinal, doc_id in enumerate(doc_ids)}
+        return self._doc_ordinals
 
     def get_field_length_stats(self, fields: list[str]) -> dict[str, FieldLengthStats]:
         """Return aggregate length stats for requested fields."""
@@ -210,6 +652,7 @@ class SqliteSegment:
                 query = _LENGTH_QUERY_BY_FIELD.get(field_name)
                 if not query:
                     continue
+                count_sql_statement()
                 row = conn.execute(query).fetchone()
                 if not row:
                     continue
@@ -234,8 +677,10 @@ class SqliteSegment:
                     stored_fields[doc_id] = stored
         return stored_fields
 
+    @timed_stage(DOCUMENTS)
     def get_document(self, doc_id: str) -> dict[str, Any] | None:
         """Retrieve document using optimized query."""
+        count_sql_statement()
         with self._pool.get_connection() as conn:
             cursor = conn.execute(_document_select_clause(with_doc_id=False) + " WHERE doc_id = ?", (doc_id,))
             row = cursor.fetchone()
@@ -244,6 +689,61 @@ class SqliteSegment:
             stored = _document_row_to_dict(row, with_doc_id=False)
             return stored or None
 
+    @timed_stage(DOCUMENTS)
+    def get_documents(
+        self, doc_ids: Sequence[str], columns: Sequence[str] = _DOCUMENT_COLUMNS
+    ) -> dict[str, dict[str, Any]]:
+        """Return the given stored ``columns`` of ``doc_ids``, keyed by doc id.
+
+        Issues one query per batch of doc ids rather than one per document.
+        Rows are read in doc id order, which is the segment's ordinal order,
+        so each batch walks the documents table front to back. Missing docs,
+        and docs with none of the columns stored, are omitted.
+        """
+        unknown = set(columns).difference(_DOCUMENT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown document columns: {sorted(unknown)}")
+        ordered_ids = sorted(set(doc_ids))
+        select = f"SELECT doc_id, {', '.join(columns)} FROM documents WHERE doc_id IN "
+        documents: dict[str, dict[str, Any]] = {}
+        with self._pool.get_connection() as conn:
+            for start in range(0, len(ordered_ids), _SQLITE_MAX_VARIABLES):
+                chunk = ordered_ids[start : start + _SQLITE_MAX_VARIABLES]
+                count_sql_statement()
+                cursor = conn.execute(f"{select}({', '.join('?' * len(chunk))}) ORDER BY doc_id", chunk)
+                for row in cursor:
+                    stored = {
+                        column: value for column, value in zip(columns, row[1:], strict=True) if value not in (None, "")
+                    }
+                    if stored:
+                        documents[row[0]] = stored
+        return documents
+
+    def get_document_by_url(self, url: str) -> tuple[str, dict[str, Any]] | None:
+        """Return ``(doc_id, stored fields)`` for a document's canonical URL."""
+        count_sql_statement()
+        with self._pool.get_connection() as conn:
+            row = conn.execute(_document_select_clause(with_doc_id=True) + " WHERE url = ?", (url,)).fetchone()
+        if not row:
+            return None
+        return row[0], _document_row_to_dict(row, with_doc_id=True)
+
+    def document_paths(self) -> list[tuple[str, str | None]]:
+        """Return ``(doc_id, path)`` for every stored document."""
+        with self._pool.get_connection() as conn:
+            return [(row[0], row[1]) for row in conn.execute("SELECT doc_id, path FROM documents")]
+
+    def deleted_doc_ids(self) -> frozenset[str]:
+        """Doc ids this delta segment tombstones in older segments of its index.
+
+        Empty for base segments and for segments written before deltas existed.
+        """
+        with self._pool.get_connection() as conn:
+            try:
+                return frozenset(row[0] for row in conn.execute("SELECT doc_id FROM deleted_docs"))
+            except sqlite3.OperationalError:
+                return frozenset()
+
     def close(self) -> None:
         """Close connection pool."""
         if self._pool:
@@ -273,24 +773,64 @@ class SqliteSegmentStore:
 
     def save(self, segment_data: dict[str, Any], *, related_files: list[Path | str] | None = None) -> Path:
         """Save segment with optimized SQLite schema."""
-        segment_id = segment_data.get("segment_id") or segment_data.get("i") or uuid4().hex
+        return self._save_source(_SegmentDataSource(segment_data), segment_data)
+
+    def save_writer(self, writer: SqliteSegmentWriter, *, provenance: dict[str, Any] | None = None) -> Path:
+        """Save a writer's documents, merging its spilled runs without building ``build()``'s dict."""
+        manifest_data: dict[str, Any] = {"created_at": writer.created_at.isoformat(), "doc_count": writer.doc_count}
+        if provenance is not None:
+            manifest_data["provenance"] = provenance
+        return self._save_source(writer, manifest_data)
+
+    def save_delta(self, writer: SqliteSegmentWriter, *, deleted_doc_ids: Iterable[str] = ()) -> Path:
+        """Save a writer as a delta layered over the manifest's current segments.
+
+        ``deleted_doc_ids`` are tombstoned in every older segment of the
+        index (the base and earlier deltas), not in the delta itself, so a
+        changed document is both deleted and re-added by one delta. The base
+        segment stays the manifest's ``latest_segment_id``.
+        """
+        base_segment_id = self._manifest_base_segment_id()
+        if base_segment_id is None:
+            raise RuntimeError("Cannot save a delta segment without a base segment")
+        db_path = self._db_path(writer.segment_id)
+        if db_path.exists():
+            raise RuntimeError(f"Delta segment {writer.segment_id} already exists")
+        self._write_segment(writer, db_path, deleted_doc_ids=deleted_doc_ids)
+        self._append_delta_to_manifest(writer.segment_id)
+        return db_path
+
+    def _save_source(self, source: SegmentSource, manifest_data: dict[str, Any]) -> Path:
+        segment_id = source.segment_id
         db_path = self._db_path(segment_id)
 
         # If segment already exists, don't overwrite it
         if db_path.exists():
             # Just update manifest and return existing path
-            self._update_manifest(segment_id, segment_data)
+            self._update_manifest(segment_id, manifest_data)
             return db_path
 
+        self._write_segment(source, db_path)
+
+        # Update manifest to point to latest segment
+        self._update_manifest(segment_id, manifest_data)
+
+        return db_path
+
+    def _write_segment(self, source: SegmentSource, db_path: Path, *, deleted_doc_ids: Iterable[str] = ()) -> None:
         conn = None
         try:
             conn = sqlite3.connect(db_path, cached_statements=0)
             self._apply_optimizations(conn)
             self._create_schema(conn)
-            self._store_metadata(conn, segment_id, segment_data)
-            self._store_postings(conn, segment_data)
-            self._store_bloom_filter(conn, segment_data)
-            self._store_documents(conn, segment_data)
+            self._store_metadata(conn, source)
+            self._store_postings(conn, source)
+            self._store_bloom_filter(conn)
+            self._store_fuzzy_index(conn, source)
+            self._store_documents(conn, source)
+            conn.executemany(
+                "INSERT OR IGNORE INTO deleted_docs (doc_id) VALUES (?)", ((doc_id,) for doc_id in deleted_doc_ids)
+            )
             conn.execute("PRAGMA optimize")  # Update query planner stats efficiently
             conn.commit()
             conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")  # Keep WAL size bounded after writes
@@ -309,11 +849,6 @@ class SqliteSegmentStore:
                 except sqlite3.Error as close_error:
                     logger.warning("Failed to close SQLite connection for %s: %s", db_path, close_error)
 
-        # Update manifest to point to latest segment
-        self._update_manifest(segment_id, segment_data)
-
-        return db_path
-
     def _update_manifest(self, segment_id: str, segment_data: dict[str, Any]) -> None:
         """Update manifest.json to point to the latest segment."""
         # Check if segment already exists to preserve timestamp
@@ -331,7 +866,7 @@ class SqliteSegmentStore:
         doc_count = 0
         if db_path.exists():
             try:
-                with sqlite3.connect(db_path) as conn:
+                with closing(sqlite3.connect(db_path)) as conn:
                     doc_count = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
             except sqlite3.Error:
                 doc_count = segment_data.get("doc_count", 0)
@@ -350,9 +885,40 @@ class SqliteSegmentStore:
             # Non-fatal error - segment is still saved
             logger.warning("Failed to update manifest: %s", e)
 
+    def _read_manifest(self) -> dict[str, Any]:
+        try:
+            manifest = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _manifest_base_segment_id(self) -> str | None:
+        segment_id = self._read_manifest().get("latest_segment_id")
+        if not isinstance(segment_id, str) or not self._db_path(segment_id).exists():
+            return None
+        return segment_id
+
+    def _append_delta_to_manifest(self, delta_segment_id: str) -> None:
+        """Record a delta after the existing ones; a full save resets the list."""
+        manifest = self._read_manifest()
+        manifest["delta_segment_ids"] = [*self.delta_segment_ids(), delta_segment_id]
+        self._manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+    def delta_segment_ids(self) -> list[str]:
+        """Delta segments layered over the manifest's base segment, oldest first."""
+        delta_ids = self._read_manifest().get("delta_segment_ids")
+        if not isinstance(delta_ids, list):
+            return []
+        return [
+            segment_id
+            for segment_id in delta_ids
+            if isinstance(segment_id, str) and segment_id and self._db_path(segment_id).exists()
+        ]
+
     def _apply_optimizations(self, conn: sqlite3.Connection) -> None:
         """Apply SQLite performance optimizations."""
-        apply_write_pragmas(conn)
+        # Let dirty pages spill to the WAL so a large segment is not held in memory until commit.
+        apply_write_pragmas(conn, cache_spill=True)
 
     def _create_schema(self, conn: sqlite3.Connection) -> None:
         """Create optimized database schema."""
@@ -362,14 +928,17 @@ class SqliteSegmentStore:
                 value TEXT
             );
 
-            CREATE TABLE IF NOT EXISTS postings (
+            CREATE TABLE IF NOT EXISTS doc_ordinals (
+                ordinal INTEGER PRIMARY KEY,
+                doc_id TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS posting_lists (
                 field TEXT NOT NULL,
                 term TEXT NOT NULL,
-                doc_id TEXT NOT NULL,
-                tf INTEGER NOT NULL,
-                doc_length INTEGER NOT NULL,
-                positions_blob BLOB,
-                PRIMARY KEY (field, term, doc_id)
+                doc_freq INTEGER NOT NULL,
+                postings_blob BLOB NOT NULL,
+                PRIMARY KEY (field, term)
             ) WITHOUT ROWID;
 
             CREATE TABLE IF NOT EXISTS bloom_blocks (
@@ -377,6 +946,16 @@ class SqliteSegmentStore:
                 bits INTEGER NOT NULL
             ) WITHOUT ROWID;
 
+            CREATE TABLE IF NOT EXISTS fuzzy_terms (
+                term_id INTEGER PRIMARY KEY,
+                term TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS fuzzy_deletes (
+                variant TEXT PRIMARY KEY,
+                term_ids BLOB NOT NULL
+            ) WITHOUT ROWID;
+
             CREATE TABLE IF NOT EXISTS documents (
                 doc_id TEXT PRIMARY KEY,
                 url TEXT,
@@ -399,68 +978,63 @@ class SqliteSegmentStore:
                 body_length INTEGER
             ) WITHOUT ROWID;
 
-            CREATE INDEX IF NOT EXISTS idx_postings_field_term ON postings(field, term);
+            CREATE TABLE IF NOT EXISTS deleted_docs (
+                doc_id TEXT PRIMARY KEY
+            ) WITHOUT ROWID;
         """)
 
-    def _store_metadata(self, conn: sqlite3.Connection, segment_id: str, segment_data: dict[str, Any]) -> None:
+    def _store_metadata(self, conn: sqlite3.Connection, source: SegmentSource) -> None:
         """Store segment metadata."""
-        # Handle both new and legacy key formats
-        schema_data = segment_data.get("schema") or segment_data.get("s", {})
-        created_at = segment_data.get("created_at") or segment_data.get("c") or datetime.now(timezone.utc).isoformat()
+        schema_data = source.schema_data
 
         # Ensure schema has required url field for compatibility
         if isinstance(schema_data, dict) and "fields" not in schema_data:
             schema_data = {"fields": [{"name": "url", "type": "text", "stored": True}]}
 
-        field_lengths = segment_data.get("field_lengths", {})
-        body_lengths = field_lengths.get("body", {})
-        total_body_terms = sum(int(length) for length in body_lengths.values())
-        doc_count = int(segment_data.get("doc_count", 0))
-
         metadata = [
-            ("segment_id", segment_id),
+            ("segment_id", source.segment_id),
             ("schema", json.dumps(schema_data)),
-            ("created_at", created_at),
-            ("doc_count", str(doc_count)),
-            ("body_total_terms", str(total_body_terms)),
+            ("created_at", source.created_at),
+            ("doc_count", str(source.doc_count)),
+            ("body_total_terms", str(source.field_total_terms("body"))),
+            ("postings_format", POSTINGS_FORMAT_ORDINAL_BLOBS),
         ]
         conn.executemany("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)", metadata)
 
-    def _store_postings(self, conn: sqlite3.Connection, segment_data: dict[str, Any]) -> None:
-        """Store postings with binary encoding."""
-        # Handle both new and legacy key formats
-        raw_postings = segment_data.get("postings") or segment_data.get("p", {})
-        raw_lengths = segment_data.get("field_lengths", {})
-        postings_data = []
-
-        for field_name, terms in raw_postings.items():
-            field_lengths = raw_lengths.get(field_name, {})
-            for term, posting_list in terms.items():
-                for posting_dict in posting_list:
-                    doc_id = posting_dict.get("doc_id") or posting_dict.get("d", "")
-                    positions = posting_dict.get("positions") or posting_dict.get("p", [])
-
-                    # Binary encode positions for memory efficiency
-                    positions_array = array("I", (int(pos) for pos in positions))
-                    positions_blob = positions_array.tobytes()
-                    tf = len(positions_array)
-                    doc_length = int(field_lengths.get(doc_id, 0))
+    def _store_postings(self, conn: sqlite3.Connection, source: SegmentSource) -> None:
+        """Store the doc ordinal table and one encoded posting blob per (field, term)."""
+        # Sorted ids make ordinals deterministic for a segment's content.
+        ordinal_by_doc = {doc_id: ordinal for ordinal, doc_id in enumerate(source.sorted_doc_ids())}
+        conn.executemany(
+            "INSERT INTO doc_ordinals (ordinal, doc_id) VALUES (?, ?)",
+            ((ordinal, doc_id) for doc_id, ordinal in ordinal_by_doc.items()),
+        )
 
-                    postings_data.append((field_name, term, doc_id, tf, doc_length, positions_blob))
+        def _encoded_posting_lists():
+            for field_name, term, posting_list in source.iter_posting_lists():
+                if not posting_list:
+                    continue
+                entries = sorted(
+                    (ordinal_by_doc[doc_id], doc_length, positions) for doc_id, doc_length, positions in posting_list
+                )
+                blob = encode_posting_list(
+                    [entry[0] for entry in entries],
+                    [len(entry[2]) for entry in entries],
+                    [entry[1] for entry in entries],
+                    [entry[2] for entry in entries],
+                )
+                yield field_name, term, len(entries), blob
 
-        if postings_data:
-            conn.executemany(
-                "INSERT OR REPLACE INTO postings (field, term, doc_id, tf, doc_length, positions_blob) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                postings_data,
-            )
+        # Lists are encoded as executemany consumes them, so only one is decoded at a time.
+        conn.executemany(
+            "INSERT OR REPLACE INTO posting_lists (field, term, doc_freq, postings_blob) VALUES (?, ?, ?, ?)",
+            _encoded_posting_lists(),
+        )
 
-    def _store_bloom_filter(self, conn: sqlite3.Connection, segment_data: dict[str, Any]) -> None:
+    def _store_bloom_filter(self, conn: sqlite3.Connection) -> None:
         """Store bloom filter blocks for fast negative term checks."""
         _validate_bloom_block_bits()
-        raw_postings = segment_data.get("postings") or segment_data.get("p", {})
-        body_terms = raw_postings.get(_BLOOM_FIELD, {})
-        term_count = len(body_terms)
+        term_count = conn.execute("SELECT COUNT(*) FROM posting_lists WHERE field = ?", (_BLOOM_FIELD,)).fetchone()[0]
 
         if term_count <= 0:
             metadata = [
@@ -474,7 +1048,7 @@ class SqliteSegmentStore:
             return
 
         bloom = BloomFilter(expected_items=term_count, false_positive_rate=_BLOOM_FALSE_POSITIVE_RATE)
-        for term in body_terms:
+        for (term,) in conn.execute("SELECT term FROM posting_lists WHERE field = ?", (_BLOOM_FIELD,)):
             bloom.add(str(term).lower())
 
         blocks = _bloom_blocks_from_bits(bytes(bloom.bit_array), block_bits=_BLOOM_BLOCK_BITS)
@@ -493,45 +1067,82 @@ class SqliteSegmentStore:
         ]
         conn.executemany("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)", metadata)
 
-    def _store_documents(self, conn: sqlite3.Connection, segment_data: dict[str, Any]) -> None:
-        """Store document fields."""
-        # Handle both new and legacy key formats
-        raw_stored = segment_data.get("stored_fields") or segment_data.get("d", {})
-        if not raw_stored:
-            return
+    def _store_fuzzy_index(self, conn: sqlite3.Connection, source: SegmentSource) -> None:
+        """Store the deletion variants of the text fields' terms for typo lookups.
 
-        raw_lengths = segment_data.get("field_lengths", {})
-        lengths_by_doc: dict[str, dict[str, int]] = {}
-        for field_name, doc_lengths in raw_lengths.items():
-            for doc_id, length in doc_lengths.items():
-                lengths_by_doc.setdefault(doc_id, {})[field_name] = int(length)
+        Each distinct term gets an id in ``fuzzy_terms``, and each variant row
+        holds the delta-varint ids of the terms producing it, so a word indexed
+        in several fields is expanded once and term text is stored once.
+        Variants are staged in a temp table (on disk with ``temp_store = FILE``)
+        and grouped in sorted order, so memory does not grow with the vocabulary.
+        """
+        try:
+            text_fields = sorted(field.name for field in Schema.from_dict(source.schema_data).text_fields)
+        except (ValueError, KeyError, TypeError):
+            text_fields = []
+        placeholders = ", ".join("?" for _ in text_fields)
+        terms = (
+            conn.execute(
+                f"SELECT DISTINCT term FROM posting_lists WHERE field IN ({placeholders}) ORDER BY term", text_fields
+            ).fetchall()
+            if text_fields
+            else []
+        )
+        conn.executemany("INSERT INTO fuzzy_terms (term_id, term) VALUES (?, ?)", enumerate(row[0] for row in terms))
+
+        def _variant_rows():
+            for term_id, (term,) in enumerate(terms):
+                max_deletions = get_index_edit_distance(len(term))
+                if not max_deletions:
+                    continue
+                for variants in deletion_variants(term.lower(), max_deletions):
+                    for variant in variants:
+                        yield variant, term_id
 
-        documents_data = []
-        for doc_id, fields in raw_stored.items():
-            lengths = lengths_by_doc.get(doc_id, {})
-            documents_data.append(
+        conn.execute("CREATE TEMP TABLE fuzzy_staging (variant TEXT NOT NULL, term_id INTEGER NOT NULL)")
+        try:
+            conn.executemany("INSERT INTO fuzzy_staging (variant, term_id) VALUES (?, ?)", _variant_rows())
+            staged = conn.execute("SELECT variant, term_id FROM fuzzy_staging ORDER BY variant, term_id")
+            conn.executemany(
+                "INSERT OR REPLACE INTO fuzzy_deletes (variant, term_ids) VALUES (?, ?)",
                 (
-                    doc_id,
-                    fields.get("url"),
-                    fields.get("url_path"),
-                    fields.get("title"),
-                    fields.get("headings_h1"),
-                    fields.get("headings_h2"),
-                    fields.get("headings"),
-                    fields.get("body"),
-                    fields.get("path"),
-                    fields.get("tags"),
-                    fields.get("excerpt"),
-                    fields.get("language"),
-                    fields.get("timestamp"),
-                    lengths.get("url_path"),
-                    lengths.get("title"),
-                    lengths.get("headings_h1"),
-                    lengths.get("headings_h2"),
-                    lengths.get("headings"),
-                    lengths.get("body"),
-                )
+                    (variant, _encode_term_ids(row[1] for row in rows))
+                    for variant, rows in groupby(staged, key=itemgetter(0))
+                ),
             )
+        finally:
+            conn.execute("DROP TABLE fuzzy_staging")
+        conn.executemany(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            [("fuzzy_prefix_length", str(FUZZY_PREFIX_LENGTH)), ("fuzzy_index_format", _FUZZY_INDEX_FORMAT)],
+        )
+
+    def _store_documents(self, conn: sqlite3.Connection, source: SegmentSource) -> None:
+        """Store document fields."""
+        documents_data = (
+            (
+                doc_id,
+                fields.get("url"),
+                fields.get("url_path"),
+                fields.get("title"),
+                fields.get("headings_h1"),
+                fields.get("headings_h2"),
+                fields.get("headings"),
+                fields.get("body"),
+                fields.get("path"),
+                fields.get("tags"),
+                fields.get("excerpt"),
+                fields.get("language"),
+                fields.get("timestamp"),
+                lengths.get("url_path"),
+                lengths.get("title"),
+                lengths.get("headings_h1"),
+                lengths.get("headings_h2"),
+                lengths.get("headings"),
+                lengths.get("body"),
+            )
+            for doc_id, fields, lengths in source.iter_documents()
+        )
 
         conn.executemany(
             "INSERT OR REPLACE INTO documents ("
@@ -572,8 +1183,23 @@ class SqliteSegmentStore:
 
             doc_count = int(metadata.get("doc_count", 0) or 0)
 
+            postings_format = metadata.get("postings_format", POSTINGS_FORMAT_ROWS)
+            if postings_format not in _READABLE_POSTINGS_FORMATS:
+                logger.warning("Segment %s has unsupported postings format %r", segment_id, postings_format)
+                return None
+
             return SqliteSegment(
-                schema=schema, db_path=db_path, segment_id=segment_id, created_at=created_at, doc_count=doc_count
+                schema=schema,
+                db_path=db_path,
+                segment_id=segment_id,
+                created_at=created_at,
+                doc_count=doc_count,
+                postings_format=postings_format,
+                fuzzy_prefix_length=(
+                    int(metadata.get("fuzzy_prefix_length", 0) or 0)
+                    if metadata.get("fuzzy_index_format") == _FUZZY_INDEX_FORMAT
+                    else 0
+                ),
             )
         except sqlite3.Error:
             return None
@@ -598,8 +1224,9 @@ class SqliteSegmentStore:
         return self.load(latest_id) if latest_id else None
 
     def latest_segment_id(self) -> str | None:
-        """Get ID of most recent segment."""
-        db_files = list(self.directory.glob(f"*{self.DB_SUFFIX}"))
+        """Get ID of most recent full (non-delta) segment."""
+        delta_ids = set(self.delta_segment_ids())
+        db_files = [db_file for db_file in self.directory.glob(f"*{self.DB_SUFFIX}") if db_file.stem not in delta_ids]
         if not db_files:
             return None
         try:
@@ -664,123 +1291,385 @@ class SqliteSegmentStore:
         return self.directory / f"{segment_id}{self.DB_SUFFIX}"
 
 
+_KEYWORD_ANALYZER = KeywordAnalyzer()
+_STORED_DOCUMENT_FIELDS = frozenset(_DOCUMENT_COLUMNS)
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyzedDocument:
+    """One document's stored fields and per-field term positions, ready for a writer.
+
+    Produced by ``analyze_document`` so that analysis can run in another process
+    and only the merge into ``SqliteSegmentWriter`` stays single-threaded.
+    """
+
+    doc_key: str
+    stored: dict[str, str]
+    lengths: dict[str, int]
+    postings: dict[str, dict[str, array]]
+
+
+def analyze_document(schema: Schema, document: dict[str, Any]) -> AnalyzedDocument:
+    """Normalize stored fields and analyze indexed fields of ``document``."""
+    doc_key = _normalize_unique(schema, document)
+    stored: dict[str, str] = {}
+    lengths: dict[str, int] = {}
+    postings: dict[str, dict[str, array]] = {}
+    for schema_field in schema.fields:
+        value = document.get(schema_field.name)
+        if schema_field.stored and (
+            schema_field.name in _STORED_DOCUMENT_FIELDS or schema_field.name == schema.unique_field
+        ):
+            normalized = _normalize_stored_value(schema_field.name, value)
+            if normalized not in (None, ""):
+                stored[schema_field.name] = normalized
+
+        if not schema_field.indexed:
+            continue
+
+        terms = _analyze_field(schema_field, value)
+        if not terms:
+            continue
+
+        lengths[schema_field.name] = len(terms)
+        field_postings: dict[str, array] = {}
+        for position, term in enumerate(terms):
+            positions = field_postings.get(term)
+            if positions is None:
+                positions = field_postings[term] = array("I")
+            positions.append(position)
+        postings[schema_field.name] = field_postings
+
+    if schema.unique_field not in stored:
+        normalized_unique = _normalize_stored_value(schema.unique_field, document.get(schema.unique_field))
+        if normalized_unique not in (None, ""):
+            stored[schema.unique_field] = normalized_unique
+
+    return AnalyzedDocument(doc_key=doc_key, stored=stored, lengths=lengths, postings=postings)
+
+
+def _normalize_unique(schema: Schema, document: dict[str, Any]) -> str:
+    """Normalize unique field value."""
+    if schema.unique_field not in document:
+        raise ValueError(f"Document missing unique field '{schema.unique_field}'")
+    value = document[schema.unique_field]
+    if value is None:
+        raise ValueError(f"Unique field '{schema.unique_field}' cannot be None")
+    return str(value)
+
+
+def _analyze_field(field, value) -> list[str]:
+    """Analyze field value into terms in position order."""
+    if value is None:
+        return []
+    if isinstance(field, TextField):
+        return get_analyzer(field.analyzer_name).terms(str(value))
+    if isinstance(field, (KeywordField, NumericField)):
+        return _KEYWORD_ANALYZER.terms(str(value))
+    return []
+
+
+def _normalize_stored_value(field_name: str, value: Any) -> str | None:
+    """Normalize stored field value."""
+    if value is None:
+        return None
+    text = str(value)
+    if field_name == "body":
+        return text[:4096] if len(text) > 4096 else text
+    if field_name == "excerpt":
+        return text[:640] if len(text) > 640 else text
+    if field_name == "title":
+        return text[:512] if len(text) > 512 else text
+    return text
+
+
+class SegmentSource(Protocol):
+    """Segment content that ``SqliteSegmentStore`` can stream into a database."""
+
+    @property
+    def segment_id(self) -> str: ...
+
+    @property
+    def created_at(self) -> str: ...
+
+    @property
+    def schema_data(self) -> dict[str, Any]: ...
+
+    @property
+    def doc_count(self) -> int: ...
+
+    def field_total_terms(self, field_name: str) -> int: ...
+
+    def sorted_doc_ids(self) -> list[str]: ...
+
+    def iter_posting_lists(self) -> Iterator[tuple[str, str, list[tuple[str, int, array]]]]: ...
+
+    def iter_documents(self) -> Iterator[tuple[str, dict[str, Any], dict[str, int]]]: ...
+
+
+class _SegmentDataSource:
+    """Adapts a ``build()``-style segment dict (new or legacy keys) to ``SegmentSource``."""
+
+    def __init__(self, segment_data: dict[str, Any]) -> None:
+        self._postings = segment_data.get("postings") or segment_data.get("p", {})
+        self._stored = segment_data.get("stored_fields") or segment_data.get("d", {})
+        self._lengths = segment_data.get("field_lengths", {})
+        self.segment_id = segment_data.get("segment_id") or segment_data.get("i") or uuid4().hex
+        self.created_at = (
+            segment_data.get("created_at") or segment_data.get("c") or datetime.now(timezone.utc).isoformat()
+        )
+        self.schema_data = segment_data.get("schema") or segment_data.get("s", {})
+        self.doc_count = int(segment_data.get("doc_count", 0))
+
+    def field_total_terms(self, field_name: str) -> int:
+        return sum(int(length) for length in self._lengths.get(field_name, {}).values())
+
+    def sorted_doc_ids(self) -> list[str]:
+        doc_ids = set(self._stored)
+        for terms in self._postings.values():
+            for posting_list in terms.values():
+                doc_ids.update(posting_dict.get("doc_id") or posting_dict.get("d", "") for posting_dict in posting_list)
+        return sorted(doc_ids)
+
+    def iter_posting_lists(self) -> Iterator[tuple[str, str, list[tuple[str, int, array]]]]:
+        for field_name, terms in self._postings.items():
+            field_lengths = self._lengths.get(field_name, {})
+            for term, posting_list in terms.items():
+                entries = []
+                for posting_dict in posting_list:
+                    doc_id = posting_dict.get("doc_id") or posting_dict.get("d", "")
+                    positions = posting_dict.get("positions") or posting_dict.get("p", [])
+                    entries.append(
+                        (doc_id, int(field_lengths.get(doc_id, 0)), array("I", (int(pos) for pos in positions)))
+                    )
+                yield field_name, term, entries
+
+    def iter_documents(self) -> Iterator[tuple[str, dict[str, Any], dict[str, int]]]:
+        lengths_by_doc: dict[str, dict[str, int]] = {}
+        for field_name, doc_lengths in self._lengths.items():
+            for doc_id, length in doc_lengths.items():
+                lengths_by_doc.setdefault(doc_id, {})[field_name] = int(length)
+        for doc_id, fields in self._stored.items():
+            yield doc_id, fields, lengths_by_doc.get(doc_id, {})
+
+
+# Rough per-entry cost of dict slots, keys, and array headers in the writer's buffers.
+_BUFFERED_POSTING_OVERHEAD_BYTES = 120
+_BUFFERED_DOCUMENT_OVERHEAD_BYTES = 512
+_POSITION_BYTES = array("I").itemsize
+
+
 class SqliteSegmentWriter:
-    """Builds SQLite segments from schema-aware documents."""
+    """Builds SQLite segments from schema-aware documents.
+
+    Postings and stored fields are buffered until their estimated size exceeds
+    the memory budget, then spilled as a sorted run into a staging SQLite
+    database. ``iter_posting_lists`` merges the runs with the in-memory tail,
+    so ``SqliteSegmentStore.save_writer`` never holds the whole segment.
+    """
 
-    def __init__(self, schema: Schema, *, segment_id: str | None = None) -> None:
+    DEFAULT_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+    MEMORY_BUDGET_BYTES = DEFAULT_MEMORY_BUDGET_BYTES
+
+    _analyze_field = staticmethod(_analyze_field)
+
+    def __init__(
+        self,
+        schema: Schema,
+        *,
+        segment_id: str | None = None,
+        memory_budget_bytes: int | None = None,
+        spill_dir: str | Path | None = None,
+    ) -> None:
         self.schema = schema
         self.segment_id = segment_id or uuid4().hex
         self.created_at = datetime.now(timezone.utc)
-        self._postings = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-        self._field_lengths = defaultdict(dict)
-        self._stored_fields = {}
-        self._keyword_analyzer = KeywordAnalyzer()
-        self._allowed_stored_fields = {
-            "url",
-            "url_path",
-            "title",
-            "excerpt",
-            "body",
-            "headings_h1",
-            "headings_h2",
-            "headings",
-            "path",
-            "tags",
-            "timestamp",
-            "language",
-        }
-        self._allowed_stored_fields.add(self.schema.unique_field)
+        self.memory_budget_bytes = max(1, memory_budget_bytes or self.MEMORY_BUDGET_BYTES)
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._postings: dict[str, dict[str, dict[str, array]]] = defaultdict(lambda: defaultdict(dict))
+        self._documents: dict[str, tuple[dict[str, str], dict[str, int]]] = {}
+        self._buffered_bytes = 0
+        self._doc_keys: set[str] = set()
+        self._field_totals: dict[str, int] = defaultdict(int)
+        self._staging_dir: tempfile.TemporaryDirectory | None = None
+        self._staging: sqlite3.Connection | None = None
+        self._run_count = 0
 
-    def add_document(self, document: dict[str, Any]) -> str:
-        """Add document to segment."""
-
-        doc_key = self._normalize_unique(document)
-        if doc_key in self._stored_fields:
-            raise ValueError(f"Duplicate document for unique field '{self.schema.unique_field}': {doc_key}")
+    @classmethod
+    def set_memory_budget(cls, budget_bytes: int | None) -> None:
+        """Configure the default buffer budget before postings spill to disk."""
+        if budget_bytes is None:
+            cls.MEMORY_BUDGET_BYTES = cls.DEFAULT_MEMORY_BUDGET_BYTES
+        else:
+            cls.MEMORY_BUDGET_BYTES = max(1, budget_bytes)
 
-        stored = {}
-        for schema_field in self.schema.fields:
-            value = document.get(schema_field.name)
-            if schema_field.stored and schema_field.name in self._allowed_stored_fields:
-                normalized = self._normalize_stored_value(schema_field.name, value)
-                if normalized not in (None, ""):
-                    stored[schema_field.name] = normalized
+    @property
+    def schema_data(self) -> dict[str, Any]:
+        return self.schema.to_dict()
 
-            if not schema_field.indexed:
-                continue
+    @property
+    def doc_count(self) -> int:
+        return len(self._doc_keys)
 
-            tokens = self._analyze_field(schema_field, value)
-            if not tokens:
-                continue
+    @property
+    def spill_count(self) -> int:
+        """Number of sorted runs written to the staging database."""
+        return self._run_count
 
-            self._field_lengths[schema_field.name][doc_key] = len(tokens)
-            for token in tokens:
-                terms = self._postings[schema_field.name][token.text]
-                positions = terms[doc_key]
-                positions.append(token.position)
+    def add_document(self, document: dict[str, Any]) -> str:
+        """Add document to segment."""
+        return self.add_analyzed_document(analyze_document(self.schema, document))
 
-        if self.schema.unique_field not in stored:
-            unique_value = document.get(self.schema.unique_field)
-            normalized_unique = self._normalize_stored_value(self.schema.unique_field, unique_value)
-            if normalized_unique not in (None, ""):
-                stored[self.schema.unique_field] = normalized_unique
+    def add_analyzed_document(self, analyzed: AnalyzedDocument) -> str:
+        """Add a document already passed through ``analyze_document``."""
+        doc_key = analyzed.doc_key
+        if doc_key in self._doc_keys:
+            raise ValueError(f"Duplicate document for unique field '{self.schema.unique_field}': {doc_key}")
 
-        self._stored_fields[doc_key] = stored
+        added_bytes = _BUFFERED_DOCUMENT_OVERHEAD_BYTES + sum(len(value) for value in analyzed.stored.values())
+        for field_name, terms in analyzed.postings.items():
+            self._field_totals[field_name] += analyzed.lengths[field_name]
+            field_postings = self._postings[field_name]
+            for term, positions in terms.items():
+                field_postings[term][doc_key] = positions
+                added_bytes += _BUFFERED_POSTING_OVERHEAD_BYTES + _POSITION_BYTES * len(positions)
+
+        self._doc_keys.add(doc_key)
+        self._documents[doc_key] = (analyzed.stored, analyzed.lengths)
+        self._buffered_bytes += added_bytes
+        if self._buffered_bytes >= self.memory_budget_bytes:
+            self._spill()
         return doc_key
 
+    def field_total_terms(self, field_name: str) -> int:
+        """Total token count of ``field_name`` across all added documents."""
+        return self._field_totals.get(field_name, 0)
+
+    def sorted_doc_ids(self) -> list[str]:
+        return sorted(self._doc_keys)
+
+    def iter_posting_lists(self) -> Iterator[tuple[str, str, list[tuple[str, int, array]]]]:
+        """Yield ``(field, term, [(doc_id, doc_length, positions)])`` in (field, term) order.
+
+        Within a list, postings keep the order their documents were added.
+        """
+        sources = [self._iter_run(run_index) for run_index in range(self._run_count)]
+        sources.append(self._iter_buffered_postings())
+        merged = heapq.merge(*sources, key=itemgetter(0, 1))
+        for (field_name, term), rows in groupby(merged, key=itemgetter(0, 1)):
+            yield field_name, term, [(row[2], row[3], row[4]) for row in rows]
+
+    def iter_documents(self) -> Iterator[tuple[str, dict[str, Any], dict[str, int]]]:
+        """Yield ``(doc_id, stored_fields, field_lengths)`` for every added document."""
+        if self._staging is not None:
+            cursor = self._staging.execute("SELECT doc_id, stored, lengths FROM staged_documents ORDER BY rowid")
+            for doc_id, stored, lengths in cursor:
+                yield doc_id, json.loads(stored), json.loads(lengths)
+        for doc_id, (stored, lengths) in self._documents.items():
+            yield doc_id, stored, lengths
+
     def build(self) -> dict[str, Any]:
         """Build segment data for SQLite storage."""
-        postings = {}
-        for field_name, terms in self._postings.items():
-            postings[field_name] = {}
-            for term, doc_map in terms.items():
-                postings[field_name][term] = [
-                    {
-                        "doc_id": doc_id,
-                        "positions": list(positions),
-                    }
-                    for doc_id, positions in doc_map.items()
-                ]
+        postings: dict[str, dict[str, list[dict[str, Any]]]] = defaultdict(dict)
+        for field_name, term, posting_list in self.iter_posting_lists():
+            postings[field_name][term] = [
+                {
+                    "doc_id": doc_id,
+                    "positions": list(positions),
+                }
+                for doc_id, _doc_length, positions in posting_list
+            ]
+
+        stored_fields = {}
+        field_lengths: dict[str, dict[str, int]] = defaultdict(dict)
+        for doc_id, stored, lengths in self.iter_documents():
+            stored_fields[doc_id] = stored
+            for field_name, length in lengths.items():
+                field_lengths[field_name][doc_id] = length
 
         return {
             "segment_id": self.segment_id,
             "created_at": self.created_at.isoformat(),
             "schema": self.schema.to_dict(),
-            "postings": postings,
-            "stored_fields": dict(self._stored_fields),
-            "field_lengths": {field: dict(lengths) for field, lengths in self._field_lengths.items()},
-            "doc_count": len(self._stored_fields),
+            "postings": dict(postings),
+            "stored_fields": stored_fields,
+            "field_lengths": dict(field_lengths),
+            "doc_count": len(stored_fields),
         }
 
-    def _normalize_unique(self, document: dict[str, Any]) -> str:
-        """Normalize unique field value."""
-        if self.schema.unique_field not in document:
-            raise ValueError(f"Document missing unique field '{self.schema.unique_field}'")
-        value = document[self.schema.unique_field]
-        if value is None:
-            raise ValueError(f"Unique field '{self.schema.unique_field}' cannot be None")
-        return str(value)
-
-    def _analyze_field(self, field, value):
-        """Analyze field value into tokens."""
-        if value is None:
-            return []
-        if isinstance(field, TextField):
-            analyzer = get_analyzer(field.analyzer_name)
-            return list(analyzer(str(value)))
-        if isinstance(field, (KeywordField, NumericField)):
-            return list(self._keyword_analyzer(str(value)))
-        return []
-
-    def _normalize_stored_value(self, field_name: str, value: Any) -> str | None:
-        """Normalize stored field value."""
-        if value is None:
-            return None
-        text = str(value)
-        if field_name == "body":
-            return text[:4096] if len(text) > 4096 else text
-        if field_name == "excerpt":
-            return text[:640] if len(text) > 640 else text
-        if field_name == "title":
-            return text[:512] if len(text) > 512 else text
-        return text
+    def close(self) -> None:
+        """Discard the staging database and its spilled runs."""
+        if self._staging is not None:
+            self._staging.close()
+            self._staging = None
+        if self._staging_dir is not None:
+            self._staging_dir.cleanup()
+            self._staging_dir = None
+
+    def _open_staging(self) -> sqlite3.Connection:
+        if self._staging is None:
+            if self._spill_dir is not None:
+                self._spill_dir.mkdir(parents=True, exist_ok=True)
+            self._staging_dir = tempfile.TemporaryDirectory(prefix=".segment-staging-", dir=self._spill_dir)
+            self._staging = sqlite3.connect(Path(self._staging_dir.name) / "staging.db")
+            # Staging data is disposable, so skip durability work.
+            self._staging.execute("PRAGMA journal_mode = OFF")
+            self._staging.execute("PRAGMA synchronous = OFF")
+            self._staging.execute(
+                "CREATE TABLE staged_documents (doc_id TEXT NOT NULL, stored TEXT NOT NULL, lengths TEXT NOT NULL)"
+            )
+        return self._staging
+
+    def _spill(self) -> None:
+        """Write the buffered postings as one sorted run and clear the buffers."""
+        conn = self._open_staging()
+        table = f"run_{self._run_count}"
+        conn.execute(
+            f"CREATE TABLE {table} ("
+            "field TEXT NOT NULL, term TEXT NOT NULL, doc_id TEXT NOT NULL, "
+            "doc_length INTEGER NOT NULL, positions BLOB NOT NULL)"
+        )
+        # Rows go in sorted, so reading back by rowid yields the run in merge order.
+        conn.executemany(
+            f"INSERT INTO {table} (field, term, doc_id, doc_length, positions) VALUES (?, ?, ?, ?, ?)",
+            (
+                (field_name, term, doc_id, doc_length, positions.tobytes())
+                for field_name, term, doc_id, doc_length, positions in self._iter_buffered_postings()
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO staged_documents (doc_id, stored, lengths) VALUES (?, ?, ?)",
+            (
+                (doc_id, json.dumps(stored), json.dumps(lengths))
+                for doc_id, (stored, lengths) in self._documents.items()
+            ),
+        )
+        conn.commit()
+        self._run_count += 1
+        logger.debug(
+            "Spilled run %d for segment %s (%d docs, ~%d bytes)",
+            self._run_count,
+            self.segment_id,
+            len(self._documents),
+            self._buffered_bytes,
+        )
+        self._postings = defaultdict(lambda: defaultdict(dict))
+        self._documents = {}
+        self._buffered_bytes = 0
+
+    def _iter_run(self, run_index: int) -> Iterator[tuple[str, str, str, int, array]]:
+        assert self._staging is not None
+        cursor = self._staging.execute(
+            f"SELECT field, term, doc_id, doc_length, positions FROM run_{run_index} ORDER BY rowid"
+        )
+        for field_name, term, doc_id, doc_length, blob in cursor:
+            positions = array("I")
+            positions.frombytes(blob)
+            yield field_name, term, doc_id, doc_length, positions
+
+    def _iter_buffered_postings(self) -> Iterator[tuple[str, str, str, int, array]]:
+        for field_name in sorted(self._postings):
+            terms = self._postings[field_name]
+            for term in sorted(terms):
+                for doc_id, positions in terms[term].items():
+                    yield field_name, term, doc_id, self._documents[doc_id][1][field_name], positions
@@ -12,6 +12,13 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
+
+# Documents longer than this multiple of the average length are scored as if
+# they were exactly this long (see ``bm25``).
+MAX_LENGTH_RATIO = 4.0
+
 
 @dataclass(frozen=True)
 class FieldLengthStats:
@@ -75,8 +82,21 @@ def bm25(tf: int, doc_length: int, avg_doc_length: float, *, k1: float = 1.5, b:
         return 0.0
     # Cap the length ratio to prevent excessive penalties for very long docs
     # This is a smart default that handles book chapters (128KB) gracefully
-    max_length_ratio = 4.0
     raw_ratio = doc_length / max(avg_doc_length, 1e-9)
-    normalized_length = min(raw_ratio, max_length_ratio)
+    normalized_length = min(raw_ratio, MAX_LENGTH_RATIO)
     denominator = tf + k1 * (1 - b + b * normalized_length)
     return (tf * (k1 + 1)) / denominator
+
+
+def bm25_weights(
+    frequencies: np.ndarray, doc_lengths: np.ndarray, avg_doc_length: float, *, k1: float = 1.5, b: float = 0.75
+) -> np.ndarray:
+    """Vectorized :func:`bm25` over parallel float arrays.
+
+    Performs the same operations in the same order, so each element is
+    bit-identical to the scalar result (including the length-ratio cap).
+    """
+
+    length_ratio = np.minimum(doc_lengths / max(avg_doc_length, 1e-9), MAX_LENGTH_RATIO)
+    weights = (frequencies * (k1 + 1)) / (frequencies + k1 * (1 - b + b * length_ratio))
+    return np.where(frequencies > 0, weights, 0.0)
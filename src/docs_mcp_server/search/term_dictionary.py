@@ -0,0 +1,111 @@
+"""Compact in-memory term dictionary for one segment.
+
+The engine asks every segment for every (field, term) of a query, synonyms
+included, and most of those terms are absent from any given field. Holding
+the segment's vocabulary in memory answers those lookups, and the document
+frequency of present terms, without a SQLite round trip.
+
+Each field's terms are stored sorted by UTF-8 bytes (SQLite's BINARY
+collation, so rows arrive in order) as one packed ``bytes`` buffer with an
+offsets array and a parallel doc-frequency array: about 8 bytes per term on
+top of the term text itself, instead of a Python object per term. Lookups
+binary-search the packed buffer.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+import heapq
+from itertools import groupby
+from operator import itemgetter
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldTerms:
+    packed: bytes
+    offsets: array
+    doc_freqs: array
+
+    def __len__(self) -> int:
+        return len(self.doc_freqs)
+
+    def term_at(self, index: int) -> bytes:
+        return self.packed[self.offsets[index] : self.offsets[index + 1]]
+
+    def find(self, term: bytes) -> int:
+        """Index of ``term``, or -1 when absent."""
+        low, high = 0, len(self.doc_freqs)
+        while low < high:
+            middle = (low + high) // 2
+            if self.term_at(middle) < term:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < len(self.doc_freqs) and self.term_at(low) == term else -1
+
+
+class TermDictionary:
+    """Immutable ``(field, term) -> doc frequency`` map over a segment's vocabulary."""
+
+    def __init__(self, fields: dict[str, _FieldTerms]) -> None:
+        self._fields = fields
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, str, int]]) -> TermDictionary:
+        """Build from ``(field, term, doc_freq)`` rows ordered by field, then term (bytewise)."""
+        fields: dict[str, _FieldTerms] = {}
+        for field_name, field_rows in groupby(rows, key=itemgetter(0)):
+            encoded: list[bytes] = []
+            offsets = array("I", [0])
+            doc_freqs = array("I")
+            size = 0
+            for _field, term, doc_freq in field_rows:
+                term_bytes = term.encode("utf-8")
+                encoded.append(term_bytes)
+                size += len(term_bytes)
+                offsets.append(size)
+                doc_freqs.append(doc_freq)
+            fields[field_name] = _FieldTerms(b"".join(encoded), offsets, doc_freqs)
+        return cls(fields)
+
+    def doc_frequency(self, field_name: str, term: str) -> int:
+        """Number of the segment's docs containing ``term`` in ``field_name`` (0 when absent)."""
+        field_terms = self._fields.get(field_name)
+        if field_terms is None:
+            return 0
+        index = field_terms.find(term.encode("utf-8"))
+        return field_terms.doc_freqs[index] if index >= 0 else 0
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return self.doc_frequency(*key) > 0
+
+    def terms(self, field_name: str) -> list[str]:
+        """The field's terms in dictionary order."""
+        field_terms = self._fields.get(field_name)
+        if field_terms is None:
+            return []
+        return [field_terms.term_at(index).decode("utf-8") for index in range(len(field_terms))]
+
+    def most_frequent(self, field_name: str, limit: int) -> list[tuple[str, int]]:
+        """The field's ``limit`` highest doc-frequency terms with their frequencies, most frequent first."""
+        field_terms = self._fields.get(field_name)
+        if field_terms is None or limit <= 0:
+            return []
+        doc_freqs = field_terms.doc_freqs
+        top = heapq.nlargest(limit, range(len(doc_freqs)), key=doc_freqs.__getitem__)
+        return [(field_terms.term_at(index).decode("utf-8"), doc_freqs[index]) for index in top]
+
+    def __len__(self) -> int:
+        return sum(len(field_terms) for field_terms in self._fields.values())
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the dictionary."""
+        return sum(
+            len(field_terms.packed)
+            + field_terms.offsets.itemsize * len(field_terms.offsets)
+            + field_terms.doc_freqs.itemsize * len(field_terms.doc_freqs)
+            for field_terms in self._fields.values()
+        )
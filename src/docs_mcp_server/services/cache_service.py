@@ -3,6 +3,7 @@
 import asyncio
 from collections.abc import Callable
 from datetime import datetime, timezone
+import hashlib
 import logging
 import math
 from urllib.parse import urlparse, urlsplit
@@ -15,7 +16,7 @@ from ..observability.tracing import create_span
 from ..service_layer import services
 from ..service_layer.filesystem_unit_of_work import AbstractUnitOfWork
 from ..services.semantic_cache_matcher import SemanticCacheMatcher
-from ..utils.doc_fetcher import AsyncDocFetcher, DocFetchError
+from ..utils.doc_fetcher import AsyncDocFetcher, DocFetchError, PageNotModifiedError
 from ..utils.models import DocPage
 
 
@@ -169,11 +170,26 @@ class CacheService:
         logger.warning(f"Using stale cache for {url} (offline mode)")
         return self._build_doc_page(doc, content=doc.content.text)
 
-    async def fetch_and_cache(self, url: str) -> tuple[DocPage | None, str | None]:
+    async def fetch_and_cache(
+        self,
+        url: str,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_hash: str | None = None,
+    ) -> tuple[DocPage | None, str | None]:
         """Fetch document from source and cache it.
 
+        When the previous fetch left validators, the fetch is conditional. A
+        304 response, or extracted content whose hash matches ``content_hash``,
+        returns the page flagged ``unchanged`` without rewriting the cached
+        document, so nothing is reindexed either.
+
         Args:
             url: Document URL to fetch
+            etag: ETag from the previous fetch
+            last_modified: Last-Modified from the previous fetch
+            content_hash: Content hash recorded for the cached copy
 
         Returns:
             Tuple of (DocPage if successful, failure reason string when None)
@@ -187,7 +203,7 @@ class CacheService:
         failure_reason: str | None = None
 
         try:
-            page = await self._fetcher.fetch_page(url)
+            page = await self._fetch_page(url, etag=etag, last_modified=last_modified, content_hash=content_hash)
         except DocFetchError as exc:
             failure_reason = self._format_fetch_failure(exc)
             logger.warning("Fetcher could not extract %s: %s", url, failure_reason)
@@ -197,7 +213,15 @@ class CacheService:
             logger.error(f"Error fetching {url}: {e}", exc_info=True)
             page = None
 
+        if page and page.unchanged:
+            return page, None
+
         if page:
+            page.content_hash = self._content_hash(page)
+            if content_hash and page.content_hash == content_hash and await self._get_document(url):
+                logger.debug("Content unchanged for %s; keeping cached copy", url)
+                page.unchanged = True
+                return page, None
             cached, cache_error = await self._cache_document(page)
             if cached:
                 return page, None
@@ -212,6 +236,40 @@ class CacheService:
         await self._mark_document_failure(url)
         return None, failure_reason
 
+    async def _fetch_page(
+        self,
+        url: str,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        content_hash: str | None,
+    ) -> DocPage | None:
+        assert self._fetcher is not None, "Fetcher should be initialized after ensure_ready()"
+        if not etag and not last_modified:
+            return await self._fetcher.fetch_page(url)
+        try:
+            return await self._fetcher.fetch_page(url, etag=etag, last_modified=last_modified)
+        except PageNotModifiedError:
+            document = await self._get_document(url)
+            if document is None:
+                logger.debug("%s not modified but missing from cache; refetching", url)
+                return await self._fetcher.fetch_page(url)
+        logger.debug("Not modified: %s", url)
+        page = self._build_doc_page(document, content=document.content.text, extraction_method="not_modified")
+        page.etag = etag
+        page.last_modified = last_modified
+        page.content_hash = content_hash
+        page.unchanged = True
+        return page
+
+    @staticmethod
+    def _page_markdown(page: DocPage) -> str:
+        return page.readability_content.processed_markdown if page.readability_content else page.content
+
+    def _content_hash(self, page: DocPage) -> str:
+        """Hash what ``_cache_document`` would write, so equal hashes mean an identical cached copy."""
+        return hashlib.sha256(f"{page.title}\n{self._page_markdown(page)}".encode()).hexdigest()
+
     async def _cache_document(self, page: DocPage) -> tuple[bool, str | None]:
         """Cache a document to the filesystem repository.
 
@@ -226,7 +284,7 @@ class CacheService:
                 stored = await services.store_document(
                     url=page.url,
                     title=page.title,
-                    markdown=page.readability_content.processed_markdown if page.readability_content else page.content,
+                    markdown=self._page_markdown(page),
                     text=page.readability_content.extracted_content if page.readability_content else page.content,
                     excerpt=page.readability_content.excerpt if page.readability_content else None,
                     uow=uow,
@@ -314,6 +372,9 @@ class CacheService:
         url: str,
         *,
         use_semantic_cache: bool = True,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_hash: str | None = None,
     ) -> tuple[DocPage | None, bool, str | None]:
         """Universal page fetching with cache check.
 
@@ -325,6 +386,10 @@ class CacheService:
             use_semantic_cache: When False, force a network fetch instead of
                 relying on semantic cache heuristics. Used by schedulers when
                 force-syncing a tenant so fresh content is guaranteed.
+            etag: ETag from the previous fetch, for a conditional refetch
+            last_modified: Last-Modified from the previous fetch, for a conditional refetch
+            content_hash: Content hash of the cached copy; a refetch that hashes
+                the same returns the page flagged ``unchanged`` without rewriting it
 
         Returns:
             Tuple of (DocPage if available, cache hit flag, failure reason when None)
@@ -378,8 +443,12 @@ class CacheService:
             await self.ensure_ready()
             logger.info("Fetching %s", url)
             span.add_event("fetch.start", {})
-            page, failure_reason = await self.fetch_and_cache(url)
-            if page:
+            page, failure_reason = await self.fetch_and_cache(
+                url, etag=etag, last_modified=last_modified, content_hash=content_hash
+            )
+            if page and page.unchanged:
+                span.add_event("fetch.unchanged", {"extraction_method": page.extraction_method})
+            elif page:
                 span.add_event("fetch.success", {})
             else:
                 span.add_event("fetch.failure", {"reason": failure_reason or "page_fetch_failed"})
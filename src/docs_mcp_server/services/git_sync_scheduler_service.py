@@ -308,3 +308,5 @@ class GitSyncSchedulerService:
 
         self._running = False
         self._initialized = False
+        # Flush queued crawl-state writes and stop the store's worker threads.
+        await asyncio.to_thread(self.metadata_store.close)
@@ -195,6 +195,9 @@ class SchedulerService:
             await self._cache_service.close()
             self._cache_service = None
 
+        # Flush queued crawl-state writes and stop the store's worker threads.
+        await asyncio.to_thread(self.metadata_store.close)
+
     async def trigger_sync(self, *, force_crawler: bool = False, force_full_sync: bool = False) -> dict:
         """Trigger an immediate sync cycle without blocking the caller."""
 
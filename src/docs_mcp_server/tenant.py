@@ -19,8 +19,12 @@ from urllib.parse import urlparse
 
 from .config import Settings
 from .deployment_config import TenantConfig
+from .observability.metrics import SEARCH_WARMUP_SECONDS
+from .registry import TenantMetadata
 from .search.indexer import INDEXABLE_EXTENSIONS, TenantIndexer
 from .search.indexing_utils import build_indexing_context
+from .search.result_cache import get_result_cache
+from .search.search_executor import SearchTimeoutError, get_search_executor
 from .search.segment_search_index import SegmentSearchIndex
 from .search.sqlite_storage import SqliteSegmentStore
 from .search.storage_factory import create_segment_store
@@ -59,33 +63,61 @@ class TenantApp:
         self._search_lock = threading.Lock()
         self._active_searches = 0
         self._retired_indexes: list[SegmentSearchIndex] = []
-        self._search_index = self._create_search_index()
+        # Warmed by warm_up() before the server takes requests, off the event loop.
+        self._search_index = self._create_search_index(warm_up=False)
         self._manifest_poll_interval = _MANIFEST_POLL_INTERVAL_S
         self._manifest_watch_task: asyncio.Task | None = None
         self._manifest_stop_event = asyncio.Event()
         self._url_translator = UrlTranslator(Path(tenant_config.docs_root_dir))
         self._docs_present: bool | None = None
+        # Serializes delta builds, compactions and full rebuilds of this tenant's segments.
+        self._index_build_lock = asyncio.Lock()
+        self._compaction_task: asyncio.Task | None = None
         # Build scheduler directly (no wrapper)
         on_sync_complete = self._make_post_sync_callback() if tenant_config.source_type == "git" else None
         self.scheduler_service = _build_scheduler_service(tenant_config, on_sync_complete)
         self._autostart_scheduler = _should_autostart_scheduler(tenant_config)
 
     def _make_post_sync_callback(self) -> Callable[[], Coroutine[Any, Any, None]]:
-        """Create a callback to rebuild index and reload search after git sync."""
+        """Create a callback to index changed docs into a delta segment and reload search after git sync."""
 
         async def _on_sync_complete() -> None:
-            logger.info(f"[{self.codename}] Post-sync: rebuilding search index")
+            logger.info(f"[{self.codename}] Post-sync: indexing changed documents")
             try:
-                indexing_context = build_indexing_context(self.tenant_config)
-                indexer = TenantIndexer(indexing_context)
-                result = indexer.build_segment(persist=True)
-                logger.info(f"[{self.codename}] Indexed {result.documents_indexed} documents")
-                self.reload_search_index()
+                async with self._index_build_lock:
+                    indexing_context = build_indexing_context(self.tenant_config)
+                    indexer = TenantIndexer(indexing_context)
+                    result = await asyncio.to_thread(indexer.build_delta)
+                    compaction_due = await asyncio.to_thread(indexer.delta_compaction_due)
+                logger.info(
+                    f"[{self.codename}] Indexed {result.documents_indexed} changed documents "
+                    f"({result.documents_deleted} replaced or removed)"
+                )
+                await asyncio.to_thread(self.reload_search_index)
+                if compaction_due:
+                    self._schedule_compaction()
             except Exception as e:
                 logger.error(f"[{self.codename}] Post-sync indexing failed: {e}")
 
         return _on_sync_complete
 
+    def _schedule_compaction(self) -> None:
+        """Merge delta segments into a fresh base segment in the background."""
+        if self._compaction_task is not None and not self._compaction_task.done():
+            return
+        self._compaction_task = asyncio.create_task(self._compact_segments(), name=f"{self.codename}-compaction")
+
+    async def _compact_segments(self) -> None:
+        logger.info("[%s] Compacting delta segments", self.codename)
+        try:
+            async with self._index_build_lock:
+                indexer = TenantIndexer(build_indexing_context(self.tenant_config))
+                result = await asyncio.to_thread(indexer.build_segment, persist=True)
+            logger.info("[%s] Compacted into %d documents", self.codename, result.documents_indexed)
+            await asyncio.to_thread(self.reload_search_index)
+        except Exception as exc:
+            logger.error("[%s] Delta compaction failed: %s", self.codename, exc)
+
     def _segments_dir(self) -> Path:
         return Path(self.tenant_config.docs_root_dir) / "__search_segments"
 
@@ -93,6 +125,11 @@ class TenantApp:
         return self._segments_dir() / "manifest.json"
 
     def _read_manifest_latest_segment_id(self, manifest_path: Path, *, log_missing: bool) -> str | None:
+        generation = self._read_manifest_generation(manifest_path, log_missing=log_missing)
+        return generation[0] if generation else None
+
+    def _read_manifest_generation(self, manifest_path: Path, *, log_missing: bool) -> tuple[str, ...] | None:
+        """Return the manifest's base segment id followed by its delta segment ids."""
         if not manifest_path.exists():
             if log_missing:
                 logger.warning("No manifest file for %s", self.codename)
@@ -116,7 +153,10 @@ class TenantApp:
             else:
                 logger.debug("No latest segment ID for %s", self.codename)
             return None
-        return latest_segment_id
+        delta_segment_ids = manifest.get("delta_segment_ids")
+        if not isinstance(delta_segment_ids, list):
+            return (latest_segment_id,)
+        return (latest_segment_id, *(segment_id for segment_id in delta_segment_ids if isinstance(segment_id, str)))
 
     def _segment_ready(self, segments_dir: Path, segment_id: str) -> bool:
         store = SqliteSegmentStore(segments_dir)
@@ -132,9 +172,18 @@ class TenantApp:
                 return None
             return self._search_index.db_path.stem
 
+    def _current_generation(self) -> tuple[str, ...] | None:
+        with self._search_lock:
+            if self._search_index is None:
+                return None
+            index = self._search_index
+            return (index.db_path.stem, *(path.stem for path in index.delta_paths))
+
     def _close_index(self, index: SegmentSearchIndex) -> None:
+        with self._search_lock:
+            live_segment_ids = self._search_index.segment_ids if self._search_index is not None else ()
         try:
-            index.close()
+            index.close(keep_segment_ids=live_segment_ids)
         except Exception as exc:
             logger.warning("[%s] Failed to close search index: %s", self.codename, exc)
 
@@ -151,6 +200,8 @@ class TenantApp:
                     close_now = True
         if close_now and old_index is not None:
             self._close_index(old_index)
+        # Cached results are keyed by segment ids, so they can't go stale; drop them to free the space.
+        get_result_cache().invalidate_tenant(self.codename, keep_segment_ids=new_index.segment_ids)
 
     def _close_search_indexes(self) -> None:
         current: SegmentSearchIndex | None = None
@@ -191,9 +242,15 @@ class TenantApp:
         self,
         *,
         segment_id: str | None = None,
+        delta_segment_ids: tuple[str, ...] = (),
         log_missing: bool = True,
+        warm_up: bool = True,
     ) -> SegmentSearchIndex | None:
-        """Create search index directly from segment database."""
+        """Create search index directly from segment database and its delta segments.
+
+        With ``warm_up`` the new index is warmed before it is returned, so it
+        never serves queries cold.
+        """
         search_segments_dir = self._segments_dir()
 
         if not search_segments_dir.exists():
@@ -205,43 +262,88 @@ class TenantApp:
 
         manifest_path = self._manifest_path()
         if segment_id is None:
-            segment_id = self._read_manifest_latest_segment_id(manifest_path, log_missing=log_missing)
+            generation = self._read_manifest_generation(manifest_path, log_missing=log_missing)
+            if not generation:
+                return None
+            segment_id, *delta_list = generation
+            delta_segment_ids = tuple(delta_list)
         if not segment_id:
             return None
 
         search_db_path = search_segments_dir / f"{segment_id}.db"
-        if not search_db_path.exists():
-            if log_missing:
-                logger.warning("Search database not found: %s", search_db_path)
-            else:
-                logger.debug("Search database not found: %s", search_db_path)
+        delta_paths = [search_segments_dir / f"{delta_id}.db" for delta_id in delta_segment_ids]
+        for db_path in (search_db_path, *delta_paths):
+            if not db_path.exists():
+                if log_missing:
+                    logger.warning("Search database not found: %s", db_path)
+                else:
+                    logger.debug("Search database not found: %s", db_path)
+                return None
+
+        try:
+            index = SegmentSearchIndex(
+                search_db_path,
+                tenant=self.codename,
+                delta_paths=delta_paths,
+                cache_pin_seconds=self.tenant_config.search.cache_pin_seconds,
+            )
+        except Exception as exc:
+            logger.error("Failed to create search index for %s: %s", self.codename, exc)
             return None
 
-        if not self._segment_ready(search_segments_dir, segment_id):
+        # The index loads its segment once and keeps it resident; an index without a
+        # loadable segment is not ready to serve and must not be swapped in.
+        if index.segment is None:
             if log_missing:
                 logger.warning("Search segment not ready for %s: %s", self.codename, segment_id)
             else:
                 logger.debug("Search segment not ready for %s: %s", self.codename, segment_id)
+            self._close_index(index)
             return None
-
+        if warm_up:
+            self._warm_up_index(index)
+        return index
+
+    def _warm_up_index(self, index: SegmentSearchIndex) -> None:
+        """Warm ``index`` with the tenant's test queries within its search warm-up budgets."""
+        search_config = self.tenant_config.search
+        if search_config.warmup_seconds <= 0:
+            return
         try:
-            return SegmentSearchIndex(search_db_path, tenant=self.codename)
+            report = index.warm_up(
+                TenantMetadata.from_config(self.tenant_config).test_queries,
+                time_budget_s=search_config.warmup_seconds,
+                io_budget_bytes=search_config.warmup_io_mb * 1024 * 1024,
+            )
         except Exception as exc:
-            logger.error("Failed to create search index for %s: %s", self.codename, exc)
-            return None
+            logger.warning("[%s] Search index warm-up failed: %s", self.codename, exc)
+            return
+        SEARCH_WARMUP_SECONDS.labels(tenant=self.codename).set(report.seconds)
+        logger.info(
+            "[%s] Search index warmed in %.3fs (%d queries, %d posting lists, %d bytes)",
+            self.codename,
+            report.seconds,
+            report.queries_replayed,
+            report.postings_loaded,
+            report.posting_bytes,
+        )
 
     def _maybe_reload_from_manifest(self, *, log_missing: bool) -> bool:
         manifest_path = self._manifest_path()
-        latest_segment_id = self._read_manifest_latest_segment_id(manifest_path, log_missing=log_missing)
-        if not latest_segment_id:
+        generation = self._read_manifest_generation(manifest_path, log_missing=log_missing)
+        if not generation:
             return False
-        if latest_segment_id == self._current_segment_id():
+        if generation == self._current_generation():
             return False
-        new_index = self._create_search_index(segment_id=latest_segment_id, log_missing=log_missing)
+        new_index = self._create_search_index(
+            segment_id=generation[0], delta_segment_ids=generation[1:], log_missing=log_missing
+        )
         if new_index is None:
             return False
         self._swap_search_index(new_index)
-        logger.info("[%s] Search index updated to segment %s", self.codename, latest_segment_id)
+        logger.info(
+            "[%s] Search index updated to segment %s (+%d deltas)", self.codename, generation[0], len(generation) - 1
+        )
         return True
 
     def _start_manifest_watch(self) -> None:
@@ -261,7 +363,8 @@ class TenantApp:
 
     async def _watch_manifest(self) -> None:
         while not self._manifest_stop_event.is_set():
-            self._maybe_reload_from_manifest(log_missing=False)
+            # Loading and warming a new generation reads the segment; keep it off the event loop.
+            await asyncio.to_thread(self._maybe_reload_from_manifest, log_missing=False)
             try:
                 await asyncio.wait_for(self._manifest_stop_event.wait(), timeout=self._manifest_poll_interval)
             except asyncio.TimeoutError:
@@ -273,15 +376,17 @@ class TenantApp:
         Returns:
             True if index was successfully loaded, False otherwise.
         """
-        latest_segment_id = self._read_manifest_latest_segment_id(self._manifest_path(), log_missing=True)
-        if not latest_segment_id:
+        generation = self._read_manifest_generation(self._manifest_path(), log_missing=True)
+        if not generation:
             return False
 
-        if latest_segment_id == self._current_segment_id():
-            logger.info("[%s] Search index already at latest segment %s", self.codename, latest_segment_id)
+        if generation == self._current_generation():
+            logger.info("[%s] Search index already at latest segment %s", self.codename, generation[0])
             return True
 
-        new_index = self._create_search_index(segment_id=latest_segment_id, log_missing=True)
+        new_index = self._create_search_index(
+            segment_id=generation[0], delta_segment_ids=generation[1:], log_missing=True
+        )
         if new_index is None:
             return False
         self._swap_search_index(new_index)
@@ -337,12 +442,13 @@ class TenantApp:
             result = indexer.build_segment(persist=True)
             return result.documents_indexed
 
-        documents_indexed = await asyncio.to_thread(_build_index)
+        async with self._index_build_lock:
+            documents_indexed = await asyncio.to_thread(_build_index)
         if documents_indexed <= 0:
             logger.warning("[%s] No documents indexed during on-demand build", self.codename)
             return False
         self._docs_present = True
-        return self.reload_search_index()
+        return await asyncio.to_thread(self.reload_search_index)
 
     async def build_search_index(self, *, force: bool = True) -> dict:
         """Build and load a fresh search index for this tenant."""
@@ -361,18 +467,25 @@ class TenantApp:
             result = indexer.build_segment(persist=True)
             return result.documents_indexed
 
-        documents_indexed = await asyncio.to_thread(_build_index)
+        async with self._index_build_lock:
+            documents_indexed = await asyncio.to_thread(_build_index)
         if documents_indexed <= 0:
             logger.warning("[%s] Index rebuild produced no documents", self.codename)
             return {"success": False, "message": "No documents indexed", "documents_indexed": documents_indexed}
         self._docs_present = True
-        reloaded = self.reload_search_index()
+        reloaded = await asyncio.to_thread(self.reload_search_index)
         return {
             "success": reloaded,
             "message": "Index rebuilt" if reloaded else "Index rebuild completed but failed to reload",
             "documents_indexed": documents_indexed,
         }
 
+    async def warm_up(self) -> None:
+        """Warm the index loaded at construction; indexes loaded later are warmed before they swap in."""
+        with self._lease_search_index() as search_index:
+            if search_index is not None:
+                await asyncio.to_thread(self._warm_up_index, search_index)
+
     async def initialize(self) -> None:
         """Initialize scheduler if auto-start is enabled, start manifest watch."""
         if self._autostart_scheduler:
@@ -382,17 +495,29 @@ class TenantApp:
     async def shutdown(self) -> None:
         """Shutdown search index and scheduler."""
         await self._stop_manifest_watch()
+        if self._compaction_task is not None and not self._compaction_task.done():
+            self._compaction_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._compaction_task
         self._close_search_indexes()
         stop_method = getattr(self.scheduler_service, "stop", None)
         if callable(stop_method):
             await stop_method()
 
     async def search(self, query: str, size: int, word_match: bool) -> SearchDocsResponse:
-        """Search documents directly using segment search index."""
+        """Search documents on the shared search executor, off the event loop."""
         if self._current_segment_id() is None:
             if not self._has_docs():
                 return SearchDocsResponse(results=[], query=query)
             await self._ensure_search_index()
+        try:
+            return await get_search_executor().run(self.codename, self._search_blocking, query, size, word_match)
+        except SearchTimeoutError as e:
+            return SearchDocsResponse(results=[], error=f"Search timed out after {e.timeout_seconds:g}s", query=query)
+
+    def _search_blocking(self, query: str, size: int, word_match: bool = False) -> SearchDocsResponse:
+        # Runs on a search worker thread; the lease keeps the index open until the
+        # worker finishes, even if the awaiting caller already timed out.
         with self._lease_search_index() as search_index:
             if search_index is None:
                 return SearchDocsResponse(
@@ -403,7 +528,7 @@ class TenantApp:
 
             try:
                 # Direct call to segment search index
-                search_response = search_index.search(query, size)
+                search_response = search_index.search(query, size, word_match=word_match)
 
                 # Convert to standardized response format
                 document_search_results = [
@@ -411,6 +536,7 @@ class TenantApp:
                         url=result.document_url,
                         title=result.document_title,
                         snippet=result.snippet,
+                        score=round(result.relevance_score, 4),
                     )
                     for result in search_response.results
                 ]
@@ -579,7 +705,8 @@ class TenantApp:
 
     def get_index_status(self) -> dict:
         """Return index status summary for status endpoints."""
-        latest_segment_id = self._read_manifest_latest_segment_id(self._manifest_path(), log_missing=False)
+        generation = self._read_manifest_generation(self._manifest_path(), log_missing=False) or ()
+        latest_segment_id = generation[0] if generation else None
         current_segment_id = self._current_segment_id()
         latest_segment = None
         segments_dir = self._segments_dir()
@@ -591,6 +718,7 @@ class TenantApp:
             "has_search_index": self._search_index is not None,
             "current_segment_id": current_segment_id,
             "latest_segment_id": latest_segment_id,
+            "delta_segment_count": max(len(generation) - 1, 0),
             "segment_ready": bool(latest_segment_id and self._segment_ready(self._segments_dir(), latest_segment_id)),
             "doc_count": latest_segment.doc_count if latest_segment else 0,
             "last_indexed_at": latest_segment.created_at.isoformat() if latest_segment else None,
@@ -682,9 +810,17 @@ def _build_scheduler_service(
     tenant_config: TenantConfig, on_sync_complete: Callable[[], Coroutine[Any, Any, None]] | None = None
 ):
     base_dir = _resolve_docs_root(tenant_config)
-    metadata_store = CrawlStateStore(base_dir)
-
     infra = tenant_config._infrastructure
+    if infra is not None:
+        metadata_store = CrawlStateStore(
+            base_dir,
+            event_flush_size=infra.crawl_event_flush_size,
+            event_flush_interval_seconds=infra.crawl_event_flush_interval_seconds,
+            event_sample_rates=infra.crawl_event_sample_rates,
+        )
+    else:
+        metadata_store = CrawlStateStore(base_dir)
+
     operation_mode = infra.operation_mode if infra else "online"
 
     if tenant_config.source_type == "git":
@@ -0,0 +1,181 @@
+"""Precomputed routing index behind the ``find_tenant`` tool.
+
+Scoring a query against tenant metadata used to lowercase and split every
+metadata field and run ``levenshtein_distance`` against each of its words,
+for every tenant, on every call. The index does that work once: fields are
+stored lowercased with their weights, and every fuzzy-matchable word sits in
+a SymSpell-style deletion index shared by all tenants. A query only verifies
+the few words that share a deletion variant with one of its terms, and
+substring matches come from a character n-gram index, so only fields that
+contain or nearly match a query term are scored at all.
+
+Scores are identical to the original per-tenant scan:
+
+- a field containing the whole query scores its weight;
+- otherwise each query term scores 0.8 when the field contains it, or
+  0.7/0.5/0.3 for the closest field word at edit distance 0/1/2 (terms and
+  words of 3+ characters only), and the field scores the average times its
+  weight;
+- a tenant scores its best field, capped at 1.0.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from docs_mcp_server.search.fuzzy import deletion_variants, levenshtein_distance
+
+
+if TYPE_CHECKING:
+    from docs_mcp_server.registry import TenantMetadata
+
+
+CODENAME_WEIGHT = 3.0
+DISPLAY_NAME_WEIGHT = 2.5
+DESCRIPTION_WEIGHT = 1.5
+SOURCE_TYPE_WEIGHT = 0.5
+URL_PREFIX_WEIGHT = 1.0
+TEST_QUERY_WEIGHT = 1.0
+
+_TERM_MATCH_SCORE = 0.8
+_MAX_FUZZY_DISTANCE = 2
+_MIN_FUZZY_LENGTH = 3
+# Fields are indexed by every substring up to this length: shorter terms are
+# looked up directly, longer ones intersect their trigrams and are verified.
+_GRAM_LENGTH = 3
+
+
+def _fuzzy_score(distance: int) -> float:
+    # 0 dist = 0.7, 1 dist = 0.5, 2 dist = 0.3
+    return max(0.0, 0.7 - (distance * 0.2))
+
+
+def _weighted_fields(metadata: TenantMetadata) -> tuple[tuple[str, float], ...]:
+    fields = [
+        (metadata.codename.lower(), CODENAME_WEIGHT),
+        (metadata.display_name.lower(), DISPLAY_NAME_WEIGHT),
+        (metadata.description.lower(), DESCRIPTION_WEIGHT),
+        (metadata.source_type.lower(), SOURCE_TYPE_WEIGHT),
+    ]
+    fields.extend((url.lower(), URL_PREFIX_WEIGHT) for url in metadata.url_prefixes)
+    fields.extend((query.lower(), TEST_QUERY_WEIGHT) for query in metadata.test_queries)
+    return tuple(fields)
+
+
+class TenantRoutingIndex:
+    """Immutable query-to-tenant scoring structure built from tenant metadata."""
+
+    def __init__(self, tenants: Sequence[TenantMetadata]) -> None:
+        self._tenants = tuple(tenants)
+        # Flat (tenant ordinal, lowercased text, weight) rows; index structures refer to row ordinals.
+        self._fields = tuple(
+            (tenant_ordinal, text, weight)
+            for tenant_ordinal, metadata in enumerate(self._tenants)
+            for text, weight in _weighted_fields(metadata)
+        )
+
+        grams: dict[str, set[int]] = {}
+        words: dict[str, set[int]] = {}
+        for row, (_tenant_ordinal, text, _weight) in enumerate(self._fields):
+            for gram in _char_grams(text):
+                grams.setdefault(gram, set()).add(row)
+            for word in text.replace("-", " ").replace("_", " ").split():
+                if len(word) >= _MIN_FUZZY_LENGTH:
+                    words.setdefault(word, set()).add(row)
+        self._gram_rows = {gram: frozenset(rows) for gram, rows in grams.items()}
+        self._word_rows = {word: tuple(sorted(rows)) for word, rows in words.items()}
+
+        variants: dict[str, set[str]] = {}
+        for word in self._word_rows:
+            for level in deletion_variants(word, _MAX_FUZZY_DISTANCE):
+                for variant in level:
+                    variants.setdefault(variant, set()).add(word)
+        self._variant_words = {variant: tuple(words) for variant, words in variants.items()}
+
+    @property
+    def tenants(self) -> tuple[TenantMetadata, ...]:
+        return self._tenants
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def score(self, query: str) -> dict[str, float]:
+        """Score every tenant against ``query`` (0.0 to 1.0), in registration order."""
+        query_lower = query.lower()
+        query_terms = query_lower.split()
+        best = [0.0] * len(self._tenants)
+        if not query_terms:
+            # No terms to look up: only a whole-query substring match can score.
+            for tenant_ordinal, text, weight in self._fields:
+                if query_lower in text:
+                    best[tenant_ordinal] = max(best[tenant_ordinal], weight)
+        else:
+            containing = {term: self._rows_containing(term) for term in set(query_terms)}
+            fuzzy = {term: self._fuzzy_row_scores(term) for term in containing}
+            # A field that neither contains nor fuzzily matches any term scores 0.
+            candidates: set[int] = set()
+            for term, rows in containing.items():
+                candidates.update(rows)
+                candidates.update(fuzzy[term])
+            for row in candidates:
+                tenant_ordinal, text, weight = self._fields[row]
+                if query_lower in text:
+                    field_score = weight
+                else:
+                    total = 0.0
+                    for term in query_terms:
+                        total += _TERM_MATCH_SCORE if row in containing[term] else fuzzy[term].get(row, 0.0)
+                    field_score = total / len(query_terms) * weight
+                best[tenant_ordinal] = max(best[tenant_ordinal], field_score)
+        return {metadata.codename: min(score, 1.0) for metadata, score in zip(self._tenants, best, strict=True)}
+
+    def match(self, query: str, *, threshold: float, limit: int) -> list[tuple[TenantMetadata, float]]:
+        """Return up to ``limit`` tenants scoring above ``threshold``, best first."""
+        scored = [
+            (metadata, score)
+            for metadata, score in zip(self._tenants, self.score(query).values(), strict=True)
+            if score > threshold
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
+
+    def _rows_containing(self, term: str) -> frozenset[int] | set[int]:
+        """Field rows whose text contains ``term`` as a substring."""
+        if len(term) <= _GRAM_LENGTH:
+            return self._gram_rows.get(term, frozenset())
+        postings = sorted(
+            (self._gram_rows.get(term[start : start + _GRAM_LENGTH], frozenset()) for start in _gram_starts(term)),
+            key=len,
+        )
+        rows = set(postings[0]).intersection(*postings[1:])
+        return {row for row in rows if term in self._fields[row][1]}
+
+    def _fuzzy_row_scores(self, term: str) -> dict[int, float]:
+        """Best fuzzy score of ``term`` per field row holding a word within edit distance 2."""
+        if len(term) < _MIN_FUZZY_LENGTH:
+            return {}
+        candidates: set[str] = set()
+        for level in deletion_variants(term, _MAX_FUZZY_DISTANCE):
+            for variant in level:
+                candidates.update(self._variant_words.get(variant, ()))
+
+        best: dict[int, float] = {}
+        for word in candidates:
+            distance = levenshtein_distance(term, word, max_distance=_MAX_FUZZY_DISTANCE)
+            if distance > _MAX_FUZZY_DISTANCE:
+                continue
+            word_score = _fuzzy_score(distance)
+            for row in self._word_rows[word]:
+                if word_score > best.get(row, 0.0):
+                    best[row] = word_score
+        return best
+
+
+def _char_grams(text: str) -> set[str]:
+    """Every substring of ``text`` up to ``_GRAM_LENGTH`` characters long."""
+    return {text[start : start + size] for size in range(1, _GRAM_LENGTH + 1) for start in range(len(text) - size + 1)}
+
+
+def _gram_starts(term: str) -> range:
+    return range(len(term) - _GRAM_LENGTH + 1)
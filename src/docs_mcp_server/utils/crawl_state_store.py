@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import json
 import logging
 from pathlib import Path
+import queue
 import re
 import sqlite3
+import threading
 import time
-from typing import Any, ClassVar
+from typing import Any, ClassVar, TypeVar
 
 from docs_mcp_server.domain.sync_progress import SyncProgress
 from docs_mcp_server.search.sqlite_pragmas import apply_read_pragmas, apply_write_pragmas
@@ -33,6 +37,17 @@ class DatabaseCriticalError(RuntimeError):
 # Maximum retries for self-healing connection attempts
 _MAX_CONNECT_RETRIES = 3
 _RETRY_DELAY_SECONDS = 0.5
+# Threads serving reads, each with its own long-lived read-only connection.
+_READER_THREADS = 2
+# How long close() waits for queued writes to finish.
+_CLOSE_TIMEOUT_SECONDS = 30.0
+# Buffered crawl events that trigger a flush, and how long one may wait for it.
+_EVENT_FLUSH_SIZE = 256
+_EVENT_FLUSH_INTERVAL_SECONDS = 1.0
+# URLs enqueued per write transaction.
+_ENQUEUE_CHUNK_SIZE = 5000
+
+_T = TypeVar("_T")
 
 
 @dataclass(slots=True)
@@ -53,8 +68,102 @@ class LockLease:
         return max(0.0, (self.expires_at - moment).total_seconds())
 
 
+@dataclass(slots=True)
+class _PendingEvent:
+    """A crawl event waiting for the next group commit.
+
+    ``sample_weight`` is how many events of its type this row stands for.
+    Events dropped by sampling have weight 0 and only update the per-URL
+    counters.
+    """
+
+    event_at: str
+    canonical: str | None
+    url: str | None
+    event_type: str
+    status: str | None
+    reason: str | None
+    detail: str | None
+    duration_ms: int | None
+    sample_weight: int = 1
+
+
+def _log_event_flush_failure(flush: Future[None]) -> None:
+    if not flush.cancelled() and (exc := flush.exception()) is not None:
+        logger.warning("Failed to write buffered crawl events: %s", exc)
+
+
+class _WriterThread:
+    """Single thread owning the store's write connection and running write jobs in submission order.
+
+    Each job runs in its own transaction, committed when it returns and
+    rolled back when it raises. A job whose caller was cancelled before it
+    started is skipped. The connection is opened on the first job and
+    reopened after a connection-level error, so ``_connect``'s retries and
+    backoff sleeps happen here rather than on the event loop.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], name: str) -> None:
+        self._connect = connect
+        self._jobs: queue.SimpleQueue[tuple[Callable[[sqlite3.Connection], Any], Future] | None] = queue.SimpleQueue()
+        self._conn: sqlite3.Connection | None = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, job: Callable[[sqlite3.Connection], _T]) -> Future[_T]:
+        future: Future[_T] = Future()
+        self._jobs.put((job, future))
+        return future
+
+    def close(self, timeout: float | None = None) -> None:
+        """Finish the queued jobs, then close the connection and stop the thread."""
+        self._jobs.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while (item := self._jobs.get()) is not None:
+            job, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if self._conn is None:
+                    self._conn = self._connect()
+                with self._conn:
+                    result = job(self._conn)
+            except BaseException as exc:
+                if isinstance(exc, sqlite3.Error) and not isinstance(exc, sqlite3.IntegrityError):
+                    self._discard_connection()
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+        self._discard_connection()
+
+    def _discard_connection(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+
 class CrawlStateStore:
-    """Persist crawl metadata, queue, locks, and progress in SQLite."""
+    """Persist crawl metadata, queue, locks, and progress in SQLite.
+
+    Async methods never touch SQLite on the event loop. Writes go through
+    one writer thread that holds a persistent connection. Reads run on a
+    small thread pool, and each reader thread holds a persistent read-only
+    connection. Callers await the result. Both are started on first use and
+    stopped by ``close()``. A closed store starts them again if it is used
+    later.
+
+    ``record_event`` buffers events in memory. The buffer is written in one
+    transaction once it holds ``event_flush_size`` events or its oldest
+    event is ``event_flush_interval_seconds`` old, with per-URL counters
+    summed per batch. Readers of the event log flush it first. Event types
+    listed in ``event_sample_rates`` keep only that fraction of their rows,
+    each weighted by the events it stands for.
+    """
 
     SUMMARY_KEY = "summary"
     LAST_SYNC_KEY = "last_sync_at"
@@ -62,7 +171,16 @@ class CrawlStateStore:
     EVENT_RETENTION_DAYS = 49
     EVENT_MAX_ROWS = 200_000
     _ALLOWED_TABLES: ClassVar[set[str]] = {"crawl_urls", "crawl_events"}
-    _ALLOWED_COLUMNS: ClassVar[set[str]] = {"fetch_count", "cache_hit_count", "failure_count", "last_event_at"}
+    _ALLOWED_COLUMNS: ClassVar[set[str]] = {
+        "fetch_count",
+        "cache_hit_count",
+        "failure_count",
+        "last_event_at",
+        "etag",
+        "last_modified",
+        "content_hash",
+        "sample_weight",
+    }
 
     def __init__(
         self,
@@ -70,12 +188,28 @@ class CrawlStateStore:
         *,
         db_dir: str = "__crawl_state",
         db_name: str = "crawl.sqlite",
+        event_flush_size: int = _EVENT_FLUSH_SIZE,
+        event_flush_interval_seconds: float = _EVENT_FLUSH_INTERVAL_SECONDS,
+        event_sample_rates: dict[str, float] | None = None,
     ) -> None:
         self.tenant_root = tenant_root
         self.db_root = tenant_root / db_dir
         self.db_root.mkdir(parents=True, exist_ok=True)
         self.db_path = self.db_root / db_name
         self._path_builder = PathBuilder()
+        self._workers_lock = threading.Lock()
+        self._writer: _WriterThread | None = None
+        self._readers: ThreadPoolExecutor | None = None
+        self._reader_local = threading.local()
+        self._reader_connections: list[sqlite3.Connection] = []
+        self._event_flush_size = max(1, event_flush_size)
+        self._event_flush_interval = event_flush_interval_seconds
+        self._event_sample_rates = dict(event_sample_rates or {})
+        self._events_lock = threading.Lock()
+        self._pending_events: list[_PendingEvent] = []
+        self._unsampled_events: dict[str, int] = {}
+        self._event_flush: Future[None] | None = None
+        self._event_timer: asyncio.TimerHandle | None = None
         self._initialize_schema()
 
     def ensure_ready(self) -> None:
@@ -112,9 +246,8 @@ class CrawlStateStore:
         2. Retrying connection with exponential backoff
         3. Raising DatabaseCriticalError after exhausting retries (triggers container restart)
 
-        Note: SQLite operations are inherently blocking. The retry sleep uses time.sleep()
-        which is acceptable here since SQLite itself blocks. For truly non-blocking behavior,
-        consider using aiosqlite, but that would require a significant refactor.
+        Note: the retry sleep uses time.sleep(). Async methods only reach this
+        from the writer thread or a reader thread, never from the event loop.
         """
         last_error: sqlite3.Error | None = None
 
@@ -127,7 +260,7 @@ class CrawlStateStore:
                     conn = sqlite3.connect(f"file:{self.db_path.as_posix()}?mode=ro", uri=True, check_same_thread=False)
                     apply_read_pragmas(conn)
                 else:
-                    conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=0)
+                    conn = sqlite3.connect(self.db_path, check_same_thread=False)
                     apply_write_pragmas(conn)
                     conn.execute("PRAGMA busy_timeout = 30000")
                 conn.row_factory = sqlite3.Row
@@ -167,6 +300,59 @@ class CrawlStateStore:
             f"Unable to open database at {self.db_path} after {_MAX_CONNECT_RETRIES} attempts: {last_error}"
         )
 
+    def _writer_thread(self) -> _WriterThread:
+        with self._workers_lock:
+            if self._writer is None:
+                self._writer = _WriterThread(self._connect, name=f"crawl-state-writer:{self.tenant_root.name}")
+            return self._writer
+
+    def _reader_pool(self) -> ThreadPoolExecutor:
+        with self._workers_lock:
+            if self._readers is None:
+                self._readers = ThreadPoolExecutor(
+                    max_workers=_READER_THREADS, thread_name_prefix=f"crawl-state-reader:{self.tenant_root.name}"
+                )
+            return self._readers
+
+    def _reader_connection(self) -> sqlite3.Connection:
+        """This thread's long-lived read-only connection."""
+        conn = getattr(self._reader_local, "conn", None)
+        if conn is None:
+            conn = self._connect(read_only=True)
+            self._reader_local.conn = conn
+            with self._workers_lock:
+                self._reader_connections.append(conn)
+        return conn
+
+    def _read_sync(self, job: Callable[[sqlite3.Connection], _T]) -> _T:
+        return job(self._reader_connection())
+
+    async def _read(self, job: Callable[[sqlite3.Connection], _T]) -> _T:
+        """Run ``job`` with a reader thread's connection."""
+        return await asyncio.wrap_future(self._reader_pool().submit(self._read_sync, job))
+
+    async def _write(self, job: Callable[[sqlite3.Connection], _T]) -> _T:
+        """Run ``job`` in a transaction on the writer thread."""
+        return await asyncio.wrap_future(self._writer_thread().submit(job))
+
+    def close(self) -> None:
+        """Flush queued writes, stop the worker threads and close their connections.
+
+        This blocks until the queued writes finish, so call it off the event loop.
+        """
+        self._submit_events()
+        with self._workers_lock:
+            writer, self._writer = self._writer, None
+            readers, self._readers = self._readers, None
+            connections, self._reader_connections = self._reader_connections, []
+            self._reader_local = threading.local()
+        if writer is not None:
+            writer.close(_CLOSE_TIMEOUT_SECONDS)
+        if readers is not None:
+            readers.shutdown(wait=True)
+        for conn in connections:
+            conn.close()
+
     def _initialize_schema(self) -> None:
         with self._connect() as conn:
             conn.executescript(
@@ -186,7 +372,10 @@ class CrawlStateStore:
                     fetch_count INTEGER DEFAULT 0,
                     cache_hit_count INTEGER DEFAULT 0,
                     failure_count INTEGER DEFAULT 0,
-                    last_event_at TEXT
+                    last_event_at TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_hash TEXT
                 );
                 CREATE TABLE IF NOT EXISTS crawl_queue (
                     canonical_url TEXT PRIMARY KEY,
@@ -244,7 +433,8 @@ class CrawlStateStore:
                     status TEXT,
                     reason TEXT,
                     detail TEXT,
-                    duration_ms INTEGER
+                    duration_ms INTEGER,
+                    sample_weight INTEGER DEFAULT 1
                 );
                 CREATE INDEX IF NOT EXISTS idx_crawl_events_url_time ON crawl_events (canonical_url, event_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_crawl_events_time ON crawl_events (event_at DESC);
@@ -256,7 +446,11 @@ class CrawlStateStore:
             self._ensure_column(conn, "crawl_urls", "cache_hit_count", "INTEGER DEFAULT 0")
             self._ensure_column(conn, "crawl_urls", "failure_count", "INTEGER DEFAULT 0")
             self._ensure_column(conn, "crawl_urls", "last_event_at", "TEXT")
+            self._ensure_column(conn, "crawl_urls", "etag", "TEXT")
+            self._ensure_column(conn, "crawl_urls", "last_modified", "TEXT")
+            self._ensure_column(conn, "crawl_urls", "content_hash", "TEXT")
             self._ensure_table(conn, "crawl_events")
+            self._ensure_column(conn, "crawl_events", "sample_weight", "INTEGER DEFAULT 1")
 
     def _ensure_column(self, conn: sqlite3.Connection, table: str, column: str, spec: str) -> None:
         try:
@@ -285,7 +479,8 @@ class CrawlStateStore:
                     status TEXT,
                     reason TEXT,
                     detail TEXT,
-                    duration_ms INTEGER
+                    duration_ms INTEGER,
+                    sample_weight INTEGER DEFAULT 1
                 )
                 """
             )
@@ -301,6 +496,108 @@ class CrawlStateStore:
     def _canonicalize(self, url: str) -> str:
         return self._path_builder.canonicalize_url(url)
 
+    def _sample_weight(self, event_type: str) -> int:
+        """Return the weight of the next ``event_type`` row, or 0 when sampling drops it."""
+        rate = self._event_sample_rates.get(event_type, 1.0)
+        if rate >= 1.0:
+            return 1
+        if rate <= 0.0:
+            return 0
+        keep_every = max(1, round(1 / rate))
+        with self._events_lock:
+            seen = self._unsampled_events.get(event_type, 0) + 1
+            if seen < keep_every:
+                self._unsampled_events[event_type] = seen
+                return 0
+            self._unsampled_events[event_type] = 0
+        return seen
+
+    def _new_event(
+        self,
+        *,
+        url: str | None,
+        canonical: str | None,
+        event_type: str,
+        status: str | None,
+        reason: str | None,
+        detail: dict[str, Any] | None,
+        duration_ms: int | None,
+    ) -> _PendingEvent:
+        return _PendingEvent(
+            event_at=datetime.now(timezone.utc).isoformat(),
+            canonical=canonical,
+            url=url,
+            event_type=event_type,
+            status=status,
+            reason=reason,
+            detail=json.dumps(detail, sort_keys=True) if detail else None,
+            duration_ms=duration_ms,
+            sample_weight=self._sample_weight(event_type),
+        )
+
+    @staticmethod
+    def _write_events(conn: sqlite3.Connection, events: list[_PendingEvent]) -> None:
+        """Insert ``events`` and fold their per-URL counters into one update per URL."""
+        # Events are append-only by design; retries and concurrent processing should be observable.
+        conn.executemany(
+            """
+            INSERT INTO crawl_events (
+                event_at, canonical_url, url, event_type, status, reason, detail, duration_ms, sample_weight
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    event.event_at,
+                    event.canonical,
+                    event.url,
+                    event.event_type,
+                    event.status,
+                    event.reason,
+                    event.detail,
+                    event.duration_ms,
+                    event.sample_weight,
+                )
+                for event in events
+                if event.sample_weight
+            ],
+        )
+        # canonical -> [url, first event_at, last event_at, fetches, cache hits, failures]
+        counters: dict[str, list[Any]] = {}
+        for event in events:
+            if not event.canonical:
+                continue
+            entry = counters.setdefault(event.canonical, [event.url or event.canonical, event.event_at, "", 0, 0, 0])
+            entry[2] = max(entry[2], event.event_at)
+            if event.event_type == "cache_hit":
+                entry[4] += 1
+            elif event.event_type in {"fetch_success", "fetch_failure"}:
+                entry[3] += 1
+            if event.status == "failed":
+                entry[5] += 1
+        if not counters:
+            return
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO crawl_urls (canonical_url, url, first_seen_at, next_due_at, last_status, retry_count)
+            VALUES (?, ?, ?, ?, 'pending', 0)
+            """,
+            [(canonical, url, first_at, first_at) for canonical, (url, first_at, *_rest) in counters.items()],
+        )
+        conn.executemany(
+            """
+            UPDATE crawl_urls SET
+                last_event_at = MAX(COALESCE(last_event_at, ''), ?),
+                fetch_count = COALESCE(fetch_count, 0) + ?,
+                cache_hit_count = COALESCE(cache_hit_count, 0) + ?,
+                failure_count = COALESCE(failure_count, 0) + ?
+            WHERE canonical_url = ?
+            """,
+            [
+                (last_at, fetches, cache_hits, failures, canonical)
+                for canonical, (_url, _first_at, last_at, fetches, cache_hits, failures) in counters.items()
+            ],
+        )
+
     def _record_event_sync(
         self,
         conn: sqlite3.Connection,
@@ -313,43 +610,17 @@ class CrawlStateStore:
         detail: dict[str, Any] | None,
         duration_ms: int | None = None,
     ) -> None:
-        now = datetime.now(timezone.utc).isoformat()
-        payload = json.dumps(detail, sort_keys=True) if detail else None
-        # Events are append-only by design; retries and concurrent processing should be observable.
-        conn.execute(
-            """
-            INSERT INTO crawl_events (event_at, canonical_url, url, event_type, status, reason, detail, duration_ms)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (now, canonical, url, event_type, status, reason, payload, duration_ms),
+        """Write one event inside the caller's write job, bypassing the buffer."""
+        event = self._new_event(
+            url=url,
+            canonical=canonical,
+            event_type=event_type,
+            status=status,
+            reason=reason,
+            detail=detail,
+            duration_ms=duration_ms,
         )
-        if canonical:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO crawl_urls (canonical_url, url, first_seen_at, next_due_at, last_status, retry_count)
-                VALUES (?, ?, ?, ?, 'pending', 0)
-                """,
-                (canonical, url or canonical, now, now),
-            )
-            conn.execute(
-                "UPDATE crawl_urls SET last_event_at = ? WHERE canonical_url = ?",
-                (now, canonical),
-            )
-            if event_type == "cache_hit":
-                conn.execute(
-                    "UPDATE crawl_urls SET cache_hit_count = cache_hit_count + 1 WHERE canonical_url = ?",
-                    (canonical,),
-                )
-            elif event_type in {"fetch_success", "fetch_failure"}:
-                conn.execute(
-                    "UPDATE crawl_urls SET fetch_count = fetch_count + 1 WHERE canonical_url = ?",
-                    (canonical,),
-                )
-            if status == "failed":
-                conn.execute(
-                    "UPDATE crawl_urls SET failure_count = failure_count + 1 WHERE canonical_url = ?",
-                    (canonical,),
-                )
+        self._write_events(conn, [event])
 
     async def record_event(
         self,
@@ -361,22 +632,58 @@ class CrawlStateStore:
         detail: dict[str, Any] | None = None,
         duration_ms: int | None = None,
     ) -> None:
-        canonical = self._canonicalize(url) if url else None
-        with self._connect() as conn:
-            self._record_event_sync(
-                conn,
-                url=url,
-                canonical=canonical,
-                event_type=event_type,
-                status=status,
-                reason=reason,
-                detail=detail,
-                duration_ms=duration_ms,
-            )
+        """Buffer a crawl event for the next group commit.
+
+        Waits for the flush only when this event fills the buffer, which
+        keeps a fast producer from outrunning the writer thread.
+        """
+        event = self._new_event(
+            url=url,
+            canonical=self._canonicalize(url) if url else None,
+            event_type=event_type,
+            status=status,
+            reason=reason,
+            detail=detail,
+            duration_ms=duration_ms,
+        )
+        with self._events_lock:
+            self._pending_events.append(event)
+            pending = len(self._pending_events)
+        if pending >= self._event_flush_size or self._event_flush_interval <= 0:
+            await self.flush_events()
+        elif self._event_timer is None:
+            self._event_timer = asyncio.get_running_loop().call_later(self._event_flush_interval, self._flush_on_timer)
+
+    def _submit_events(self) -> Future[None] | None:
+        """Hand the buffered events to the writer thread as one job.
+
+        Write jobs run in submission order, so a job submitted after this
+        sees the events.
+        """
+        with self._events_lock:
+            events, self._pending_events = self._pending_events, []
+            if events:
+                self._event_flush = self._writer_thread().submit(lambda conn: self._write_events(conn, events))
+            elif self._event_flush is None or self._event_flush.done():
+                return None
+            return self._event_flush
+
+    def _flush_on_timer(self) -> None:
+        self._event_timer = None
+        flush = self._submit_events()
+        if flush is not None:
+            flush.add_done_callback(_log_event_flush_failure)
+
+    async def flush_events(self) -> None:
+        """Write the buffered events and wait until the last flush has committed."""
+        flush = self._submit_events()
+        if flush is not None:
+            await asyncio.wrap_future(flush)
 
     async def save_last_sync_time(self, sync_time: datetime, *, source_revision: str | None = None) -> None:
         payload = sync_time.astimezone(timezone.utc).isoformat()
-        with self._connect() as conn:
+
+        def _save(conn: sqlite3.Connection) -> None:
             conn.execute(
                 "INSERT INTO crawl_meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
                 (self.LAST_SYNC_KEY, payload),
@@ -388,35 +695,33 @@ class CrawlStateStore:
                     (self.SOURCE_REVISION_KEY, source_revision),
                 )
 
-    async def get_last_sync_time(self) -> datetime | None:
-        with self._connect(read_only=True) as conn:
-            row = conn.execute("SELECT value FROM crawl_meta WHERE key = ?", (self.LAST_SYNC_KEY,)).fetchone()
+        await self._write(_save)
+
+    async def _get_meta_value(self, key: str) -> str | None:
+        row = await self._read(
+            lambda conn: conn.execute("SELECT value FROM crawl_meta WHERE key = ?", (key,)).fetchone()
+        )
         if not row or not row["value"]:
             return None
+        return str(row["value"])
+
+    async def get_last_sync_time(self) -> datetime | None:
+        value = await self._get_meta_value(self.LAST_SYNC_KEY)
+        if value is None:
+            return None
         try:
-            return datetime.fromisoformat(row["value"])
+            return datetime.fromisoformat(value)
         except ValueError:
             return None
 
     async def get_source_revision(self) -> str | None:
-        with self._connect(read_only=True) as conn:
-            row = conn.execute("SELECT value FROM crawl_meta WHERE key = ?", (self.SOURCE_REVISION_KEY,)).fetchone()
-        if not row or not row["value"]:
-            return None
-        return str(row["value"])
+        return await self._get_meta_value(self.SOURCE_REVISION_KEY)
 
-    async def save_sitemap_snapshot(self, snapshot: dict, snapshot_id: str) -> None:
-        payload = json.dumps(snapshot, sort_keys=True)
-        with self._connect() as conn:
-            conn.execute(
-                "INSERT INTO crawl_sitemaps (snapshot_id, payload) VALUES (?, ?)"
-                " ON CONFLICT(snapshot_id) DO UPDATE SET payload=excluded.payload",
-                (snapshot_id, payload),
-            )
+    async def _execute(self, sql: str, params: tuple[Any, ...]) -> None:
+        await self._write(lambda conn: conn.execute(sql, params))
 
-    async def get_sitemap_snapshot(self, snapshot_id: str) -> dict | None:
-        with self._connect(read_only=True) as conn:
-            row = conn.execute("SELECT payload FROM crawl_sitemaps WHERE snapshot_id = ?", (snapshot_id,)).fetchone()
+    async def _load_payload(self, sql: str, key: str) -> Any | None:
+        row = await self._read(lambda conn: conn.execute(sql, (key,)).fetchone())
         if not row:
             return None
         try:
@@ -424,65 +729,75 @@ class CrawlStateStore:
         except json.JSONDecodeError:
             return None
 
+    async def save_sitemap_snapshot(self, snapshot: dict, snapshot_id: str) -> None:
+        payload = json.dumps(snapshot, sort_keys=True)
+        await self._execute(
+            "INSERT INTO crawl_sitemaps (snapshot_id, payload) VALUES (?, ?)"
+            " ON CONFLICT(snapshot_id) DO UPDATE SET payload=excluded.payload",
+            (snapshot_id, payload),
+        )
+
+    async def get_sitemap_snapshot(self, snapshot_id: str) -> dict | None:
+        return await self._load_payload("SELECT payload FROM crawl_sitemaps WHERE snapshot_id = ?", snapshot_id)
+
     async def save_debug_snapshot(self, name: str, payload: dict[str, Any]) -> None:
         serialized = json.dumps(payload, sort_keys=True)
         now = datetime.now(timezone.utc).isoformat()
-        with self._connect() as conn:
-            conn.execute(
-                "INSERT INTO crawl_debug (name, payload, updated_at) VALUES (?, ?, ?)"
-                " ON CONFLICT(name) DO UPDATE SET payload=excluded.payload, updated_at=excluded.updated_at",
-                (name, serialized, now),
-            )
+        await self._execute(
+            "INSERT INTO crawl_debug (name, payload, updated_at) VALUES (?, ?, ?)"
+            " ON CONFLICT(name) DO UPDATE SET payload=excluded.payload, updated_at=excluded.updated_at",
+            (name, serialized, now),
+        )
 
     async def save_summary(self, payload: dict[str, Any]) -> None:
         serialized = json.dumps(payload, sort_keys=True)
         now = datetime.now(timezone.utc).isoformat()
-        with self._connect() as conn:
-            conn.execute(
-                "INSERT INTO crawl_summary (key, payload, updated_at) VALUES (?, ?, ?)"
-                " ON CONFLICT(key) DO UPDATE SET payload=excluded.payload, updated_at=excluded.updated_at",
-                (self.SUMMARY_KEY, serialized, now),
-            )
+        await self._execute(
+            "INSERT INTO crawl_summary (key, payload, updated_at) VALUES (?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET payload=excluded.payload, updated_at=excluded.updated_at",
+            (self.SUMMARY_KEY, serialized, now),
+        )
 
     async def load_summary(self) -> dict[str, Any] | None:
-        with self._connect(read_only=True) as conn:
-            row = conn.execute("SELECT payload FROM crawl_summary WHERE key = ?", (self.SUMMARY_KEY,)).fetchone()
-        if not row:
-            return None
-        try:
-            return json.loads(row["payload"])
-        except json.JSONDecodeError:
-            return None
+        return await self._load_payload("SELECT payload FROM crawl_summary WHERE key = ?", self.SUMMARY_KEY)
 
     async def get_status_snapshot(self) -> dict[str, Any]:
         """Return aggregate crawl status metrics from SQLite."""
         now = datetime.now(timezone.utc)
         now_iso = now.isoformat()
-        with self._connect(read_only=True) as conn:
-            total = conn.execute("SELECT COUNT(DISTINCT canonical_url) FROM crawl_urls").fetchone()[0]
-            success = conn.execute(
-                "SELECT COUNT(DISTINCT canonical_url) FROM crawl_urls WHERE last_status = 'success'"
-            ).fetchone()[0]
-            failed = conn.execute(
-                "SELECT COUNT(DISTINCT canonical_url) FROM crawl_urls WHERE last_status = 'failed'"
-            ).fetchone()[0]
-            pending = conn.execute(
-                "SELECT COUNT(DISTINCT canonical_url) FROM crawl_urls WHERE last_status IN ('pending', 'processing')"
-            ).fetchone()[0]
-            due = conn.execute(
-                "SELECT COUNT(*) FROM crawl_urls WHERE next_due_at IS NOT NULL AND next_due_at <= ?",
-                (now_iso,),
-            ).fetchone()[0]
-            queue_depth = conn.execute("SELECT COUNT(*) FROM crawl_queue").fetchone()[0]
-            first_seen_at = conn.execute("SELECT MIN(first_seen_at) FROM crawl_urls").fetchone()[0]
-            last_success_at = conn.execute(
-                "SELECT MAX(last_fetched_at) FROM crawl_urls WHERE last_status = 'success'"
-            ).fetchone()[0]
-            last_event_at = conn.execute("SELECT MAX(event_at) FROM crawl_events").fetchone()[0]
-            summary_row = conn.execute(
-                "SELECT payload FROM crawl_summary WHERE key = ?",
-                (self.SUMMARY_KEY,),
-            ).fetchone()
+        await self.flush_events()
+
+        def _snapshot(conn: sqlite3.Connection) -> dict[str, Any]:
+            return {
+                "total": conn.execute("SELECT COUNT(DISTINCT canonical_url) FROM crawl_urls").fetchone()[0],
+                "success": conn.execute(
+                    "SELECT COUNT(DISTINCT canonical_url) FROM crawl_urls WHERE last_status = 'success'"
+                ).fetchone()[0],
+                "failed": conn.execute(
+                    "SELECT COUNT(DISTINCT canonical_url) FROM crawl_urls WHERE last_status = 'failed'"
+                ).fetchone()[0],
+                "pending": conn.execute(
+                    "SELECT COUNT(DISTINCT canonical_url) FROM crawl_urls "
+                    "WHERE last_status IN ('pending', 'processing')"
+                ).fetchone()[0],
+                "due": conn.execute(
+                    "SELECT COUNT(*) FROM crawl_urls WHERE next_due_at IS NOT NULL AND next_due_at <= ?",
+                    (now_iso,),
+                ).fetchone()[0],
+                "queue_depth": conn.execute("SELECT COUNT(*) FROM crawl_queue").fetchone()[0],
+                "first_seen_at": conn.execute("SELECT MIN(first_seen_at) FROM crawl_urls").fetchone()[0],
+                "last_success_at": conn.execute(
+                    "SELECT MAX(last_fetched_at) FROM crawl_urls WHERE last_status = 'success'"
+                ).fetchone()[0],
+                "last_event_at": conn.execute("SELECT MAX(event_at) FROM crawl_events").fetchone()[0],
+                "summary_row": conn.execute(
+                    "SELECT payload FROM crawl_summary WHERE key = ?",
+                    (self.SUMMARY_KEY,),
+                ).fetchone(),
+            }
+
+        counts = await self._read(_snapshot)
+        summary_row = counts["summary_row"]
 
         storage_doc_count = 0
         summary_payload: dict[str, Any] | None = None
@@ -496,17 +811,17 @@ class CrawlStateStore:
 
         return {
             "captured_at": now_iso,
-            "metadata_total_urls": total,
-            "metadata_unique_urls": total,
-            "metadata_due_urls": due,
-            "metadata_successful": success,
-            "metadata_pending": pending,
-            "metadata_first_seen_at": first_seen_at,
-            "metadata_last_success_at": last_success_at,
-            "failed_url_count": failed,
-            "queue_depth": queue_depth,
+            "metadata_total_urls": counts["total"],
+            "metadata_unique_urls": counts["total"],
+            "metadata_due_urls": counts["due"],
+            "metadata_successful": counts["success"],
+            "metadata_pending": counts["pending"],
+            "metadata_first_seen_at": counts["first_seen_at"],
+            "metadata_last_success_at": counts["last_success_at"],
+            "failed_url_count": counts["failed"],
+            "queue_depth": counts["queue_depth"],
             "storage_doc_count": storage_doc_count,
-            "last_event_at": last_event_at,
+            "last_event_at": counts["last_event_at"],
         }
 
     async def upsert_url_metadata(self, payload: dict[str, Any]) -> None:
@@ -515,55 +830,58 @@ class CrawlStateStore:
             logger.debug("Skipping crawl metadata save with missing URL: %s", payload)
             return
         canonical = self._canonicalize(url)
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO crawl_urls (
-                    canonical_url, url, discovered_from, first_seen_at, last_fetched_at,
-                    next_due_at, last_status, retry_count, last_failure_reason,
-                    last_failure_at, markdown_rel_path
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(canonical_url) DO UPDATE SET
-                    url=excluded.url,
-                    discovered_from=COALESCE(excluded.discovered_from, crawl_urls.discovered_from),
-                    first_seen_at=COALESCE(crawl_urls.first_seen_at, excluded.first_seen_at),
-                    last_fetched_at=excluded.last_fetched_at,
-                    next_due_at=excluded.next_due_at,
-                    last_status=excluded.last_status,
-                    retry_count=excluded.retry_count,
-                    last_failure_reason=excluded.last_failure_reason,
-                    last_failure_at=excluded.last_failure_at,
-                    markdown_rel_path=excluded.markdown_rel_path
-                """,
-                (
-                    canonical,
-                    url,
-                    payload.get("discovered_from"),
-                    payload.get("first_seen_at"),
-                    payload.get("last_fetched_at"),
-                    payload.get("next_due_at"),
-                    payload.get("last_status"),
-                    payload.get("retry_count", 0),
-                    payload.get("last_failure_reason"),
-                    payload.get("last_failure_at"),
-                    payload.get("markdown_rel_path"),
-                ),
-            )
+        params = (
+            canonical,
+            url,
+            payload.get("discovered_from"),
+            payload.get("first_seen_at"),
+            payload.get("last_fetched_at"),
+            payload.get("next_due_at"),
+            payload.get("last_status"),
+            payload.get("retry_count", 0),
+            payload.get("last_failure_reason"),
+            payload.get("last_failure_at"),
+            payload.get("markdown_rel_path"),
+            payload.get("etag"),
+            payload.get("last_modified"),
+            payload.get("content_hash"),
+        )
+        await self._execute(
+            """
+            INSERT INTO crawl_urls (
+                canonical_url, url, discovered_from, first_seen_at, last_fetched_at,
+                next_due_at, last_status, retry_count, last_failure_reason,
+                last_failure_at, markdown_rel_path, etag, last_modified, content_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(canonical_url) DO UPDATE SET
+                url=excluded.url,
+                discovered_from=COALESCE(excluded.discovered_from, crawl_urls.discovered_from),
+                first_seen_at=COALESCE(crawl_urls.first_seen_at, excluded.first_seen_at),
+                last_fetched_at=excluded.last_fetched_at,
+                next_due_at=excluded.next_due_at,
+                last_status=excluded.last_status,
+                retry_count=excluded.retry_count,
+                last_failure_reason=excluded.last_failure_reason,
+                last_failure_at=excluded.last_failure_at,
+                markdown_rel_path=excluded.markdown_rel_path,
+                etag=COALESCE(excluded.etag, crawl_urls.etag),
+                last_modified=COALESCE(excluded.last_modified, crawl_urls.last_modified),
+                content_hash=COALESCE(excluded.content_hash, crawl_urls.content_hash)
+            """,
+            params,
+        )
 
     async def load_url_metadata(self, url: str) -> dict | None:
         canonical = self._canonicalize(url)
-        with self._connect(read_only=True) as conn:
-            row = conn.execute(
-                "SELECT * FROM crawl_urls WHERE canonical_url = ?",
-                (canonical,),
-            ).fetchone()
+        row = await self._read(
+            lambda conn: conn.execute("SELECT * FROM crawl_urls WHERE canonical_url = ?", (canonical,)).fetchone()
+        )
         if not row:
             return None
         return dict(row)
 
     async def list_all_metadata(self) -> list[dict]:
-        with self._connect(read_only=True) as conn:
-            rows = conn.execute("SELECT * FROM crawl_urls").fetchall()
+        rows = await self._read(lambda conn: conn.execute("SELECT * FROM crawl_urls").fetchall())
         return [dict(row) for row in rows]
 
     async def enqueue_urls(
@@ -576,76 +894,76 @@ class CrawlStateStore:
     ) -> int:
         if not urls:
             return 0
-        now_dt = datetime.now(timezone.utc)
-        now = now_dt.isoformat()
-        inserted = 0
+        now = datetime.now(timezone.utc).isoformat()
         url_list = list(urls)
-        chunk_size = 200
-        conn = self._connect()
-        try:
-            for start in range(0, len(url_list), chunk_size):
-                chunk = url_list[start : start + chunk_size]
-                conn.execute("BEGIN")
-                for url in chunk:
-                    canonical = self._canonicalize(url)
-                    conn.execute(
-                        """
-                        INSERT OR IGNORE INTO crawl_urls (
-                            canonical_url, url, first_seen_at, next_due_at, last_status, retry_count
-                        ) VALUES (?, ?, ?, ?, 'pending', 0)
-                        """,
-                        (canonical, url, now, now),
+        if force:
+            queue_insert = """
+                INSERT INTO crawl_queue (canonical_url, url, enqueued_at, priority, reason)
+                SELECT canonical_url, url, ?, ?, ? FROM temp.crawl_enqueue WHERE true
+                ON CONFLICT(canonical_url) DO UPDATE SET
+                    url=excluded.url,
+                    enqueued_at=excluded.enqueued_at,
+                    priority=MAX(crawl_queue.priority, excluded.priority),
+                    reason=excluded.reason
+            """
+        else:
+            queue_insert = """
+                INSERT OR IGNORE INTO crawl_queue (canonical_url, url, enqueued_at, priority, reason)
+                SELECT canonical_url, url, ?, ?, ? FROM temp.crawl_enqueue
+            """
+
+        def _enqueue_chunk(conn: sqlite3.Connection, chunk: list[str]) -> int:
+            # The candidates go into a temp table so due-ness and queue inserts are a few set-based statements.
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS crawl_enqueue (canonical_url TEXT PRIMARY KEY, url TEXT NOT NULL)"
+            )
+            conn.execute("DELETE FROM temp.crawl_enqueue")
+            conn.executemany(
+                "INSERT OR IGNORE INTO temp.crawl_enqueue (canonical_url, url) VALUES (?, ?)",
+                [(self._canonicalize(url), url) for url in chunk],
+            )
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO crawl_urls (canonical_url, url, first_seen_at, next_due_at, last_status, retry_count)
+                SELECT canonical_url, url, ?, ?, 'pending', 0 FROM temp.crawl_enqueue
+                """,
+                (now, now),
+            )
+            if not force:
+                # URLs fetched successfully and not yet due stay out of the queue.
+                conn.execute(
+                    """
+                    DELETE FROM temp.crawl_enqueue WHERE canonical_url IN (
+                        SELECT canonical_url FROM crawl_urls
+                        WHERE last_status = 'success' AND julianday(next_due_at) > julianday(?)
                     )
-                    if not force:
-                        row = conn.execute(
-                            "SELECT last_status, next_due_at FROM crawl_urls WHERE canonical_url = ?",
-                            (canonical,),
-                        ).fetchone()
-                        if row and row["last_status"] == "success" and row["next_due_at"]:
-                            try:
-                                next_due_at = datetime.fromisoformat(row["next_due_at"])
-                            except ValueError:
-                                next_due_at = None
-                            if next_due_at and next_due_at > now_dt:
-                                continue
-                    if force:
-                        conn.execute(
-                            """
-                            INSERT INTO crawl_queue (canonical_url, url, enqueued_at, priority, reason)
-                            VALUES (?, ?, ?, ?, ?)
-                            ON CONFLICT(canonical_url) DO UPDATE SET
-                                url=excluded.url,
-                                enqueued_at=excluded.enqueued_at,
-                                priority=MAX(crawl_queue.priority, excluded.priority),
-                                reason=excluded.reason
-                            """,
-                            (canonical, url, now, priority, reason),
-                        )
-                        inserted += conn.execute("SELECT changes()").fetchone()[0]
-                    else:
-                        conn.execute(
-                            """
-                            INSERT OR IGNORE INTO crawl_queue (canonical_url, url, enqueued_at, priority, reason)
-                            VALUES (?, ?, ?, ?, ?)
-                            """,
-                            (canonical, url, now, priority, reason),
-                        )
-                        inserted += conn.execute("SELECT changes()").fetchone()[0]
-                    self._record_event_sync(
-                        conn,
-                        url=url,
-                        canonical=canonical,
+                    """,
+                    (now,),
+                )
+            inserted = conn.execute(queue_insert, (now, priority, reason)).rowcount
+            candidates = conn.execute("SELECT canonical_url, url FROM temp.crawl_enqueue").fetchall()
+            self._write_events(
+                conn,
+                [
+                    self._new_event(
+                        url=row["url"],
+                        canonical=row["canonical_url"],
                         event_type="queue_enqueued",
                         status="ok",
                         reason=reason,
                         detail={"priority": priority, "force": force},
+                        duration_ms=None,
                     )
-                conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+                    for row in candidates
+                ],
+            )
+            return inserted
+
+        inserted = 0
+        # One transaction per chunk, so other writes interleave with a large enqueue.
+        for start in range(0, len(url_list), _ENQUEUE_CHUNK_SIZE):
+            chunk = url_list[start : start + _ENQUEUE_CHUNK_SIZE]
+            inserted += await self._write(lambda conn, chunk=chunk: _enqueue_chunk(conn, chunk))
         return inserted
 
     async def requeue_failed_urls(
@@ -657,16 +975,15 @@ class CrawlStateStore:
     ) -> int:
         if limit is not None and limit <= 0:
             return 0
-        with self._connect(read_only=True) as conn:
-            query = (
-                "SELECT url FROM crawl_urls WHERE last_status = 'failed' "
-                "ORDER BY (last_failure_at IS NULL), last_failure_at DESC"
-            )
-            params: tuple[int, ...] = ()
-            if limit is not None:
-                query += " LIMIT ?"
-                params = (limit,)
-            rows = conn.execute(query, params).fetchall()
+        query = (
+            "SELECT url FROM crawl_urls WHERE last_status = 'failed' "
+            "ORDER BY (last_failure_at IS NULL), last_failure_at DESC"
+        )
+        params: tuple[int, ...] = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
+        rows = await self._read(lambda conn: conn.execute(query, params).fetchall())
         urls = {row["url"] for row in rows if row["url"]}
         if not urls:
             return 0
@@ -675,49 +992,52 @@ class CrawlStateStore:
     async def dequeue_batch(self, limit: int) -> list[str]:
         if limit <= 0:
             return []
-        with self._connect() as conn:
+
+        def _dequeue(conn: sqlite3.Connection) -> list[str]:
+            # Dequeue is destructive; retry scheduling is handled via crawl_urls metadata on failure.
             rows = conn.execute(
                 """
-                SELECT canonical_url, url FROM crawl_queue
-                ORDER BY priority DESC, enqueued_at ASC
-                LIMIT ?
+                DELETE FROM crawl_queue WHERE canonical_url IN (
+                    SELECT canonical_url FROM crawl_queue
+                    ORDER BY priority DESC, enqueued_at ASC
+                    LIMIT ?
+                )
+                RETURNING canonical_url, url, priority, enqueued_at
                 """,
                 (limit,),
             ).fetchall()
             if not rows:
                 return []
-            canonical_urls = [row["canonical_url"] for row in rows]
-            try:
-                conn.execute("BEGIN IMMEDIATE")
-                # Dequeue is destructive; retry scheduling is handled via crawl_urls metadata on failure.
-                conn.executemany(
-                    "DELETE FROM crawl_queue WHERE canonical_url = ?",
-                    [(canonical,) for canonical in canonical_urls],
-                )
-                now = datetime.now(timezone.utc).isoformat()
-                conn.executemany(
-                    "UPDATE crawl_urls SET last_status = 'processing', next_due_at = ? WHERE canonical_url = ?",
-                    [(now, canonical) for canonical in canonical_urls],
-                )
-                for row in rows:
-                    self._record_event_sync(
-                        conn,
+            # RETURNING yields rows in no particular order.
+            rows.sort(key=lambda row: (-(row["priority"] or 0), row["enqueued_at"] or ""))
+            now = datetime.now(timezone.utc).isoformat()
+            conn.executemany(
+                "UPDATE crawl_urls SET last_status = 'processing', next_due_at = ? WHERE canonical_url = ?",
+                [(now, row["canonical_url"]) for row in rows],
+            )
+            self._write_events(
+                conn,
+                [
+                    self._new_event(
                         url=row["url"],
                         canonical=row["canonical_url"],
                         event_type="queue_dequeued",
                         status="ok",
                         reason=None,
                         detail=None,
+                        duration_ms=None,
                     )
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
-        return [row["url"] for row in rows]
+                    for row in rows
+                ],
+            )
+            return [row["url"] for row in rows]
+
+        return await self._write(_dequeue)
 
     async def remove_from_queue(self, url: str) -> None:
         canonical = self._canonicalize(url)
-        with self._connect() as conn:
+
+        def _remove(conn: sqlite3.Connection) -> None:
             conn.execute("DELETE FROM crawl_queue WHERE canonical_url = ?", (canonical,))
             self._record_event_sync(
                 conn,
@@ -729,9 +1049,12 @@ class CrawlStateStore:
                 detail=None,
             )
 
+        await self._write(_remove)
+
     async def delete_url_metadata(self, url: str, *, reason: str | None = None) -> None:
         canonical = self._canonicalize(url)
-        with self._connect() as conn:
+
+        def _delete(conn: sqlite3.Connection) -> None:
             conn.execute("DELETE FROM crawl_queue WHERE canonical_url = ?", (canonical,))
             conn.execute("DELETE FROM crawl_urls WHERE canonical_url = ?", (canonical,))
             self._record_event_sync(
@@ -744,6 +1067,10 @@ class CrawlStateStore:
                 detail=None,
             )
 
+        # Buffered events for this URL commit first, as if they had been written directly.
+        self._submit_events()
+        await self._write(_delete)
+
     async def delete_urls_by_prefix(self, prefix: str) -> int:
         """Delete all URLs matching a prefix pattern.
 
@@ -753,19 +1080,8 @@ class CrawlStateStore:
         Returns:
             Number of URLs deleted
         """
-
-        def _delete_sync() -> int:
-            pattern = prefix + "%"
-            with self._connect() as conn:
-                row = conn.execute("SELECT COUNT(*) FROM crawl_urls WHERE url LIKE ?", (pattern,)).fetchone()
-                count = row[0] if row else 0
-                if count > 0:
-                    conn.execute("DELETE FROM crawl_queue WHERE url LIKE ?", (pattern,))
-                    conn.execute("DELETE FROM crawl_urls WHERE url LIKE ?", (pattern,))
-                    logger.info(f"Deleted {count} URLs matching prefix: {prefix}")
-                return count
-
-        return await asyncio.to_thread(_delete_sync)
+        results = await self.delete_urls_by_prefixes([prefix])
+        return results[prefix]
 
     async def delete_urls_by_prefixes(self, prefixes: list[str]) -> dict[str, int]:
         """Bulk delete URLs matching multiple prefixes in a single transaction.
@@ -780,36 +1096,35 @@ class CrawlStateStore:
             Dictionary mapping prefix to count of deleted URLs
         """
 
-        def _delete_bulk_sync() -> dict[str, int]:
+        def _delete_bulk(conn: sqlite3.Connection) -> dict[str, int]:
             results: dict[str, int] = {}
-            with self._connect() as conn:
-                for prefix in prefixes:
-                    pattern = prefix + "%"
-                    row = conn.execute("SELECT COUNT(*) FROM crawl_urls WHERE url LIKE ?", (pattern,)).fetchone()
-                    count = row[0] if row else 0
-                    if count > 0:
-                        conn.execute("DELETE FROM crawl_queue WHERE url LIKE ?", (pattern,))
-                        conn.execute("DELETE FROM crawl_urls WHERE url LIKE ?", (pattern,))
-                    results[prefix] = count
-            total = sum(results.values())
-            if total > 0:
-                logger.info(f"Bulk deleted {total} URLs across {len(prefixes)} prefixes")
+            for prefix in prefixes:
+                pattern = prefix + "%"
+                row = conn.execute("SELECT COUNT(*) FROM crawl_urls WHERE url LIKE ?", (pattern,)).fetchone()
+                count = row[0] if row else 0
+                if count > 0:
+                    conn.execute("DELETE FROM crawl_queue WHERE url LIKE ?", (pattern,))
+                    conn.execute("DELETE FROM crawl_urls WHERE url LIKE ?", (pattern,))
+                results[prefix] = count
             return results
 
-        return await asyncio.to_thread(_delete_bulk_sync)
+        self._submit_events()
+        results = await self._write(_delete_bulk)
+        total = sum(results.values())
+        if total > 0:
+            logger.info(f"Bulk deleted {total} URLs across {len(prefixes)} prefixes")
+        return results
 
     async def queue_depth(self) -> int:
-        with self._connect(read_only=True) as conn:
-            row = conn.execute("SELECT COUNT(*) AS count FROM crawl_queue").fetchone()
+        row = await self._read(lambda conn: conn.execute("SELECT COUNT(*) AS count FROM crawl_queue").fetchone())
         return int(row["count"]) if row else 0
 
-    async def was_recently_fetched(self, url: str, *, interval_hours: float) -> bool:
+    def _recently_fetched(self, conn: sqlite3.Connection, url: str, interval_hours: float) -> bool:
         canonical = self._canonicalize(url)
-        with self._connect(read_only=True) as conn:
-            row = conn.execute(
-                "SELECT last_fetched_at, last_status FROM crawl_urls WHERE canonical_url = ?",
-                (canonical,),
-            ).fetchone()
+        row = conn.execute(
+            "SELECT last_fetched_at, last_status FROM crawl_urls WHERE canonical_url = ?",
+            (canonical,),
+        ).fetchone()
         if not row:
             return False
         last_fetched = row["last_fetched_at"]
@@ -822,24 +1137,12 @@ class CrawlStateStore:
         age_hours = (datetime.now(timezone.utc) - fetched_at).total_seconds() / 3600
         return age_hours < interval_hours
 
+    async def was_recently_fetched(self, url: str, *, interval_hours: float) -> bool:
+        return await self._read(lambda conn: self._recently_fetched(conn, url, interval_hours))
+
     def was_recently_fetched_sync(self, url: str, *, interval_hours: float) -> bool:
-        canonical = self._canonicalize(url)
-        with self._connect(read_only=True) as conn:
-            row = conn.execute(
-                "SELECT last_fetched_at, last_status FROM crawl_urls WHERE canonical_url = ?",
-                (canonical,),
-            ).fetchone()
-        if not row:
-            return False
-        last_fetched = row["last_fetched_at"]
-        if not last_fetched or row["last_status"] != "success":
-            return False
-        try:
-            fetched_at = datetime.fromisoformat(last_fetched)
-        except ValueError:
-            return False
-        age_hours = (datetime.now(timezone.utc) - fetched_at).total_seconds() / 3600
-        return age_hours < interval_hours
+        """Blocking variant for synchronous crawler callbacks; uses this thread's persistent connection."""
+        return self._read_sync(lambda conn: self._recently_fetched(conn, url, interval_hours))
 
     async def try_acquire_lock(
         self, name: str, owner: str, ttl_seconds: int
@@ -847,21 +1150,23 @@ class CrawlStateStore:
         now = datetime.now(timezone.utc)
         expires_at = now + timedelta(seconds=ttl_seconds)
         payload = (name, owner, now.isoformat(), expires_at.isoformat())
-        with self._connect() as conn:
+
+        def _acquire(conn: sqlite3.Connection) -> tuple[bool, sqlite3.Row | None]:
             try:
                 conn.execute(
                     "INSERT INTO crawl_locks (name, owner, acquired_at, expires_at) VALUES (?, ?, ?, ?)",
                     payload,
                 )
-                return (
-                    LockLease(name=name, owner=owner, acquired_at=now, expires_at=expires_at),
-                    None,
-                )
             except sqlite3.IntegrityError:
-                row = conn.execute(
+                return False, conn.execute(
                     "SELECT name, owner, acquired_at, expires_at FROM crawl_locks WHERE name = ?",
                     (name,),
                 ).fetchone()
+            return True, None
+
+        acquired, row = await self._write(_acquire)
+        if acquired:
+            return LockLease(name=name, owner=owner, acquired_at=now, expires_at=expires_at), None
         if not row:
             return None, None
         existing = LockLease(
@@ -873,66 +1178,58 @@ class CrawlStateStore:
         return None, existing
 
     async def release_lock(self, lease: LockLease) -> None:
-        with self._connect() as conn:
-            conn.execute("DELETE FROM crawl_locks WHERE name = ? AND owner = ?", (lease.name, lease.owner))
+        await self._write(
+            lambda conn: conn.execute("DELETE FROM crawl_locks WHERE name = ? AND owner = ?", (lease.name, lease.owner))
+        )
 
     async def clear_queue(self, *, reason: str | None = None) -> int:
-        with self._connect() as conn:
-            try:
-                conn.execute("BEGIN IMMEDIATE")
-                row = conn.execute("SELECT COUNT(*) AS count FROM crawl_queue").fetchone()
-                count = int(row["count"]) if row else 0
-                conn.execute("DELETE FROM crawl_queue")
-                if reason:
-                    self._record_event_sync(
-                        conn,
-                        url=None,
-                        canonical=None,
-                        event_type="queue_cleared",
-                        status="ok",
-                        reason=reason,
-                        detail={"count": count},
-                    )
-                conn.commit()
-                return count
-            except Exception:
-                conn.rollback()
-                raise
+        def _clear(conn: sqlite3.Connection) -> int:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT COUNT(*) AS count FROM crawl_queue").fetchone()
+            count = int(row["count"]) if row else 0
+            conn.execute("DELETE FROM crawl_queue")
+            if reason:
+                self._record_event_sync(
+                    conn,
+                    url=None,
+                    canonical=None,
+                    event_type="queue_cleared",
+                    status="ok",
+                    reason=reason,
+                    detail={"count": count},
+                )
+            return count
+
+        return await self._write(_clear)
 
     async def break_lock(self, name: str) -> None:
-        with self._connect() as conn:
-            conn.execute("DELETE FROM crawl_locks WHERE name = ?", (name,))
+        await self._write(lambda conn: conn.execute("DELETE FROM crawl_locks WHERE name = ?", (name,)))
 
     async def save_progress(self, key: str, payload: dict[str, Any]) -> None:
         serialized = json.dumps(payload, sort_keys=True)
         now = datetime.now(timezone.utc).isoformat()
-        with self._connect() as conn:
-            conn.execute(
-                "INSERT INTO crawl_progress (key, payload, updated_at) VALUES (?, ?, ?)"
-                " ON CONFLICT(key) DO UPDATE SET payload=excluded.payload, updated_at=excluded.updated_at",
-                (key, serialized, now),
-            )
+        await self._execute(
+            "INSERT INTO crawl_progress (key, payload, updated_at) VALUES (?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET payload=excluded.payload, updated_at=excluded.updated_at",
+            (key, serialized, now),
+        )
 
     async def load_progress(self, key: str) -> dict[str, Any] | None:
-        with self._connect(read_only=True) as conn:
-            row = conn.execute("SELECT payload FROM crawl_progress WHERE key = ?", (key,)).fetchone()
-        if not row:
-            return None
-        try:
-            return json.loads(row["payload"])
-        except json.JSONDecodeError:
-            return None
+        return await self._load_payload("SELECT payload FROM crawl_progress WHERE key = ?", key)
 
     async def delete_progress(self, key: str) -> None:
-        with self._connect() as conn:
+        def _delete(conn: sqlite3.Connection) -> None:
             conn.execute("DELETE FROM crawl_progress WHERE key = ?", (key,))
             conn.execute("DELETE FROM crawl_checkpoint WHERE key = ?", (key,))
             conn.execute("DELETE FROM crawl_checkpoint_history WHERE key = ?", (key,))
 
+        await self._write(_delete)
+
     async def _save_checkpoint_payload(self, key: str, payload: dict[str, Any], *, keep_history: bool = False) -> None:
         serialized = json.dumps(payload, sort_keys=True)
         now = datetime.now(timezone.utc).isoformat()
-        with self._connect() as conn:
+
+        def _save(conn: sqlite3.Connection) -> None:
             conn.execute(
                 "INSERT INTO crawl_checkpoint (key, payload, updated_at) VALUES (?, ?, ?)"
                 " ON CONFLICT(key) DO UPDATE SET payload=excluded.payload, updated_at=excluded.updated_at",
@@ -944,6 +1241,8 @@ class CrawlStateStore:
                     (key, serialized, now),
                 )
 
+        await self._write(_save)
+
     async def maintenance(
         self,
         *,
@@ -956,36 +1255,36 @@ class CrawlStateStore:
         now = datetime.now(timezone.utc)
         cutoff = (now - timedelta(days=retention_days)).isoformat()
 
-        with self._connect() as conn:
+        def _prune(conn: sqlite3.Connection) -> int | None:
             conn.execute("PRAGMA busy_timeout = 2000")
             try:
                 conn.execute("BEGIN IMMEDIATE")
             except sqlite3.OperationalError as exc:
                 logger.debug("Skipping maintenance; crawl DB busy: %s", exc)
-                return
-            try:
-                deleted = conn.execute("DELETE FROM crawl_events WHERE event_at < ?", (cutoff,)).rowcount
-                row = conn.execute("SELECT COUNT(*) AS count FROM crawl_events").fetchone()
-                total = int(row["count"]) if row else 0
-                if total > max_rows:
-                    trim = total - max_rows
-                    conn.execute(
-                        """
-                        DELETE FROM crawl_events
-                        WHERE id IN (
-                            SELECT id FROM crawl_events
-                            ORDER BY event_at ASC
-                            LIMIT ?
-                        )
-                        """,
-                        (trim,),
+                return None
+            finally:
+                conn.execute("PRAGMA busy_timeout = 30000")
+            deleted = conn.execute("DELETE FROM crawl_events WHERE event_at < ?", (cutoff,)).rowcount
+            row = conn.execute("SELECT COUNT(*) AS count FROM crawl_events").fetchone()
+            total = int(row["count"]) if row else 0
+            if total > max_rows:
+                trim = total - max_rows
+                conn.execute(
+                    """
+                    DELETE FROM crawl_events
+                    WHERE id IN (
+                        SELECT id FROM crawl_events
+                        ORDER BY event_at ASC
+                        LIMIT ?
                     )
-                    deleted += trim
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
+                    """,
+                    (trim,),
+                )
+                deleted += trim
+            return deleted
 
+        def _checkpoint(conn: sqlite3.Connection, deleted: int) -> None:
+            # Runs after _prune committed: checkpoints and vacuum need no open transaction.
             try:
                 conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
                 if deleted > 0:
@@ -1004,6 +1303,11 @@ class CrawlStateStore:
             except sqlite3.OperationalError as exc:
                 logger.debug("Skipping checkpoint/vacuum due to lock: %s", exc)
 
+        deleted = await self._write(_prune)
+        if deleted is None:
+            return
+        await self._write(lambda conn: _checkpoint(conn, deleted))
+
     async def get_event_history(
         self,
         *,
@@ -1019,10 +1323,11 @@ class CrawlStateStore:
             cutoff = (now - timedelta(days=range_days)).isoformat()
         else:
             cutoff = (now - timedelta(minutes=minutes)).isoformat()
-        with self._connect(read_only=True) as conn:
-            rows = conn.execute(
+        await self.flush_events()
+        rows = await self._read(
+            lambda conn: conn.execute(
                 """
-                SELECT event_at, event_type, status
+                SELECT event_at, event_type, status, sample_weight
                 FROM crawl_events
                 WHERE event_at >= ?
                 ORDER BY event_at ASC
@@ -1030,11 +1335,13 @@ class CrawlStateStore:
                 """,
                 (cutoff, limit),
             ).fetchall()
+        )
 
         buckets: dict[str, dict[str, int]] = {}
         status_counts: dict[str, int] = {}
         type_counts: dict[str, int] = {}
         last_event_at: str | None = None
+        total_events = 0
 
         for row in rows:
             event_at = row["event_at"]
@@ -1047,6 +1354,9 @@ class CrawlStateStore:
             if parsed.tzinfo is None:
                 parsed = parsed.replace(tzinfo=timezone.utc)
             last_event_at = event_at
+            # A sampled row stands for sample_weight events of its type.
+            weight = row["sample_weight"] if row["sample_weight"] is not None else 1
+            total_events += weight
             bucket_epoch = int(parsed.timestamp() // bucket_seconds * bucket_seconds)
             bucket_dt = datetime.fromtimestamp(bucket_epoch, tz=timezone.utc)
             key = bucket_dt.isoformat()
@@ -1054,19 +1364,19 @@ class CrawlStateStore:
                 key,
                 {"t": bucket_dt.isoformat(), "total": 0, "success": 0, "failed": 0, "discovered": 0, "fetched": 0},
             )
-            bucket["total"] += 1
+            bucket["total"] += weight
             status = row["status"]
-            status_counts[status] = status_counts.get(status, 0) + 1
+            status_counts[status] = status_counts.get(status, 0) + weight
             if status == "failed":
-                bucket["failed"] += 1
+                bucket["failed"] += weight
             else:
-                bucket["success"] += 1
+                bucket["success"] += weight
             event_type = row["event_type"]
-            type_counts[event_type] = type_counts.get(event_type, 0) + 1
+            type_counts[event_type] = type_counts.get(event_type, 0) + weight
             if event_type == "crawl_discovered":
-                bucket["discovered"] += 1
+                bucket["discovered"] += weight
             if event_type in {"fetch_success", "cache_hit"}:
-                bucket["fetched"] += 1
+                bucket["fetched"] += weight
 
         ordered = [buckets[key] for key in sorted(buckets.keys())]
         return {
@@ -1074,7 +1384,7 @@ class CrawlStateStore:
             "range_days": range_days,
             "bucket_seconds": bucket_seconds,
             "last_event_at": last_event_at,
-            "total_events": len(rows),
+            "total_events": total_events,
             "status_counts": status_counts,
             "type_counts": type_counts,
             "buckets": ordered,
@@ -1098,15 +1408,15 @@ class CrawlStateStore:
             params.append(status)
         where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         sql = f"""
-            SELECT event_at, event_type, status, url, reason, detail, duration_ms
+            SELECT event_at, event_type, status, url, reason, detail, duration_ms, sample_weight
             FROM crawl_events
             {where}
             ORDER BY event_at DESC
             LIMIT ?
         """
         params.append(limit)
-        with self._connect(read_only=True) as conn:
-            rows = conn.execute(sql, params).fetchall()
+        await self.flush_events()
+        rows = await self._read(lambda conn: conn.execute(sql, params).fetchall())
         events = [
             {
                 "event_at": row["event_at"],
@@ -1116,6 +1426,7 @@ class CrawlStateStore:
                 "reason": row["reason"],
                 "detail": row["detail"],
                 "duration_ms": row["duration_ms"],
+                "sample_weight": row["sample_weight"],
             }
             for row in rows
         ]
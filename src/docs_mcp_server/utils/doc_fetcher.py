@@ -8,10 +8,14 @@ article-extractor build inside a separate service.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 import logging
 import re
+import time
 from typing import Any
-from urllib.parse import urlsplit, urlunsplit
+from urllib.parse import SplitResult, urlsplit, urlunsplit
+from urllib.robotparser import RobotFileParser
 
 import aiohttp
 from article_extractor import ArticleResult, ExtractionOptions, NetworkOptions, extract_article
@@ -22,8 +26,9 @@ from opentelemetry.trace import SpanKind
 
 from ..config import Settings
 from ..observability.tracing import create_span
+from .host_politeness import get_host_politeness
 from .models import DocPage, ReadabilityContent
-from .proxy_pool import ProxyPool, proxy_label, should_rotate_proxy
+from .proxy_pool import ProxyPool, has_blocked_body, proxy_label, should_rotate_proxy
 
 
 logger = logging.getLogger(__name__)
@@ -43,6 +48,10 @@ class FetchBlockedError(RuntimeError):
     """Raised when every configured proxy is blocked for a fetch attempt."""
 
 
+class PageNotModifiedError(RuntimeError):
+    """Raised when a conditional fetch comes back 304, so the cached copy is still current."""
+
+
 class AsyncDocFetcher:
     """High-performance async documentation fetcher with Playwright + article-extractor."""
 
@@ -79,8 +88,8 @@ class AsyncDocFetcher:
         self.playwright_fetcher: PlaywrightFetcher | None = None  # type: ignore[valid-type]
         self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
 
-        # Rate limiting
-        self._last_request_time = 0.0
+        # Per-host pacing shared with every other fetcher in the process
+        self._politeness = get_host_politeness()
         self._request_delay = self.request_delay_ms / 1000.0
 
         # Extraction options for article-extractor
@@ -160,7 +169,7 @@ class AsyncDocFetcher:
 
         connector = aiohttp.TCPConnector(
             limit=self.max_concurrent_requests,
-            limit_per_host=5,
+            limit_per_host=self._politeness.max_concurrency,
             ttl_dns_cache=300,
             use_dns_cache=True,
         )
@@ -192,17 +201,33 @@ class AsyncDocFetcher:
             await self.session.close()
             self.session = None
 
-    async def fetch_page(self, url: str) -> DocPage | None:
+    async def fetch_page(
+        self,
+        url: str,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> DocPage | None:
         """Fetch and parse a documentation page.
 
         Strategy:
         1. Check for direct markdown mirrors first
         2. Fetch HTML with Playwright (handles Cloudflare/JS)
         3. Extract content with article-extractor (pure Python)
+
+        ``etag`` and ``last_modified`` are validators from the previous fetch.
+        The static HTML request sends them as If-None-Match/If-Modified-Since
+        and raises PageNotModifiedError when the server answers 304.
         """
         if not self.session:
             self._create_session()
 
+        conditional_headers: dict[str, str] = {}
+        if etag:
+            conditional_headers["If-None-Match"] = etag
+        if last_modified:
+            conditional_headers["If-Modified-Since"] = last_modified
+
         url_parts = urlsplit(url)
         with create_span(
             "fetch.page",
@@ -214,9 +239,7 @@ class AsyncDocFetcher:
                 "url.path": url_parts.path,
             },
         ) as span:
-            async with self.semaphore:
-                await self._apply_rate_limit()
-
+            async with self.semaphore, self._host_slot(url):
                 # Prefer Markdown mirrors when suffix configured (e.g., Twilio *.md endpoints)
                 try:
                     direct_markdown = await self._fetch_direct_markdown(url)
@@ -231,12 +254,15 @@ class AsyncDocFetcher:
                     return direct_markdown
 
                 try:
-                    result = await self._fetch_static_html_and_extract(url)
+                    result = await self._fetch_static_html_and_extract(url, headers=conditional_headers or None)
                 except FetchBlockedError as exc:
                     span.add_event("fetch.static_html.blocked", {})
                     detail = str(exc)
                     logger.error(detail)
                     raise DocFetchError("fetch_blocked", detail=detail) from exc
+                except PageNotModifiedError:
+                    span.add_event("fetch.static_html.not_modified", {})
+                    raise
                 if result:
                     span.add_event("fetch.static_html.success", {})
                     return result
@@ -270,30 +296,46 @@ class AsyncDocFetcher:
                 logger.error(detail)
                 raise DocFetchError(reason, detail=detail)
 
-    async def _fetch_static_html_and_extract(self, url: str) -> DocPage | None:
+    async def _fetch_static_html_and_extract(
+        self, url: str, *, headers: Mapping[str, str] | None = None
+    ) -> DocPage | None:
         if not self.session:
             return None
 
         try:
-            response = await self._fetch_text_with_proxy_pool(url)
-            if not response:
-                return None
-            status_code, html_content = response
-            if status_code != 200:
-                return None
-
-            extraction_result = extract_article(html_content, url, self._extraction_options)
-            if extraction_result.success:
-                page = self._convert_to_doc_page(url, extraction_result)
-                if page:
-                    return page
-            return self._convert_static_html_to_doc_page(url, html_content)
+            response = await self._fetch_text_with_proxy_pool(url, headers=headers)
         except FetchBlockedError:
             raise
+        except Exception as e:
+            logger.debug("Static HTML fetch failed for %s: %s", url, e)
+            return None
+        if not response:
+            return None
+        status_code, html_content, response_headers = response
+        if status_code == 304 and headers:
+            raise PageNotModifiedError(f"{url} not modified since the last fetch")
+        if status_code != 200:
+            return None
+
+        try:
+            extraction_result = extract_article(html_content, url, self._extraction_options)
+            page = self._convert_to_doc_page(url, extraction_result) if extraction_result.success else None
+            page = page or self._convert_static_html_to_doc_page(url, html_content)
+            if page:
+                self._attach_validators(page, response_headers)
+            return page
         except Exception as e:
             logger.debug("Static HTML extraction failed for %s: %s", url, e)
             return None
 
+    @staticmethod
+    def _attach_validators(page: DocPage, headers: Mapping[str, str]) -> None:
+        """Keep the response's cache validators so the next refresh can revalidate instead of refetching."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        page.etag = etag if isinstance(etag, str) and etag else None
+        page.last_modified = last_modified if isinstance(last_modified, str) and last_modified else None
+
     def _convert_static_html_to_doc_page(self, url: str, html_content: str) -> DocPage | None:
         document = html.fromstring(html_content)
         for node in document.xpath("//script|//style|//noscript|//svg"):
@@ -351,6 +393,10 @@ class AsyncDocFetcher:
 
             try:
                 html_content, status_code = await self.playwright_fetcher.fetch(url)
+                # Render time says little about the host, so only the status feeds its pacing.
+                self._politeness.record(
+                    urlsplit(url).netloc, status=status_code, blocked=has_blocked_body(html_content)
+                )
                 if should_rotate_proxy(status_code, html_content):
                     logger.warning(
                         "Playwright fetch blocked with proxy=%s for %s (status=%s)",
@@ -384,23 +430,38 @@ class AsyncDocFetcher:
             raise FetchBlockedError(f"All configured proxies were blocked for {url}")
         return None
 
-    async def _fetch_text_with_proxy_pool(self, url: str) -> tuple[int, str] | None:
+    async def _fetch_text_with_proxy_pool(
+        self, url: str, *, headers: Mapping[str, str] | None = None
+    ) -> tuple[int, str, Mapping[str, str]] | None:
         if not self.session:
             return None
 
+        host = urlsplit(url).netloc
         last_error: Exception | None = None
         blocked_response_seen = False
         for proxy in self._proxy_candidates():
+            started = time.perf_counter()
             try:
-                kwargs = {"proxy": proxy} if proxy else {}
+                kwargs: dict[str, Any] = {"proxy": proxy} if proxy else {}
+                if headers:
+                    kwargs["headers"] = headers
                 response = await self.session.get(url, **kwargs)
                 try:
                     text = await response.text()
                     status_code = response.status
+                    response_headers = getattr(response, "headers", None) or {}
+                    retry_after = response_headers.get("Retry-After")
                 finally:
                     release = getattr(response, "release", None)
                     if callable(release):
                         release()
+                self._politeness.record(
+                    host,
+                    status=status_code,
+                    latency_seconds=time.perf_counter() - started,
+                    retry_after=retry_after,
+                    blocked=has_blocked_body(text),
+                )
                 if should_rotate_proxy(status_code, text):
                     blocked_response_seen = True
                     logger.warning(
@@ -413,9 +474,10 @@ class AsyncDocFetcher:
                     continue
 
                 self._proxy_pool.mark_success(proxy)
-                return status_code, text
+                return status_code, text, response_headers
             except Exception as exc:  # pragma: no cover - network best effort
                 last_error = exc
+                self._politeness.record(host, status=None, latency_seconds=time.perf_counter() - started)
                 logger.debug("HTTP fetch failed with proxy=%s for %s: %s", proxy_label(proxy), url, exc)
                 self._proxy_pool.mark_blocked(proxy)
                 continue
@@ -485,13 +547,37 @@ class AsyncDocFetcher:
 
         return self._truncate_excerpt(markdown_content)
 
-    async def _apply_rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self._request_delay:
-            await asyncio.sleep(self._request_delay - time_since_last)
-        self._last_request_time = asyncio.get_event_loop().time()
+    @asynccontextmanager
+    async def _host_slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a politeness slot for the URL's host, reading its robots.txt crawl-delay on first contact.
+
+        ``request_delay_ms`` is the minimum interval between requests to one host.
+        """
+        parts = urlsplit(url)
+        if self._politeness.claim_robots(parts.netloc):
+            crawl_delay = None
+            try:
+                crawl_delay = await self._fetch_crawl_delay(parts)
+            finally:
+                # Always settle the lookup: requests to the host wait on it.
+                self._politeness.set_crawl_delay(parts.netloc, crawl_delay)
+        async with self._politeness.slot(parts.netloc, min_interval=self._request_delay):
+            yield
+
+    async def _fetch_crawl_delay(self, parts: SplitResult) -> float | None:
+        robots_url = urlunsplit((parts.scheme, parts.netloc, "/robots.txt", "", ""))
+        try:
+            response = await self._fetch_text_with_proxy_pool(robots_url)
+        except FetchBlockedError:
+            return None
+        if not response or response[0] != 200:
+            return None
+        parser = RobotFileParser()
+        parser.parse(response[1].splitlines())
+        delay = parser.crawl_delay(self.settings.fetch_user_agent or "*")
+        if delay:
+            logger.info("Honoring robots.txt crawl-delay of %ss for %s", delay, parts.netloc)
+        return float(delay) if delay else None
 
     def _clean_markdown(self, markdown: str) -> str:
         """Clean up the markdown content."""
@@ -756,7 +842,7 @@ class AsyncDocFetcher:
             response = await self._fetch_text_with_proxy_pool(candidate_url)
             if not response:
                 continue
-            status_code, raw_markdown = response
+            status_code, raw_markdown, _ = response
             if status_code != 200:
                 logger.debug("Markdown mirror unavailable for %s (status %s)", candidate_url, status_code)
                 continue
@@ -0,0 +1,298 @@
+"""Per-host crawl politeness: token-bucket pacing with AIMD-adapted rate and concurrency.
+
+One scheduler is shared by every fetcher in the process, so tenants that crawl
+the same host share that host's budget. Each host starts slow and grows its
+rate and concurrency additively while responses come back clean and fast. A
+429/503 response, a block page, or latency above the target halves both and
+starts an exponential backoff. ``Retry-After`` and robots.txt ``Crawl-delay``
+are hard floors that adaptation never undercuts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import math
+import threading
+import time
+
+from ..observability.metrics import CRAWL_HOST_BACKOFF, CRAWL_HOST_CONCURRENCY, CRAWL_HOST_RATE, CRAWL_HOST_THROTTLED
+
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+_MIN_RATE = 0.1
+_RATE_INCREASE = 0.25
+_DECREASE_FACTOR = 0.5
+_BASE_BACKOFF_SECONDS = 1.0
+_MAX_BACKOFF_SECONDS = 600.0
+_LATENCY_EWMA_ALPHA = 0.2
+
+
+def parse_retry_after(value: object, *, now: datetime | None = None) -> float | None:
+    """Return the seconds a ``Retry-After`` header asks for, or None when absent or unparseable."""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), _MAX_BACKOFF_SECONDS)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    seconds = (retry_at - (now or datetime.now(timezone.utc))).total_seconds()
+    return min(max(seconds, 0.0), _MAX_BACKOFF_SECONDS)
+
+
+@dataclass(slots=True)
+class _HostState:
+    rate: float
+    concurrency: float
+    tokens: float = 1.0
+    refilled_at: float = 0.0
+    last_started_at: float = -math.inf
+    in_flight: int = 0
+    backoff_until: float = 0.0
+    consecutive_throttles: int = 0
+    last_decrease_at: float = -math.inf
+    latency_ewma: float | None = None
+    crawl_delay: float | None = None
+    robots_claimed: bool = False
+    robots_pending: bool = False
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+
+
+class HostPolitenessScheduler:
+    """Pace and cap concurrent requests per host, adapting to how each host responds."""
+
+    def __init__(
+        self,
+        *,
+        max_rate: float = 10.0,
+        max_concurrency: int = 8,
+        latency_target_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_rate = max(_MIN_RATE, max_rate)
+        self.max_concurrency = max(1, max_concurrency)
+        self.latency_target_seconds = latency_target_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(
+                rate=max(_MIN_RATE, self.max_rate / 4),
+                concurrency=float(min(2, self.max_concurrency)),
+                refilled_at=self._clock(),
+            )
+            self._hosts[host] = state
+        return state
+
+    def claim_robots(self, host: str) -> bool:
+        """Return True once per host, telling that caller to read the host's robots.txt.
+
+        Until the caller reports the result through ``set_crawl_delay``, no
+        slot for ``host`` is handed out, so no request can skip the delay.
+        """
+        with self._lock:
+            state = self._state(host)
+            if state.robots_claimed:
+                return False
+            state.robots_claimed = True
+            state.robots_pending = True
+            return True
+
+    def set_crawl_delay(self, host: str, seconds: float | None) -> None:
+        """Apply a robots.txt ``Crawl-delay`` as the minimum interval between requests to ``host``."""
+        with self._lock:
+            state = self._state(host)
+            state.crawl_delay = min(seconds, _MAX_BACKOFF_SECONDS) if seconds else None
+            state.robots_pending = False
+            self._wake(state)
+
+    def _try_acquire(self, state: _HostState, min_interval: float) -> float | None:
+        """Take a slot and return None, or return how long to wait (inf until a release or robots.txt wakes it)."""
+        if state.robots_pending or state.in_flight >= max(1, int(state.concurrency)):
+            return math.inf
+        now = self._clock()
+        if now < state.backoff_until:
+            return state.backoff_until - now
+        interval = max(min_interval, state.crawl_delay or 0.0)
+        if now - state.last_started_at < interval:
+            return state.last_started_at + interval - now
+        capacity = max(1.0, math.floor(state.concurrency))
+        state.tokens = min(capacity, state.tokens + (now - state.refilled_at) * state.rate)
+        state.refilled_at = now
+        if state.tokens < 1.0:
+            return (1.0 - state.tokens) / state.rate
+        state.tokens -= 1.0
+        state.in_flight += 1
+        state.last_started_at = now
+        return None
+
+    async def acquire(self, host: str, *, min_interval: float = 0.0) -> None:
+        """Wait until ``host`` may receive another request, then take a slot for it."""
+        while True:
+            with self._lock:
+                state = self._state(host)
+                wait = self._try_acquire(state, min_interval)
+                if wait is None:
+                    return
+                waiter = asyncio.get_running_loop().create_future() if wait == math.inf else None
+                if waiter is not None:
+                    state.waiters.append(waiter)
+            if waiter is None:
+                await asyncio.sleep(wait)
+                continue
+            try:
+                await waiter
+            finally:
+                with self._lock:
+                    if waiter in state.waiters:
+                        state.waiters.remove(waiter)
+
+    def release(self, host: str) -> None:
+        with self._lock:
+            state = self._state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+            self._wake(state)
+
+    @asynccontextmanager
+    async def slot(self, host: str, *, min_interval: float = 0.0) -> AsyncIterator[None]:
+        """Hold one of ``host``'s request slots for the duration of the block."""
+        await self.acquire(host, min_interval=min_interval)
+        try:
+            yield
+        finally:
+            self.release(host)
+
+    @staticmethod
+    def _wake(state: _HostState) -> None:
+        # Woken waiters re-check their slot, so waking all of them is safe.
+        while state.waiters:
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                waiter.get_loop().call_soon_threadsafe(_resolve, waiter)
+
+    def record(
+        self,
+        host: str,
+        *,
+        status: int | None,
+        latency_seconds: float | None = None,
+        retry_after: object = None,
+        blocked: bool = False,
+    ) -> None:
+        """Adapt ``host``'s rate and concurrency to one response.
+
+        ``status`` is None when the request failed without a response.
+        ``latency_seconds`` is None when the timing says nothing about the
+        host, such as a browser render.
+        """
+        retry_seconds = parse_retry_after(retry_after)
+        throttled = blocked or status in THROTTLE_STATUS_CODES
+        with self._lock:
+            state = self._state(host)
+            now = self._clock()
+            if retry_seconds:
+                state.backoff_until = max(state.backoff_until, now + retry_seconds)
+            if latency_seconds is not None:
+                state.latency_ewma = (
+                    latency_seconds
+                    if state.latency_ewma is None
+                    else state.latency_ewma + _LATENCY_EWMA_ALPHA * (latency_seconds - state.latency_ewma)
+                )
+            if throttled:
+                state.consecutive_throttles += 1
+                if not retry_seconds:
+                    backoff = _BASE_BACKOFF_SECONDS * 2 ** (state.consecutive_throttles - 1)
+                    state.backoff_until = max(state.backoff_until, now + min(backoff, _MAX_BACKOFF_SECONDS))
+                self._decrease(state, now)
+                CRAWL_HOST_THROTTLED.labels(host=host, reason="blocked" if blocked else f"status_{status}").inc()
+            elif self._too_slow(state):
+                self._decrease(state, now)
+                CRAWL_HOST_THROTTLED.labels(host=host, reason="latency").inc()
+            elif status is not None and status < 500:
+                state.consecutive_throttles = 0
+                state.rate = min(self.max_rate, state.rate + _RATE_INCREASE)
+                state.concurrency = min(float(self.max_concurrency), state.concurrency + 1 / state.concurrency)
+                self._wake(state)
+            CRAWL_HOST_RATE.labels(host=host).set(state.rate)
+            CRAWL_HOST_CONCURRENCY.labels(host=host).set(int(state.concurrency))
+            CRAWL_HOST_BACKOFF.labels(host=host).set(max(0.0, state.backoff_until - now))
+
+    def _too_slow(self, state: _HostState) -> bool:
+        return (
+            self.latency_target_seconds > 0
+            and state.latency_ewma is not None
+            and state.latency_ewma > self.latency_target_seconds
+        )
+
+    def _decrease(self, state: _HostState, now: float) -> None:
+        # Responses already in flight report the same congestion, so decrease at most once per round trip.
+        window = max(1.0, state.latency_ewma or 0.0)
+        if now - state.last_decrease_at < window:
+            return
+        state.last_decrease_at = now
+        state.rate = max(_MIN_RATE, state.rate * _DECREASE_FACTOR)
+        state.concurrency = max(1.0, state.concurrency * _DECREASE_FACTOR)
+        state.tokens = min(state.tokens, 1.0)
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        """Return each host's current pacing state."""
+        now = self._clock()
+        with self._lock:
+            return {
+                host: {
+                    "rate_per_second": round(state.rate, 3),
+                    "concurrency_limit": int(state.concurrency),
+                    "in_flight": state.in_flight,
+                    "backoff_seconds": round(max(0.0, state.backoff_until - now), 3),
+                    "crawl_delay_seconds": state.crawl_delay,
+                    "latency_ewma_seconds": round(state.latency_ewma, 3) if state.latency_ewma is not None else None,
+                }
+                for host, state in self._hosts.items()
+            }
+
+
+def _resolve(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_scheduler_lock = threading.Lock()
+_scheduler_holder: dict[str, HostPolitenessScheduler] = {}
+
+
+def configure_host_politeness(
+    max_rate: float, max_concurrency: int, latency_target_seconds: float
+) -> HostPolitenessScheduler:
+    """Replace the process-wide host politeness scheduler (called once at startup)."""
+    scheduler = HostPolitenessScheduler(
+        max_rate=max_rate,
+        max_concurrency=max_concurrency,
+        latency_target_seconds=latency_target_seconds,
+    )
+    with _scheduler_lock:
+        _scheduler_holder["scheduler"] = scheduler
+    return scheduler
+
+
+def get_host_politeness() -> HostPolitenessScheduler:
+    """Return the process-wide host politeness scheduler, creating a default one if needed."""
+    with _scheduler_lock:
+        scheduler = _scheduler_holder.get("scheduler")
+        if scheduler is None:
+            scheduler = HostPolitenessScheduler()
+            _scheduler_holder["scheduler"] = scheduler
+        return scheduler
@@ -68,18 +68,21 @@ class SearchResult(BaseModel):
         url: Public documentation URL with optional line number fragment
         title: Human-readable document title
         snippet: Contextual preview showing query match in surrounding text
+        score: Relevance score used to rank the results
 
     Example:
         {
             "url": "https://docs.python.org/3.13/library/bdb.html#L380",
             "title": "bdb — Debugger framework",
-            "snippet": "...The Bdb class acts as a generic Python debugger base class..."
+            "snippet": "...The Bdb class acts as a generic Python debugger base class...",
+            "score": 12.45
         }
     """
 
     url: str = Field(description="Public documentation URL with optional line number (#L123 for precise navigation)")
     title: str = Field(description="Human-readable document title")
     snippet: str = Field(description="Contextual preview showing match in surrounding text")
+    score: float | None = Field(default=None, description="Relevance score (only comparable within one tenant)")
 
 
 class SearchDocsResponse(BaseModel):
@@ -163,6 +166,68 @@ class SearchDocsResponse(BaseModel):
         return super().model_dump_json(*args, **kwargs)
 
 
+class FederatedSearchResult(SearchResult):
+    """Search result tagged with the tenant it came from.
+
+    Scores from different tenants are not comparable, so ``score`` here is
+    the merged cross-tenant score: the tenant's BM25 score normalized by its
+    best hit, blended with a dampened raw score and the tenant's match
+    against the query.
+    """
+
+    tenant: str = Field(description="Codename of the tenant the result came from")
+
+
+class FederatedSearchResponse(BaseModel):
+    """Response model for the root_search_all MCP tool.
+
+    Fields:
+        results: Merged top results across tenants, best first
+        tenants_searched: Tenants whose search succeeded before the deadline
+        tenants_failed: Tenants whose search errored, with the error (their results are omitted)
+        tenants_timed_out: Tenants still searching when the deadline passed (their results are omitted)
+        error: Error message if the search could not run (None on success)
+        query: Original query (included on error for debugging)
+
+    Example Success Response:
+        {
+            "results": [
+                {"url": "https://...", "title": "Serializers", "snippet": "...", "score": 1.42, "tenant": "drf"}
+            ],
+            "tenants_searched": ["drf", "django"],
+            "tenants_failed": {},
+            "tenants_timed_out": []
+        }
+    """
+
+    results: list[FederatedSearchResult] = Field(
+        default_factory=list, description="Merged search results across tenants (empty on error, never null)"
+    )
+    tenants_searched: list[str] = Field(
+        default_factory=list, description="Tenants whose results were merged into this response"
+    )
+    tenants_failed: dict[str, str] = Field(
+        default_factory=dict, description="Tenants whose search errored, mapped to the error message"
+    )
+    tenants_timed_out: list[str] = Field(
+        default_factory=list, description="Tenants that did not finish before the deadline"
+    )
+    error: str | None = Field(default=None, description="Error message if search failed (None on success)")
+    query: str | None = Field(default=None, description="Original query (included on error for debugging)")
+
+    def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Exclude None fields (error, query) unless caller overrides."""
+
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args: Any, **kwargs: Any) -> str:
+        """Exclude None fields when serializing to JSON by default."""
+
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(*args, **kwargs)
+
+
 class SearchStats(BaseModel):
     """Detailed search statistics for diagnostics and performance monitoring.
 
@@ -249,3 +314,11 @@ class DocPage(BaseModel):
     readability_content: ReadabilityContent | None = Field(
         default=None, description="Complete readability extraction data"
     )
+    etag: str | None = Field(default=None, description="ETag response header, sent back as If-None-Match")
+    last_modified: str | None = Field(
+        default=None, description="Last-Modified response header, sent back as If-Modified-Since"
+    )
+    content_hash: str | None = Field(default=None, description="SHA-256 of the title and markdown that get cached")
+    unchanged: bool = Field(
+        default=False, description="Revalidation found the cached copy current, so it was not rewritten"
+    )
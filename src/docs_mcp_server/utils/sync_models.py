@@ -43,6 +43,10 @@ class SyncMetadata:
         last_failure_reason: str | None = None,
         last_failure_at: datetime | None = None,
         markdown_rel_path: str | None = None,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_hash: str | None = None,
     ):
         self.url = url
         self.discovered_from = discovered_from
@@ -54,6 +58,9 @@ class SyncMetadata:
         self.last_failure_reason = last_failure_reason
         self.last_failure_at = last_failure_at
         self.markdown_rel_path = markdown_rel_path
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
 
     def to_dict(self) -> dict:
         return {
@@ -67,6 +74,9 @@ class SyncMetadata:
             "last_failure_reason": self.last_failure_reason,
             "last_failure_at": self.last_failure_at.isoformat() if self.last_failure_at else None,
             "markdown_rel_path": self.markdown_rel_path,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_hash": self.content_hash,
         }
 
     @staticmethod
@@ -93,6 +103,9 @@ class SyncMetadata:
             last_failure_reason=data.get("last_failure_reason"),
             last_failure_at=cls._parse_optional_timestamp(data.get("last_failure_at")),
             markdown_rel_path=data.get("markdown_rel_path"),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            content_hash=data.get("content_hash"),
         )
 
 
@@ -108,6 +121,11 @@ class SyncSchedulerStats:
     last_sync_at: str | None = None
     next_sync_at: str | None = None
     urls_processed: int = 0
+    # URLs processed per second by the last batch execution.
+    urls_per_second: float = 0.0
+    # Pages the last batch execution revalidated as unchanged, and the content bytes it did not rewrite.
+    urls_unchanged: int = 0
+    bytes_saved: int = 0
     urls_discovered: int = 0
     urls_cached: int = 0
     urls_fetched: int = 0
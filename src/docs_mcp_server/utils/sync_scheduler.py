@@ -17,6 +17,7 @@ import logging
 import os
 import shutil
 import socket
+import time
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlsplit
 
@@ -515,6 +516,9 @@ class SyncScheduler(SyncSchedulerProgressMixin, SyncSchedulerMetadataMixin):
         total_urls = await self.metadata_store.queue_depth()
         processed = 0
         failed = 0
+        started = time.perf_counter()
+        self.stats.urls_unchanged = 0
+        self.stats.bytes_saved = 0
 
         async def handle_url(url: str) -> None:
             nonlocal processed, failed
@@ -537,6 +541,18 @@ class SyncScheduler(SyncSchedulerProgressMixin, SyncSchedulerMetadataMixin):
             progress.stats = progress.stats.with_updates(urls_pending=self.stats.queue_depth)
             await self._checkpoint_progress(force=False)
 
+        elapsed = time.perf_counter() - started
+        if processed + failed and elapsed > 0:
+            self.stats.urls_per_second = round((processed + failed) / elapsed, 1)
+            logger.info(
+                "Processed %s URLs in %.1fs (%.1f URLs/s, %s unchanged, %s bytes not rewritten) for %s",
+                processed + failed,
+                elapsed,
+                self.stats.urls_per_second,
+                self.stats.urls_unchanged,
+                self.stats.bytes_saved,
+                self.tenant_codename,
+            )
         return SyncBatchResult(total_urls=total_urls, processed=processed, failed=failed)
 
     async def _sync_cycle(self, force_crawler: bool = False, force_full_sync: bool = False):
@@ -1040,6 +1056,7 @@ class SyncScheduler(SyncSchedulerProgressMixin, SyncSchedulerMetadataMixin):
                 page, was_cached, failure_reason = await cache_service.check_and_fetch_page(
                     url,
                     use_semantic_cache=not self._bypass_idempotency,
+                    **self._revalidation_kwargs(existing_metadata),
                 )
                 self._refresh_fetcher_metrics(cache_service)
 
@@ -1049,6 +1066,9 @@ class SyncScheduler(SyncSchedulerProgressMixin, SyncSchedulerMetadataMixin):
                         self.stats.urls_cached += 1
                     else:
                         self.stats.urls_fetched += 1
+                    if page.unchanged:
+                        self.stats.urls_unchanged += 1
+                        self.stats.bytes_saved += len(page.content.encode())
 
                     # Calculate next check time based on sitemap lastmod freshness
                     next_due = self._calculate_next_due(sitemap_lastmod)
@@ -1069,6 +1089,9 @@ class SyncScheduler(SyncSchedulerProgressMixin, SyncSchedulerMetadataMixin):
                         status="success",
                         retry_count=0,  # Reset on success
                         markdown_rel_path=markdown_rel_path,
+                        etag=page.etag,
+                        last_modified=page.last_modified,
+                        content_hash=page.content_hash,
                     )
                     duration_ms = int((datetime.now(timezone.utc) - started_at).total_seconds() * 1000)
                     await self.metadata_store.record_event(
@@ -1077,6 +1100,7 @@ class SyncScheduler(SyncSchedulerProgressMixin, SyncSchedulerMetadataMixin):
                         status="ok",
                         detail={
                             "was_cached": was_cached,
+                            "unchanged": page.unchanged,
                             "markdown_rel_path": markdown_rel_path,
                         },
                         duration_ms=duration_ms,
@@ -1112,6 +1136,21 @@ class SyncScheduler(SyncSchedulerProgressMixin, SyncSchedulerMetadataMixin):
                 )
                 await self._mark_url_failed(url, error=e)
 
+    def _revalidation_kwargs(self, existing_metadata: dict | None) -> dict[str, str]:
+        """Return the stored validators that let a refresh skip unchanged pages.
+
+        Validators are only stored by successful fetches, so their presence is
+        the signal; ``last_status`` is already ``processing`` once a URL is
+        dequeued. Forced syncs refetch and rewrite everything, so they get none.
+        """
+        if self._bypass_idempotency or not existing_metadata:
+            return {}
+        return {
+            key: existing_metadata[key]
+            for key in ("etag", "last_modified", "content_hash")
+            if existing_metadata.get(key)
+        }
+
     async def delete_blacklisted_caches(self) -> dict[str, int]:
         """Delete cached documents that match blacklist patterns.
 
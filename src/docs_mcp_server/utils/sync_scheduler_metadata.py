@@ -38,7 +38,7 @@ class SyncSchedulerMetadataMixin:
 
         return now + timedelta(days=self.settings.default_sync_interval_days)
 
-    async def _update_metadata(
+    async def _update_metadata(  # noqa: PLR0913
         self,
         url: str,
         last_fetched_at: datetime,
@@ -46,8 +46,16 @@ class SyncSchedulerMetadataMixin:
         status: str,
         retry_count: int,
         markdown_rel_path: str | None = None,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_hash: str | None = None,
     ) -> None:
-        """Update metadata for a URL."""
+        """Update metadata for a URL.
+
+        Validators are replaced only when ``content_hash`` is given, that is
+        when the page came from the network rather than a cache hit.
+        """
         existing_payload = await self.metadata_store.load_url_metadata(url)
         existing = SyncMetadata.from_dict(existing_payload) if existing_payload else SyncMetadata(url=url)
 
@@ -57,6 +65,10 @@ class SyncSchedulerMetadataMixin:
         existing.retry_count = retry_count
         if markdown_rel_path:
             existing.markdown_rel_path = markdown_rel_path
+        if content_hash:
+            existing.etag = etag
+            existing.last_modified = last_modified
+            existing.content_hash = content_hash
         if status == "success":
             existing.last_failure_reason = None
             existing.last_failure_at = None
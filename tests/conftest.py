@@ -12,7 +12,7 @@ import pytest
 from docs_mcp_server.config import Settings
 
 # Import commonly used utility modules for tests
-from docs_mcp_server.utils import doc_fetcher, sync_discovery_runner
+from docs_mcp_server.utils import doc_fetcher, host_politeness, sync_discovery_runner
 from docs_mcp_server.utils.models import DocPage, ReadabilityContent, SearchResult
 
 
@@ -99,6 +99,12 @@ def stub_doc_fetcher_session(monkeypatch):
     monkeypatch.setattr(doc_fetcher.AsyncDocFetcher, "_create_session", _fake_create_session)
 
 
+@pytest.fixture(autouse=True)
+def isolate_host_politeness(monkeypatch):
+    """Give each test its own process-wide host politeness scheduler so pacing never leaks between tests."""
+    monkeypatch.setattr(host_politeness, "_scheduler_holder", {})
+
+
 @pytest.fixture(autouse=True)
 def stub_efficient_crawler(monkeypatch):
     """Stub EfficientCrawler so tests never launch real Playwright sessions."""
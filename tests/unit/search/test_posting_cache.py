@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+
+import pytest
+
+from docs_mcp_server.observability import metrics as metrics_module
+from docs_mcp_server.search import posting_cache as posting_cache_module
+from docs_mcp_server.search.models import PostingColumns
+from docs_mcp_server.search.posting_cache import PostingCache, configure_posting_cache, get_posting_cache
+from docs_mcp_server.search.schema import create_default_schema
+from docs_mcp_server.search.segment_search_index import SegmentSearchIndex
+from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter
+
+
+def _entry(length: int) -> PostingColumns:
+    values = array("I", range(length))
+    return PostingColumns(values, array("I", values), array("I", values))
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch) -> PostingCache:
+    monkeypatch.setattr(posting_cache_module, "_cache_holder", {})
+    return configure_posting_cache(1024 * 1024)
+
+
+def _build_segment(tmp_path: Path) -> Path:
+    writer = SqliteSegmentWriter(create_default_schema(), segment_id="cache-seg")
+    for index, body in enumerate(("request model config", "model request", "unrelated text")):
+        writer.add_document(
+            {
+                "url": f"https://example.com/{index}",
+                "url_path": f"/{index}",
+                "title": f"Doc {index}",
+                "body": body,
+                "path": f"{index}.md",
+                "excerpt": body,
+                "language": "en",
+                "timestamp": 0,
+            }
+        )
+    store = SqliteSegmentStore(tmp_path)
+    return store.save(writer.build())
+
+
+@pytest.mark.unit
+def test_lru_evicts_least_recently_used_within_budget():
+    cache = PostingCache(budget_bytes=_entry(10).nbytes * 2)
+    cache.put("seg", "body", "a", _entry(10))
+    cache.put("seg", "body", "b", _entry(10))
+    assert cache.get("seg", "body", "a") is not None
+
+    cache.put("seg", "body", "c", _entry(10))
+
+    assert cache.get("seg", "body", "b") is None
+    assert cache.get("seg", "body", "a") is not None
+    assert cache.get("seg", "body", "c") is not None
+    assert cache.bytes_used <= cache.budget_bytes
+
+
+@pytest.mark.unit
+def test_entry_larger_than_budget_is_not_cached():
+    cache = PostingCache(budget_bytes=100)
+    cache.put("seg", "body", "huge", _entry(1000))
+
+    assert len(cache) == 0
+    assert cache.bytes_used == 0
+
+
+@pytest.mark.unit
+def test_invalidate_segment_drops_only_that_segment():
+    cache = PostingCache()
+    cache.put("old", "body", "term", _entry(4))
+    cache.put("new", "body", "term", _entry(4))
+
+    assert cache.invalidate_segment("old") == 1
+
+    assert cache.get("old", "body", "term") is None
+    assert cache.get("new", "body", "term") is not None
+    assert cache.bytes_used == _entry(4).nbytes
+    assert metrics_module._POSTING_CACHE_BYTES_PROM.labels(field="body")._value.get() == _entry(4).nbytes
+
+
+@pytest.mark.unit
+def test_zero_budget_disables_cache(monkeypatch):
+    monkeypatch.setattr(posting_cache_module, "_cache_holder", {})
+    assert get_posting_cache().enabled
+
+    cache = configure_posting_cache(0)
+
+    assert not cache.enabled
+    assert get_posting_cache() is cache
+
+
+@pytest.mark.unit
+def test_segment_postings_are_served_from_cache(tmp_path: Path, fresh_cache: PostingCache):
+    db_path = _build_segment(tmp_path)
+    segment = SqliteSegmentStore(tmp_path).load(db_path.stem)
+    hits_before = metrics_module._POSTING_CACHE_HITS_PROM.labels(field="body")._value.get()
+
+    first = segment.get_postings("body", "model")
+    second = segment.get_postings("body", "model")
+
+    assert first == second
+    assert {posting.doc_id for posting in second} == {"https://example.com/0", "https://example.com/1"}
+    assert fresh_cache.hits == 1
+    assert fresh_cache.misses == 1
+    assert metrics_module._POSTING_CACHE_HITS_PROM.labels(field="body")._value.get() == hits_before + 1
+
+    # Positional lookups bypass the cache.
+    with_positions = segment.get_postings("body", "model", include_positions=True)
+    assert all(len(posting.positions) > 0 for posting in with_positions)
+    assert fresh_cache.hits == 1
+    segment.close()
+
+
+@pytest.mark.unit
+def test_closing_search_index_invalidates_its_cached_postings(tmp_path: Path, fresh_cache: PostingCache):
+    db_path = _build_segment(tmp_path)
+    index = SegmentSearchIndex(db_path)
+    assert index.search("model request", 5).results
+    assert len(fresh_cache) > 0
+
+    index.close()
+
+    assert len(fresh_cache) == 0
+    assert fresh_cache.bytes_used == 0
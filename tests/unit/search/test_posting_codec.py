@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from array import array
+
+import numpy as np
+import pytest
+
+from docs_mcp_server.search.posting_codec import (
+    PostingBlocks,
+    decode_posting_columns,
+    decode_posting_positions,
+    decode_varints,
+    encode_posting_list,
+    encode_varints,
+)
+from docs_mcp_server.search.stats import bm25
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [0, 1, 127],
+        [128, 300, 16_383, 16_384],
+        [2**32 - 1, 5, 2**63],
+    ],
+)
+def test_varints_roundtrip(values: list[int]):
+    encoded = encode_varints(np.array(values, dtype=np.uint64))
+
+    assert decode_varints(encoded).tolist() == values
+
+
+@pytest.mark.unit
+def test_varints_match_reference_leb128():
+    # Same bytes as Go's binary.PutUvarint.
+    assert encode_varints(np.array([1, 300])) == bytes([0x01, 0xAC, 0x02])
+
+
+@pytest.mark.unit
+def test_truncated_varint_stream_is_rejected():
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_varints(bytes([0x80]))
+
+
+@pytest.mark.unit
+def test_posting_list_roundtrip():
+    ordinals = [0, 3, 4, 1_000_000]
+    frequencies = [2, 1, 3, 1]
+    doc_lengths = [10, 5, 400, 70_000]
+    positions = [array("I", [1, 7]), array("I", [0]), array("I", [2, 3, 900]), array("I", [65_000])]
+
+    blob = encode_posting_list(ordinals, frequencies, doc_lengths, positions)
+    columns = decode_posting_columns(blob)
+
+    assert list(columns.ordinals) == ordinals
+    assert list(columns.frequencies) == frequencies
+    assert list(columns.doc_lengths) == doc_lengths
+    assert len(columns) == 4
+    assert [list(doc_positions) for doc_positions in decode_posting_positions(blob)] == [
+        list(doc_positions) for doc_positions in positions
+    ]
+    assert [list(doc_positions) for doc_positions in decode_posting_positions(blob, [3, 0])] == [
+        list(positions[3]),
+        list(positions[0]),
+    ]
+
+
+@pytest.mark.unit
+def test_posting_list_roundtrip_without_positions():
+    blob = encode_posting_list([2, 5], [1, 1], [3, 4], [array("I"), array("I")])
+
+    assert list(decode_posting_columns(blob).ordinals) == [2, 5]
+    assert decode_posting_positions(blob) == [array("I"), array("I")]
+
+
+@pytest.mark.unit
+def test_corrupt_columns_are_rejected():
+    blob = encode_posting_list([1, 2], [1, 1], [3, 3], [array("I"), array("I")])
+
+    with pytest.raises(ValueError, match="Corrupt"):
+        decode_posting_columns(bytes([3]) + blob[1:])
+
+
+def _block_list(count: int) -> tuple[list[int], list[int], list[int], list[array]]:
+    ordinals = [3 * index + (index % 2) for index in range(count)]
+    frequencies = [1 + index % 5 for index in range(count)]
+    doc_lengths = [0 if index % 7 == 0 else 10 + index for index in range(count)]
+    positions = [array("I", range(tf)) for tf in frequencies]
+    return ordinals, frequencies, doc_lengths, positions
+
+
+@pytest.mark.unit
+def test_multi_block_list_decodes_whole_and_selected_blocks():
+    ordinals, frequencies, doc_lengths, positions = _block_list(10)
+    blob = encode_posting_list(ordinals, frequencies, doc_lengths, positions, block_size=4)
+
+    blocks = PostingBlocks.from_blob(blob)
+
+    assert len(blocks) == 10
+    assert blocks.sizes.tolist() == [4, 4, 2]
+    assert blocks.last_ordinals.tolist() == [ordinals[3], ordinals[7], ordinals[9]]
+    assert blocks.max_frequencies.tolist() == [4, 5, 5]
+    # A missing doc length (0) falls back to tf, as in scoring.
+    assert blocks.min_doc_lengths.tolist() == [1, 3, 18]
+    assert list(blocks.columns().ordinals) == ordinals
+    assert list(blocks.columns().doc_lengths) == doc_lengths
+
+    selected = blocks.select(np.array([1, 2]))
+    assert list(selected.ordinals) == ordinals[4:]
+    assert list(selected.frequencies) == frequencies[4:]
+    assert [list(doc_positions) for doc_positions in decode_posting_positions(blob)] == [
+        list(doc_positions) for doc_positions in positions
+    ]
+
+
+@pytest.mark.unit
+def test_skip_table_from_columns_matches_stored_one():
+    ordinals, frequencies, doc_lengths, positions = _block_list(300)
+    stored = PostingBlocks.from_blob(encode_posting_list(ordinals, frequencies, doc_lengths, positions))
+    derived = PostingBlocks.from_columns(stored.columns())
+
+    for attribute in ("sizes", "last_ordinals", "max_frequencies", "min_doc_lengths"):
+        assert getattr(derived, attribute).tolist() == getattr(stored, attribute).tolist()
+    assert list(derived.select(np.array([2])).ordinals) == ordinals[256:]
+    assert derived.block_of(np.array([0, ordinals[128], ordinals[-1] + 1])).tolist() == [0, 1, 3]
+
+
+@pytest.mark.unit
+def test_block_max_weights_bound_every_posting():
+    ordinals, frequencies, doc_lengths, positions = _block_list(40)
+    blocks = PostingBlocks.from_blob(encode_posting_list(ordinals, frequencies, doc_lengths, positions, block_size=8))
+
+    bounds = blocks.max_weights(20.0, k1=1.2, b=0.75)
+
+    for index, (tf, doc_length) in enumerate(zip(frequencies, doc_lengths, strict=True)):
+        assert bm25(tf, doc_length or tf, 20.0, k1=1.2, b=0.75) <= bounds[index // 8]
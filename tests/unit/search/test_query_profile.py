@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from pathlib import Path
+import time
+
+import pytest
+
+from docs_mcp_server.search import query_profile as query_profile_module, result_cache as result_cache_module
+from docs_mcp_server.search.query_profile import (
+    QueryProfile,
+    SlowQueryLog,
+    configure_slow_query_log,
+    count_postings,
+    count_sql_statement,
+    profile_query,
+    stage,
+    timed_stage,
+)
+from docs_mcp_server.search.result_cache import configure_result_cache
+from docs_mcp_server.search.schema import create_default_schema
+from docs_mcp_server.search.segment_search_index import SegmentSearchIndex
+from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter
+
+
+def _build_segment(tmp_path: Path) -> Path:
+    writer = SqliteSegmentWriter(create_default_schema(), segment_id="profile-seg")
+    for index, body in enumerate(("request model config", "model request handling", "unrelated text")):
+        writer.add_document(
+            {
+                "url": f"https://example.com/{index}",
+                "url_path": f"/{index}",
+                "title": f"Doc {index}",
+                "body": body,
+                "path": f"{index}.md",
+                "excerpt": body,
+                "language": "en",
+                "timestamp": 0,
+            }
+        )
+    return SqliteSegmentStore(tmp_path).save(writer.build())
+
+
+def _profile(postings: int = 0, sql: int = 0) -> QueryProfile:
+    profile = QueryProfile()
+    profile.postings_scanned = postings
+    profile.sql_statements = sql
+    profile.stage_seconds = {"postings": 0.002}
+    return profile
+
+
+@pytest.mark.unit
+def test_nested_stages_are_charged_exclusively():
+    @timed_stage("inner")
+    def inner() -> str:
+        time.sleep(0.01)
+        return "done"
+
+    with profile_query() as profile:
+        with stage("outer"):
+            time.sleep(0.01)
+            assert inner() == "done"
+        count_postings(7)
+        count_sql_statement()
+
+    assert set(profile.stage_seconds) == {"outer", "inner"}
+    assert 0.005 < profile.stage_seconds["outer"] < 0.015
+    assert profile.stage_seconds["inner"] >= 0.005
+    assert profile.postings_scanned == 7
+    assert profile.sql_statements == 1
+
+
+@pytest.mark.unit
+def test_counters_are_noops_without_a_profile():
+    count_postings(3)
+    count_sql_statement()
+    with stage("ignored"):
+        pass
+
+    with profile_query() as profile:
+        pass
+
+    assert profile.postings_scanned == 0
+    assert profile.stage_seconds == {}
+
+
+@pytest.mark.unit
+def test_slow_query_log_threshold_and_order():
+    slow_log = SlowQueryLog(threshold_ms=10)
+
+    assert not slow_log.observe(_profile(), tenant="django", query="fast", duration_s=0.005, result_count=1)
+    assert slow_log.observe(_profile(5, 2), tenant="django", query="first", duration_s=0.02, result_count=1)
+    assert slow_log.observe(_profile(), tenant="flask", query="other", duration_s=0.03, result_count=0)
+    assert slow_log.observe(_profile(), tenant="django", query="second", duration_s=0.04, result_count=0)
+
+    assert [entry.query for entry in slow_log.entries("django")] == ["second", "first"]
+    assert len(slow_log.entries()) == 3
+    entry = slow_log.entries("django")[-1].as_dict()
+    assert entry["duration_ms"] == 20.0
+    assert entry["postings_scanned"] == 5
+    assert entry["sql_statements"] == 2
+    assert entry["stages_ms"] == {"postings": 2.0}
+
+
+@pytest.mark.unit
+def test_slow_query_log_sampling_and_disable():
+    draws = iter([0.9, 0.1])
+    sampled = SlowQueryLog(threshold_ms=1, sample_rate=0.5, rng=lambda: next(draws))
+    disabled = SlowQueryLog(threshold_ms=0)
+
+    assert not sampled.observe(_profile(), tenant="t", query="dropped", duration_s=1.0, result_count=0)
+    assert sampled.observe(_profile(), tenant="t", query="kept", duration_s=1.0, result_count=0)
+    assert not disabled.observe(_profile(), tenant="t", query="q", duration_s=10.0, result_count=0)
+
+    assert [entry.query for entry in sampled.entries()] == ["kept"]
+    assert disabled.entries() == []
+
+
+@pytest.mark.unit
+def test_segment_search_profiles_scored_queries(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(query_profile_module, "_log_holder", {})
+    monkeypatch.setattr(result_cache_module, "_cache_holder", {})
+    configure_result_cache(64, 1024 * 1024, 300)
+    slow_log = configure_slow_query_log(threshold_ms=1e-6, sample_rate=1.0)
+    db_path = _build_segment(tmp_path)
+
+    with SegmentSearchIndex(db_path, tenant="profiled") as index:
+        response = index.search("request model", max_results=5)
+        cached = index.search("request model", max_results=5)
+
+    assert cached is response
+    entries = slow_log.entries("profiled")
+    # The cached repeat was not scored, so it is not profiled.
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry.query == "request model"
+    assert entry.result_count == len(response.results) == 2
+    assert entry.postings_scanned >= 4
+    assert entry.sql_statements >= len(response.results)
+    assert {"tokenize", "postings", "scoring", "documents", "snippets"} <= set(entry.stages_ms)
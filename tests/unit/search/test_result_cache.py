@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from docs_mcp_server.domain.search import MatchTrace, SearchResponse, SearchResult
+from docs_mcp_server.search import result_cache as result_cache_module
+from docs_mcp_server.search.result_cache import QueryResultCache, configure_result_cache, response_nbytes
+from docs_mcp_server.search.schema import create_default_schema
+from docs_mcp_server.search.segment_search_index import SegmentSearchIndex
+from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(url: str = "https://example.com/doc") -> SearchResponse:
+    trace = MatchTrace(stage=5, stage_name="bm25f", query_variant="model", match_reason="test")
+    return SearchResponse(
+        results=[
+            SearchResult(
+                document_url=url, document_title="Doc", snippet="model", match_trace=trace, relevance_score=1.0
+            )
+        ]
+    )
+
+
+def _key(query: str, *, tenant: str = "django", segment_id: str = "seg") -> tuple:
+    return (tenant, (segment_id,), ((query,),), 10)
+
+
+def _build_segment(tmp_path: Path) -> Path:
+    writer = SqliteSegmentWriter(create_default_schema(), segment_id="result-cache-seg")
+    for index, body in enumerate(("request model config", "model request", "unrelated text")):
+        writer.add_document(
+            {
+                "url": f"https://example.com/{index}",
+                "url_path": f"/{index}",
+                "title": f"Doc {index}",
+                "body": body,
+                "path": f"{index}.md",
+                "excerpt": body,
+                "language": "en",
+                "timestamp": 0,
+            }
+        )
+    return SqliteSegmentStore(tmp_path).save(writer.build())
+
+
+@pytest.mark.unit
+def test_lru_evicts_least_recently_used_beyond_max_entries():
+    cache = QueryResultCache(max_entries=2)
+    cache.put(_key("a"), _response())
+    cache.put(_key("b"), _response())
+    assert cache.get(_key("a")) is not None
+
+    cache.put(_key("c"), _response())
+
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) is not None
+    assert cache.get(_key("c")) is not None
+
+
+@pytest.mark.unit
+def test_byte_budget_bounds_entries():
+    size = response_nbytes(_response())
+    cache = QueryResultCache(budget_bytes=size * 2)
+    for query in ("a", "b", "c"):
+        cache.put(_key(query), _response())
+
+    assert len(cache) == 2
+    assert cache.bytes_used <= cache.budget_bytes
+    assert cache.get(_key("a")) is None
+
+
+@pytest.mark.unit
+def test_entries_expire_after_ttl_unless_pinned():
+    clock = _Clock()
+    cache = QueryResultCache(ttl_seconds=60, clock=clock)
+    cache.put(_key("plain"), _response())
+    cache.put(_key("pinned"), _response(), pin_seconds=600)
+
+    clock.now += 120
+
+    assert cache.get(_key("plain")) is None
+    assert cache.get(_key("pinned")) is not None
+    clock.now += 600
+    assert cache.get(_key("pinned")) is None
+
+
+@pytest.mark.unit
+def test_pinned_entries_are_not_evicted_for_room():
+    clock = _Clock()
+    cache = QueryResultCache(max_entries=2, clock=clock)
+    cache.put(_key("pinned"), _response(), pin_seconds=60)
+    cache.put(_key("a"), _response())
+    cache.put(_key("b"), _response())
+
+    assert cache.get(_key("pinned")) is not None
+    assert cache.get(_key("a")) is None
+
+    cache.put(_key("other-pinned"), _response(), pin_seconds=60)
+    cache.put(_key("rejected"), _response(), pin_seconds=60)
+
+    assert cache.get(_key("rejected")) is None
+    assert cache.get(_key("pinned")) is not None
+    assert cache.get(_key("other-pinned")) is not None
+
+
+@pytest.mark.unit
+def test_invalidate_tenant_keeps_only_the_new_generation():
+    cache = QueryResultCache()
+    cache.put(_key("q", segment_id="old"), _response())
+    cache.put(_key("q", segment_id="new"), _response())
+    cache.put(_key("q", tenant="flask", segment_id="old"), _response())
+
+    assert cache.invalidate_tenant("django", keep_segment_ids=("new",)) == 1
+
+    assert cache.get(_key("q", segment_id="old")) is None
+    assert cache.get(_key("q", segment_id="new")) is not None
+    assert cache.get(_key("q", tenant="flask", segment_id="old")) is not None
+
+
+@pytest.mark.unit
+def test_hit_ratio_is_tracked_per_tenant():
+    cache = QueryResultCache()
+    cache.put(_key("q"), _response())
+    cache.get(_key("q"))
+    cache.get(_key("missing"))
+    cache.get(_key("q", tenant="flask"))
+
+    assert cache.hit_ratio("django") == 0.5
+    assert cache.hit_ratio("flask") == 0.0
+    assert cache.hit_ratio("unknown") == 0.0
+
+
+@pytest.mark.unit
+def test_zero_ttl_disables_cache():
+    cache = QueryResultCache(ttl_seconds=0)
+    cache.put(_key("q"), _response())
+
+    assert not cache.enabled
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_segment_search_serves_repeated_normalized_queries_from_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache_module, "_cache_holder", {})
+    cache = configure_result_cache(64, 1024 * 1024, 300)
+    db_path = _build_segment(tmp_path)
+
+    with SegmentSearchIndex(db_path, tenant="cache-tenant", cache_pin_seconds=30) as index:
+        first = index.search("request model", max_results=5)
+        second = index.search("  Request,   MODEL ", max_results=5)
+        other_size = index.search("request model", max_results=1)
+
+    assert first.results
+    assert second is first
+    assert len(other_size.results) == 1
+    assert len(cache) == 2
+    assert cache.hit_ratio("cache-tenant") == pytest.approx(1 / 3)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from docs_mcp_server.observability import metrics as metrics_module
+from docs_mcp_server.search import search_executor as executor_module
+from docs_mcp_server.search.search_executor import (
+    SearchExecutor,
+    SearchTimeoutError,
+    configure_search_executor,
+    get_search_executor,
+)
+
+
+@pytest.fixture
+def executor():
+    search_executor = SearchExecutor(max_workers=4, max_concurrency_per_tenant=1, timeout_seconds=5)
+    yield search_executor
+    search_executor.shutdown(wait=True)
+
+
+@pytest.mark.unit
+async def test_run_executes_off_the_event_loop_thread(executor: SearchExecutor):
+    loop_thread = threading.get_ident()
+
+    worker_thread = await executor.run("alpha", threading.get_ident)
+
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.unit
+async def test_run_propagates_worker_exceptions(executor: SearchExecutor):
+    def _boom() -> None:
+        raise ValueError("bad query")
+
+    with pytest.raises(ValueError, match="bad query"):
+        await executor.run("alpha", _boom)
+
+    assert executor.active("alpha") == 0
+
+
+@pytest.mark.unit
+async def test_per_tenant_limit_queues_excess_searches(executor: SearchExecutor):
+    release = threading.Event()
+    started = threading.Event()
+
+    def _slow() -> str:
+        started.set()
+        release.wait(5)
+        return "slow"
+
+    first = asyncio.create_task(executor.run("alpha", _slow))
+    await asyncio.to_thread(started.wait, 5)
+    second = asyncio.create_task(executor.run("alpha", lambda: "queued"))
+    await asyncio.sleep(0.05)
+
+    assert executor.active("alpha") == 1
+    assert executor.queue_depth("alpha") == 1
+    assert metrics_module._SEARCH_QUEUE_DEPTH_PROM.labels(tenant="alpha")._value.get() == 1
+
+    # Another tenant is not blocked by alpha's saturated gate.
+    assert await executor.run("beta", lambda: "beta") == "beta"
+
+    release.set()
+    assert await first == "slow"
+    assert await second == "queued"
+    assert executor.queue_depth("alpha") == 0
+    assert executor.active("alpha") == 0
+
+
+@pytest.mark.unit
+async def test_timeout_raises_and_keeps_slot_until_worker_finishes():
+    search_executor = SearchExecutor(max_workers=2, max_concurrency_per_tenant=1, timeout_seconds=0.05)
+    release = threading.Event()
+    before = metrics_module._SEARCH_TIMEOUTS_PROM.labels(tenant="slow")._value.get()
+
+    with pytest.raises(SearchTimeoutError) as exc_info:
+        await search_executor.run("slow", release.wait, 5)
+
+    assert exc_info.value.tenant == "slow"
+    assert metrics_module._SEARCH_TIMEOUTS_PROM.labels(tenant="slow")._value.get() == before + 1
+    # The abandoned worker still holds the tenant's only slot.
+    assert search_executor.active("slow") == 1
+
+    release.set()
+    for _ in range(100):
+        if search_executor.active("slow") == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert search_executor.active("slow") == 0
+    search_executor.shutdown(wait=True)
+
+
+@pytest.mark.unit
+def test_configure_replaces_process_executor(monkeypatch):
+    monkeypatch.setattr(executor_module, "_executor_holder", {})
+
+    default = get_search_executor()
+    configured = configure_search_executor(max_workers=2, max_concurrency_per_tenant=3, timeout_seconds=7)
+
+    assert configured is not default
+    assert get_search_executor() is configured
+    assert configured.max_concurrency_per_tenant == 3
+    assert configured.timeout_seconds == 7
+    configured.shutdown()
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from docs_mcp_server.search import posting_cache as posting_cache_module, result_cache as result_cache_module
+from docs_mcp_server.search.posting_cache import configure_posting_cache
+from docs_mcp_server.search.result_cache import configure_result_cache
 from docs_mcp_server.search.schema import create_default_schema
 from docs_mcp_server.search.segment_search_index import SegmentSearchIndex
 from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter
@@ -50,3 +53,87 @@ def test_segment_search_can_lookup_by_url(tmp_path: Path) -> None:
 
     assert doc is not None
     assert doc.get("path") == "doc.md"
+
+
+def test_segment_search_keeps_segment_resident(tmp_path: Path, monkeypatch) -> None:
+    db_path = _build_segment(tmp_path, body="Hello search world.", excerpt="Excerpt only.")
+    load_calls: list[str] = []
+    original_load = SqliteSegmentStore.load
+
+    def _counting_load(self, segment_id: str):
+        load_calls.append(segment_id)
+        return original_load(self, segment_id)
+
+    monkeypatch.setattr(SqliteSegmentStore, "load", _counting_load)
+
+    search_index = SegmentSearchIndex(db_path)
+    resident = search_index.segment
+    for _ in range(3):
+        assert search_index.search("search", max_results=5).results
+
+    assert load_calls == [db_path.stem]
+    assert search_index.segment is resident
+    assert search_index.get_performance_info()["resident_segment_id"] == db_path.stem
+
+
+def test_segment_search_close_releases_resident_segment(tmp_path: Path) -> None:
+    db_path = _build_segment(tmp_path, body="Hello search world.", excerpt="Excerpt only.")
+
+    search_index = SegmentSearchIndex(db_path)
+    assert search_index.segment is not None
+    search_index.search("search", max_results=5)
+
+    search_index.close()
+
+    assert search_index.segment is None
+    assert search_index._engine is None
+
+
+def test_segment_search_word_match_requires_exact_phrase(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(result_cache_module, "_cache_holder", {})
+    configure_result_cache(64, 1024 * 1024, 300)
+    db_path = _build_segment(tmp_path, body="The form model is configured here.", excerpt="Excerpt only.")
+
+    with SegmentSearchIndex(db_path, tenant="phrases") as search_index:
+        assert search_index.search("model form", max_results=5).results
+        assert not search_index.search("model form", max_results=5, word_match=True).results
+        assert not search_index.search('"model form"', max_results=5).results
+        assert search_index.search("Form, model", max_results=5, word_match=True).results
+
+
+def test_segment_search_warm_up_replays_queries_and_prefetches_postings(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(posting_cache_module, "_cache_holder", {})
+    monkeypatch.setattr(result_cache_module, "_cache_holder", {})
+    posting_cache = configure_posting_cache(1024 * 1024)
+    result_cache = configure_result_cache(64, 1024 * 1024, 300)
+    db_path = _build_segment(tmp_path, body="Hello search world.", excerpt="Excerpt only.")
+
+    with SegmentSearchIndex(db_path, tenant="warm") as search_index:
+        report = search_index.warm_up(["search", "  ", "world"], time_budget_s=5.0, io_budget_bytes=1024 * 1024)
+        info = search_index.get_performance_info()
+
+    assert report.queries_replayed == 2
+    assert report.postings_loaded > 0
+    assert report.posting_bytes > 0
+    assert report.seconds > 0
+    assert info["warmup_seconds"] == round(report.seconds, 3)
+    assert info["warmup_queries_replayed"] == 2
+    assert posting_cache.hits + posting_cache.misses > 0
+    # Replays bypass the result cache so warm-up can't skew its hit ratio.
+    assert len(result_cache) == 0
+    assert result_cache.hit_ratio("warm") == 0.0
+
+
+def test_segment_search_warm_up_respects_budgets(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(posting_cache_module, "_cache_holder", {})
+    configure_posting_cache(1024 * 1024)
+    db_path = _build_segment(tmp_path, body="Hello search world.", excerpt="Excerpt only.")
+
+    with SegmentSearchIndex(db_path) as search_index:
+        disabled = search_index.warm_up(["search"], time_budget_s=0, io_budget_bytes=1024)
+        assert search_index.warmup_report is None
+        no_io = search_index.warm_up(["search"], time_budget_s=5.0, io_budget_bytes=0)
+
+    assert disabled.queries_replayed == 0
+    assert no_io.queries_replayed == 1
+    assert no_io.postings_loaded == 0
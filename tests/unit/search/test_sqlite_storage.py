@@ -179,6 +179,29 @@ def test_sqlite_storage_document_retrieval(sample_schema, sample_documents, mana
             assert sqlite_doc == expected
 
 
+def test_sqlite_segment_get_documents_batches_requested_columns(
+    sample_schema, sample_documents, managed_sqlite_store, monkeypatch
+):
+    """Batched retrieval returns only the requested columns and skips unknown docs."""
+    monkeypatch.setattr("docs_mcp_server.search.sqlite_storage._SQLITE_MAX_VARIABLES", 2)
+    with tempfile.TemporaryDirectory() as sqlite_dir:
+        writer = SqliteSegmentWriter(sample_schema)
+        for doc in sample_documents:
+            writer.add_document(doc)
+        segment_data = writer.build()
+        sqlite_store = managed_sqlite_store(sqlite_dir)
+        sqlite_store.save(segment_data)
+        segment = sqlite_store.load(segment_data["segment_id"])
+
+        doc_ids = [doc["url"] for doc in reversed(sample_documents)]
+        documents = segment.get_documents([*doc_ids, "https://example.com/missing"], ("url", "title"))
+
+        assert documents == {doc["url"]: {"url": doc["url"], "title": doc["title"]} for doc in sample_documents}
+        assert segment.get_documents(doc_ids[:1]) == {doc_ids[0]: segment.get_document(doc_ids[0])}
+        with pytest.raises(ValueError, match="Unknown document columns"):
+            segment.get_documents(doc_ids, ("url", "doc_id; DROP TABLE documents"))
+
+
 def test_binary_position_encoding():
     """Test that binary position encoding works correctly."""
     # Test position array encoding/decoding
@@ -269,10 +292,8 @@ def test_sqlite_storage_prune_segments(sample_schema, sample_documents):
         keep_ids = segment_ids[:2]
         sqlite_store.prune_to_segment_ids(keep_ids)
 
-        # Verify only kept segments remain
-        remaining_segments = sqlite_store.list_segments()
-        remaining_ids = {seg["segment_id"] for seg in remaining_segments}
-        assert remaining_ids == set(keep_ids)
+        # Check sidecars before listing: closing the last connection to a kept
+        # segment lets SQLite clean up its (fake) WAL files.
         for segment_id in keep_ids:
             assert (Path(temp_dir) / f"{segment_id}.db-wal").exists()
             assert (Path(temp_dir) / f"{segment_id}.db-shm").exists()
@@ -280,6 +301,11 @@ def test_sqlite_storage_prune_segments(sample_schema, sample_documents):
             assert not (Path(temp_dir) / f"{segment_id}.db-wal").exists()
             assert not (Path(temp_dir) / f"{segment_id}.db-shm").exists()
 
+        # Verify only kept segments remain
+        remaining_segments = sqlite_store.list_segments()
+        remaining_ids = {seg["segment_id"] for seg in remaining_segments}
+        assert remaining_ids == set(keep_ids)
+
 
 def test_sqlite_storage_segment_path(sample_schema, sample_documents):
     """Test getting segment path."""
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from docs_mcp_server.search.term_dictionary import TermDictionary
+
+
+def _rows() -> list[tuple[str, str, int]]:
+    rows = [
+        ("body", "config", 2),
+        ("body", "model", 5),
+        ("body", "naïve", 1),
+        ("body", "request", 3),
+        ("body", "zebra", 1),
+        ("title", "model", 1),
+        ("title", "日本", 4),
+    ]
+    # Rows arrive in SQLite BINARY order: bytewise on UTF-8.
+    return sorted(rows, key=lambda row: (row[0].encode(), row[1].encode()))
+
+
+@pytest.mark.unit
+def test_doc_frequency_for_present_and_absent_terms():
+    dictionary = TermDictionary.from_rows(_rows())
+
+    assert dictionary.doc_frequency("body", "model") == 5
+    assert dictionary.doc_frequency("body", "naïve") == 1
+    assert dictionary.doc_frequency("title", "日本") == 4
+    assert dictionary.doc_frequency("title", "config") == 0
+    assert dictionary.doc_frequency("body", "a") == 0
+    assert dictionary.doc_frequency("body", "zzz") == 0
+    assert dictionary.doc_frequency("missing", "model") == 0
+    assert ("body", "zebra") in dictionary
+    assert ("headings", "zebra") not in dictionary
+
+
+@pytest.mark.unit
+def test_terms_and_size():
+    dictionary = TermDictionary.from_rows(_rows())
+
+    assert dictionary.terms("body") == ["config", "model", "naïve", "request", "zebra"]
+    assert dictionary.terms("missing") == []
+    assert len(dictionary) == 7
+    assert 0 < dictionary.nbytes < 200
+
+
+@pytest.mark.unit
+def test_empty_dictionary():
+    dictionary = TermDictionary.from_rows([])
+
+    assert len(dictionary) == 0
+    assert dictionary.doc_frequency("body", "model") == 0
+
+
+@pytest.mark.unit
+def test_most_frequent_orders_by_doc_frequency():
+    dictionary = TermDictionary.from_rows(_rows())
+
+    assert dictionary.most_frequent("body", 2) == [("model", 5), ("request", 3)]
+    assert dictionary.most_frequent("title", 10) == [("日本", 4), ("model", 1)]
+    assert dictionary.most_frequent("body", 0) == []
+    assert dictionary.most_frequent("missing", 3) == []
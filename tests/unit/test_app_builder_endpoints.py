@@ -443,6 +443,7 @@ def test_sync_status_returns_scheduler_snapshot() -> None:
     assert payload["scheduler_initialized"] is True
     assert payload["stats"] == {"status": "ok"}
     assert payload["index"] == {"ok": True}
+    assert payload["slow_queries"] == []
 
 
 @pytest.mark.unit
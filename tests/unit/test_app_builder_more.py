@@ -40,9 +40,13 @@ async def test_lifespan_drains_on_shutdown_event() -> None:
 
     class DummyTenant:
         def __init__(self) -> None:
+            self.warm_calls = 0
             self.init_calls = 0
             self.shutdown_calls = 0
 
+        async def warm_up(self) -> None:
+            self.warm_calls += 1
+
         async def initialize(self) -> None:
             self.init_calls += 1
 
@@ -66,6 +70,7 @@ async def test_lifespan_drains_on_shutdown_event() -> None:
     app = Starlette()
 
     async with lifespan(app):
+        assert tenant.warm_calls == 1  # warmed before the app takes requests
         await asyncio.sleep(0.2)  # let background init task complete
 
     assert tenant.init_calls == 1
@@ -62,6 +62,9 @@ class FakeTenantApp:
         self.docs_name = config.docs_name
         self._events = events
 
+    async def warm_up(self) -> None:
+        self._events.append(("warm_up", self.codename))
+
     async def initialize(self) -> None:
         self._events.append(("initialize", self.codename))
 
@@ -245,6 +248,7 @@ def test_combined_lifespan_enters_and_exits_in_order(
     # Events should include tenant initialization and root hub lifecycle
     assert ("initialize", "alpha") in events
     assert ("enter", "root") in events
+    assert events.index(("warm_up", "alpha")) < events.index(("initialize", "alpha"))
 
 
 @pytest.mark.unit
@@ -272,6 +276,9 @@ def test_health_endpoint_handles_tenant_health_error(tmp_path: Path, monkeypatch
             self.codename = codename
             self.docs_name = docs_name
 
+        async def warm_up(self) -> None:
+            pass
+
         async def initialize(self) -> None:
             pass
 
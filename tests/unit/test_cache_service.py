@@ -15,7 +15,7 @@ from docs_mcp_server.config import Settings
 from docs_mcp_server.domain.model import Document
 from docs_mcp_server.service_layer.filesystem_unit_of_work import FakeUnitOfWork
 from docs_mcp_server.services.cache_service import CacheService
-from docs_mcp_server.utils.doc_fetcher import DocFetchError
+from docs_mcp_server.utils.doc_fetcher import DocFetchError, PageNotModifiedError
 from docs_mcp_server.utils.models import DocPage, ReadabilityContent
 
 
@@ -456,6 +456,81 @@ class TestFetchAndCache:
         cache_service._mark_document_failure.assert_awaited_once_with(failing_page.url)
 
 
+@pytest.mark.unit
+class TestRevalidation:
+    """Test conditional refetches that leave unchanged documents alone."""
+
+    async def _store(self, url: str) -> None:
+        doc = Document.create(url=url, title="Cached Doc", markdown="# Cached", text="Cached content", excerpt="")
+        doc.metadata.mark_success()
+        uow = FakeUnitOfWork()
+        async with uow:
+            await uow.documents.add(doc)
+            await uow.commit()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_cached_copy_without_rewriting(self, cache_service):
+        url = "https://example.com/doc"
+        await self._store(url)
+
+        with patch("docs_mcp_server.services.cache_service.AsyncDocFetcher") as mock_fetcher_class:
+            mock_fetcher = AsyncMock()
+            mock_fetcher.fetch_page = AsyncMock(side_effect=PageNotModifiedError(url))
+            mock_fetcher_class.return_value = mock_fetcher
+            await cache_service.ensure_ready()
+            cache_service._cache_document = AsyncMock()
+
+            page, failure_reason = await cache_service.fetch_and_cache(url, etag='"v1"', content_hash="abc")
+
+        assert failure_reason is None
+        assert page.unchanged is True
+        assert page.content == "Cached content"
+        assert (page.etag, page.content_hash) == ('"v1"', "abc")
+        mock_fetcher.fetch_page.assert_awaited_once_with(url, etag='"v1"', last_modified=None)
+        cache_service._cache_document.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_refetches_when_cached_copy_is_missing(self, cache_service):
+        url = "https://example.com/gone"
+        fetched = DocPage(url=url, title="Gone", content="Fresh content")
+
+        with patch("docs_mcp_server.services.cache_service.AsyncDocFetcher") as mock_fetcher_class:
+            mock_fetcher = AsyncMock()
+            mock_fetcher.fetch_page = AsyncMock(side_effect=[PageNotModifiedError(url), fetched])
+            mock_fetcher_class.return_value = mock_fetcher
+            await cache_service.ensure_ready()
+
+            page, failure_reason = await cache_service.fetch_and_cache(url, etag='"v1"')
+
+        assert failure_reason is None
+        assert page is fetched
+        assert page.unchanged is False
+        assert mock_fetcher.fetch_page.await_args_list[-1].kwargs == {}
+
+    @pytest.mark.asyncio
+    async def test_identical_content_hash_skips_the_write(self, cache_service):
+        url = "https://example.com/same"
+
+        with patch("docs_mcp_server.services.cache_service.AsyncDocFetcher") as mock_fetcher_class:
+            mock_fetcher = AsyncMock()
+            mock_fetcher.fetch_page = AsyncMock(
+                side_effect=lambda *_args, **_kwargs: DocPage(url=url, title="Same", content="Same content")
+            )
+            mock_fetcher_class.return_value = mock_fetcher
+            await cache_service.ensure_ready()
+
+            first, _ = await cache_service.fetch_and_cache(url)
+            cache_service._cache_document = AsyncMock()
+            second, failure_reason = await cache_service.fetch_and_cache(url, content_hash=first.content_hash)
+
+        assert first.unchanged is False
+        assert first.content_hash
+        assert failure_reason is None
+        assert second.unchanged is True
+        assert second.content_hash == first.content_hash
+        cache_service._cache_document.assert_not_awaited()
+
+
 @pytest.mark.unit
 class TestCheckAndFetchPage:
     """Test the primary check_and_fetch_page method."""
@@ -646,7 +721,9 @@ class TestCheckAndFetchPage:
         assert is_cache_hit is False
         assert failure_reason is None
         assert "Semantic cache candidate rejected" in caplog.text
-        service.fetch_and_cache.assert_awaited_once_with("https://example.com/install")
+        service.fetch_and_cache.assert_awaited_once_with(
+            "https://example.com/install", etag=None, last_modified=None, content_hash=None
+        )
 
     @pytest.mark.asyncio
     async def test_semantic_cache_can_be_disabled_per_call(self, mock_settings, uow_factory):
@@ -685,7 +762,9 @@ class TestCheckAndFetchPage:
         assert page is fetched_page
         assert is_cache_hit is False
         assert failure_reason is None
-        service.fetch_and_cache.assert_awaited_once_with("https://example.com/install")
+        service.fetch_and_cache.assert_awaited_once_with(
+            "https://example.com/install", etag=None, last_modified=None, content_hash=None
+        )
 
 
 @pytest.mark.unit
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 import sqlite3
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -48,6 +50,21 @@ async def test_upsert_and_load_metadata_roundtrip(tmp_path) -> None:
     assert payload["last_fetched_at"] == now.isoformat()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_upsert_keeps_validators_when_payload_omits_them(tmp_path) -> None:
+    store = CrawlStateStore(tmp_path)
+    url = "https://example.com/doc"
+    await store.upsert_url_metadata({"url": url, "etag": '"v1"', "last_modified": "Wed", "content_hash": "abc"})
+    await store.upsert_url_metadata({"url": url, "last_status": "failed"})
+
+    payload = await store.load_url_metadata(url)
+
+    assert payload is not None
+    assert (payload["etag"], payload["last_modified"], payload["content_hash"]) == ('"v1"', "Wed", "abc")
+    assert payload["last_status"] == "failed"
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_enqueue_respects_recent_success_and_force(tmp_path) -> None:
@@ -70,6 +87,36 @@ async def test_enqueue_respects_recent_success_and_force(tmp_path) -> None:
     assert await store.queue_depth() == 1
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_bulk_enqueue_spans_chunks_and_skips_only_fresh_successes(tmp_path) -> None:
+    store = CrawlStateStore(tmp_path)
+    now = datetime.now(timezone.utc)
+    for url, due in (("https://example.com/page-0", 4), ("https://example.com/page-1", -4)):
+        await store.upsert_url_metadata(
+            {
+                "url": url,
+                "last_status": "success",
+                "last_fetched_at": now.isoformat(),
+                "next_due_at": (now + timedelta(hours=due)).isoformat(),
+            }
+        )
+    urls = {f"https://example.com/page-{index}" for index in range(6000)}
+
+    assert await store.enqueue_urls(urls, reason="sitemap") == 5999
+    assert await store.enqueue_urls(urls, reason="sitemap") == 0
+    assert await store.enqueue_urls({"https://example.com/page-2"}, reason="forced", priority=3, force=True) == 1
+    assert await store.queue_depth() == 5999
+
+    batch = await store.dequeue_batch(50)
+
+    assert batch[0] == "https://example.com/page-2"
+    assert len(set(batch)) == 50
+    assert await store.queue_depth() == 5949
+    assert (await store.load_url_metadata(batch[1]))["last_status"] == "processing"
+    store.close()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_get_status_snapshot_aggregates_counts(tmp_path) -> None:
@@ -251,6 +298,67 @@ async def test_record_event_and_history(tmp_path) -> None:
     assert failed_log["events"][0]["event_type"] == "fetch_failure"
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_buffered_events_group_commit_with_summed_counters(tmp_path) -> None:
+    store = CrawlStateStore(tmp_path, event_flush_size=4, event_flush_interval_seconds=60)
+    url = "https://example.com/doc"
+
+    await store.record_event(url=url, event_type="process_start", status="ok")
+    await store.record_event(url=url, event_type="fetch_failure", status="failed")
+    await store.record_event(url=url, event_type="cache_hit", status="ok")
+
+    # Below the flush size and before the interval, nothing is written yet.
+    assert await store.load_url_metadata(url) is None
+
+    await store.record_event(url=url, event_type="fetch_success", status="ok")
+    metadata = await store.load_url_metadata(url)
+
+    assert metadata is not None
+    assert metadata["fetch_count"] == 2
+    assert metadata["cache_hit_count"] == 1
+    assert metadata["failure_count"] == 1
+    assert (await store.get_event_log())["count"] == 4
+    store.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_buffered_events_flush_on_interval_and_close(tmp_path) -> None:
+    store = CrawlStateStore(tmp_path, event_flush_size=100, event_flush_interval_seconds=0.01)
+
+    await store.record_event(url="https://example.com/a", event_type="fetch_success", status="ok")
+    await asyncio.sleep(0.2)
+    assert await store.load_url_metadata("https://example.com/a") is not None
+
+    await store.record_event(url="https://example.com/b", event_type="fetch_success", status="ok")
+    store.close()
+    assert await store.load_url_metadata("https://example.com/b") is not None
+    store.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sampled_event_rows_are_weighted_in_history(tmp_path) -> None:
+    store = CrawlStateStore(tmp_path, event_sample_rates={"process_start": 0.25, "skip_recent": 0.0})
+
+    for index in range(8):
+        url = f"https://example.com/{index}"
+        await store.record_event(url=url, event_type="process_start", status="ok")
+        await store.record_event(url=url, event_type="skip_recent", status="ok")
+
+    history = await store.get_event_history(minutes=60)
+    log = await store.get_event_log()
+
+    assert log["count"] == 2
+    assert [event["sample_weight"] for event in log["events"]] == [4, 4]
+    assert history["type_counts"] == {"process_start": 8}
+    assert history["total_events"] == 8
+    # Dropped rows still count against their URL.
+    assert (await store.load_url_metadata("https://example.com/0"))["last_event_at"] is not None
+    store.close()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_maintenance_prunes_old_events(tmp_path) -> None:
@@ -460,3 +568,42 @@ def test_database_critical_error_is_runtime_error() -> None:
     assert issubclass(DatabaseCriticalError, RuntimeError)
     err = DatabaseCriticalError("test error")
     assert str(err) == "test error"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_writes_run_on_writer_thread_off_the_event_loop(tmp_path) -> None:
+    store = CrawlStateStore(tmp_path)
+
+    thread_name = await store._write(lambda _conn: threading.current_thread().name)
+
+    assert thread_name == f"crawl-state-writer:{tmp_path.name}"
+    assert thread_name != threading.current_thread().name
+    store.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_events_all_persist(tmp_path) -> None:
+    store = CrawlStateStore(tmp_path)
+
+    await asyncio.gather(
+        *(store.record_event(url=f"https://example.com/{index}", event_type="fetch_success") for index in range(50))
+    )
+
+    assert (await store.get_event_log(limit=100))["count"] == 50
+    store.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_store_restarts_workers_after_close(tmp_path) -> None:
+    store = CrawlStateStore(tmp_path)
+    await store.enqueue_urls({"https://example.com/a"}, reason="test", force=True)
+    store.close()
+    store.close()
+
+    await store.enqueue_urls({"https://example.com/b"}, reason="test", force=True)
+
+    assert await store.queue_depth() == 2
+    store.close()
@@ -278,6 +278,13 @@ class TestSharedInfraConfig:
                 },
             )
 
+    def test_crawl_event_sample_rates_must_be_fractions(self):
+        config = SharedInfraConfig(crawl_event_sample_rates={"process_start": 0.1, "skip_recent": 0.0})
+
+        assert config.crawl_event_sample_rates == {"process_start": 0.1, "skip_recent": 0.0}
+        with pytest.raises(ValidationError, match="crawl_event_sample_rates"):
+            SharedInfraConfig(crawl_event_sample_rates={"process_start": 1.5})
+
 
 class TestArticleExtractorFallbackConfig:
     """Direct tests for the fallback config validator."""
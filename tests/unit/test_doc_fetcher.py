@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import asynccontextmanager
+import itertools
 import types
 from unittest.mock import AsyncMock
 
@@ -10,7 +12,8 @@ import pytest
 
 from docs_mcp_server.config import Settings
 from docs_mcp_server.utils import doc_fetcher as doc_fetcher_module
-from docs_mcp_server.utils.doc_fetcher import AsyncDocFetcher, DocFetchError
+from docs_mcp_server.utils.doc_fetcher import AsyncDocFetcher, DocFetchError, PageNotModifiedError
+from docs_mcp_server.utils.host_politeness import HostPolitenessScheduler
 from docs_mcp_server.utils.models import DocPage
 
 
@@ -74,6 +77,21 @@ class _ProxyGetSession:
         return self._responses[proxy]
 
 
+class _RecordingGetSession:
+    def __init__(self, response: _StubGetResponse) -> None:
+        self._response = response
+        self.headers: list[dict | None] = []
+
+    async def get(self, _url: str, **kwargs):
+        self.headers.append(kwargs.get("headers"))
+        return self._response
+
+
+@asynccontextmanager
+async def _unthrottled_host_slot(_url: str):
+    yield
+
+
 @pytest.fixture
 def settings_factory(monkeypatch):
     """Provide helper to build Settings instances without network warmups."""
@@ -166,7 +184,7 @@ async def test_fetch_page_returns_primary_result_without_fallback(settings_facto
 
     primary_page = DocPage(url="https://example.com/page", title="Primary", content="Body")
 
-    fetcher._apply_rate_limit = AsyncMock()
+    fetcher._host_slot = _unthrottled_host_slot
     fetcher._fetch_direct_markdown = AsyncMock(return_value=None)
     fetcher._fetch_and_extract = AsyncMock(return_value=primary_page)
     fetcher._fetch_with_fallback = AsyncMock(side_effect=AssertionError("fallback should not run"))
@@ -189,7 +207,7 @@ async def test_fetch_page_stops_after_markdown_proxy_pool_blocked(settings_facto
         }
     )
 
-    fetcher._apply_rate_limit = AsyncMock()
+    fetcher._host_slot = _unthrottled_host_slot
     fetcher._fetch_static_html_and_extract = AsyncMock(side_effect=AssertionError("static fetch should not run"))
     fetcher._fetch_and_extract = AsyncMock(side_effect=AssertionError("playwright should not run"))
     fetcher._fetch_with_fallback = AsyncMock(side_effect=AssertionError("fallback should not run"))
@@ -215,7 +233,7 @@ async def test_fetch_page_stops_after_static_proxy_pool_blocked(settings_factory
         }
     )
 
-    fetcher._apply_rate_limit = AsyncMock()
+    fetcher._host_slot = _unthrottled_host_slot
     fetcher._fetch_and_extract = AsyncMock(side_effect=AssertionError("playwright should not run"))
     fetcher._fetch_with_fallback = AsyncMock(side_effect=AssertionError("fallback should not run"))
 
@@ -238,7 +256,7 @@ async def test_fetch_page_exhausts_all_static_proxies_before_blocking(settings_f
         {proxy: _StubGetResponse(status=429, text_data="google.com/sorry unusual traffic") for proxy in proxies}
     )
 
-    fetcher._apply_rate_limit = AsyncMock()
+    fetcher._host_slot = _unthrottled_host_slot
     fetcher._fetch_and_extract = AsyncMock(side_effect=AssertionError("playwright should not run"))
     fetcher._fetch_with_fallback = AsyncMock(side_effect=AssertionError("fallback should not run"))
 
@@ -259,7 +277,7 @@ async def test_fetch_page_stops_after_playwright_proxy_pool_blocked(settings_fac
     fetcher.session = object()
     fetcher.playwright_fetcher = object()
 
-    fetcher._apply_rate_limit = AsyncMock()
+    fetcher._host_slot = _unthrottled_host_slot
     fetcher._fetch_direct_markdown = AsyncMock(return_value=None)
     fetcher._fetch_static_html_and_extract = AsyncMock(return_value=None)
     fetcher._fetch_and_extract = AsyncMock(
@@ -464,3 +482,124 @@ async def test_fetch_direct_markdown_rotates_blocked_proxy(settings_factory):
         ("https://example.com/page.md.txt", "http://good:2"),
     ]
     assert fetcher._proxy_candidates()[0] == "http://good:2"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_host_slot_reads_robots_crawl_delay_once(settings_factory):
+    settings = settings_factory()
+    fetcher = AsyncDocFetcher(settings)
+    # Each clock reading is 10s later, so the 7s crawl delay never forces a real wait.
+    fetcher._politeness = HostPolitenessScheduler(clock=itertools.count(step=10.0).__next__)
+    fetcher._request_delay = 0
+    fetcher.session = _ProxyGetSession(
+        {None: _StubGetResponse(status=200, text_data="User-agent: *\nCrawl-delay: 7\n")}
+    )
+
+    async with fetcher._host_slot("https://docs.example.com/a"):
+        pass
+    async with fetcher._host_slot("https://docs.example.com/b"):
+        pass
+
+    assert fetcher.session.calls == [("https://docs.example.com/robots.txt", None)]
+    assert fetcher._politeness.snapshot()["docs.example.com"]["crawl_delay_seconds"] == 7.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_first_host_slots_wait_for_robots_crawl_delay(settings_factory):
+    settings = settings_factory()
+    fetcher = AsyncDocFetcher(settings)
+    fetcher._politeness = HostPolitenessScheduler(clock=itertools.count(step=10.0).__next__)
+    fetcher._request_delay = 0
+    robots_read = asyncio.Event()
+
+    async def slow_crawl_delay(parts):
+        await robots_read.wait()
+        return 7.0
+
+    fetcher._fetch_crawl_delay = slow_crawl_delay  # type: ignore[method-assign]
+    delays_seen: list[float | None] = []
+
+    async def fetch(path: str) -> None:
+        async with fetcher._host_slot(f"https://docs.example.com/{path}"):
+            delays_seen.append(fetcher._politeness.snapshot()["docs.example.com"]["crawl_delay_seconds"])
+
+    tasks = [asyncio.create_task(fetch(path)) for path in ("a", "b", "c")]
+    await asyncio.sleep(0.01)
+    assert delays_seen == []
+
+    robots_read.set()
+    await asyncio.gather(*tasks)
+
+    assert delays_seen == [7.0, 7.0, 7.0]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_robots_lookup_still_releases_waiting_host_slots(settings_factory):
+    settings = settings_factory()
+    fetcher = AsyncDocFetcher(settings)
+    fetcher._politeness = HostPolitenessScheduler()
+    fetcher._request_delay = 0
+
+    async def broken_crawl_delay(parts):
+        raise RuntimeError("robots exploded")
+
+    fetcher._fetch_crawl_delay = broken_crawl_delay  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError):
+        async with fetcher._host_slot("https://docs.example.com/a"):
+            pass
+    async with asyncio.timeout(1.0), fetcher._host_slot("https://docs.example.com/b"):
+        pass
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fetch_text_feeds_retry_after_into_host_politeness(settings_factory):
+    settings = settings_factory()
+    fetcher = AsyncDocFetcher(settings)
+    fetcher._politeness = HostPolitenessScheduler()
+    response = _StubGetResponse(status=429, text_data="slow down")
+    response.headers = {"Retry-After": "120"}
+    fetcher.session = _StubGetSession(response)
+
+    assert await fetcher._fetch_text_with_proxy_pool("https://docs.example.com/a") is None
+
+    state = fetcher._politeness.snapshot()["docs.example.com"]
+    assert 119 < state["backoff_seconds"] <= 120
+    assert state["concurrency_limit"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_static_fetch_sends_validators_and_raises_when_not_modified(settings_factory):
+    fetcher = AsyncDocFetcher(settings_factory())
+    fetcher._politeness = HostPolitenessScheduler()
+    fetcher.session = _RecordingGetSession(_StubGetResponse(status=304, text_data=""))
+    validators = {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+    with pytest.raises(PageNotModifiedError):
+        await fetcher._fetch_static_html_and_extract("https://docs.example.com/a", headers=validators)
+
+    assert fetcher.session.headers == [validators]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_static_fetch_keeps_response_validators(settings_factory, monkeypatch):
+    fetcher = AsyncDocFetcher(settings_factory())
+    fetcher._politeness = HostPolitenessScheduler()
+    body = " ".join(f"word{index}" for index in range(200))
+    response = _StubGetResponse(status=200, text_data=f"<html><title>Guide</title><body><p>{body}</p></body></html>")
+    response.headers = {"ETag": '"v2"', "Last-Modified": "Thu, 02 Jan 2025 00:00:00 GMT"}
+    fetcher.session = _RecordingGetSession(response)
+    monkeypatch.setattr(doc_fetcher_module, "extract_article", lambda *_args: types.SimpleNamespace(success=False))
+
+    page = await fetcher._fetch_static_html_and_extract("https://docs.example.com/a")
+
+    assert page is not None
+    assert page.etag == '"v2"'
+    assert page.last_modified == "Thu, 02 Jan 2025 00:00:00 GMT"
+    assert fetcher.session.headers == [None]
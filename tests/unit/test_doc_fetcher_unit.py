@@ -730,29 +730,16 @@ class TestConversionHelpers:
 
 
 @pytest.mark.unit
-class TestRateLimiting:
-    @pytest.mark.asyncio
-    async def test_apply_rate_limit_sleeps_when_needed(self, monkeypatch):
+class TestHostPoliteness:
+    def test_fetchers_share_the_process_wide_scheduler(self):
         doc_fetcher = _import_doc_fetcher()
         settings = _create_mock_settings()
-        fetcher = doc_fetcher.AsyncDocFetcher(settings)
-        fetcher._request_delay = 0.2
-        fetcher._last_request_time = 1.0
-
-        times = {"now": 1.05}
-
-        def fake_time():
-            return times["now"]
-
-        async def fake_sleep(duration: float):
-            times["now"] += duration
-
-        monkeypatch.setattr(doc_fetcher.asyncio.get_event_loop(), "time", fake_time)
-        monkeypatch.setattr(doc_fetcher.asyncio, "sleep", fake_sleep)
 
-        await fetcher._apply_rate_limit()
+        first = doc_fetcher.AsyncDocFetcher(settings)
+        second = doc_fetcher.AsyncDocFetcher(settings)
 
-        assert fetcher._last_request_time >= 1.2
+        assert first._politeness is second._politeness
+        assert first._request_delay == 0.1
 
 
 @pytest.mark.unit
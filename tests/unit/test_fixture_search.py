@@ -12,6 +12,7 @@ import pytest
 
 from docs_mcp_server.search.bm25_engine import BM25SearchEngine
 from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore
+from docs_mcp_server.search.stats import bm25, calculate_idf
 
 
 FIXTURE_DIR = Path(__file__).parent.parent / "fixtures" / "ci_mcp_data"
@@ -95,3 +96,60 @@ def test_all_golden_files_have_results():
     for path in sorted(GOLDEN_DIR.glob("search_*.json")):
         data = json.loads(path.read_text())
         assert len(data["results"]) >= 1, f"No results in {path.name}"
+
+
+def _scalar_reference_scores(engine: BM25SearchEngine, segment, query: str, limit: int) -> list[tuple[str, float]]:
+    """Per-posting scalar BM25F, as the engine computed it before vectorization."""
+    tokens = engine.tokenize_query(query)
+    field_stats = segment.get_field_length_stats(list(tokens.per_field))
+    scores: dict[str, float] = {}
+    for field_name, terms in tokens.per_field.items():
+        stats = field_stats.get(field_name)
+        if stats is None:
+            continue
+        avg_length = max(stats.average_length, 1e-9)
+        for term in terms:
+            postings = segment.get_postings(field_name, term)
+            if not postings:
+                continue
+            idf = calculate_idf(len(postings), max(segment.doc_count, 1))
+            for posting in postings:
+                weight = bm25(
+                    posting.frequency, posting.doc_length or posting.frequency, avg_length, k1=engine.k1, b=engine.b
+                )
+                if weight > 0:
+                    scores[posting.doc_id] = scores.get(posting.doc_id, 0.0) + idf * weight * 1.0 * 1.0
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return ranked[:limit]
+
+
+@pytest.mark.parametrize(
+    ("tenant", "query"),
+    [
+        ("webapi-ci", "routing"),
+        ("webapi-ci", "security dependencies request body"),
+        ("gitdocs-ci", "themes"),
+        ("gitdocs-ci", "plugins configuration navigation"),
+        ("localdocs-ci", "tools"),
+        ("localdocs-ci", "install guide docs"),
+    ],
+)
+@pytest.mark.parametrize("limit", [1, 3, 10, 1000])
+@pytest.mark.parametrize("pruning", [False, True])
+def test_vectorized_scores_match_scalar_reference(tenant: str, query: str, limit: int, pruning: bool):
+    store = SqliteSegmentStore(str(FIXTURE_DIR / tenant / "__search_segments"))
+    segment = store.latest()
+    engine = BM25SearchEngine(
+        segment.schema,
+        enable_synonyms=False,
+        enable_fuzzy=False,
+        enable_phrase_bonus=False,
+        enable_pruning=pruning,
+    )
+
+    ranked = engine.score(segment, engine.tokenize_query(query), limit=limit)
+    expected = _scalar_reference_scores(engine, segment, query, limit)
+    segment.close()
+
+    assert expected
+    assert [(doc.doc_id, doc.score) for doc in ranked] == expected
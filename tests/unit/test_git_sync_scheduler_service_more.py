@@ -30,6 +30,9 @@ class _MetadataStore:
     async def save_last_sync_time(self, sync_time: datetime, *, source_revision: str | None = None) -> None:
         self.saved.append(sync_time)
 
+    def close(self) -> None:
+        return None
+
 
 @pytest.mark.unit
 def test_scheduler_property_returns_self() -> None:
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from docs_mcp_server.utils import host_politeness as host_politeness_module
+from docs_mcp_server.utils.host_politeness import (
+    HostPolitenessScheduler,
+    configure_host_politeness,
+    get_host_politeness,
+    parse_retry_after,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after(format_datetime(now + timedelta(seconds=90), usegmt=True), now=now) == 90.0
+    assert parse_retry_after("99999") == 600.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.unit
+def test_clean_responses_grow_rate_and_concurrency_up_to_the_caps():
+    scheduler = HostPolitenessScheduler(max_rate=4.0, max_concurrency=3, clock=_Clock())
+
+    for _ in range(50):
+        scheduler.record("docs.example.com", status=200, latency_seconds=0.1)
+
+    state = scheduler.snapshot()["docs.example.com"]
+    assert state["rate_per_second"] == 4.0
+    assert state["concurrency_limit"] == 3
+
+
+@pytest.mark.unit
+def test_throttling_halves_once_per_round_trip_and_backs_off():
+    clock = _Clock()
+    scheduler = HostPolitenessScheduler(max_rate=8.0, max_concurrency=8, clock=clock)
+    for _ in range(20):
+        scheduler.record("docs.example.com", status=200, latency_seconds=0.1)
+    before = scheduler.snapshot()["docs.example.com"]
+
+    scheduler.record("docs.example.com", status=429)
+    scheduler.record("docs.example.com", status=503)
+    after = scheduler.snapshot()["docs.example.com"]
+
+    assert after["rate_per_second"] == before["rate_per_second"] / 2
+    assert after["concurrency_limit"] == before["concurrency_limit"] // 2
+    # Two throttles in a row: 1s, then 2s of exponential backoff.
+    assert after["backoff_seconds"] == 2.0
+
+    scheduler.record("docs.example.com", status=200, retry_after="30")
+    assert scheduler.snapshot()["docs.example.com"]["backoff_seconds"] == 30.0
+
+
+@pytest.mark.unit
+def test_slow_responses_and_block_pages_count_as_congestion():
+    clock = _Clock()
+    scheduler = HostPolitenessScheduler(max_rate=8.0, latency_target_seconds=1.0, clock=clock)
+
+    scheduler.record("slow.example.com", status=200, latency_seconds=3.0)
+    scheduler.record("blocked.example.com", status=200, blocked=True)
+
+    snapshot = scheduler.snapshot()
+    assert snapshot["slow.example.com"]["rate_per_second"] == 1.0
+    assert snapshot["slow.example.com"]["backoff_seconds"] == 0.0
+    assert snapshot["blocked.example.com"]["rate_per_second"] == 1.0
+    assert snapshot["blocked.example.com"]["backoff_seconds"] == 1.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_slots_cap_concurrency_per_host():
+    scheduler = HostPolitenessScheduler(max_rate=1000.0, max_concurrency=1)
+    active = 0
+    peak = 0
+
+    async def fetch(host: str) -> None:
+        nonlocal active, peak
+        async with scheduler.slot(host):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(fetch("docs.example.com") for _ in range(4)))
+
+    assert peak == 1
+    assert scheduler.snapshot()["docs.example.com"]["in_flight"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_crawl_delay_spaces_requests_and_robots_are_claimed_once():
+    scheduler = HostPolitenessScheduler(max_rate=1000.0)
+    loop = asyncio.get_running_loop()
+
+    assert scheduler.claim_robots("docs.example.com")
+    assert not scheduler.claim_robots("docs.example.com")
+    scheduler.set_crawl_delay("docs.example.com", 0.05)
+
+    started = loop.time()
+    for _ in range(3):
+        async with scheduler.slot("docs.example.com"):
+            pass
+
+    assert loop.time() - started >= 0.1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_slots_wait_for_a_claimed_robots_lookup():
+    scheduler = HostPolitenessScheduler(max_rate=1000.0)
+    assert scheduler.claim_robots("docs.example.com")
+
+    waiting = asyncio.create_task(scheduler.acquire("docs.example.com"))
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+
+    scheduler.set_crawl_delay("docs.example.com", 5.0)
+    await asyncio.wait_for(waiting, timeout=1.0)
+    assert scheduler.snapshot()["docs.example.com"]["in_flight"] == 1
+
+
+@pytest.mark.unit
+def test_process_wide_scheduler_is_shared(monkeypatch):
+    monkeypatch.setattr(host_politeness_module, "_scheduler_holder", {})
+
+    default = get_host_politeness()
+    assert get_host_politeness() is default
+
+    configured = configure_host_politeness(5.0, 4, 2.0)
+    assert get_host_politeness() is configured
+    assert configured.max_concurrency == 4
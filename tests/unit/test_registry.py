@@ -132,3 +132,17 @@ class TestTenantRegistry:
 
         tenants = registry.list_tenants()
         assert [metadata.codename for metadata in tenants] == ["alpha", "beta"]
+
+    def test_routing_index_is_cached_until_next_registration(self) -> None:
+        registry = TenantRegistry()
+        registry.register(make_config(codename="django", docs_name="Django Docs"), FakeTenantApp([]))
+
+        index = registry.routing_index()
+        assert registry.routing_index() is index
+        assert [metadata.codename for metadata in index.tenants] == ["django"]
+
+        registry.register(make_config(codename="flask", docs_name="Flask Docs"), FakeTenantApp([]))
+
+        rebuilt = registry.routing_index()
+        assert rebuilt is not index
+        assert [metadata.codename for metadata, _score in rebuilt.match("flask", threshold=0.1, limit=10)] == ["flask"]
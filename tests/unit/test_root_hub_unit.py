@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 import logging
@@ -14,6 +15,7 @@ import pytest
 
 from docs_mcp_server import root_hub
 from docs_mcp_server.registry import TenantMetadata
+from docs_mcp_server.tenant_routing import TenantRoutingIndex
 from docs_mcp_server.utils.models import (
     FetchDocResponse,
     SearchDocsResponse,
@@ -47,6 +49,9 @@ class RecordingContext:
     async def info(self, message: str) -> None:
         self.messages.append(message)
 
+    async def report_progress(self, progress: float, total: float | None = None, message: str | None = None) -> None:
+        self.messages.append(f"{progress}/{total} {message}")
+
 
 @dataclass
 class FakeTenantApp:
@@ -110,6 +115,9 @@ class FakeRegistry:
     def get_tenant(self, codename: str) -> Any | None:
         return self._tenants.get(codename)
 
+    def routing_index(self) -> TenantRoutingIndex:
+        return TenantRoutingIndex(self.list_tenants())
+
     def __len__(self) -> int:  # pragma: no cover - trivial passthrough
         return len(self._tenants)
 
@@ -437,6 +445,140 @@ class TestRootHubTools:
         assert "File not found" in response.error
 
 
+def _scored_tenant(codename: str, *scores: float) -> FakeTenantApp:
+    results = [
+        SearchResult(url=f"https://{codename}.example/{index}", title=f"{codename} {index}", snippet="", score=score)
+        for index, score in enumerate(scores)
+    ]
+    return FakeTenantApp(codename=codename, _search_results=results)
+
+
+def _metadata(codename: str, description: str = "Docs") -> TenantMetadata:
+    return TenantMetadata(
+        codename=codename,
+        display_name=codename.title(),
+        description=description,
+        source_type="filesystem",
+        test_queries=[],
+        url_prefixes=[],
+    )
+
+
+@pytest.mark.unit
+class TestRootSearchAll:
+    """Tests for the federated root_search_all tool."""
+
+    @pytest.mark.asyncio
+    async def test_merges_tenants_by_normalized_score(self) -> None:
+        tenants = {"small": _scored_tenant("small", 2.0, 1.0), "large": _scored_tenant("large", 40.0, 4.0)}
+        registry = FakeRegistry(tenants=tenants, metadata={name: _metadata(name) for name in tenants})
+        mcp = ToolCaptureMCP()
+        root_hub._register_proxy_tools(mcp, registry)
+        ctx = RecordingContext()
+
+        response = await mcp.tools["root_search_all"]["func"](
+            query="install", tenant_codenames=["small", "large"], size=3, ctx=ctx
+        )
+
+        assert response.error is None
+        assert [(result.tenant, result.url) for result in response.results] == [
+            ("large", "https://large.example/0"),
+            ("small", "https://small.example/0"),
+            ("small", "https://small.example/1"),
+        ]
+        assert response.results[0].score > response.results[1].score > response.results[2].score
+        assert sorted(response.tenants_searched) == ["large", "small"]
+        assert response.tenants_timed_out == []
+        assert len(ctx.messages) == 2
+
+    @pytest.mark.asyncio
+    async def test_returns_finished_tenants_when_deadline_passes(self, monkeypatch) -> None:
+        slow = _scored_tenant("slow", 9.0)
+
+        async def slow_search(**kwargs):
+            await asyncio.sleep(5)
+            return SearchDocsResponse(results=[])
+
+        slow.search = slow_search  # type: ignore[method-assign]
+        tenants = {"fast": _scored_tenant("fast", 3.0), "slow": slow}
+        registry = FakeRegistry(tenants=tenants, metadata={name: _metadata(name) for name in tenants})
+        mcp = ToolCaptureMCP()
+        root_hub._register_proxy_tools(mcp, registry)
+        monkeypatch.setattr(root_hub, "_FEDERATED_DEADLINE_S", 0.05)
+
+        response = await mcp.tools["root_search_all"]["func"](query="install", tenant_codenames=["fast", "slow"])
+
+        assert [result.tenant for result in response.results] == ["fast"]
+        assert response.tenants_searched == ["fast"]
+        assert response.tenants_timed_out == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_reports_failed_tenants_apart_from_searched_ones(self) -> None:
+        broken = _scored_tenant("broken", 9.0)
+        erroring = _scored_tenant("erroring", 8.0)
+
+        async def raising_search(**kwargs):
+            raise RuntimeError("index unavailable")
+
+        async def error_search(**kwargs):
+            return SearchDocsResponse(results=[], error="Search failed: no index")
+
+        broken.search = raising_search  # type: ignore[method-assign]
+        erroring.search = error_search  # type: ignore[method-assign]
+        tenants = {"ok": _scored_tenant("ok", 3.0), "broken": broken, "erroring": erroring}
+        registry = FakeRegistry(tenants=tenants, metadata={name: _metadata(name) for name in tenants})
+        mcp = ToolCaptureMCP()
+        root_hub._register_proxy_tools(mcp, registry)
+
+        response = await mcp.tools["root_search_all"]["func"](
+            query="install", tenant_codenames=["ok", "broken", "erroring"]
+        )
+
+        assert [result.tenant for result in response.results] == ["ok"]
+        assert response.tenants_searched == ["ok"]
+        assert response.tenants_failed == {
+            "broken": "Search failed: index unavailable",
+            "erroring": "Search failed: no index",
+        }
+        assert response.tenants_timed_out == []
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_tenants_matching_the_query(self) -> None:
+        tenants = {"django": _scored_tenant("django", 1.0), "react": _scored_tenant("react", 50.0)}
+        metadata = {"django": _metadata("django", "Web framework"), "react": _metadata("react", "UI library")}
+        registry = FakeRegistry(tenants=tenants, metadata=metadata)
+        mcp = ToolCaptureMCP()
+        root_hub._register_proxy_tools(mcp, registry)
+
+        response = await mcp.tools["root_search_all"]["func"](query="django")
+
+        assert response.tenants_searched == ["django"]
+        assert [result.tenant for result in response.results] == ["django"]
+
+    @pytest.mark.asyncio
+    async def test_unmatched_query_falls_back_to_max_tenants(self) -> None:
+        tenants = {name: _scored_tenant(name, 1.0) for name in ("alpha", "beta", "gamma")}
+        registry = FakeRegistry(tenants=tenants, metadata={name: _metadata(name) for name in tenants})
+        mcp = ToolCaptureMCP()
+        root_hub._register_proxy_tools(mcp, registry)
+
+        response = await mcp.tools["root_search_all"]["func"](query="zzzz", max_tenants=2)
+
+        assert response.error is None
+        assert response.tenants_searched == ["alpha", "beta"]
+
+    @pytest.mark.asyncio
+    async def test_reports_unknown_tenants(self, tenant_metadata: TenantMetadata) -> None:
+        registry = FakeRegistry(tenants={"django": FakeTenantApp()}, metadata={"django": tenant_metadata})
+        mcp = ToolCaptureMCP()
+        root_hub._register_proxy_tools(mcp, registry)
+
+        response = await mcp.tools["root_search_all"]["func"](query="install", tenant_codenames=["django", "nope"])
+
+        assert response.results == []
+        assert "Tenant 'nope' not found" in response.error
+
+
 @pytest.mark.unit
 class TestRootHubLifespan:
     """Tests for RootHub lifecycle management."""
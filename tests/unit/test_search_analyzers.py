@@ -244,3 +244,57 @@ class TestPathAnalyzer:
         analyzer = get_analyzer("path")
 
         assert isinstance(analyzer, PathAnalyzer)
+
+
+_PARITY_SAMPLES = [
+    "",
+    "The Quick brown FOX jumps over the lazy dogs",
+    "Configuring ModelForms and QuerySets in Django's ORM",
+    "İstanbul ÇAĞRI straße Ωmega naïve café",
+    "use os.path.join and snake_case_name with __init__",
+    "/en/5.1/topics/forms/modelforms/",
+    "///docs///Path//",
+    "running runs ran happily quickly stated",
+    "it is not such a thing, and that is that",
+    "tabs\tand\nnewlines\r\nmixed   spacing",
+    "1.2.3 v2 x86_64 42",
+]
+
+
+@pytest.mark.unit
+class TestTermsFastPath:
+    """``terms`` matches the Token pipeline term for term."""
+
+    @pytest.mark.parametrize("name", sorted(analyzers._ANALYZER_FACTORIES))
+    @pytest.mark.parametrize("text", _PARITY_SAMPLES)
+    def test_terms_match_token_pipeline(self, name, text):
+        analyzer = get_analyzer(name)
+
+        tokens = analyzer(text)
+
+        assert analyzer.terms(text) == [token.text for token in tokens]
+        assert [token.position for token in tokens] == list(range(len(tokens)))
+
+    def test_custom_stopwords_and_no_stemming_match_pipeline(self):
+        analyzer = StandardAnalyzer(stopwords=["Custom"], apply_stemming=False)
+        text = "Custom stopwords are Running here"
+
+        expected = ["stopwords", "are", "running", "here"]
+        assert analyzer.terms(text) == [token.text for token in analyzer(text)] == expected
+
+    def test_keyword_analyzer_terms_preserve_input(self):
+        assert KeywordAnalyzer().terms("Mixed Case") == ["Mixed Case"]
+        assert KeywordAnalyzer().terms("") == []
+
+    def test_stemmer_is_memoized(self):
+        analyzers._stem_word.cache_clear()
+
+        StandardAnalyzer().terms("configuring configuring configuring")
+
+        info = analyzers._stem_word.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_get_analyzer_returns_shared_instance(self):
+        assert get_analyzer("default") is get_analyzer(None)
+        assert get_analyzer("code-friendly") is get_analyzer("CODE-FRIENDLY")
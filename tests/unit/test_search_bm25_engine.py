@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 from array import array
+import random
 import tempfile
 from types import MappingProxyType
 
+import numpy as np
 import pytest
 
 from docs_mcp_server.search.analyzers import get_analyzer
-from docs_mcp_server.search.bm25_engine import _FUZZY_DISCOUNT, BM25SearchEngine, QueryTokens
-from docs_mcp_server.search.models import Posting
+from docs_mcp_server.search.bm25_engine import _FUZZY_DISCOUNT, BM25SearchEngine, QueryTokens, _top_ordinals
+from docs_mcp_server.search.models import Posting, PostingColumns
+from docs_mcp_server.search.posting_codec import PostingBlocks
 from docs_mcp_server.search.schema import KeywordField, Schema, TextField, create_default_schema
-from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter
+from docs_mcp_server.search.sqlite_storage import SqliteSegment, SqliteSegmentStore, SqliteSegmentWriter
 from docs_mcp_server.search.stats import compute_field_length_stats
 
 
@@ -26,10 +29,31 @@ def _create_mock_segment(schema, postings=None, stored_fields=None, field_length
             self.stored_fields = stored_fields or {}
             self.field_lengths = field_lengths or {}
             self.doc_count = doc_count if doc_count is not None else (len(stored_fields) if stored_fields else 0)
+            self.has_fuzzy_index = False
+
+        @property
+        def doc_ids(self):
+            doc_ids = set(self.stored_fields)
+            for terms in self.postings.values():
+                for term_postings in terms.values():
+                    doc_ids.update(posting.doc_id for posting in term_postings)
+            return sorted(doc_ids)
 
         def get_postings(self, field_name, term, include_positions=False, doc_id_filter=None):
             return self.postings.get(field_name, {}).get(term, [])
 
+        def get_posting_columns(self, field_name, term):
+            postings = self.get_postings(field_name, term)
+            if not postings:
+                return None
+            ordinal_by_doc = {doc_id: ordinal for ordinal, doc_id in enumerate(self.doc_ids)}
+            rows = sorted((ordinal_by_doc[p.doc_id], p.frequency, p.doc_length or 0) for p in postings)
+            return PostingColumns(*(array("I", column) for column in zip(*rows, strict=True)))
+
+        def get_posting_blocks(self, field_name, term):
+            columns = self.get_posting_columns(field_name, term)
+            return PostingBlocks.from_columns(columns) if columns is not None else None
+
         def get_terms(self, field_name):
             return list(self.postings.get(field_name, {}).keys())
 
@@ -120,6 +144,26 @@ def test_score_supports_fuzzy_matches_for_base_terms() -> None:
         assert ranked[0].score > 0
 
 
+def test_fuzzy_lookup_uses_segment_index_instead_of_vocabulary(tmp_path, monkeypatch) -> None:
+    schema = create_default_schema()
+    writer = SqliteSegmentWriter(schema, segment_id="fuzzy-index")
+    writer.add_document({"url": "https://example.com/hooks", "title": "Webhooks", "body": "Use webhooks for events."})
+    store = SqliteSegmentStore(tmp_path)
+    store.save(writer.build())
+    segment = store.load("fuzzy-index")
+
+    def _no_vocabulary_scan(self, field_name):
+        raise AssertionError("vocabulary scan should not run when the segment has a fuzzy index")
+
+    monkeypatch.setattr(SqliteSegment, "get_terms", _no_vocabulary_scan)
+    engine = BM25SearchEngine(schema, enable_synonyms=False, enable_fuzzy=True)
+
+    ranked = engine.score(segment, engine.tokenize_query("webhookz"), limit=5)
+
+    assert [result.doc_id for result in ranked] == ["https://example.com/hooks"]
+    segment.close()
+
+
 def test_tokenize_query_returns_empty_for_blank_input() -> None:
     schema = create_default_schema()
     engine = BM25SearchEngine(schema)
@@ -398,3 +442,177 @@ def test_score_applies_phrase_bonus_for_adjacent_terms() -> None:
 
         assert score_bonus["https://example.com/adjacent"] > score_plain["https://example.com/adjacent"]
         assert score_bonus["https://example.com/scattered"] >= score_plain["https://example.com/scattered"]
+
+
+@pytest.mark.unit
+def test_top_ordinals_breaks_ties_by_ordinal_at_the_cutoff():
+    scores = np.array([0.0, 2.0, 1.0, 2.0, 1.0, 3.0, 1.0])
+    hits = np.flatnonzero(scores > 0)
+
+    assert _top_ordinals(scores, hits, 4).tolist() == [5, 1, 3, 2]
+    assert _top_ordinals(scores, hits, 10).tolist() == [5, 1, 3, 2, 4, 6]
+
+
+@pytest.fixture(scope="module")
+def zipf_segment(tmp_path_factory):
+    """A few hundred docs over a skewed vocabulary, so common terms span several posting blocks."""
+    rng = random.Random(7)
+    vocabulary = [f"term{index}x" for index in range(400)]
+    weights = [1 / (index + 1) for index in range(len(vocabulary))]
+    writer = SqliteSegmentWriter(create_default_schema(), segment_id="zipf")
+    for doc_index in range(400):
+        body = " ".join(rng.choices(vocabulary, weights, k=rng.randint(20, 150)))
+        writer.add_document(
+            {
+                "url": f"https://example.com/{doc_index}",
+                "url_path": f"/{doc_index}",
+                "title": " ".join(rng.choices(vocabulary, weights, k=3)),
+                "body": body,
+                "path": f"{doc_index}.md",
+                "excerpt": body[:80],
+                "language": "en",
+                "timestamp": 0,
+            }
+        )
+    store = SqliteSegmentStore(tmp_path_factory.mktemp("zipf"))
+    store.save(writer.build())
+    segment = store.latest()
+    queries = [" ".join(rng.choices(vocabulary, weights, k=rng.randint(4, 15))) for _ in range(20)]
+    yield segment, queries
+    segment.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("phrase_bonus", [False, True])
+@pytest.mark.parametrize("limit", [1, 10, 100])
+def test_pruned_scoring_matches_exhaustive(zipf_segment, monkeypatch, phrase_bonus: bool, limit: int):
+    segment, queries = zipf_segment
+    schema = segment.schema
+    boosts = {"title": 2.5, "body": 1.0}
+    exhaustive = BM25SearchEngine(schema, field_boosts=boosts, enable_phrase_bonus=phrase_bonus, enable_pruning=False)
+    pruned = BM25SearchEngine(schema, field_boosts=boosts, enable_phrase_bonus=phrase_bonus)
+    decoded_blocks = []
+    select = PostingBlocks.select
+
+    def _counting_select(self, block_indices):
+        decoded_blocks.append((len(block_indices), self.block_count))
+        return select(self, block_indices)
+
+    monkeypatch.setattr(PostingBlocks, "select", _counting_select)
+
+    for query in queries:
+        tokens = exhaustive.tokenize_query(query)
+        expected = exhaustive.score(segment, tokens, limit=limit)
+        assert pruned.score(segment, tokens, limit=limit) == expected
+
+    if limit == 1 and not phrase_bonus:
+        assert any(selected < total for selected, total in decoded_blocks)
+
+
+@pytest.fixture
+def phrase_segment(tmp_path):
+    writer = SqliteSegmentWriter(create_default_schema(), segment_id="phrases")
+    bodies = {
+        "exact": "configure the model form before saving",
+        "reversed": "the form model is configured here",
+        "scattered": "a model and then a separate form",
+        "title-only": "nothing relevant in the body",
+    }
+    for name, body in bodies.items():
+        writer.add_document(
+            {
+                "url": f"https://example.com/{name}",
+                "url_path": f"/{name}",
+                "title": "Model Form reference" if name == "title-only" else name,
+                "body": body,
+                "path": f"{name}.md",
+            }
+        )
+    store = SqliteSegmentStore(tmp_path)
+    store.save(writer.build())
+    segment = store.load("phrases")
+    yield segment
+    segment.close()
+
+
+def _ranked_urls(engine: BM25SearchEngine, segment, query: str, *, word_match: bool = False) -> set[str]:
+    return {
+        ranked.doc_id for ranked in engine.score(segment, engine.tokenize_query(query, word_match=word_match), limit=10)
+    }
+
+
+def test_tokenize_query_records_quoted_phrases_without_expanding_them() -> None:
+    engine = BM25SearchEngine(create_default_schema())
+
+    tokens = engine.tokenize_query('"auth" setup')
+
+    assert [dict(phrase).get("body") for phrase in tokens.phrases] == [("auth",)]
+    assert "authentication" not in tokens.per_field["body"]
+    assert engine.tokenize_query("auth setup").phrases == ()
+
+
+def test_tokenize_query_word_match_disables_fuzzy_and_synonyms() -> None:
+    engine = BM25SearchEngine(create_default_schema(), enable_fuzzy=True)
+
+    tokens = engine.tokenize_query("auth setup", word_match=True)
+
+    assert tokens.base_term_count == 0
+    assert tokens.per_field["body"] == ("auth", "setup")
+    assert [dict(phrase)["body"] for phrase in tokens.phrases] == [("auth", "setup")]
+
+
+def test_word_match_only_returns_exact_phrase_matches(phrase_segment) -> None:
+    engine = BM25SearchEngine(phrase_segment.schema, enable_synonyms=False)
+
+    assert _ranked_urls(engine, phrase_segment, "model form") == {
+        "https://example.com/exact",
+        "https://example.com/reversed",
+        "https://example.com/scattered",
+        "https://example.com/title-only",
+    }
+    assert _ranked_urls(engine, phrase_segment, "model form", word_match=True) == {
+        "https://example.com/exact",
+        "https://example.com/title-only",
+    }
+    assert _ranked_urls(engine, phrase_segment, "form model", word_match=True) == {"https://example.com/reversed"}
+
+
+def test_quoted_phrase_combines_with_free_terms(phrase_segment) -> None:
+    engine = BM25SearchEngine(phrase_segment.schema, enable_synonyms=False)
+
+    assert _ranked_urls(engine, phrase_segment, '"configure the model" saving') == {"https://example.com/exact"}
+    assert _ranked_urls(engine, phrase_segment, '"model missing"') == set()
+
+
+def test_phrase_match_respects_deleted_docs(phrase_segment) -> None:
+    engine = BM25SearchEngine(phrase_segment.schema, enable_synonyms=False)
+    deleted = np.array([doc_id == "https://example.com/exact" for doc_id in phrase_segment.doc_ids])
+    tokens = engine.tokenize_query("model form", word_match=True)
+
+    ranked = engine.score(phrase_segment, tokens, limit=10, deleted=deleted)
+
+    assert [entry.doc_id for entry in ranked] == ["https://example.com/title-only"]
+
+
+def test_phrase_matches_agree_with_scanning_stored_fields(zipf_segment) -> None:
+    segment, _queries = zipf_segment
+    engine = BM25SearchEngine(segment.schema, enable_synonyms=False)
+    fields = {field.name: get_analyzer(field.analyzer_name) for field in segment.schema.text_fields}
+
+    for query in ("term0x term1x", "term1x term0x term0x", "term2x term5x"):
+        tokens = engine.tokenize_query(query, word_match=True)
+        phrase = query.split()
+        expected = set()
+        for doc_id in segment.doc_ids:
+            document = segment.get_document(doc_id)
+            for name, analyzer in fields.items():
+                terms = analyzer.terms(str(document.get(name) or ""))
+                if any(terms[start : start + len(phrase)] == phrase for start in range(len(terms))):
+                    expected.add(doc_id)
+
+        matched = engine.match_phrases(segment, tokens)
+        ranked = engine.score(segment, tokens, limit=len(segment.doc_ids))
+
+        assert expected
+        assert {segment.doc_ids[ordinal] for ordinal in np.flatnonzero(matched)} == expected
+        assert {entry.doc_id for entry in ranked} == expected
@@ -3,7 +3,9 @@
 import pytest
 
 from docs_mcp_server.search.fuzzy import (
+    deletion_variants,
     find_fuzzy_matches,
+    get_index_edit_distance,
     get_max_edit_distance,
     levenshtein_distance,
 )
@@ -72,6 +74,44 @@ class TestGetMaxEditDistance:
         assert get_max_edit_distance(20) == 2
 
 
+@pytest.mark.unit
+class TestDeletionIndex:
+    """Tests for the deletion-variant helpers behind the segment fuzzy index."""
+
+    def test_index_distance_covers_every_reachable_query_length(self):
+        assert [get_index_edit_distance(length) for length in range(7)] == [0, 0, 1, 1, 2, 2, 2]
+
+    def test_variants_are_grouped_by_deletion_count(self):
+        levels = deletion_variants("cats", 2)
+
+        assert levels[0] == {"cats"}
+        assert levels[1] == {"ats", "cts", "cas", "cat"}
+        assert "ca" in levels[2]
+        assert not levels[2] & levels[1]
+
+    def test_variants_only_use_the_prefix(self):
+        levels = deletion_variants("configuration", 1, prefix_length=4)
+
+        assert levels == [{"conf"}, {"onf", "cnf", "cof", "con"}]
+
+    @pytest.mark.parametrize(
+        ("query", "term"),
+        [
+            ("xconfiguration", "configuration"),
+            ("configuraton", "configuration"),
+            ("confgiuration", "configuration"),
+            ("webhookz", "webhook"),
+            ("improt", "import"),
+            ("tset", "test"),
+        ],
+    )
+    def test_terms_within_query_distance_share_a_variant(self, query, term):
+        query_variants = set().union(*deletion_variants(query, get_max_edit_distance(len(query))))
+        term_variants = set().union(*deletion_variants(term, get_index_edit_distance(len(term))))
+
+        assert query_variants & term_variants
+
+
 @pytest.mark.unit
 class TestFindFuzzyMatches:
     """Tests for find_fuzzy_matches function."""
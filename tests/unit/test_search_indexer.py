@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 import json
+import os
 from pathlib import Path
+import time
 
 import pytest
 
+from docs_mcp_server.search import indexer as indexer_module
 from docs_mcp_server.search.indexer import (
     DocumentLoadError,
     IndexBuildResult,
@@ -15,7 +18,7 @@ from docs_mcp_server.search.indexer import (
     TenantIndexingContext,
     _extract_url_path,
 )
-from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore
+from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter
 from docs_mcp_server.utils.crawl_state_store import CrawlStateStore
 
 
@@ -55,6 +58,105 @@ def test_indexer_builds_segment_from_filesystem(tenant_root: Path) -> None:
     assert postings
 
 
+def test_indexer_spills_over_budget_and_reports_throughput(tenant_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for index in range(3):
+        _write_markdown_doc(
+            tenant_root,
+            f"site/docs/page-{index}.md",
+            title=f"Page {index}",
+            body=f"# Page {index}\n\nShared routing content {index}.",
+        )
+    monkeypatch.setattr(SqliteSegmentWriter, "MEMORY_BUDGET_BYTES", 1)
+
+    context = TenantIndexingContext(
+        codename="demo",
+        docs_root=tenant_root,
+        segments_dir=tenant_root / "segments",
+        source_type="filesystem",
+    )
+    result = TenantIndexer(context).build_segment()
+
+    assert result.documents_indexed == 3
+    assert result.spilled_runs == 3
+    assert result.elapsed_seconds > 0
+    assert result.documents_per_second > 0
+    assert result.peak_rss_bytes is None or result.peak_rss_bytes > 0
+    assert sorted(path.suffix for path in context.segments_dir.iterdir()) == [".db", ".json"]
+
+    latest = SqliteSegmentStore(context.segments_dir).latest()
+    assert latest is not None
+    assert latest.doc_count == 3
+    assert len(latest.get_postings("body", "rout")) == 3
+
+
+def test_indexer_parallel_parse_matches_serial_build(tenant_root: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for index in range(12):
+        _write_markdown_doc(
+            tenant_root,
+            f"site/docs/page-{index}.md",
+            title=f"Page {index}",
+            body=f"# Page {index}\n\n## Section\n\nParallel parsing content {index}.",
+        )
+    (tenant_root / "__docs_metadata" / "broken.meta.json").write_text("{not json", encoding="utf-8")
+    monkeypatch.setattr(indexer_module, "_MIN_DOCUMENTS_PER_WORKER", 1)
+    context = TenantIndexingContext(
+        codename="demo",
+        docs_root=tenant_root,
+        segments_dir=tenant_root / "segments",
+        url_blacklist_prefixes=("https://example.com/site/docs/page-3",),
+    )
+
+    monkeypatch.setattr(TenantIndexer, "PARSE_WORKERS", 1)
+    serial = TenantIndexer(context).build_segment(persist=False)
+    monkeypatch.setattr(TenantIndexer, "PARSE_WORKERS", 2)
+    parallel = TenantIndexer(context).build_segment()
+
+    assert parallel.documents_indexed == serial.documents_indexed == 11
+    assert parallel.documents_skipped == serial.documents_skipped
+    assert parallel.errors == serial.errors
+    assert parallel.segment_ids == serial.segment_ids
+    latest = SqliteSegmentStore(context.segments_dir).latest()
+    assert latest is not None
+    assert latest.segment_id == serial.segment_ids[0]
+    assert len(latest.get_postings("body", "parallel")) == 11
+
+
+def test_build_delta_indexes_changed_docs_and_tombstones_replaced_ones(tenant_root: Path) -> None:
+    for index in range(4):
+        _write_markdown_doc(
+            tenant_root,
+            f"docs/page-{index}.md",
+            title=f"Page {index}",
+            body=f"# Page {index}\n\nOriginal content {index}.",
+        )
+    _set_mtimes(tenant_root, time.time() - 3600)
+    context = TenantIndexingContext(codename="demo", docs_root=tenant_root, segments_dir=tenant_root / "segments")
+    indexer = TenantIndexer(context)
+    base = indexer.build_segment()
+    assert indexer.build_delta().segment_ids == ()
+
+    _write_markdown_doc(tenant_root, "docs/page-1.md", title="Page 1", body="# Page 1\n\nRevised content.")
+    _set_mtimes(tenant_root / "docs" / "page-1.md", time.time() + 5)
+    (tenant_root / "docs" / "page-2.md").unlink()
+    (tenant_root / "__docs_metadata" / "docs" / "page-2.meta.json").unlink()
+    delta = indexer.build_delta(changed_paths=["docs/page-0.md"])
+
+    assert delta.documents_indexed == 2
+    assert delta.documents_deleted == 3
+    store = SqliteSegmentStore(context.segments_dir)
+    assert store.latest_segment_id() == base.segment_ids[0]
+    assert store.delta_segment_ids() == list(delta.segment_ids)
+    delta_segment = store.load(delta.segment_ids[0])
+    assert delta_segment.deleted_doc_ids() == frozenset(f"https://example.com/docs/page-{index}" for index in range(3))
+    assert delta_segment.get_postings("body", "revis")
+    delta_segment.close()
+
+    assert indexer.delta_compaction_due()  # 2 docs + 3 tombstones exceed 10% of the base
+    rebuilt = indexer.build_segment()
+    assert store.delta_segment_ids() == []
+    assert sorted(path.name for path in context.segments_dir.glob("*.db")) == [f"{rebuilt.segment_ids[0]}.db"]
+
+
 def test_indexer_persists_index_bound_document_freshness(tenant_root: Path) -> None:
     _write_markdown_doc(
         tenant_root,
@@ -930,6 +1032,12 @@ def test_indexer_prunes_manifest_to_latest_segment(tenant_root: Path) -> None:
 # --- helpers --------------------------------------------------------------
 
 
+def _set_mtimes(path: Path, timestamp: float) -> None:
+    for candidate in [path, *path.rglob("*")] if path.is_dir() else [path]:
+        if candidate.is_file():
+            os.utime(candidate, (timestamp, timestamp))
+
+
 def _write_markdown_doc(
     root: Path,
     relative_path: str,
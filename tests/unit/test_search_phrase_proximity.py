@@ -6,7 +6,7 @@ adjacent or near each other, improving results for multi-word queries.
 
 import pytest
 
-from docs_mcp_server.search.phrase import get_min_span
+from docs_mcp_server.search.phrase import get_min_span, has_phrase, parse_phrases, strip_phrases
 
 
 @pytest.mark.unit
@@ -41,3 +41,40 @@ class TestGetMinSpan:
         positions = {"a": [5]}
         span = get_min_span(positions)
         assert span == 1
+
+
+@pytest.mark.unit
+class TestParsePhrases:
+    """parse_phrases extracts the exact phrases a query requires."""
+
+    def test_quoted_spans_become_phrases(self):
+        assert parse_phrases('use "model form" with "query set"') == ["model form", "query set"]
+
+    def test_unmatched_and_empty_quotes_are_ignored(self):
+        assert parse_phrases('"" plain "unterminated') == []
+
+    def test_word_match_makes_whole_query_one_phrase(self):
+        assert parse_phrases('  use "model form" here ', word_match=True) == ["use  model form  here"]
+        assert parse_phrases('""', word_match=True) == []
+
+    def test_strip_phrases_leaves_unquoted_text(self):
+        assert strip_phrases('use "model form" here').split() == ["use", "here"]
+
+
+@pytest.mark.unit
+class TestHasPhrase:
+    """has_phrase checks that terms occur at consecutive positions."""
+
+    def test_consecutive_positions_match(self):
+        assert has_phrase([[4, 9], [1, 10], [11]])
+
+    def test_out_of_order_positions_do_not_match(self):
+        assert not has_phrase([[5], [4]])
+
+    def test_repeated_term_needs_distinct_positions(self):
+        assert has_phrase([[2, 3], [2, 3]])
+        assert not has_phrase([[2], [2]])
+
+    def test_missing_term_does_not_match(self):
+        assert not has_phrase([[1], []])
+        assert not has_phrase([])
@@ -265,6 +265,16 @@ class TestBuildSmartSnippet:
         # Should highlight the first occurrence
         assert "[[match]]" in result
 
+    def test_earliest_offset_wins_over_term_order(self):
+        text = "Routing is configured once. Views come later."
+
+        result = build_smart_snippet(text, ["view", "rout", "routing"])
+
+        assert result.startswith("[[Routing]]")
+
+    def test_ignores_empty_terms(self):
+        assert build_smart_snippet("Plain text here.", ["", ""]) == "Plain text here."
+
     def test_real_world_example(self):
         text = """Django is a high-level Python web framework that encourages rapid development
         and clean, pragmatic design. Built by experienced developers, it takes care of much of
@@ -11,9 +11,10 @@ import pytest
 
 from docs_mcp_server.domain.search import SearchResponse
 from docs_mcp_server.search.bloom_filter import BloomFilter, bloom_positions
+from docs_mcp_server.search.schema import create_default_schema
 import docs_mcp_server.search.segment_search_index as module_under_test
 from docs_mcp_server.search.segment_search_index import SegmentSearchIndex
-from docs_mcp_server.search.sqlite_storage import _bloom_blocks_from_bits
+from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter, _bloom_blocks_from_bits
 
 
 def _insert_bloom_metadata(conn: sqlite3.Connection, terms: set[str]) -> None:
@@ -1104,3 +1105,31 @@ def test_performance_info_includes_concurrent_search(tmp_path):
     info = index.get_performance_info()
 
     assert info["lockfree"] is True
+
+
+def test_search_merges_delta_segments_and_masks_tombstoned_docs(tmp_path):
+    schema = create_default_schema()
+    store = SqliteSegmentStore(tmp_path)
+    base = SqliteSegmentWriter(schema, segment_id="base")
+    for name in ("alpha", "beta", "gamma"):
+        base.add_document(
+            {"url": f"https://docs.example.com/{name}", "title": name.title(), "body": f"shared original {name}"}
+        )
+    store.save_writer(base)
+    delta = SqliteSegmentWriter(schema, segment_id="delta")
+    delta.add_document({"url": "https://docs.example.com/beta", "title": "Beta", "body": "shared revised beta"})
+    store.save_delta(delta, deleted_doc_ids=["https://docs.example.com/beta", "https://docs.example.com/gamma"])
+
+    with SegmentSearchIndex(tmp_path / "base.db", delta_paths=[tmp_path / "delta.db"]) as index:
+        assert index.segment_ids == ("base", "delta")
+        shared = [result.document_url for result in index.search("shared", 10).results]
+        original = [result.document_url for result in index.search("original", 10).results]
+        revised = [result.document_url for result in index.search("revised", 10).results]
+        assert sorted(shared) == ["https://docs.example.com/alpha", "https://docs.example.com/beta"]
+        assert original == ["https://docs.example.com/alpha"]
+        assert revised == ["https://docs.example.com/beta"]
+        assert index.get_document_by_url("https://docs.example.com/beta")["body"] == "shared revised beta"
+        assert index.get_document_by_url("https://docs.example.com/gamma") is None
+
+    with SegmentSearchIndex(tmp_path / "base.db", delta_paths=[tmp_path / "missing.db"]) as index:
+        assert index.segment is None
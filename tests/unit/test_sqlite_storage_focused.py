@@ -1,16 +1,22 @@
 """Focused tests for SQLite storage coverage."""
 
 from array import array
+from contextlib import closing
 from datetime import datetime, timezone
+import json
 from pathlib import Path
 import sqlite3
 import tempfile
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
+from docs_mcp_server.search.fuzzy import find_fuzzy_matches
 from docs_mcp_server.search.schema import Schema, TextField
 from docs_mcp_server.search.sqlite_storage import (
+    POSTINGS_FORMAT_ORDINAL_BLOBS,
+    POSTINGS_FORMAT_ROWS,
     SQLiteConnectionPool,
     SqliteSegment,
     SqliteSegmentStore,
@@ -193,6 +199,101 @@ def test_sqlite_segment_writer_build():
     assert len(segment_data["stored_fields"]) == 1
 
 
+def _spill_corpus() -> list[dict[str, str]]:
+    words = ["request", "model", "config", "router", "schema", "token", "index", "segment"]
+    return [
+        {"title": f"doc {i:02d}", "body": " ".join(words[(i + j) % len(words)] for j in range(i % 5 + 3))}
+        for i in range(24)
+    ]
+
+
+@pytest.mark.unit
+def test_sqlite_segment_writer_spilled_build_matches_in_memory(tmp_path):
+    schema = Schema(fields=[TextField("title"), TextField("body")], unique_field="title", name="spill")
+    buffered = SqliteSegmentWriter(schema, segment_id="spill")
+    spilled = SqliteSegmentWriter(schema, segment_id="spill", memory_budget_bytes=2048, spill_dir=tmp_path)
+    for document in _spill_corpus():
+        buffered.add_document(document)
+        spilled.add_document(document)
+
+    assert buffered.spill_count == 0
+    assert spilled.spill_count > 1
+    expected = buffered.build()
+    actual = spilled.build()
+    for segment_data in (expected, actual):
+        segment_data.pop("created_at")
+    assert actual == expected
+    assert spilled.field_total_terms("body") == sum(expected["field_lengths"]["body"].values())
+
+    with pytest.raises(ValueError, match="Duplicate document"):
+        spilled.add_document(_spill_corpus()[0])
+
+    spilled.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_save_writer_streams_spilled_runs_into_equivalent_segment(tmp_path):
+    schema = Schema(fields=[TextField("title"), TextField("body")], unique_field="title", name="spill")
+    buffered = SqliteSegmentWriter(schema, segment_id="spill")
+    spilled = SqliteSegmentWriter(schema, segment_id="spill", memory_budget_bytes=1, spill_dir=tmp_path / "staging")
+    for document in _spill_corpus():
+        buffered.add_document(document)
+        spilled.add_document(document)
+
+    buffered_path = SqliteSegmentStore(tmp_path / "buffered").save(buffered.build())
+    spilled_store = SqliteSegmentStore(tmp_path / "spilled")
+    spilled_path = spilled_store.save_writer(spilled, provenance={"source_type": "filesystem"})
+    spilled.close()
+
+    assert spilled.spill_count == len(_spill_corpus())
+    tables = ("metadata", "doc_ordinals", "posting_lists", "documents", "bloom_blocks", "fuzzy_terms", "fuzzy_deletes")
+    with closing(sqlite3.connect(buffered_path)) as expected, closing(sqlite3.connect(spilled_path)) as actual:
+        for table in tables:
+            query = f"SELECT * FROM {table} ORDER BY 1, 2"
+            expected_rows = expected.execute(query).fetchall()
+            actual_rows = actual.execute(query).fetchall()
+            if table == "metadata":
+                expected_rows = [row for row in expected_rows if row[0] != "created_at"]
+                actual_rows = [row for row in actual_rows if row[0] != "created_at"]
+            assert actual_rows == expected_rows, table
+
+    manifest = json.loads((tmp_path / "spilled" / SqliteSegmentStore.MANIFEST_FILENAME).read_text(encoding="utf-8"))
+    assert manifest["latest_segment_id"] == "spill"
+    assert manifest["doc_count"] == len(_spill_corpus())
+    assert manifest["provenance"] == {"source_type": "filesystem"}
+
+
+def test_save_delta_layers_tombstones_over_the_manifest_base(tmp_path):
+    schema = Schema(fields=[TextField("title"), TextField("body")], unique_field="title", name="delta")
+    store = SqliteSegmentStore(tmp_path)
+    delta = SqliteSegmentWriter(schema, segment_id="delta")
+    delta.add_document({"title": "gamma", "body": "replacement text"})
+    with pytest.raises(RuntimeError, match="without a base segment"):
+        store.save_delta(delta, deleted_doc_ids=["alpha"])
+
+    base = SqliteSegmentWriter(schema, segment_id="base")
+    base.add_document({"title": "alpha", "body": "original text"})
+    base.add_document({"title": "beta", "body": "kept text"})
+    store.save_writer(base)
+    store.save_delta(delta, deleted_doc_ids=["alpha", "alpha"])
+
+    # The delta is the newest file, but the base stays the latest full segment.
+    assert store.latest_segment_id() == "base"
+    assert store.delta_segment_ids() == ["delta"]
+    loaded_delta = store.load("delta")
+    loaded_base = store.load("base")
+    assert loaded_delta.deleted_doc_ids() == frozenset({"alpha"})
+    assert loaded_base.deleted_doc_ids() == frozenset()
+    assert loaded_delta.get_document_by_url("missing") is None
+    assert sorted(loaded_base.document_paths()) == [("alpha", None), ("beta", None)]
+    loaded_delta.close()
+    loaded_base.close()
+
+    store.save_writer(base)
+    assert store.delta_segment_ids() == []
+
+
 @pytest.mark.unit
 def test_sqlite_segment_store_save_existing_segment():
     """Test saving when segment already exists."""
@@ -259,7 +360,9 @@ def test_sqlite_segment_store_create_schema():
         table_names = [t[0] for t in tables]
 
         assert "metadata" in table_names
-        assert "postings" in table_names
+        assert "posting_lists" in table_names
+        assert "doc_ordinals" in table_names
+        assert "postings" not in table_names
         assert "bloom_blocks" in table_names
         assert "documents" in table_names
         assert "field_lengths" not in table_names
@@ -444,3 +547,217 @@ def test_sqlite_segment_store_set_max_segments():
 
     # Restore original
     SqliteSegmentStore.MAX_SEGMENTS = original
+
+
+@pytest.mark.unit
+def test_sqlite_connection_pool_close_all_closes_other_thread_connections(tmp_path: Path):
+    """close_all releases connections opened by every reader thread."""
+    pool = SQLiteConnectionPool(tmp_path / "pool.db")
+    opened: list[sqlite3.Connection] = []
+
+    def _open() -> None:
+        with pool.get_connection() as conn:
+            opened.append(conn)
+
+    worker = threading.Thread(target=_open)
+    worker.start()
+    worker.join()
+    _open()
+
+    pool.close_all()
+
+    assert len(opened) == 2
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    with pool.get_connection() as conn:
+        assert conn not in opened
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+    pool.close_all()
+
+
+def _ordinal_segment(tmp_path: Path) -> tuple[SqliteSegmentStore, SqliteSegment]:
+    schema = Schema(fields=[TextField("title"), TextField("body")], unique_field="title", name="ordinals")
+    writer = SqliteSegmentWriter(schema, segment_id="ordinals")
+    for title, body in (("zeta", "model request model"), ("alpha", "request config"), ("mid", "unrelated text")):
+        writer.add_document({"title": title, "body": body})
+    store = SqliteSegmentStore(tmp_path)
+    store.save(writer.build())
+    return store, store.load("ordinals")
+
+
+def _downgrade_to_row_postings(segment: SqliteSegment) -> None:
+    """Rewrite a segment in the pre-ordinal row-per-posting layout."""
+    segment_data = segment.to_segment_data()
+    rows = [
+        (
+            field_name,
+            term,
+            posting["doc_id"],
+            len(posting["positions"]),
+            segment_data["field_lengths"][field_name][posting["doc_id"]],
+            array("I", posting["positions"]).tobytes(),
+        )
+        for field_name, terms in segment_data["postings"].items()
+        for term, posting_list in terms.items()
+        for posting in posting_list
+    ]
+    segment.close()
+    with sqlite3.connect(segment.db_path) as conn:
+        conn.executescript(
+            """
+            DROP TABLE posting_lists;
+            DROP TABLE doc_ordinals;
+            DELETE FROM metadata WHERE key = 'postings_format';
+            CREATE TABLE postings (
+                field TEXT NOT NULL, term TEXT NOT NULL, doc_id TEXT NOT NULL, tf INTEGER NOT NULL,
+                doc_length INTEGER NOT NULL, positions_blob BLOB, PRIMARY KEY (field, term, doc_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        conn.executemany("INSERT INTO postings VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+
+@pytest.mark.unit
+def test_ordinal_segment_postings_terms_and_doc_ids(tmp_path: Path):
+    _, segment = _ordinal_segment(tmp_path)
+
+    assert segment.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS
+    assert segment.doc_ids == ["alpha", "mid", "zeta"]
+    assert sorted(segment.get_terms("body")) == ["config", "model", "request", "text", "unrelat"]
+
+    columns = segment.get_posting_columns("body", "request")
+    assert list(columns.ordinals) == [0, 2]
+    assert list(columns.frequencies) == [1, 1]
+    assert segment.get_posting_columns("body", "missing") is None
+
+    postings = segment.get_postings("body", "model", include_positions=True)
+    assert [(posting.doc_id, posting.frequency, list(posting.positions)) for posting in postings] == [
+        ("zeta", 2, [0, 2])
+    ]
+    blocks = segment.get_posting_blocks("body", "request")
+    assert list(blocks.columns().ordinals) == [0, 2]
+    assert blocks.last_ordinals.tolist() == [2]
+    assert segment.get_posting_blocks("body", "missing") is None
+    filtered = segment.get_postings("body", "request", doc_id_filter=["alpha", ""])
+    assert [posting.doc_id for posting in filtered] == ["alpha"]
+    assert segment.get_postings("body", "missing", include_positions=True) == []
+    positions = segment.get_positions("body", "model", [0, 2])
+    assert {ordinal: list(doc_positions) for ordinal, doc_positions in positions.items()} == {2: [0, 2]}
+    assert segment.get_positions("body", "missing", [0]) == {}
+    assert segment.get_positions("body", "model", []) == {}
+    segment.close()
+
+
+@pytest.mark.unit
+def test_term_dictionary_answers_absent_terms_without_sql(tmp_path: Path, monkeypatch):
+    _, segment = _ordinal_segment(tmp_path)
+    assert segment.doc_frequency("body", "request") == 2
+    assert segment.doc_frequency("title", "zeta") == 1
+    assert len(segment.term_dictionary) == 8
+
+    reads: list[tuple[str, str]] = []
+    monkeypatch.setattr(SqliteSegment, "_read_posting_blob", lambda self, field, term: reads.append((field, term)))
+
+    assert segment.get_posting_blocks("body", "missing") is None
+    assert segment.get_posting_columns("title", "request") is None
+    assert segment.get_postings("body", "missing", include_positions=True) == []
+    assert segment.doc_frequency("body", "missing") == 0
+    assert reads == []
+    segment.close()
+
+
+@pytest.mark.unit
+def test_row_segment_is_readable_and_migrates_to_ordinal_blobs(tmp_path: Path):
+    store, segment = _ordinal_segment(tmp_path)
+    expected = segment.to_segment_data()
+    _downgrade_to_row_postings(segment)
+
+    legacy = store.load("ordinals")
+    assert legacy.postings_format == POSTINGS_FORMAT_ROWS
+    assert legacy.doc_ids == ["alpha", "mid", "zeta"]
+    assert list(legacy.get_posting_columns("body", "request").ordinals) == [0, 2]
+    assert legacy.get_posting_blocks("body", "request").max_frequencies.tolist() == [1]
+    assert legacy.get_posting_blocks("body", "missing") is None
+    assert [posting.doc_id for posting in legacy.get_postings("body", "request")] == ["alpha", "zeta"]
+    positions = legacy.get_positions("body", "model", [0, 2])
+    assert {ordinal: list(doc_positions) for ordinal, doc_positions in positions.items()} == {2: [0, 2]}
+    assert legacy.doc_frequency("body", "request") == 2
+    assert legacy.doc_frequency("body", "missing") == 0
+    assert sorted(legacy.get_terms("body")) == ["config", "model", "request", "text", "unrelat"]
+
+    exported = legacy.to_segment_data()
+    assert exported["postings"] == expected["postings"]
+    assert exported["field_lengths"] == expected["field_lengths"]
+    legacy.close()
+
+    migrated_dir = tmp_path / "migrated"
+    SqliteSegmentStore(migrated_dir).save(exported)
+    migrated = SqliteSegmentStore(migrated_dir).load("ordinals")
+    assert migrated.postings_format == POSTINGS_FORMAT_ORDINAL_BLOBS
+    assert migrated.to_segment_data()["postings"] == expected["postings"]
+    migrated.close()
+
+
+@pytest.mark.unit
+def test_load_rejects_unknown_postings_format(tmp_path: Path):
+    store, segment = _ordinal_segment(tmp_path)
+    segment.close()
+    with sqlite3.connect(segment.db_path) as conn:
+        conn.execute("UPDATE metadata SET value = 'ordinal-blobs-v1' WHERE key = 'postings_format'")
+
+    assert store.load("ordinals") is None
+
+
+@pytest.mark.unit
+def test_fuzzy_index_matches_vocabulary_scan(tmp_path: Path):
+    schema = Schema(fields=[TextField("title"), TextField("body")], unique_field="title", name="fuzzy")
+    writer = SqliteSegmentWriter(schema, segment_id="fuzzy")
+    bodies = ("configuration configure config", "webhook webhooks hook", "import imports export", "test tests text")
+    for index, body in enumerate(bodies):
+        writer.add_document({"title": f"doc{index}", "body": body})
+    store = SqliteSegmentStore(tmp_path)
+    store.save(writer.build())
+    segment = store.load("fuzzy")
+    vocabulary = segment.get_terms("body")
+
+    assert segment.has_fuzzy_index
+    for query in ("configuraton", "webhookz", "improt", "tset", "txt", "zz", "unrelated"):
+        assert segment.find_fuzzy_terms("body", query) == find_fuzzy_matches(query, vocabulary)
+    assert segment.find_fuzzy_terms("title", "doc9") == [("doc0", 1), ("doc1", 1), ("doc2", 1), ("doc3", 1)]
+    assert segment.find_fuzzy_terms("title", "configuraton") == []
+    segment.close()
+
+
+@pytest.mark.unit
+def test_fuzzy_index_stores_terms_shared_by_fields_once(tmp_path: Path):
+    schema = Schema(fields=[TextField("title"), TextField("body")], unique_field="title", name="fuzzy")
+    writer = SqliteSegmentWriter(schema, segment_id="shared")
+    writer.add_document({"title": "python", "body": "python webhook"})
+    store = SqliteSegmentStore(tmp_path)
+    store.save(writer.build())
+    segment = store.load("shared")
+
+    with closing(sqlite3.connect(segment.db_path)) as conn:
+        terms = [row[0] for row in conn.execute("SELECT term FROM fuzzy_terms ORDER BY term_id")]
+    assert terms == ["python", "webhook"]
+    assert segment.find_fuzzy_terms("title", "pythn") == [("python", 1)]
+    assert segment.find_fuzzy_terms("body", "pythn") == [("python", 1)]
+    assert segment.find_fuzzy_terms("title", "webhok") == []
+    assert segment.find_fuzzy_terms("body", "webhok") == [("webhook", 1)]
+    segment.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("metadata_key", ["fuzzy_prefix_length", "fuzzy_index_format"])
+def test_segment_without_fuzzy_index_reports_it(tmp_path: Path, metadata_key: str):
+    store, segment = _ordinal_segment(tmp_path)
+    segment.close()
+    with sqlite3.connect(segment.db_path) as conn:
+        conn.execute("DELETE FROM metadata WHERE key = ?", (metadata_key,))
+
+    legacy = store.load("ordinals")
+
+    assert not legacy.has_fuzzy_index
+    assert legacy.find_fuzzy_terms("body", "requst") == []
+    legacy.close()
@@ -591,7 +591,10 @@ async def test_process_url_skip_and_success():
 
     class GoodCacheService:
         async def check_and_fetch_page(self, url, **kwargs):
-            return ("<html></html>", False, None)
+            page = types.SimpleNamespace(
+                content="<html></html>", unchanged=False, etag=None, last_modified=None, content_hash=None
+            )
+            return (page, False, None)
 
     scheduler.cache_service_factory = lambda: GoodCacheService()
 
@@ -12,6 +12,7 @@ from docs_mcp_server.config import Settings
 from docs_mcp_server.domain.sync_progress import SyncPhase, SyncProgress
 from docs_mcp_server.utils import sync_discovery_runner
 from docs_mcp_server.utils.crawl_state_store import CrawlStateStore, LockLease
+from docs_mcp_server.utils.models import DocPage
 from docs_mcp_server.utils.sync_models import SyncBatchRunner, SyncCyclePlan, SyncMetadata, SyncSchedulerStats
 from docs_mcp_server.utils.sync_scheduler import (
     SyncScheduler,
@@ -1185,7 +1186,9 @@ async def test_process_url_skips_recently_fetched(tmp_path) -> None:
         ).to_dict()
     )
 
-    fetch_stub = _FetchStub(page=object(), was_cached=False, reason=None)
+    fetch_stub = _FetchStub(
+        page=DocPage(url="https://example.com", title="Example", content="Example body"), was_cached=False, reason=None
+    )
     scheduler.cache_service_factory = _StaticFactory(fetch_stub)
 
     await scheduler._process_url("https://example.com")  # pylint: disable=protected-access
@@ -1200,7 +1203,9 @@ async def test_process_url_success_updates_metadata(tmp_path) -> None:
     scheduler = _build_scheduler(tmp_path)
     scheduler._active_progress = SyncProgress.create_new("demo")  # pylint: disable=protected-access
 
-    fetch_stub = _FetchStub(page=object(), was_cached=True, reason=None)
+    fetch_stub = _FetchStub(
+        page=DocPage(url="https://example.com", title="Example", content="Example body"), was_cached=True, reason=None
+    )
     scheduler.cache_service_factory = _StaticFactory(fetch_stub)
 
     await scheduler._process_url("https://example.com")  # pylint: disable=protected-access
@@ -1212,6 +1217,107 @@ async def test_process_url_success_updates_metadata(tmp_path) -> None:
     assert scheduler.stats.urls_cached == 1
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_url_revalidates_with_stored_validators(tmp_path) -> None:
+    scheduler = _build_scheduler(tmp_path)
+    scheduler._active_progress = SyncProgress.create_new("demo")  # pylint: disable=protected-access
+    stale = datetime.now(timezone.utc) - timedelta(days=30)
+    await scheduler.metadata_store.upsert_url_metadata(
+        SyncMetadata(
+            url="https://example.com",
+            last_status="success",
+            last_fetched_at=stale,
+            next_due_at=stale,
+            etag='"v1"',
+            content_hash="abc",
+        ).to_dict()
+    )
+    page = DocPage(
+        url="https://example.com",
+        title="Example",
+        content="Example body",
+        etag='"v1"',
+        content_hash="abc",
+        unchanged=True,
+    )
+    fetch_kwargs: list[dict] = []
+
+    class _RevalidatingStub(_FetchStub):
+        async def check_and_fetch_page(self, url: str, **kwargs):
+            fetch_kwargs.append(kwargs)
+            return self.page, False, None
+
+    scheduler.cache_service_factory = _StaticFactory(_RevalidatingStub(page=page, was_cached=False, reason=None))
+
+    await scheduler._process_url("https://example.com")  # pylint: disable=protected-access
+
+    assert fetch_kwargs == [{"use_semantic_cache": True, "etag": '"v1"', "content_hash": "abc"}]
+    assert scheduler.stats.urls_unchanged == 1
+    assert scheduler.stats.bytes_saved == len("Example body")
+    payload = await scheduler.metadata_store.load_url_metadata("https://example.com")
+    assert (payload["last_status"], payload["etag"], payload["content_hash"]) == ("success", '"v1"', "abc")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_batch_execution_sends_stored_validators_for_dequeued_urls(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    scheduler = _build_scheduler(tmp_path)
+    progress = SyncProgress.create_new("demo")
+    scheduler._active_progress = progress  # pylint: disable=protected-access
+    url = "https://example.com/page"
+    stale = datetime.now(timezone.utc) - timedelta(days=30)
+    await scheduler.metadata_store.upsert_url_metadata(
+        SyncMetadata(
+            url=url,
+            last_status="success",
+            last_fetched_at=stale,
+            next_due_at=stale,
+            etag='"v1"',
+            last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+            content_hash="abc",
+        ).to_dict()
+    )
+    await scheduler.metadata_store.enqueue_urls({url}, reason="test")
+    page = DocPage(url=url, title="Example", content="Example body", etag='"v1"', content_hash="abc", unchanged=True)
+    fetch_kwargs: list[dict] = []
+
+    class _RevalidatingStub(_FetchStub):
+        async def check_and_fetch_page(self, url: str, **kwargs):
+            fetch_kwargs.append(kwargs)
+            return self.page, False, None
+
+    async def no_sleep(*args, **kwargs):
+        return None
+
+    sync_scheduler = _import_sync_scheduler()
+    monkeypatch.setattr(sync_scheduler.asyncio, "sleep", no_sleep)
+    scheduler.cache_service_factory = _StaticFactory(_RevalidatingStub(page=page, was_cached=False, reason=None))
+    plan = SyncCyclePlan(
+        sitemap_urls=set(),
+        sitemap_lastmod_map={},
+        sitemap_changed=True,
+        due_urls={url},
+        has_previous_metadata=True,
+        has_documents=True,
+    )
+
+    result = await scheduler._run_batch_execution(plan=plan, progress=progress)  # pylint: disable=protected-access
+
+    assert result.processed == 1
+    assert fetch_kwargs == [
+        {
+            "use_semantic_cache": True,
+            "etag": '"v1"',
+            "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+            "content_hash": "abc",
+        }
+    ]
+    assert scheduler.stats.urls_unchanged == 1
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_process_url_handles_invalid_metadata(tmp_path) -> None:
@@ -1227,7 +1333,9 @@ async def test_process_url_handles_invalid_metadata(tmp_path) -> None:
 
     scheduler.metadata_store.load_url_metadata = fake_load  # type: ignore[assignment]
 
-    fetch_stub = _FetchStub(page=object(), was_cached=False, reason=None)
+    fetch_stub = _FetchStub(
+        page=DocPage(url="https://example.com", title="Example", content="Example body"), was_cached=False, reason=None
+    )
     scheduler.cache_service_factory = _StaticFactory(fetch_stub)
 
     await scheduler._process_url("https://example.com")  # pylint: disable=protected-access
@@ -2462,7 +2570,9 @@ async def test_process_url_invalid_metadata_falls_back(tmp_path) -> None:
 
     scheduler.metadata_store.load_url_metadata = load_url_metadata  # type: ignore[assignment]
 
-    fetch_stub = _FetchStub(page=object(), was_cached=False, reason=None)
+    fetch_stub = _FetchStub(
+        page=DocPage(url="https://example.com", title="Example", content="Example body"), was_cached=False, reason=None
+    )
     scheduler.cache_service_factory = _StaticFactory(fetch_stub)
 
     await scheduler._process_url("https://example.com")  # pylint: disable=protected-access
@@ -2477,7 +2587,9 @@ async def test_process_url_bypass_idempotency(tmp_path) -> None:
     scheduler._active_progress = SyncProgress.create_new("demo")  # pylint: disable=protected-access
     scheduler._bypass_idempotency = True  # pylint: disable=protected-access
 
-    fetch_stub = _FetchStub(page=object(), was_cached=False, reason=None)
+    fetch_stub = _FetchStub(
+        page=DocPage(url="https://example.com", title="Example", content="Example body"), was_cached=False, reason=None
+    )
     scheduler.cache_service_factory = _StaticFactory(fetch_stub)
 
     await scheduler._process_url("https://example.com")  # pylint: disable=protected-access
@@ -3,6 +3,7 @@
 import json
 from pathlib import Path
 import sqlite3
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,6 +12,7 @@ from docs_mcp_server.deployment_config import TenantConfig
 from docs_mcp_server.search.indexer import TenantIndexer
 from docs_mcp_server.search.indexing_utils import build_indexing_context
 from docs_mcp_server.search.schema import create_default_schema
+from docs_mcp_server.search.search_executor import SearchExecutor
 from docs_mcp_server.services.scheduler_service import SchedulerService
 from docs_mcp_server.tenant import TenantApp, create_tenant_app
 from docs_mcp_server.utils.models import FetchDocResponse, SearchDocsResponse
@@ -298,7 +300,18 @@ class TestTenantApp:
         assert result.results[0].snippet == "Test snippet"
         assert result.error is None
 
-        mock_index.search.assert_called_once_with("test query", 10)
+        mock_index.search.assert_called_once_with("test query", 10, word_match=False)
+
+    @pytest.mark.asyncio
+    async def test_search_forwards_word_match(self, tenant_config):
+        app = TenantApp(tenant_config)
+        mock_index = Mock()
+        mock_index.search.return_value = Mock(results=[])
+        app._search_index = mock_index
+
+        await app.search("model form", 5, True)
+
+        mock_index.search.assert_called_once_with("model form", 5, word_match=True)
 
     @pytest.mark.asyncio
     async def test_search_with_index_exception(self, tenant_config):
@@ -318,6 +331,27 @@ class TestTenantApp:
         assert "Search failed" in result.error
         assert result.query == "test query"
 
+    @pytest.mark.asyncio
+    async def test_search_times_out_on_search_executor(self, tenant_config, monkeypatch):
+        """Test that a slow search returns a timeout error instead of blocking."""
+        app = TenantApp(tenant_config)
+        release = threading.Event()
+
+        mock_index = Mock()
+        mock_index.search.side_effect = lambda *_args, **_kwargs: release.wait(5)
+        app._search_index = mock_index
+        executor = SearchExecutor(max_workers=1, max_concurrency_per_tenant=1, timeout_seconds=0.05)
+        monkeypatch.setattr("docs_mcp_server.tenant.get_search_executor", lambda: executor)
+
+        result = await app.search("test query", 10, False)
+        release.set()
+        executor.shutdown(wait=True)
+
+        assert result.results == []
+        assert result.error == "Search timed out after 0.05s"
+        assert result.query == "test query"
+        assert app._active_searches == 0
+
     @pytest.mark.asyncio
     async def test_fetch_returns_error_for_uncached_url(self, tenant_config):
         """Test that fetch returns error for URLs not in cache."""
@@ -10,8 +10,17 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from docs_mcp_server.deployment_config import ArticleExtractorFallbackConfig, SharedInfraConfig, TenantConfig
+from docs_mcp_server.deployment_config import (
+    ArticleExtractorFallbackConfig,
+    SearchConfig,
+    SharedInfraConfig,
+    TenantConfig,
+)
+from docs_mcp_server.search import posting_cache as posting_cache_module
+from docs_mcp_server.search.posting_cache import configure_posting_cache
 from docs_mcp_server.search.schema import create_default_schema
+from docs_mcp_server.search.segment_search_index import SegmentSearchIndex, WarmupReport
+from docs_mcp_server.search.sqlite_storage import SqliteSegmentStore, SqliteSegmentWriter
 from docs_mcp_server.service_layer.filesystem_unit_of_work import FileSystemUnitOfWork
 from docs_mcp_server.services.git_sync_scheduler_service import GitSyncSchedulerService
 from docs_mcp_server.tenant import (
@@ -141,8 +150,9 @@ def test_reload_search_index_keeps_old_on_failure(tmp_path: Path):
 
     class MockIndex:
         db_path = Path("old.db")
+        delta_paths = ()
 
-        def close(self):
+        def close(self, **_kwargs):
             close_called.append(True)
 
     app._search_index = MockIndex()
@@ -162,8 +172,9 @@ def test_reload_search_index_closes_old_on_success(tmp_path: Path, caplog):
 
     class MockIndex:
         db_path = Path("old.db")
+        delta_paths = ()
 
-        def close(self):
+        def close(self, **_kwargs):
             raise RuntimeError("close failed")
 
     app._search_index = MockIndex()
@@ -234,10 +245,34 @@ def test_manifest_reload_skips_unready_segment(tmp_path: Path):
     app._close_search_indexes()
 
 
+@pytest.mark.unit
+def test_manifest_reload_layers_delta_segments(tmp_path: Path):
+    tenant = _make_filesystem_config(tmp_path)
+    segments_dir = Path(tenant.docs_root_dir) / "__search_segments"
+    segments_dir.mkdir()
+    for segment_id in ("seg1", "delta1"):
+        _write_minimal_segment_db(segments_dir / f"{segment_id}.db")
+    manifest = segments_dir / "manifest.json"
+    manifest.write_text('{"latest_segment_id": "seg1"}')
+
+    app = TenantApp(tenant)
+    assert app._current_generation() == ("seg1",)
+
+    manifest.write_text('{"latest_segment_id": "seg1", "delta_segment_ids": ["delta1"]}')
+    assert app._maybe_reload_from_manifest(log_missing=False) is True
+    assert app._current_segment_id() == "seg1"
+    assert app._current_generation() == ("seg1", "delta1")
+
+    manifest.write_text('{"latest_segment_id": "seg1", "delta_segment_ids": ["delta1", "delta2"]}')
+    assert app._maybe_reload_from_manifest(log_missing=False) is False
+    assert app._current_generation() == ("seg1", "delta1")
+    app._close_search_indexes()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_post_sync_callback_rebuilds_index(tmp_path: Path, monkeypatch):
-    """Test that post-sync callback rebuilds search index."""
+async def test_post_sync_callback_builds_delta_and_reloads(tmp_path: Path, monkeypatch):
+    """Test that post-sync callback indexes a delta segment and reloads search."""
     # Create a git tenant config
     docs_root = tmp_path / "mcp-data" / "git-tenant"
     docs_root.mkdir(parents=True)
@@ -258,9 +293,12 @@ async def test_post_sync_callback_rebuilds_index(tmp_path: Path, monkeypatch):
         def __init__(self, ctx):
             pass
 
-        def build_segment(self, persist=True):
-            indexer_called.append(persist)
-            return SimpleNamespace(documents_indexed=10)
+        def build_delta(self):
+            indexer_called.append("delta")
+            return SimpleNamespace(documents_indexed=10, documents_deleted=2)
+
+        def delta_compaction_due(self):
+            return False
 
     monkeypatch.setattr("docs_mcp_server.tenant.TenantIndexer", MockIndexer)
     monkeypatch.setattr("docs_mcp_server.tenant.build_indexing_context", lambda cfg: None)
@@ -278,9 +316,9 @@ async def test_post_sync_callback_rebuilds_index(tmp_path: Path, monkeypatch):
     callback = app._make_post_sync_callback()
     await callback()
 
-    assert len(indexer_called) == 1
-    assert indexer_called[0] is True  # persist=True
+    assert indexer_called == ["delta"]
     assert len(reload_called) == 1
+    assert app._compaction_task is None
 
 
 @pytest.mark.unit
@@ -420,3 +458,110 @@ def test_build_scheduler_service_returns_uow_factory(tmp_path: Path):
 
     uow = service.uow_factory()
     assert isinstance(uow, FileSystemUnitOfWork)
+
+
+def _make_warmup_config(tmp_path: Path) -> TenantConfig:
+    docs_root = tmp_path / "mcp-data" / "warm"
+    docs_root.mkdir(parents=True)
+    segments_dir = docs_root / "__search_segments"
+    segments_dir.mkdir()
+    (segments_dir / "manifest.json").write_text('{"latest_segment_id": "seg1"}')
+    _write_minimal_segment_db(segments_dir / "seg1.db")
+    return TenantConfig(
+        source_type="filesystem",
+        codename="warm",
+        docs_name="Warm Docs",
+        docs_root_dir=str(docs_root),
+        docs_entry_url=["https://example.com/"],
+        search={"warmup_seconds": 1.5, "warmup_io_mb": 2},
+        test_queries={"natural": ["how to warm"], "words": ["cache"]},
+    )
+
+
+def _record_warm_ups(monkeypatch) -> list[tuple]:
+    calls: list[tuple] = []
+
+    def _warm_up(index, queries, *, time_budget_s, io_budget_bytes):
+        calls.append((index, list(queries), time_budget_s, io_budget_bytes))
+        return WarmupReport(0.25, len(queries), 0, 0)
+
+    monkeypatch.setattr(SegmentSearchIndex, "warm_up", _warm_up)
+    return calls
+
+
+@pytest.mark.unit
+def test_reloaded_index_is_warmed_before_swap(tmp_path: Path, monkeypatch):
+    app = TenantApp(_make_warmup_config(tmp_path))
+    calls = _record_warm_ups(monkeypatch)
+    assert calls == []
+    old_index = app._search_index
+    app._search_index = None
+
+    assert app.reload_search_index() is True
+
+    assert len(calls) == 1
+    warmed, queries, time_budget, io_budget = calls[0]
+    assert warmed is app._search_index
+    assert queries == ["how to warm", "cache"]
+    assert time_budget == 1.5
+    assert io_budget == 2 * 1024 * 1024
+    app._close_index(old_index)
+    app._close_search_indexes()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_warm_up_warms_initial_index_and_initialize_does_not(tmp_path: Path, monkeypatch):
+    app = TenantApp(_make_warmup_config(tmp_path))
+    calls = _record_warm_ups(monkeypatch)
+
+    await app.initialize()
+    assert calls == []
+    await app.warm_up()
+    await app.shutdown()
+
+    assert len(calls) == 1
+    assert calls[0][1] == ["how to warm", "cache"]
+
+
+@pytest.mark.unit
+def test_warm_up_disabled_by_default(tmp_path: Path, monkeypatch):
+    calls = _record_warm_ups(monkeypatch)
+    config = _make_warmup_config(tmp_path).model_copy(update={"search": SearchConfig()})
+    app = TenantApp(config)
+    app._search_index = None
+
+    assert app.reload_search_index() is True
+
+    assert calls == []
+    app._close_search_indexes()
+
+
+@pytest.mark.unit
+def test_swap_keeps_postings_of_the_shared_base_segment(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(posting_cache_module, "_cache_holder", {})
+    posting_cache = configure_posting_cache(1024 * 1024)
+    tenant = _make_filesystem_config(tmp_path)
+    writer = SqliteSegmentWriter(create_default_schema())
+    writer.add_document(
+        {
+            "url": "file:///doc.md",
+            "url_path": "/doc.md",
+            "title": "Doc",
+            "body": "Hello cached world.",
+            "path": "doc.md",
+        }
+    )
+    base_id = SqliteSegmentStore(Path(tenant.docs_root_dir) / "__search_segments").save_writer(writer).stem
+    app = TenantApp(tenant)
+    reloaded = app._create_search_index(segment_id=base_id, warm_up=False)
+    assert reloaded is not None
+    reloaded.warm_up(["cached"], time_budget_s=5.0, io_budget_bytes=1024 * 1024)
+    warmed = len(posting_cache)
+    assert warmed > 0
+
+    app._swap_search_index(reloaded)
+
+    assert len(posting_cache) == warmed
+    app._close_search_indexes()
+    assert len(posting_cache) == 0
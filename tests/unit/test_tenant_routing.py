@@ -0,0 +1,73 @@
+"""Unit tests for the find_tenant routing index."""
+
+from __future__ import annotations
+
+import pytest
+
+from docs_mcp_server.registry import TenantMetadata
+from docs_mcp_server.tenant_routing import TenantRoutingIndex
+
+
+def _metadata(codename: str, display_name: str, description: str, **overrides: object) -> TenantMetadata:
+    fields: dict[str, object] = {
+        "codename": codename,
+        "display_name": display_name,
+        "description": description,
+        "source_type": "online",
+        "test_queries": [],
+        "url_prefixes": [],
+    }
+    fields.update(overrides)
+    return TenantMetadata(**fields)
+
+
+@pytest.fixture
+def index() -> TenantRoutingIndex:
+    return TenantRoutingIndex(
+        [
+            _metadata("django", "Django", "Official Django docs", test_queries=["orm queries"]),
+            _metadata("drf", "Django REST Framework", "REST framework for Django"),
+            _metadata(
+                "aws-bedrock",
+                "AWS Bedrock",
+                "Foundation model service",
+                url_prefixes=["https://docs.aws.amazon.com/bedrock/"],
+            ),
+            _metadata("react", "React", "UI library", source_type="git"),
+        ]
+    )
+
+
+@pytest.mark.unit
+class TestTenantRoutingIndex:
+    def test_whole_query_substring_scores_field_weight(self, index: TenantRoutingIndex) -> None:
+        scores = index.score("django")
+
+        assert scores["django"] == 1.0
+        assert scores["drf"] == 1.0
+        assert scores["react"] == 0.0
+
+    def test_terms_average_substring_and_fuzzy_matches(self, index: TenantRoutingIndex) -> None:
+        # "foundation" is contained (0.8), "modl" is one edit from "model" (0.5): 0.65 * 1.5.
+        assert index.score("foundation modl")["aws-bedrock"] == pytest.approx(0.975)
+        # Two edits from "django" in the codename: 0.3 * 3.0.
+        assert index.score("djnga")["django"] == pytest.approx(0.9)
+        # Test queries and URL prefixes are routed too.
+        assert index.score("queries")["django"] == 1.0
+        assert index.score("amazon")["aws-bedrock"] == 1.0
+
+    def test_short_terms_match_substrings_but_never_fuzzily(self, index: TenantRoutingIndex) -> None:
+        scores = index.score("ui")
+
+        assert scores["react"] == 1.0
+        assert index.score("zz")["react"] == 0.0
+
+    def test_match_filters_sorts_and_limits(self, index: TenantRoutingIndex) -> None:
+        matches = index.match("djangoo", threshold=0.1, limit=1)
+
+        assert [(metadata.codename, score) for metadata, score in matches] == [("django", 1.0)]
+        assert index.match("kubernetes", threshold=0.1, limit=10) == []
+
+    def test_blank_query_falls_back_to_substring_scan(self, index: TenantRoutingIndex) -> None:
+        assert set(index.score("").values()) == {1.0}
+        assert set(index.score("   ").values()) == {0.0}